@@ -337,6 +337,145 @@ class AdminCog(commands.Cog):
         except discord.HTTPException as e:
             await interaction.response.send_message(f"❌ Failed to unmute user: {e}", ephemeral=True)
 
+    # ------------------------------------------------------------------
+    # Translation diagnostics
+    # ------------------------------------------------------------------
+    @admin.command(name="translation_stats", description="📊 Show translation cache statistics")
+    async def translation_stats(self, interaction: discord.Interaction) -> None:
+        """Report translation cache hit ratio and counters."""
+        try:
+            self._ensure_permitted(interaction)
+        except PermissionError:
+            await self._deny(interaction)
+            return
+
+        orchestrator = getattr(self.bot, "translation_orchestrator", None)
+        stats = orchestrator.cache_stats() if orchestrator and hasattr(orchestrator, "cache_stats") else {}
+        if not stats:
+            await interaction.response.send_message("Translation cache is not enabled.", ephemeral=True)
+            return
+
+        lines = [
+            "**Translation cache**",
+            f"Hit ratio: {stats['hit_ratio']:.1%} ({stats['hits']}/{stats['lookups']} lookups)",
+            f"Hits: memory {stats['hits_memory']}, persistent {stats['hits_persistent']} | Misses: {stats['misses']}",
+            f"Entries in memory: {stats['memory_entries']} | Evictions: {stats['evictions']} | Expired: {stats['expirations']}",
+            f"Persistent store: {'on' if stats['persistent'] else 'off'}",
+        ]
+        if hasattr(orchestrator, "singleflight_stats"):
+            flights = orchestrator.singleflight_stats()
+            lines.append(
+                f"Upstream calls: {flights['leaders']} | Coalesced duplicates: {flights['coalesced']} | In flight: {flights['inflight']}"
+            )
+        if getattr(orchestrator, "hedge", False) and hasattr(orchestrator, "hedge_stats"):
+            hedges = orchestrator.hedge_stats()
+            lines.append(f"Hedged requests: {hedges['hedged']} | Won by backup tier: {hedges['hedge_wins']}")
+        await interaction.response.send_message("\n".join(lines), ephemeral=True)
+
+    @admin.command(name="provider_health", description="🩺 Show translation provider circuit breakers")
+    async def provider_health(self, interaction: discord.Interaction) -> None:
+        """Report circuit state, EWMA latency and error rate per translation provider."""
+        try:
+            self._ensure_permitted(interaction)
+        except PermissionError:
+            await self._deny(interaction)
+            return
+
+        orchestrator = getattr(self.bot, "translation_orchestrator", None)
+        health = orchestrator.provider_health() if orchestrator and hasattr(orchestrator, "provider_health") else {}
+        if not health:
+            await interaction.response.send_message("No translation providers are configured.", ephemeral=True)
+            return
+
+        icons = {"closed": "🟢", "half_open": "🟡", "open": "🔴"}
+        lines = ["**Translation providers**"]
+        for provider, snap in health.items():
+            latency = f"{snap['latency_ewma'] * 1000:.0f}ms" if snap["latency_ewma"] is not None else "n/a"
+            line = (
+                f"{icons.get(snap['state'], '⚪')} **{provider}** {snap['state']} | latency {latency} | "
+                f"errors {snap['error_rate']:.0%} | trips {snap['trips']} | skipped {snap['rejected']}"
+            )
+            if snap["state"] == "open":
+                line += f" | retry in {snap['retry_in']:.0f}s"
+            lines.append(line)
+        if getattr(orchestrator, "adaptive_order", False):
+            lines.append("Adaptive tier ordering: on")
+        await interaction.response.send_message("\n".join(lines), ephemeral=True)
+
+    @admin.command(name="runtime_stats", description="⚙️ Show HTTP pool and provider worker statistics")
+    async def runtime_stats(self, interaction: discord.Interaction) -> None:
+        """Report the shared HTTP pool, provider SDK executors and DeepL batching."""
+        try:
+            self._ensure_permitted(interaction)
+        except PermissionError:
+            await self._deny(interaction)
+            return
+
+        lines = ["**Runtime**"]
+        http_client = getattr(self.bot, "http_client", None)
+        if http_client is not None and hasattr(http_client, "stats"):
+            pool = http_client.stats()
+            lines.append(
+                f"HTTP pool: {pool['requests']} requests | {pool['active_connections']} active, "
+                f"{pool['idle_connections']} idle | reuse {pool['reuse_ratio']:.0%} | errors {pool['errors']}"
+            )
+        for name, executor in (getattr(self.bot, "provider_executors", None) or {}).items():
+            pool = executor.stats()
+            lines.append(
+                f"{name} workers: {pool['running']}/{pool['max_workers']} busy | queued {pool['queued']} "
+                f"(peak {pool['peak_queue']}) | wait {pool['avg_queue_wait_ms']:.0f}ms | rejected {pool['rejected']}"
+            )
+        orchestrator = getattr(self.bot, "translation_orchestrator", None)
+        deepl = getattr(orchestrator, "deepl", None)
+        batches = deepl.batch_stats() if deepl is not None and hasattr(deepl, "batch_stats") else {}
+        if batches:
+            lines.append(
+                f"DeepL batching: {batches['batches']} requests for {batches['items']} texts "
+                f"(avg {batches['avg_batch_size']:.1f}, max {batches['largest_batch']})"
+            )
+        if len(lines) == 1:
+            await interaction.response.send_message("No shared runtime pools are running.", ephemeral=True)
+            return
+        await interaction.response.send_message("\n".join(lines), ephemeral=True)
+
+    @admin.command(name="ranking_stats", description="📸 Show ranking OCR and screenshot statistics")
+    async def ranking_stats(self, interaction: discord.Interaction) -> None:
+        """Report the OCR worker pool, the screenshot cache and screenshot intake."""
+        try:
+            self._ensure_permitted(interaction)
+        except PermissionError:
+            await self._deny(interaction)
+            return
+
+        lines = ["**Ranking screenshots**"]
+        ocr_executor = getattr(self.bot, "ocr_executor", None)
+        if ocr_executor is not None:
+            pool = ocr_executor.stats()
+            lines.append(
+                f"OCR workers: {pool['running']}/{pool['max_workers']} busy | queued {pool['queued']} "
+                f"(peak {pool['peak_queue']}) | latency {pool['avg_latency_ms']:.0f}ms avg, "
+                f"{pool['p95_latency_ms']:.0f}ms p95 | rejected {pool['rejected']} | timeouts {pool['timeouts']}"
+            )
+        screenshot_cache = getattr(self.bot, "screenshot_cache", None)
+        if screenshot_cache is not None:
+            cache = screenshot_cache.stats()
+            lines.append(
+                f"Screenshot cache: {cache['exact_hits']} exact hits, "
+                f"{cache['misses']} OCR runs ({cache['hit_ratio']:.0%}) | slot hits {cache['slot_hits']}"
+            )
+        screenshot_intake = getattr(self.bot, "screenshot_intake", None)
+        if screenshot_intake is not None:
+            intake = screenshot_intake.stats()
+            lines.append(
+                f"Screenshot intake: {intake['accepted']} accepted, {intake['rejected']} rejected | "
+                f"peak {intake['peak_bytes'] / 1048576:.1f}/{intake['max_bytes'] / 1048576:.0f}MB per upload | "
+                f"{intake['bytes_skipped'] / 1048576:.1f}MB not downloaded"
+            )
+        if len(lines) == 1:
+            await interaction.response.send_message("The ranking screenshot pipeline is not running.", ephemeral=True)
+            return
+        await interaction.response.send_message("\n".join(lines), ephemeral=True)
+
     # ------------------------------------------------------------------
     # Admin/Helper Cookie Give Command
     # ------------------------------------------------------------------
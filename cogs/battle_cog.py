@@ -22,6 +22,7 @@ try:
         end_battle, BattleState
     )
     from discord_bot.games.storage.game_storage_engine import GameStorageEngine
+    from discord_bot.games.storage.async_game_storage import AsyncGameStorage
     from discord_bot.core.engines.cookie_manager import CookieManager
     from discord_bot.core.engines.relationship_manager import RelationshipManager
 except ImportError:
@@ -30,6 +31,7 @@ except ImportError:
         end_battle, BattleState
     )
     from games.storage.game_storage_engine import GameStorageEngine
+    from games.storage.async_game_storage import AsyncGameStorage
     from core.engines.cookie_manager import CookieManager
     from core.engines.relationship_manager import RelationshipManager
 
@@ -44,6 +46,7 @@ class BattleCog(commands.Cog):
                  cookie_manager: CookieManager, relationship_manager: RelationshipManager):
         self.bot = bot
         self.storage = storage
+        self.db = AsyncGameStorage.for_engine(storage)
         self.cookie_manager = cookie_manager
         self.relationship_manager = relationship_manager
     
@@ -163,14 +166,14 @@ class BattleCog(commands.Cog):
         opponent_id = str(opponent.id)
         
         # Check if game is unlocked
-        if not self.storage.is_game_unlocked(challenger_id):
+        if not await self.db.is_game_unlocked(challenger_id):
             await interaction.response.send_message(
                 "🦛 You need to unlock the Pokemon game first! Use `/feed` to unlock it.",
                 ephemeral=True
             )
             return
         
-        if not self.storage.is_game_unlocked(opponent_id):
+        if not await self.db.is_game_unlocked(opponent_id):
             await interaction.response.send_message(
                 f"🦛 {opponent.display_name} hasn't unlocked the Pokemon game yet!",
                 ephemeral=True
@@ -209,8 +212,8 @@ class BattleCog(commands.Cog):
             return
         
         # Get Pokemon for both players
-        challenger_pokemon_list = self.storage.get_user_pokemon(challenger_id)
-        opponent_pokemon_list = self.storage.get_user_pokemon(opponent_id)
+        challenger_pokemon_list = await self.db.get_user_pokemon(challenger_id)
+        opponent_pokemon_list = await self.db.get_user_pokemon(opponent_id)
         
         if not challenger_pokemon_list:
             await interaction.response.send_message(
@@ -235,7 +238,7 @@ class BattleCog(commands.Cog):
         opponent_battle_poke = self._create_battle_pokemon(opponent_poke_data)
         
         # Spend cookies
-        success, cost = self.cookie_manager.spend_stamina(challenger_id, 'battle')
+        success, cost = await self.db.run(self.cookie_manager.spend_stamina, challenger_id, 'battle')
         if not success:
             await interaction.response.send_message(
                 "⚠️ Failed to spend cookies. Please try again.",
@@ -250,7 +253,7 @@ class BattleCog(commands.Cog):
         )
         
         # Record interaction
-        self.relationship_manager.record_interaction(challenger_id, 'game_action')
+        await self.db.run(self.relationship_manager.record_interaction, challenger_id, 'game_action')
         
         # Create battle start embed
         embed = self._create_battle_embed(battle, "⚔️ Battle Started!")
@@ -352,10 +355,10 @@ class BattleCog(commands.Cog):
             cookie_reward = BattleEngine.calculate_cookie_reward(winner_pokemon.level, loser_pokemon.level)
             
             # Award XP to winner's Pokemon
-            self.storage.update_pokemon_xp(winner_pokemon.pokemon_id, xp_reward)
+            await self.db.update_pokemon_xp(winner_pokemon.pokemon_id, xp_reward)
             
             # Award cookies to winner
-            self.storage.add_cookies(user_id, cookie_reward)
+            await self.db.add_cookies(user_id, cookie_reward)
             
             # Victory embed
             victory_embed = discord.Embed(
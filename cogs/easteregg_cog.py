@@ -16,12 +16,13 @@ Includes:
 from __future__ import annotations
 
 import aiohttp
+import contextlib
 import discord
 import random
 from datetime import datetime, timedelta
 from discord import app_commands
 from discord.ext import commands
-from typing import Optional, TYPE_CHECKING
+from typing import AsyncIterator, Optional, TYPE_CHECKING
 
 # Import GameCog to reference the shared cookies group
 from discord_bot.cogs.game_cog import GameCog
@@ -37,6 +38,7 @@ if TYPE_CHECKING:
     from discord_bot.core.engines.cookie_manager import CookieManager
     from discord_bot.core.engines.personality_engine import PersonalityEngine
     from discord_bot.games.storage.game_storage_engine import GameStorageEngine
+    from discord_bot.core.engines.http_client import HttpClientService
 
 
 class EasterEggCog(commands.Cog):
@@ -98,12 +100,14 @@ class EasterEggCog(commands.Cog):
     
     def __init__(self, bot: commands.Bot, relationship_manager: RelationshipManager,
                  cookie_manager: CookieManager, personality_engine: PersonalityEngine,
-                 storage: Optional[GameStorageEngine] = None):
+                 storage: Optional[GameStorageEngine] = None,
+                 http_client: Optional[HttpClientService] = None):
         self.bot = bot
         self.relationship_manager = relationship_manager
         self.cookie_manager = cookie_manager
         self.personality_engine = personality_engine
         self.storage = storage
+        self.http_client = http_client  # Shared pooled session for joke/fact/weather lookups
         self.active_trivia = {}  # Track active trivia sessions
         self.active_riddles = {}  # Track active riddle sessions
 
@@ -600,10 +604,19 @@ class EasterEggCog(commands.Cog):
             f"🤔 **Riddle Time!**\n{riddle_data['question']}\n\nReply with your answer!"
         )
 
+    @contextlib.asynccontextmanager
+    async def _http_session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Yield the shared pooled session, or a throwaway one when none was injected."""
+        if self.http_client is not None:
+            yield self.http_client.session()
+            return
+        async with aiohttp.ClientSession() as session:
+            yield session
+
     async def _fetch_joke(self) -> str:
         """Fetch a joke from an API."""
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._http_session() as session:
                 async with session.get('https://official-joke-api.appspot.com/random_joke') as resp:
                     if resp.status == 200:
                         data = await resp.json()
@@ -622,7 +635,7 @@ class EasterEggCog(commands.Cog):
     async def _fetch_cat_fact(self) -> str:
         """Fetch a cat fact from an API."""
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._http_session() as session:
                 async with session.get('https://catfact.ninja/fact') as resp:
                     if resp.status == 200:
                         data = await resp.json()
@@ -647,7 +660,7 @@ class EasterEggCog(commands.Cog):
         """Fetch weather information."""
         try:
             # Using wttr.in - no API key required
-            async with aiohttp.ClientSession() as session:
+            async with self._http_session() as session:
                 async with session.get(f'https://wttr.in/{location}?format=3') as resp:
                     if resp.status == 200:
                         text = await resp.text()
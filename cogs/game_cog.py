@@ -22,6 +22,7 @@ from discord_bot.core.utils import (
     is_allowed_channel,
     safe_send_interaction_response,
 )
+from discord_bot.games.storage.async_game_storage import AsyncGameStorage
 
 if TYPE_CHECKING:
     from discord_bot.games.pokemon_game import PokemonGame
@@ -61,6 +62,8 @@ class GameCog(commands.Cog):
         self.pokemon_game = pokemon_game
         self.pokemon_api = pokemon_api
         self.storage = storage
+        # Cog handlers await storage through the shared writer/reader pools.
+        self.db = AsyncGameStorage.for_engine(storage)
         self.cookie_manager = cookie_manager
         self.relationship_manager = relationship_manager
         self.personality_engine = personality_engine
@@ -101,11 +104,11 @@ class GameCog(commands.Cog):
         """Check if user has unlocked the game."""
         user_id = str(interaction.user.id)
         
-        if self.storage.is_game_unlocked(user_id):
+        if await self.db.is_game_unlocked(user_id):
             return True
         
         # Not unlocked - show how to unlock
-        total, current = self.storage.get_user_cookies(user_id)
+        total, current = await self.db.get_user_cookies(user_id)
         
         embed = discord.Embed(
             title="🦛 Pokemon Game Locked!",
@@ -138,7 +141,7 @@ class GameCog(commands.Cog):
         user_id = str(interaction.user.id)
         
         # Check if already unlocked
-        if self.storage.is_game_unlocked(user_id):
+        if await self.db.is_game_unlocked(user_id):
             await interaction.response.send_message(
                 "🦛 You've already fed me! The Pokemon game is unlocked! Use `/pokemonhelp` for info.",
                 ephemeral=True
@@ -147,7 +150,7 @@ class GameCog(commands.Cog):
         
         # Check eligibility
         if not self.cookie_manager.check_game_unlock_eligibility(user_id):
-            total, current = self.storage.get_user_cookies(user_id)
+            total, current = await self.db.get_user_cookies(user_id)
             await interaction.response.send_message(
                 f"🦛 You need 5 cookies to feed me! You have {current} 🍪\n"
                 "Keep interacting with me to earn more cookies!",
@@ -156,7 +159,7 @@ class GameCog(commands.Cog):
             return
         
         # Unlock the game
-        success = self.cookie_manager.unlock_game_with_cookies(user_id)
+        success = await self.db.run(self.cookie_manager.unlock_game_with_cookies, user_id)
         
         if not success:
             await interaction.response.send_message(
@@ -215,7 +218,7 @@ class GameCog(commands.Cog):
     async def pokemonhelp(self, interaction: discord.Interaction) -> None:
         """Show detailed Pokemon game help."""
         user_id = str(interaction.user.id)
-        is_unlocked = self.storage.is_game_unlocked(user_id)
+        is_unlocked = await self.db.is_game_unlocked(user_id)
         
         if not is_unlocked:
             await self._check_game_unlocked(interaction)
@@ -309,7 +312,7 @@ class GameCog(commands.Cog):
         relationship = self.relationship_manager.get_relationship_index(user_id)
         tier = self.relationship_manager.get_relationship_tier(user_id)
         luck = self.relationship_manager.get_luck_modifier(user_id)
-        user_data = self.storage.get_user_data(user_id)
+        user_data = await self.db.get_user_data(user_id)
         
         streak = user_data.get('daily_streak', 0) if user_data else 0
         
@@ -354,7 +357,7 @@ class GameCog(commands.Cog):
         )
         
         # Game status
-        game_status = "🎮 Unlocked" if self.storage.is_game_unlocked(user_id) else "🔒 Locked (need 5 🍪)"
+        game_status = "🎮 Unlocked" if await self.db.is_game_unlocked(user_id) else "🔒 Locked (need 5 🍪)"
         embed.add_field(
             name="Pokemon Game",
             value=game_status,
@@ -370,7 +373,7 @@ class GameCog(commands.Cog):
         await interaction.response.defer()
         
         # Get top 10 users
-        leaderboard_data = self.storage.get_cookie_leaderboard(limit=10)
+        leaderboard_data = await self.db.get_cookie_leaderboard(limit=10)
         
         if not leaderboard_data:
             await interaction.followup.send("No one has earned cookies yet! 🍪", ephemeral=True)
@@ -427,7 +430,7 @@ class GameCog(commands.Cog):
             return
         
         # Spend cookies
-        success, cost = self.cookie_manager.spend_stamina(user_id, 'catch')
+        success, cost = await self.db.run(self.cookie_manager.spend_stamina, user_id, 'catch')
         if not success:
             await interaction.response.send_message("⚠️ Failed to spend cookies. Try again!", ephemeral=True)
             return
@@ -438,10 +441,10 @@ class GameCog(commands.Cog):
         user_name = interaction.user.display_name
         
         # Record interaction
-        self.relationship_manager.record_interaction(user_id, 'game_action')
+        await self.db.run(self.relationship_manager.record_interaction, user_id, 'game_action')
         
         # Attempt catch
-        caught, pokemon = self.pokemon_game.attempt_catch(user_id, encounter)
+        caught, pokemon = await self.db.run(self.pokemon_game.attempt_catch, user_id, encounter)
         
         if pokemon:
             # Success!
@@ -458,7 +461,7 @@ class GameCog(commands.Cog):
             embed.add_field(name="ID", value=str(pokemon.pokemon_id), inline=True)
             
             # Try cookie reward
-            cookies = self.cookie_manager.try_award_cookies(user_id, 'game_action', self.personality_engine.get_mood())
+            cookies = await self.db.run(self.cookie_manager.try_award_cookies, user_id, 'game_action', self.personality_engine.get_mood())
             if cookies:
                 embed.set_footer(text=f"Bonus: +{cookies} 🍪")
             
@@ -467,7 +470,7 @@ class GameCog(commands.Cog):
             # Failed
             if not caught:
                 # Check if it was limit or catch failure
-                count = self.storage.get_pokemon_count_by_species(user_id, encounter.species)
+                count = await self.db.get_pokemon_count_by_species(user_id, encounter.species)
                 if count >= 3:
                     result_info = f"\U0001f99b A **{pokemon_name}** appeared, but you already have 3! Consider evolving one."
                 else:
@@ -499,7 +502,7 @@ class GameCog(commands.Cog):
             return
         
         # Spend cookies
-        success, cost = self.cookie_manager.spend_stamina(user_id, 'fish')
+        success, cost = await self.db.run(self.cookie_manager.spend_stamina, user_id, 'fish')
         if not success:
             await interaction.response.send_message("⚠️ Failed to spend cookies. Try again!", ephemeral=True)
             return
@@ -510,10 +513,10 @@ class GameCog(commands.Cog):
         user_name = interaction.user.display_name
         
         # Record interaction
-        self.relationship_manager.record_interaction(user_id, 'game_action')
+        await self.db.run(self.relationship_manager.record_interaction, user_id, 'game_action')
         
         # Attempt catch
-        caught, pokemon = self.pokemon_game.attempt_catch(user_id, encounter)
+        caught, pokemon = await self.db.run(self.pokemon_game.attempt_catch, user_id, encounter)
         
         if pokemon:
             # Success!
@@ -530,13 +533,13 @@ class GameCog(commands.Cog):
             embed.add_field(name="ID", value=str(pokemon.pokemon_id), inline=True)
             
             # Try cookie reward
-            cookies = self.cookie_manager.try_award_cookies(user_id, 'game_action', self.personality_engine.get_mood())
+            cookies = await self.db.run(self.cookie_manager.try_award_cookies, user_id, 'game_action', self.personality_engine.get_mood())
             if cookies:
                 embed.set_footer(text=f"Bonus: +{cookies} 🍪")
             
             await interaction.response.send_message(embed=embed)
         else:
-            count = self.storage.get_pokemon_count_by_species(user_id, encounter.species)
+            count = await self.db.get_pokemon_count_by_species(user_id, encounter.species)
             if count >= 3:
                 result_info = f"🎣 A **{pokemon_name}** bit the line, but you already have 3!"
             else:
@@ -568,7 +571,7 @@ class GameCog(commands.Cog):
             return
         
         # Spend stamina
-        success, cost = self.cookie_manager.spend_stamina(user_id, 'explore')
+        success, cost = await self.db.run(self.cookie_manager.spend_stamina, user_id, 'explore')
         if not success:
             await interaction.response.send_message("⚠️ Failed to spend cookies. Try again!", ephemeral=True)
             return
@@ -579,10 +582,10 @@ class GameCog(commands.Cog):
         user_name = interaction.user.display_name
         
         # Record interaction
-        self.relationship_manager.record_interaction(user_id, 'game_action')
+        await self.db.run(self.relationship_manager.record_interaction, user_id, 'game_action')
         
         # Attempt catch
-        caught, pokemon = self.pokemon_game.attempt_catch(user_id, encounter)
+        caught, pokemon = await self.db.run(self.pokemon_game.attempt_catch, user_id, encounter)
         
         if pokemon:
             # Success!
@@ -599,13 +602,13 @@ class GameCog(commands.Cog):
             embed.add_field(name="ID", value=str(pokemon.pokemon_id), inline=True)
             
             # Try cookie reward
-            cookies = self.cookie_manager.try_award_cookies(user_id, 'game_action', self.personality_engine.get_mood())
+            cookies = await self.db.run(self.cookie_manager.try_award_cookies, user_id, 'game_action', self.personality_engine.get_mood())
             if cookies:
                 embed.set_footer(text=f"Bonus: +{cookies} 🍪")
             
             await interaction.response.send_message(embed=embed)
         else:
-            count = self.storage.get_pokemon_count_by_species(user_id, encounter.species)
+            count = await self.db.get_pokemon_count_by_species(user_id, encounter.species)
             if count >= 3:
                 result_info = f"🌟 A **{pokemon_name}** appeared, but you already have 3!"
             else:
@@ -686,7 +689,7 @@ class GameCog(commands.Cog):
         
         # Check if user has enough cookies (2 for stamina + cookies for training)
         total_cost = 2 + cookies
-        _, current = self.storage.get_user_cookies(user_id)
+        _, current = await self.db.get_user_cookies(user_id)
         if current < total_cost:
             await interaction.response.send_message(
                 f"🦛 Not enough cookies! Need {total_cost} 🍪 (2 stamina + {cookies} for training)\nYou have: {current} 🍪",
@@ -695,7 +698,7 @@ class GameCog(commands.Cog):
             return
         
         # Train Pokemon
-        success, updated_pokemon = self.pokemon_game.train_pokemon(user_id, pokemon_id, cookies)
+        success, updated_pokemon = await self.db.run(self.pokemon_game.train_pokemon, user_id, pokemon_id, cookies)
         
         if not success or not updated_pokemon:
             await interaction.response.send_message("⚠️ Training failed! Check that the Pokemon ID is correct.", ephemeral=True)
@@ -754,8 +757,8 @@ class GameCog(commands.Cog):
             return
         
         # Evolve
-        success, evolved_pokemon, error_msg = self.pokemon_game.evolve_pokemon(
-            user_id, pokemon_id, duplicate_id
+        success, evolved_pokemon, error_msg = await self.db.run(
+            self.pokemon_game.evolve_pokemon, user_id, pokemon_id, duplicate_id
         )
         
         if not success or not evolved_pokemon:
@@ -847,7 +850,7 @@ class GameCog(commands.Cog):
     async def pokemon_info(self, interaction: discord.Interaction, pokemon_name: str) -> None:
         """Fetch Pokemon information using PokeAPI."""
         user_id = str(interaction.user.id)
-        self.relationship_manager.record_interaction(user_id, 'help_command')
+        await self.db.run(self.relationship_manager.record_interaction, user_id, 'help_command')
         
         data = self.pokemon_api.get_pokemon_data(pokemon_name)
         if data:
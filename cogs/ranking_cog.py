@@ -22,6 +22,9 @@ from discord import app_commands
 from discord.ext import commands
 
 from discord_bot.core import ui_groups
+from discord_bot.core.engines.provider_executor import ExecutorSaturatedError
+from discord_bot.core.engines.screenshot_cache import ScreenshotCache
+from discord_bot.core.engines.screenshot_intake import ScreenshotIntake, ScreenshotRejected
 from discord_bot.core.engines.screenshot_processor import RankingData, StageType
 from discord_bot.core.utils import find_bot_channel, is_admin_or_helper
 
@@ -85,11 +88,17 @@ class RankingCog(commands.Cog):
         bot: commands.Bot,
         processor: ScreenshotProcessor,
         storage: RankingStorageEngine,
-        kvk_tracker=None
+        kvk_tracker=None,
+        intake: Optional[ScreenshotIntake] = None,
     ):
         self.bot = bot
         self.processor = processor
         self.storage = storage
+        self.intake = (
+            intake
+            or getattr(bot, "screenshot_intake", None)
+            or ScreenshotIntake(http_client=getattr(bot, "http_client", None))
+        )
         self._rankings_channel_id = self._get_rankings_channel_id()
         self.kvk_tracker = kvk_tracker or getattr(bot, "kvk_tracker", None)
         loop = getattr(self.bot, "loop", None)
@@ -227,12 +236,11 @@ class RankingCog(commands.Cog):
         else:
             normalized_day = 6  # War stage aggregates into a single slot
 
-        content_type = (screenshot.content_type or "").lower()
-        if not content_type.startswith("image/"):
-            raise SubmissionValidationError("Please upload an image file (PNG, JPG, etc.).")
-
-        if screenshot.size and screenshot.size > 10 * 1024 * 1024:
-            raise SubmissionValidationError("Image too large. Please upload a screenshot under 10MB.")
+        # Declared type and size only; nothing is downloaded yet.
+        try:
+            self.intake.check_metadata(screenshot)
+        except ScreenshotRejected as exc:
+            raise SubmissionValidationError(str(exc))
 
         event_week = self._format_event_week_label(kvk_run)
         guild_id = str(interaction.guild_id) if interaction.guild else None
@@ -247,27 +255,26 @@ class RankingCog(commands.Cog):
             kvk_run_id=kvk_run.id,
         )
 
+        # Streamed under the byte cap; type and header are verified before any decode or OCR.
         try:
-            image_data = await screenshot.read()
-        except Exception:
-            raise SubmissionValidationError("Could not read the uploaded screenshot. Please try again.")
-
-        is_valid, error_msg = await self.processor.validate_screenshot(image_data)
-        if not is_valid:
-            self.storage.log_submission(
-                user_id,
-                guild_id,
-                "failed",
-                error_message=error_msg,
-            )
-            raise SubmissionValidationError(f"Screenshot validation failed: {error_msg}")
+            upload = await self.intake.read(screenshot)
+        except ScreenshotRejected as exc:
+            raise SubmissionValidationError(str(exc))
+        image_data = upload.data
 
+        # One OCR pass serves both validation and extraction. Cached OCR text is only
+        # reused within the declared slot: other days and stages share the layout.
         try:
-            ranking = await self.processor.process_screenshot(
+            analysis = await self.processor.analyze_screenshot(
                 image_data,
                 user_id,
                 interaction.user.name,
                 guild_id,
+                cache_scope=ScreenshotCache.scope(guild_id, (kvk_run.id, stage_type.value, normalized_day)),
+            )
+        except ExecutorSaturatedError:
+            raise SubmissionValidationError(
+                "The screenshot reader is busy right now. Please try again in a minute."
             )
         except Exception as exc:
             self.storage.log_submission(
@@ -280,6 +287,16 @@ class RankingCog(commands.Cog):
                 "An unexpected error occurred while processing the screenshot. Please try again."
             ) from exc
 
+        if not analysis.is_valid:
+            self.storage.log_submission(
+                user_id,
+                guild_id,
+                "failed",
+                error_message=analysis.error,
+            )
+            raise SubmissionValidationError(f"Screenshot validation failed: {analysis.error}")
+
+        ranking = analysis.ranking
         if not ranking:
             self.storage.log_submission(
                 user_id,
@@ -1410,7 +1427,8 @@ class RankingCog(commands.Cog):
 async def setup(
     bot: commands.Bot,
     processor: Optional[ScreenshotProcessor] = None,
-    storage: Optional[RankingStorageEngine] = None
+    storage: Optional[RankingStorageEngine] = None,
+    intake: Optional[ScreenshotIntake] = None,
 ):
     """Setup function for the cog."""
     if processor is None:
@@ -1423,6 +1441,6 @@ async def setup(
         storage = RankingStorageEngine(storage=game_storage)
     
     kvk_tracker = getattr(bot, "kvk_tracker", None)
-    await bot.add_cog(RankingCog(bot, processor, storage, kvk_tracker=kvk_tracker), override=True)
+    await bot.add_cog(RankingCog(bot, processor, storage, kvk_tracker=kvk_tracker, intake=intake), override=True)
 
 
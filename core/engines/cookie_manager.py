@@ -102,8 +102,9 @@ class CookieManager:
         # Get base drop rate
         base_rate = self.DROP_RATES.get(interaction_type, 0.10)
         
-        # Apply relationship bonus to drop rate
-        relationship_bonus = self.relationship_manager.get_cookie_drop_bonus(user_id)
+        # One relationship read drives both the drop bonus and the luck modifier
+        relationship = self.relationship_manager.get_relationship_index(user_id)
+        relationship_bonus = self.relationship_manager.cookie_drop_bonus_for(relationship)
         final_rate = min(1.0, base_rate + relationship_bonus)
         
         # Roll for cookie drop
@@ -111,7 +112,7 @@ class CookieManager:
             return None
         
         # Calculate cookie amount based on mood and luck
-        luck_modifier = self.relationship_manager.get_luck_modifier(user_id)
+        luck_modifier = self.relationship_manager.luck_modifier_for(relationship)
         min_cookies, max_cookies = self.MOOD_MULTIPLIERS.get(bot_mood, (1, 2))
         
         # Apply luck modifier
@@ -127,6 +128,13 @@ class CookieManager:
         
         return None
     
+    def award_cookies_bulk(self, awards: Dict[str, int]) -> Dict[str, tuple[int, int]]:
+        """Award fixed amounts to many users in one write; returns each user's (total, current)."""
+        awards = {user_id: amount for user_id, amount in awards.items() if amount > 0}
+        if not awards:
+            return {}
+        return self.storage.add_cookies_bulk(awards)
+
     def spend_stamina(self, user_id: str, action: str) -> tuple[bool, int]:
         """
         Spend stamina (cookies) for an action.
@@ -176,10 +184,7 @@ class CookieManager:
         Unlock game by feeding 5 cookies to the hippo.
         Returns True if successful, False if not enough cookies.
         """
-        if not self.check_game_unlock_eligibility(user_id):
-            return False
-        
-        # Spend 5 cookies
+        # spend_cookies only succeeds when the balance covers the cost
         if self.storage.spend_cookies(user_id, 5):
             self.storage.unlock_game(user_id)
             return True
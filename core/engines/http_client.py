@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+import logging
+
+import aiohttp
+
+logger = logging.getLogger("hippo_bot.http_client")
+
+
+class HttpClientService:
+    """
+    Process-wide pooled aiohttp client for outbound HTTP.
+
+    One `ClientSession` (created lazily inside the running loop) is shared by the
+    translation adapters, cogs and scrapers so keep-alive connections and resolved
+    DNS entries are reused instead of paying TCP/TLS setup on every call. The
+    connector enforces a global and a per-host connection limit; every request gets
+    the default timeout unless the caller passes its own. `IntegrationLoader` owns
+    the instance and closes it on shutdown.
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        keepalive_timeout: float = 30.0,
+        dns_cache_ttl: int = 300,
+        total_timeout: float = 15.0,
+        connect_timeout: float = 5.0,
+        user_agent: Optional[str] = "HippoBot/1.0",
+    ) -> None:
+        self.limit = max(0, int(limit))
+        self.limit_per_host = max(0, int(limit_per_host))
+        self.keepalive_timeout = float(keepalive_timeout)
+        self.dns_cache_ttl = int(dns_cache_ttl)
+        self.timeout = aiohttp.ClientTimeout(total=total_timeout, connect=connect_timeout)
+        self.user_agent = user_agent
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        self._stats: Dict[str, int] = {
+            "sessions_created": 0,
+            "requests": 0,
+            "errors": 0,
+            "connections_created": 0,
+            "connections_reused": 0,
+            "dns_cache_hits": 0,
+            "dns_cache_misses": 0,
+        }
+
+    # ----------------------
+    # Session lifecycle
+    # ----------------------
+
+    def session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use (must run inside the event loop)."""
+        if self._session is None or self._session.closed:
+            self._connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl,
+                use_dns_cache=True,
+            )
+            headers = {"User-Agent": self.user_agent} if self.user_agent else None
+            self._session = aiohttp.ClientSession(
+                connector=self._connector,
+                timeout=self.timeout,
+                headers=headers,
+                trace_configs=[self._trace_config()],
+            )
+            self._stats["sessions_created"] += 1
+            logger.debug(
+                "HTTP client session created (limit=%d, per_host=%d, keepalive=%.0fs)",
+                self.limit,
+                self.limit_per_host,
+                self.keepalive_timeout,
+            )
+        return self._session
+
+    @property
+    def closed(self) -> bool:
+        return self._session is None or self._session.closed
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            try:
+                await self._session.close()
+            except Exception:
+                logger.debug("Failed to close HTTP client session", exc_info=True)
+        self._session = None
+        self._connector = None
+
+    # ----------------------
+    # Stats
+    # ----------------------
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+
+        def _count(name: str):
+            async def _handler(_session: Any, _ctx: Any, _params: Any) -> None:
+                self._stats[name] += 1
+
+            return _handler
+
+        trace.on_request_start.append(_count("requests"))
+        trace.on_request_exception.append(_count("errors"))
+        trace.on_connection_create_end.append(_count("connections_created"))
+        trace.on_connection_reuseconn.append(_count("connections_reused"))
+        trace.on_dns_cache_hit.append(_count("dns_cache_hits"))
+        trace.on_dns_cache_miss.append(_count("dns_cache_misses"))
+        return trace
+
+    def stats(self) -> Dict[str, Any]:
+        """Return request/connection counters plus the current pool configuration."""
+        out: Dict[str, Any] = dict(self._stats)
+        out["limit"] = self.limit
+        out["limit_per_host"] = self.limit_per_host
+        out["open"] = not self.closed
+        connector = self._connector
+        # aiohttp keeps idle keep-alive connections in `_conns` and checked-out ones in `_acquired`.
+        out["idle_connections"] = (
+            sum(len(conns) for conns in getattr(connector, "_conns", {}).values()) if connector else 0
+        )
+        out["active_connections"] = len(getattr(connector, "_acquired", ())) if connector else 0
+        reuse_total = out["connections_created"] + out["connections_reused"]
+        out["reuse_ratio"] = (out["connections_reused"] / reuse_total) if reuse_total else 0.0
+        return out
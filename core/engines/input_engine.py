@@ -23,7 +23,7 @@ import logging
 import os
 import re
 import time
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import discord
 from discord.ext import commands
@@ -217,20 +217,19 @@ class InputEngine:
     ) -> Optional[str]:
         """
         Execute job via orchestrator (preferred) or fallback adapters.
+        The job is already planned (source detected), so it is run as-is rather than re-planned.
         Returns translated text or None.
         """
         orchestrator = getattr(self.processing, "orchestrator", None)
 
         if orchestrator:
             try:
-                wrapper = await self.context.translate_for_author_via_orchestrator(
-                    guild_id=guild_id,
-                    author_id=author_id,
-                    orchestrator=orchestrator,
-                    text=original_text,
+                resp = await self.context.run_planned_job(
+                    job,
+                    orchestrator,
+                    original_text=original_text,
                     channel_id=channel_id,
                 )
-                resp = wrapper.get("response") if isinstance(wrapper, dict) else None
                 if resp and getattr(resp, "text", None):
                     return resp.text
             except Exception as exc:
@@ -402,7 +401,8 @@ class InputEngine:
     ) -> None:
         """
         Send SOS alert to all guild members with language roles.
-        Messages are translated to each user's language role (if not English).
+        Messages are translated to each user's language role (if not English);
+        each distinct language is translated once and shared by its recipients.
         """
         if not self.roles:
             logger.debug("RoleManager not available, skipping SOS DMs")
@@ -420,11 +420,14 @@ class InputEngine:
         failed_dms = 0
 
         try:
-            # Iterate through all guild members
+            # Pass 1: resolve each recipient's target language (first language role)
+            recipients: List[Tuple[discord.Member, str]] = []
+            seen: Set[int] = set()
             for member in guild.members:
                 # Skip bots and the sender
-                if member.bot or member.id == sender.id or member.id in sent_users:
+                if member.bot or member.id == sender.id or member.id in seen:
                     continue
+                seen.add(member.id)
 
                 # Get user's language roles
                 try:
@@ -437,35 +440,32 @@ class InputEngine:
                 if not user_languages:
                     continue
 
-                # Determine target language (use first language role, default to English)
-                target_lang = user_languages[0] if user_languages else "en"
-                
-                # Translate message if not English and orchestrator is available
-                translated_msg = sos_message
-                if target_lang.lower() != "en" and orchestrator:
-                    try:
-                        translation, _, provider = await orchestrator.translate_text_for_user(
-                            text=sos_message,
-                            guild_id=guild.id,
-                            user_id=member.id,
-                            tgt_lang=target_lang
-                        )
-                        if translation:
-                            translated_msg = translation
-                            logger.debug(
-                                "Translated SOS for user %s to %s via %s",
-                                member.id, target_lang, provider
-                            )
-                        else:
-                            logger.warning(
-                                "Translation failed for user %s (target: %s), using original message",
-                                member.id, target_lang
-                            )
-                    except Exception as exc:
-                        logger.warning(
-                            "Error translating SOS for user %s to %s: %s",
-                            member.id, target_lang, exc
-                        )
+                recipients.append((member, (user_languages[0] or "en").lower()))
+
+            # Pass 2: translate once per distinct non-English language. Recipients
+            # sharing a language share one translation, so the call is attributed to
+            # the sender; per-recipient preferences are deliberately not consulted.
+            translations: Dict[str, str] = {}
+            targets = sorted({lang for _, lang in recipients if lang != "en"})
+            if targets and orchestrator:
+                try:
+                    fanned = await orchestrator.translate_to_many(
+                        sos_message, targets, guild_id=guild.id, user_id=sender.id
+                    )
+                except Exception as exc:
+                    logger.warning("Error translating SOS to %s: %s", ", ".join(targets), exc)
+                    fanned = {}
+                for lang in targets:
+                    translation, provider = fanned.get(lang, (None, None))
+                    if translation:
+                        translations[lang] = translation
+                        logger.debug("Translated SOS to %s via %s", lang, provider)
+                    else:
+                        logger.warning("Translation failed for target %s, using original message", lang)
+
+            # Pass 3: deliver
+            for member, target_lang in recipients:
+                translated_msg = translations.get(target_lang, sos_message)
 
                 # Send DM with translated message
                 try:
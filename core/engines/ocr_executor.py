@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import CancelledError as FutureCancelledError
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Deque, Dict, Optional, Tuple, TypeVar
+
+import asyncio
+import logging
+import multiprocessing
+import threading
+import time
+
+from discord_bot.core.engines.provider_executor import ExecutorSaturatedError
+
+logger = logging.getLogger("hippo_bot.ocr_executor")
+
+T = TypeVar("T")
+
+
+def _timed_call(fn: Callable[..., T], args: Tuple[Any, ...]) -> Tuple[float, T]:
+    """Worker-side wrapper: report when the job actually started so queue wait can be measured."""
+    return time.time(), fn(*args)
+
+
+class OcrExecutor:
+    """
+    Bounded process pool for CPU-bound OCR (Pillow + tesseract).
+
+    OCR holds the GIL for long stretches, so a thread pool would still stall the
+    event loop; jobs run in `max_workers` spawned processes instead. At most
+    `max_queue` jobs may wait for a worker; beyond that `run()` raises
+    `ExecutorSaturatedError` immediately so the caller can tell the user to retry.
+    A job exceeding its timeout is abandoned: a queued job is cancelled outright,
+    a running one keeps its worker until it finishes (the tesseract call itself is
+    given the same timeout so it ends shortly after).
+    """
+
+    def __init__(
+        self,
+        name: str = "ocr",
+        *,
+        max_workers: int = 2,
+        max_queue: int = 8,
+        default_timeout: Optional[float] = 30.0,
+        latency_window: int = 256,
+    ) -> None:
+        self.name = name
+        self.max_workers = max(1, int(max_workers))
+        self.max_queue = max(0, int(max_queue))
+        self.default_timeout = default_timeout
+        # spawn, not fork: the bot process owns SQLite writer threads and an event loop.
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._latencies: Deque[float] = deque(maxlen=max(1, int(latency_window)))
+        self._stats: Dict[str, float] = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "rejected": 0,
+            "timeouts": 0,
+            "cancelled": 0,
+            "peak_queue": 0,
+            "queue_wait_total": 0.0,
+            "started": 0,
+        }
+        self._closed = False
+
+    async def run(self, fn: Callable[..., T], *args: Any, timeout: Optional[float] = None) -> T:
+        """
+        Run `fn(*args)` in a worker process and await its result.
+
+        `fn` and its arguments must be picklable (module-level functions, bytes).
+        Raises `ExecutorSaturatedError` when the queue is full and
+        `asyncio.TimeoutError` when the job exceeds `timeout` (default `default_timeout`).
+        """
+        if self._closed:
+            raise ExecutorSaturatedError(f"{self.name} executor is shut down")
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_queue:
+                self._stats["rejected"] += 1
+                raise ExecutorSaturatedError(
+                    f"{self.name} executor saturated ({self._in_flight} jobs in flight)"
+                )
+            self._in_flight += 1
+            self._stats["submitted"] += 1
+            self._stats["peak_queue"] = max(self._stats["peak_queue"], self._in_flight - self.max_workers)
+
+        enqueued = time.time()
+        try:
+            future: Future = self._pool.submit(_timed_call, fn, args)
+        except Exception:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+
+        limit = self.default_timeout if timeout is None else timeout
+        try:
+            started, result = await asyncio.wait_for(asyncio.wrap_future(future), limit)
+        except asyncio.TimeoutError:
+            future.cancel()
+            self._stats["timeouts"] += 1
+            logger.warning("%s job timed out after %.1fs", self.name, limit)
+            raise
+        except (asyncio.CancelledError, FutureCancelledError):
+            future.cancel()
+            self._stats["cancelled"] += 1
+            raise
+        except Exception:
+            self._stats["failed"] += 1
+            raise
+
+        finished = time.time()
+        with self._lock:
+            self._stats["completed"] += 1
+            self._stats["started"] += 1
+            self._stats["queue_wait_total"] += max(0.0, started - enqueued)
+            self._latencies.append(finished - enqueued)
+        return result
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue depth, outcome counters and latency (submit to result) percentiles."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            started = self._stats["started"]
+            running = min(self._in_flight, self.max_workers)
+
+            def percentile(fraction: float) -> float:
+                if not latencies:
+                    return 0.0
+                return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1000
+
+            return {
+                "name": self.name,
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "queued": self._in_flight - running,
+                "running": running,
+                "submitted": int(self._stats["submitted"]),
+                "completed": int(self._stats["completed"]),
+                "failed": int(self._stats["failed"]),
+                "rejected": int(self._stats["rejected"]),
+                "timeouts": int(self._stats["timeouts"]),
+                "cancelled": int(self._stats["cancelled"]),
+                "peak_queue": int(self._stats["peak_queue"]),
+                "avg_queue_wait_ms": (self._stats["queue_wait_total"] / started * 1000) if started else 0.0,
+                "avg_latency_ms": (sum(latencies) / len(latencies) * 1000) if latencies else 0.0,
+                "p95_latency_ms": percentile(0.95),
+            }
+
+    def shutdown(self, *, wait: bool = False) -> None:
+        self._closed = True
+        self._pool.shutdown(wait=wait, cancel_futures=True)
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import List, Optional
 import discord
 
+from discord_bot.language_context.detectors.nlp_model import NLPProcessor
+
+# Discord rejects bot messages longer than this many characters.
+DISCORD_MESSAGE_LIMIT = 2000
+
 
 class OutputEngine:
     """
@@ -10,16 +15,26 @@ class OutputEngine:
     - DM to user
     - Channel messages
     - Ephemeral replies (UI engines may override/extend)
+
+    DMs and channel messages longer than Discord's limit are split at paragraph
+    boundaries and sent as consecutive messages.
     """
 
     def __init__(self, *, error_engine=None) -> None:
         self.error_engine = error_engine
+        self._splitter = NLPProcessor(max_input_chars=DISCORD_MESSAGE_LIMIT)
+
+    def _split(self, text: str) -> List[str]:
+        if len(text) <= DISCORD_MESSAGE_LIMIT:
+            return [text]
+        return list(self._splitter.split_into_chunks(text, max_size=DISCORD_MESSAGE_LIMIT))
 
     async def send_dm(self, user: discord.User | discord.Member, text: str) -> None:
         if not text:
             return
         try:
-            await user.send(text)
+            for part in self._split(text):
+                await user.send(part)
         except Exception as e:
             if self.error_engine:
                 await self.error_engine.log_error(e, context="send_dm")
@@ -28,7 +43,8 @@ class OutputEngine:
         if not text:
             return
         try:
-            await channel.send(text)
+            for part in self._split(text):
+                await channel.send(part)
         except Exception as e:
             if self.error_engine:
                 await self.error_engine.log_error(e, context="send_channel")
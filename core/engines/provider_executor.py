@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, TypeVar
+
+import asyncio
+import functools
+import logging
+import threading
+import time
+
+logger = logging.getLogger("hippo_bot.provider_executor")
+
+T = TypeVar("T")
+
+
+class ExecutorSaturatedError(RuntimeError):
+    """Raised when a provider executor's queue is full; the caller should fall back or fail fast."""
+
+
+class ProviderExecutor:
+    """
+    Bounded thread pool reserved for blocking provider SDKs (deep-translator, deepl).
+
+    Keeping these calls off the loop's default executor means a slow provider can
+    only exhaust its own `max_workers` threads instead of starving detection and
+    other `run_in_executor` users. At most `max_queue` calls may wait for a worker;
+    beyond that `run()` raises `ExecutorSaturatedError` immediately rather than
+    queueing unbounded work behind a stalled provider.
+    """
+
+    def __init__(self, name: str, *, max_workers: int = 4, max_queue: int = 32) -> None:
+        self.name = name
+        self.max_workers = max(1, int(max_workers))
+        self.max_queue = max(0, int(max_queue))
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=f"provider-{name}")
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._stats: Dict[str, float] = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "rejected": 0,
+            "peak_queue": 0,
+            "queue_wait_total": 0.0,
+        }
+        self._closed = False
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run `fn(*args, **kwargs)` on the pool and await its result."""
+        if self._closed:
+            raise ExecutorSaturatedError(f"{self.name} executor is shut down")
+        with self._lock:
+            if self._queued + self._running >= self.max_workers + self.max_queue:
+                self._stats["rejected"] += 1
+                raise ExecutorSaturatedError(
+                    f"{self.name} executor saturated ({self._running} running, {self._queued} queued)"
+                )
+            self._queued += 1
+            self._stats["submitted"] += 1
+            self._stats["peak_queue"] = max(self._stats["peak_queue"], self._queued)
+
+        enqueued = time.monotonic()
+        call = functools.partial(fn, *args, **kwargs)
+        state = {"started": False, "abandoned": False}
+
+        def _work() -> Any:
+            with self._lock:
+                if state["abandoned"]:
+                    return None
+                state["started"] = True
+                self._queued -= 1
+                self._running += 1
+                self._stats["queue_wait_total"] += time.monotonic() - enqueued
+            try:
+                return call()
+            finally:
+                with self._lock:
+                    self._running -= 1
+
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(self._pool, _work)
+        except asyncio.CancelledError:
+            # A call cancelled while still queued never reaches a worker; release its slot.
+            with self._lock:
+                if not state["started"]:
+                    state["abandoned"] = True
+                    self._queued -= 1
+            raise
+        except Exception:
+            self._stats["failed"] += 1
+            raise
+        self._stats["completed"] += 1
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue depth, worker utilisation and throughput counters."""
+        with self._lock:
+            started = self._stats["submitted"] - self._queued
+            return {
+                "name": self.name,
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "queued": self._queued,
+                "running": self._running,
+                "submitted": int(self._stats["submitted"]),
+                "completed": int(self._stats["completed"]),
+                "failed": int(self._stats["failed"]),
+                "rejected": int(self._stats["rejected"]),
+                "peak_queue": int(self._stats["peak_queue"]),
+                "avg_queue_wait_ms": (self._stats["queue_wait_total"] / started * 1000) if started else 0.0,
+            }
+
+    def shutdown(self, *, wait: bool = False) -> None:
+        self._closed = True
+        self._pool.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+import logging
+import time
+
+logger = logging.getLogger("hippo_bot.provider_health")
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def _ewma(previous: Optional[float], sample: float, alpha: float) -> float:
+    return sample if previous is None else (alpha * sample) + ((1 - alpha) * previous)
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open breaker for one translation provider.
+
+    Every attempt feeds an EWMA of latency (successes only) and of the error rate.
+    The circuit opens after `failure_threshold` consecutive failures, or once the
+    error-rate EWMA reaches `error_rate_threshold` with at least `min_samples`
+    observations. After `cooldown` seconds a single probe is let through
+    (half-open); its outcome closes the circuit or opens it for another cooldown.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        *,
+        failure_threshold: int = 5,
+        error_rate_threshold: float = 0.5,
+        min_samples: int = 10,
+        cooldown: float = 30.0,
+        alpha: float = 0.2,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.provider = provider
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.error_rate_threshold = float(error_rate_threshold)
+        self.min_samples = max(1, int(min_samples))
+        self.cooldown = float(cooldown)
+        self.alpha = float(alpha)
+        self._clock = clock
+
+        self.state = CLOSED
+        self.latency_ewma: Optional[float] = None
+        self.error_rate = 0.0
+        self.samples = 0
+        self.consecutive_failures = 0
+        self.trips = 0
+        self.rejected = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    # ----------------------
+    # Gatekeeping
+    # ----------------------
+
+    def _refresh(self) -> None:
+        if self.state == OPEN and self._clock() - self._opened_at >= self.cooldown:
+            self.state = HALF_OPEN
+            self._probe_in_flight = False
+            logger.info("Circuit for %s is half-open; allowing a probe", self.provider)
+
+    def available(self) -> bool:
+        """True when a call could currently be attempted (does not reserve a probe)."""
+        self._refresh()
+        if self.state == OPEN:
+            return False
+        if self.state == HALF_OPEN:
+            return not self._probe_in_flight
+        return True
+
+    def acquire(self) -> bool:
+        """Reserve permission for one call; in half-open state only one probe is allowed."""
+        if not self.available():
+            self.rejected += 1
+            return False
+        if self.state == HALF_OPEN:
+            self._probe_in_flight = True
+        return True
+
+    def release(self) -> None:
+        """Give back a reservation without an outcome (e.g. the call was cancelled)."""
+        self._probe_in_flight = False
+
+    # ----------------------
+    # Outcomes
+    # ----------------------
+
+    def record_success(self, latency: float) -> None:
+        self.samples += 1
+        self.latency_ewma = _ewma(self.latency_ewma, max(0.0, latency), self.alpha)
+        self.error_rate = _ewma(self.error_rate, 0.0, self.alpha)
+        self.consecutive_failures = 0
+        if self.state != CLOSED:
+            logger.info("Circuit for %s closed after successful probe", self.provider)
+        self.state = CLOSED
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self.samples += 1
+        self.error_rate = _ewma(self.error_rate, 1.0, self.alpha)
+        self.consecutive_failures += 1
+        self._probe_in_flight = False
+        if self.state == HALF_OPEN:
+            self._open("probe failed")
+        elif self.state == CLOSED and (
+            self.consecutive_failures >= self.failure_threshold
+            or (self.samples >= self.min_samples and self.error_rate >= self.error_rate_threshold)
+        ):
+            self._open(f"{self.consecutive_failures} consecutive failures, error rate {self.error_rate:.0%}")
+
+    def _open(self, reason: str) -> None:
+        self.state = OPEN
+        self._opened_at = self._clock()
+        self.trips += 1
+        logger.warning("Circuit for %s opened (%s); skipping it for %.0fs", self.provider, reason, self.cooldown)
+
+    def reset(self) -> None:
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.error_rate = 0.0
+        self._probe_in_flight = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        self._refresh()
+        remaining = 0.0
+        if self.state == OPEN:
+            remaining = max(0.0, self.cooldown - (self._clock() - self._opened_at))
+        return {
+            "state": self.state,
+            "latency_ewma": self.latency_ewma,
+            "error_rate": self.error_rate,
+            "samples": self.samples,
+            "consecutive_failures": self.consecutive_failures,
+            "trips": self.trips,
+            "rejected": self.rejected,
+            "retry_in": remaining,
+        }
+
+
+class ProviderHealth:
+    """
+    Registry of per-provider circuit breakers plus per-language-pair latency EWMAs.
+
+    The pair figures drive optional adaptive ordering: healthy tiers are sorted by
+    their expected cost for (src, tgt) once every candidate has been measured for
+    that pair; until then the configured quality order is kept.
+    """
+
+    def __init__(self, *, clock: Callable[[], float] = time.monotonic, **breaker_options: Any) -> None:
+        self._clock = clock
+        self._breaker_options = breaker_options
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._pairs: Dict[Tuple[str, str, str], Tuple[float, float]] = {}
+
+    def breaker(self, provider: str) -> CircuitBreaker:
+        breaker = self._breakers.get(provider)
+        if breaker is None:
+            breaker = CircuitBreaker(provider, clock=self._clock, **self._breaker_options)
+            self._breakers[provider] = breaker
+        return breaker
+
+    def record_success(self, provider: str, src: str, tgt: str, latency: float) -> None:
+        breaker = self.breaker(provider)
+        breaker.record_success(latency)
+        self._record_pair(provider, src, tgt, latency, failed=False)
+
+    def record_failure(self, provider: str, src: str, tgt: str) -> None:
+        self.breaker(provider).record_failure()
+        self._record_pair(provider, src, tgt, None, failed=True)
+
+    def _record_pair(self, provider: str, src: str, tgt: str, latency: Optional[float], *, failed: bool) -> None:
+        key = (provider, (src or "auto").lower(), (tgt or "").lower())
+        breaker = self.breaker(provider)
+        outcome = 1.0 if failed else 0.0
+        prev = self._pairs.get(key)
+        if prev is None:
+            # Failures before any success on this pair borrow the provider's overall latency.
+            seed = latency if latency is not None else breaker.latency_ewma
+            if seed is not None:
+                self._pairs[key] = (seed, outcome)
+            return
+        prev_latency, prev_errors = prev
+        new_latency = prev_latency if latency is None else _ewma(prev_latency, latency, breaker.alpha)
+        self._pairs[key] = (new_latency, _ewma(prev_errors, outcome, breaker.alpha))
+
+    def pair_cost(self, provider: str, src: str, tgt: str) -> Optional[float]:
+        """Expected latency for a pair, inflated by its error rate; None when unmeasured."""
+        entry = self._pairs.get((provider, (src or "auto").lower(), (tgt or "").lower()))
+        if entry is None:
+            return None
+        latency, errors = entry
+        return latency * (1.0 + 4.0 * errors)
+
+    def order(self, tiers: Sequence[Tuple[str, T]], src: str, tgt: str) -> List[Tuple[str, T]]:
+        costs = [self.pair_cost(provider, src, tgt) for provider, _ in tiers]
+        if any(cost is None for cost in costs):
+            return list(tiers)
+        ranked = sorted(zip(costs, range(len(tiers))), key=lambda item: (item[0], item[1]))
+        return [tiers[idx] for _, idx in ranked]
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {provider: breaker.snapshot() for provider, breaker in self._breakers.items()}
+
+    def reset(self, provider: Optional[str] = None) -> None:
+        """Close one provider's circuit, or every circuit when `provider` is None."""
+        for name, breaker in self._breakers.items():
+            if provider is None or name == provider:
+                breaker.reset()
@@ -10,6 +10,7 @@ from typing import Optional, List, Dict, Any, TYPE_CHECKING
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from discord_bot.core.engines.screenshot_cache import ScreenshotCache
 from discord_bot.core.engines.screenshot_processor import RankingData, StageType, RankingCategory
 
 if TYPE_CHECKING:
@@ -17,15 +18,23 @@ if TYPE_CHECKING:
 
 
 class RankingStorageEngine:
-    """Manages storage of Top Heroes event rankings."""
+    """
+    Manages storage of Top Heroes event rankings.
+
+    With a `ScreenshotCache`, saved and looked-up submission rows are remembered
+    per guild and run, so a player resubmitting for the same slot gets the
+    duplicate check answered without a query.
+    """
     
     def __init__(
         self,
     db_path: str = "data/event_rankings.db",
         storage: Optional["GameStorageEngine"] = None,
+        screenshot_cache: Optional[ScreenshotCache] = None,
     ):
         self.db_path = db_path
         self.storage = storage
+        self.screenshot_cache = screenshot_cache
         self._ensure_tables()
     
     def _get_connection(self) -> sqlite3.Connection:
@@ -130,6 +139,15 @@ class RankingStorageEngine:
         Returns:
             ID of saved ranking
         """
+        ranking_id = self._insert_ranking(ranking)
+        if self.screenshot_cache is not None:
+            self.screenshot_cache.remember_submission(
+                ScreenshotCache.scope(ranking.guild_id, ranking.kvk_run_id or ranking.event_week),
+                {"id": ranking_id, **ranking.to_dict()},
+            )
+        return ranking_id
+
+    def _insert_ranking(self, ranking: RankingData) -> int:
         if self.storage:
             return self.storage.save_event_ranking(ranking)  # type: ignore[attr-defined]
         conn = self._get_connection()
@@ -177,6 +195,25 @@ class RankingStorageEngine:
         Returns:
             Existing ranking dict if duplicate, None if no duplicate
         """
+        scope = ScreenshotCache.scope(guild_id, kvk_run_id if kvk_run_id is not None else event_week)
+        if self.screenshot_cache is not None:
+            cached = self.screenshot_cache.find_submission(scope, user_id, stage_type.value, day_number)
+            if cached is not None:
+                return cached
+        row = self._find_duplicate_submission(user_id, guild_id, event_week, stage_type, day_number, kvk_run_id)
+        if row is not None and self.screenshot_cache is not None:
+            self.screenshot_cache.remember_submission(scope, row)
+        return row
+
+    def _find_duplicate_submission(
+        self,
+        user_id: str,
+        guild_id: str,
+        event_week: str,
+        stage_type: StageType,
+        day_number: int,
+        kvk_run_id: Optional[int],
+    ) -> Optional[Dict[str, Any]]:
         if self.storage:
             return self.storage.check_duplicate_event_submission(
                 user_id, guild_id, event_week, stage_type, day_number, kvk_run_id  # type: ignore[attr-defined]
@@ -216,6 +253,23 @@ class RankingStorageEngine:
         Returns:
             True if updated, False if not found
         """
+        updated = self._update_ranking_row(ranking_id, rank, score, screenshot_url)
+        if self.screenshot_cache is not None:
+            if updated:
+                self.screenshot_cache.update_submission(
+                    ranking_id, rank=rank, score=score, screenshot_url=screenshot_url
+                )
+            else:
+                self.screenshot_cache.forget_submission(ranking_id)
+        return updated
+
+    def _update_ranking_row(
+        self,
+        ranking_id: int,
+        rank: int,
+        score: int,
+        screenshot_url: Optional[str],
+    ) -> bool:
         if self.storage:
             return self.storage.update_event_ranking(  # type: ignore[attr-defined]
                 ranking_id,
@@ -360,18 +414,21 @@ class RankingStorageEngine:
         processor = ScreenshotProcessor()
         return processor._get_current_event_week()
     
-    def delete_old_event_weeks(self, weeks_to_keep: int = 4) -> int:
+    def delete_old_event_weeks(self, weeks_to_keep: int = 4, batch_size: int = 500) -> int:
         """
         Delete event weeks older than specified weeks.
         
         Args:
             weeks_to_keep: Number of recent weeks to keep (default 4 = 1 month)
+            batch_size: Rows deleted per transaction
             
         Returns:
             Number of rankings deleted
         """
+        if self.screenshot_cache is not None:
+            self.screenshot_cache.clear()
         if self.storage:
-            return self.storage.prune_event_weeks(weeks_to_keep)  # type: ignore[attr-defined]
+            return self.storage.prune_event_weeks(weeks_to_keep, batch_size)  # type: ignore[attr-defined]
         conn = self._get_connection()
         try:
             # Get all unique event weeks
@@ -388,14 +445,7 @@ class RankingStorageEngine:
             # Delete old weeks
             weeks_to_delete = all_weeks[weeks_to_keep:]
             placeholders = ','.join(['?'] * len(weeks_to_delete))
-            
-            cursor = conn.execute(f"""
-                DELETE FROM event_rankings
-                WHERE event_week IN ({placeholders})
-            """, weeks_to_delete)
-            
-            conn.commit()
-            return cursor.rowcount
+            return self._delete_in_batches(conn, f"event_week IN ({placeholders})", weeks_to_delete, batch_size)
         finally:
             self._maybe_close(conn)
     
@@ -502,18 +552,34 @@ class RankingStorageEngine:
         finally:
             self._maybe_close(conn)
     
-    def delete_old_rankings(self, days: int = 30) -> int:
+    def delete_old_rankings(self, days: int = 30, batch_size: int = 500) -> int:
         """Delete rankings older than specified days."""
+        if self.screenshot_cache is not None:
+            self.screenshot_cache.clear()
         if self.storage:
-            return self.storage.delete_old_event_rankings(days)  # type: ignore[attr-defined]
+            return self.storage.delete_old_event_rankings(days, batch_size)  # type: ignore[attr-defined]
         conn = self._get_connection()
         try:
             cutoff = datetime.utcnow() - timedelta(days=days)
-            cursor = conn.execute("""
-                DELETE FROM event_rankings
-                WHERE submitted_at < ?
-            """, (cutoff.isoformat(),))
-            conn.commit()
-            return cursor.rowcount
+            return self._delete_in_batches(conn, "submitted_at < ?", [cutoff.isoformat()], batch_size)
         finally:
             self._maybe_close(conn)
+
+    @staticmethod
+    def _delete_in_batches(conn: sqlite3.Connection, condition: str, params: List[Any], batch_size: int) -> int:
+        """Delete matching rankings in short rowid-bounded transactions instead of one long one."""
+        deleted = 0
+        while True:
+            lo, hi = conn.execute(f"""
+                SELECT MIN(id), MAX(id) FROM (
+                    SELECT id FROM event_rankings WHERE {condition} ORDER BY id LIMIT ?
+                )
+            """, (*params, max(1, int(batch_size)))).fetchone()
+            if lo is None:
+                return deleted
+            cursor = conn.execute(
+                f"DELETE FROM event_rankings WHERE id BETWEEN ? AND ? AND {condition}",
+                (lo, hi, *params),
+            )
+            conn.commit()
+            deleted += cursor.rowcount
@@ -63,14 +63,11 @@ class RelationshipManager:
         """
         Record an interaction and update relationship index.
         Returns the new relationship index.
+
+        Changes are staged in the storage user-state cache and reach SQLite in
+        the next batched flush.
         """
-        # Ensure user exists
-        self.storage.add_user(user_id)
-        
-        # Get current user data
-        user_data = self.storage.get_user_data(user_id)
-        if not user_data:
-            return self.BASELINE_RELATIONSHIP
+        user_data = self.storage.get_user_state(user_id)
         
         current_relationship = user_data['relationship_index']
         if user_data.get('total_interactions', 0) == 0 and current_relationship < self.BASELINE_RELATIONSHIP:
@@ -86,45 +83,42 @@ class RelationshipManager:
         new_relationship = min(100, current_relationship + gain)
         
         # Check for daily streak bonus
-        daily_streak = self._check_daily_streak(user_data)
+        daily_streak, last_daily_check = self._check_daily_streak(user_data)
         
-        # Update storage
-        self.storage.update_relationship(user_id, new_relationship, daily_streak)
-        self.storage.increment_interactions(user_id, interaction_type, cookies_earned)
+        # Stage the update
+        now = datetime.utcnow().isoformat()
+        self.storage.stage_user_state(
+            user_id,
+            relationship_index=new_relationship,
+            daily_streak=daily_streak,
+            last_daily_check=last_daily_check,
+            last_interaction=now,
+            relationship_anchor_at=now,
+        )
+        self.storage.stage_interaction(user_id, interaction_type, cookies_earned)
         self._update_best_friend(user_id)
 
         return new_relationship
     
     def get_relationship_index(self, user_id: str) -> int:
         """Get current relationship index with decay applied."""
-        self.storage.add_user(user_id)
-        user_data = self.storage.get_user_data(user_id)
-        
-        if not user_data:
-            return self.BASELINE_RELATIONSHIP
+        user_data = self.storage.get_user_state(user_id)
 
         relationship_value = user_data['relationship_index']
+        anchor_time = self._get_anchor_time(user_data)
 
         if user_data.get('total_interactions', 0) == 0 and relationship_value < self.BASELINE_RELATIONSHIP:
-            self.storage.update_relationship(
-                user_id,
-                self.BASELINE_RELATIONSHIP,
-                touch_last_interaction=False,
-                touch_anchor=True,
-            )
             relationship_value = self.BASELINE_RELATIONSHIP
-            user_data = self.storage.get_user_data(user_id) or user_data
+            anchor_time = datetime.utcnow()
 
-        anchor_time = self._get_anchor_time(user_data)
         decayed_value = self._apply_decay(anchor_time, relationship_value)
         recovered_value = self._apply_recovery(anchor_time, decayed_value)
 
         if recovered_value != user_data['relationship_index']:
-            self.storage.update_relationship(
+            self.storage.stage_user_state(
                 user_id,
-                recovered_value,
-                touch_last_interaction=False,
-                touch_anchor=True,
+                relationship_index=recovered_value,
+                relationship_anchor_at=datetime.utcnow().isoformat(),
             )
 
         return recovered_value
@@ -134,45 +128,49 @@ class RelationshipManager:
         Calculate luck modifier based on relationship (0.5 to 1.5 multiplier).
         Higher relationship = better luck for cookie rewards and XP gains.
         """
-        relationship = self.get_relationship_index(user_id)
-        # Map 0-100 relationship to a narrower 0.5-1.2 range
-        return 0.5 + (relationship / 140.0)
+        return self.luck_modifier_for(self.get_relationship_index(user_id))
     
     def get_cookie_drop_bonus(self, user_id: str) -> float:
         """
         Get cookie drop rate bonus based on relationship (0% to +50%).
         """
-        relationship = self.get_relationship_index(user_id)
+        return self.cookie_drop_bonus_for(self.get_relationship_index(user_id))
+
+    @staticmethod
+    def luck_modifier_for(relationship: int) -> float:
+        """Luck modifier for an already-fetched relationship index."""
+        # Map 0-100 relationship to a narrower 0.5-1.2 range
+        return 0.5 + (relationship / 140.0)
+
+    @staticmethod
+    def cookie_drop_bonus_for(relationship: int) -> float:
+        """Drop rate bonus for an already-fetched relationship index."""
         # Map 0-100 relationship to 0-0.4 bonus drop rate
         return relationship / 250.0
     
-    def _check_daily_streak(self, user_data: dict) -> int:
-        """Check and update daily login streak."""
+    def _check_daily_streak(self, user_data: dict) -> tuple[int, Optional[str]]:
+        """Return the daily login streak and the last_daily_check value to store."""
         last_check_str = user_data.get('last_daily_check')
         current_streak = user_data.get('daily_streak', 0)
+        now = datetime.utcnow()
         
         if not last_check_str:
             # First time checking
-            self.storage.update_daily_check(user_data['user_id'])
-            return 1
+            return 1, now.isoformat()
         
         last_check = datetime.fromisoformat(last_check_str)
-        now = datetime.utcnow()
         days_diff = (now - last_check).days
         
         if days_diff >= 1:
-            # Update daily check
-            self.storage.update_daily_check(user_data['user_id'])
-            
             if days_diff == 1:
                 # Consecutive day - increment streak
-                return current_streak + 1
+                return current_streak + 1, now.isoformat()
             else:
                 # Streak broken - reset to 1
-                return 1
+                return 1, now.isoformat()
         
         # Same day - return current streak
-        return current_streak
+        return current_streak, last_check_str
     
     def _apply_decay(self, anchor_time: datetime, current_relationship: int) -> int:
         """Apply relationship decay for inactivity."""
@@ -0,0 +1,175 @@
+"""
+Recent-screenshot cache for ranking submissions.
+
+During KVK players re-upload the same screenshot after a typo or a timeout.
+The cache remembers, per scope:
+
+ - OCR results keyed by the SHA-1 of the upload, so a byte-identical
+   resubmission skips OCR. The ranking cog scopes these per submission slot,
+   ``(guild_id, (run, stage, day))``.
+ - the ranking row each submission slot (user, stage, day) last produced, so
+   ``RankingStorageEngine.check_duplicate_submission`` can answer from memory;
+   these are scoped per ``(guild_id, run)``
+
+Only exact byte matches are reused. Ranking panels share one layout, so a
+screenshot with a corrected rank or score looks almost identical to the one
+it replaces; anything but the same bytes is read again. Only positive slot
+answers are served from memory: a row deleted behind the cache's back makes
+the ranking cog's update miss, and it falls back to an insert.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Hashable, Optional, Tuple
+
+Scope = Tuple[str, Hashable]
+Slot = Tuple[str, str, Optional[int]]
+
+
+def digest(image_data: bytes) -> str:
+    """Exact-duplicate key for raw upload bytes."""
+    return hashlib.sha1(image_data).hexdigest()
+
+
+@dataclass
+class CachedScreenshot:
+    """One OCR result: image dimensions and text, as returned by the OCR worker."""
+    user_id: str
+    digest: str
+    width: int
+    height: int
+    text: str
+
+
+class _ScopeEntries:
+    __slots__ = ("screenshots", "slots")
+
+    def __init__(self, per_scope: int) -> None:
+        self.screenshots: Deque[CachedScreenshot] = deque(maxlen=per_scope)
+        self.slots: "OrderedDict[Slot, Dict[str, Any]]" = OrderedDict()
+
+
+class ScreenshotCache:
+    """
+    Bounded LRU of scopes, each holding recent OCR results and submission rows.
+
+    Parameters:
+        max_scopes: scopes kept (run scopes plus per-slot OCR scopes); the least recently used is dropped.
+        per_scope: OCR results and submission slots kept per scope.
+    """
+
+    def __init__(self, max_scopes: int = 128, per_scope: int = 256) -> None:
+        self.max_scopes = max(1, int(max_scopes))
+        self.per_scope = max(1, int(per_scope))
+        self._lock = threading.Lock()
+        self._scopes: "OrderedDict[Scope, _ScopeEntries]" = OrderedDict()
+        self._by_ranking_id: Dict[int, Tuple[Scope, Slot]] = {}
+        self._stats = {"exact_hits": 0, "misses": 0, "slot_hits": 0, "slot_misses": 0}
+
+    @staticmethod
+    def scope(guild_id: Optional[str], run_key: Hashable) -> Scope:
+        """Scope key for a guild and a run key: a KVK run id (or event week), or a submission slot."""
+        return (str(guild_id or "0"), run_key)
+
+    # ------------------------------------------------------------------
+    # OCR results
+    # ------------------------------------------------------------------
+    def find_exact(self, scope: Scope, image_digest: str) -> Optional[CachedScreenshot]:
+        """Cached OCR result for byte-identical upload bytes; counts a miss otherwise."""
+        with self._lock:
+            entries = self._touch(scope, create=False)
+            if entries is not None:
+                for entry in entries.screenshots:
+                    if entry.digest == image_digest:
+                        self._stats["exact_hits"] += 1
+                        return entry
+            self._stats["misses"] += 1
+            return None
+
+    def store(self, scope: Scope, entry: CachedScreenshot) -> None:
+        with self._lock:
+            self._touch(scope, create=True).screenshots.append(entry)
+
+    # ------------------------------------------------------------------
+    # Submission slots
+    # ------------------------------------------------------------------
+    def find_submission(self, scope: Scope, user_id: str, stage_type: str, day_number: Optional[int]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entries = self._touch(scope, create=False)
+            row = entries.slots.get((user_id, stage_type, day_number)) if entries is not None else None
+            self._stats["slot_hits" if row else "slot_misses"] += 1
+            return dict(row) if row else None
+
+    def remember_submission(self, scope: Scope, row: Dict[str, Any]) -> None:
+        """Record the ranking row a slot now holds (``row`` needs id, user_id, stage_type, day_number)."""
+        slot = (str(row["user_id"]), row["stage_type"], row.get("day_number"))
+        with self._lock:
+            entries = self._touch(scope, create=True)
+            previous = entries.slots.pop(slot, None)
+            if previous is not None:
+                self._by_ranking_id.pop(previous.get("id"), None)
+            entries.slots[slot] = dict(row)
+            if row.get("id") is not None:
+                self._by_ranking_id[row["id"]] = (scope, slot)
+            while len(entries.slots) > self.per_scope:
+                _, evicted = entries.slots.popitem(last=False)
+                self._by_ranking_id.pop(evicted.get("id"), None)
+
+    def update_submission(self, ranking_id: int, **changes: Any) -> None:
+        """Apply column changes to a remembered row, if it is cached."""
+        with self._lock:
+            located = self._by_ranking_id.get(ranking_id)
+            if located is None:
+                return
+            scope, slot = located
+            entries = self._scopes.get(scope)
+            row = entries.slots.get(slot) if entries is not None else None
+            if row is not None:
+                row.update(changes)
+
+    def forget_submission(self, ranking_id: int) -> None:
+        with self._lock:
+            located = self._by_ranking_id.pop(ranking_id, None)
+            if located is None:
+                return
+            scope, slot = located
+            entries = self._scopes.get(scope)
+            if entries is not None:
+                entries.slots.pop(slot, None)
+
+    # ------------------------------------------------------------------
+    # Housekeeping
+    # ------------------------------------------------------------------
+    def _touch(self, scope: Scope, *, create: bool) -> Optional[_ScopeEntries]:
+        entries = self._scopes.get(scope)
+        if entries is None:
+            if not create:
+                return None
+            entries = self._scopes[scope] = _ScopeEntries(self.per_scope)
+            while len(self._scopes) > self.max_scopes:
+                _, dropped = self._scopes.popitem(last=False)
+                for row in dropped.slots.values():
+                    self._by_ranking_id.pop(row.get("id"), None)
+        self._scopes.move_to_end(scope)
+        return entries
+
+    def clear(self) -> None:
+        with self._lock:
+            self._scopes.clear()
+            self._by_ranking_id.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the number of cached screenshots and slots."""
+        with self._lock:
+            lookups = self._stats["exact_hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "scopes": len(self._scopes),
+                "screenshots": sum(len(entries.screenshots) for entries in self._scopes.values()),
+                "slots": sum(len(entries.slots) for entries in self._scopes.values()),
+                "hit_ratio": self._stats["exact_hits"] / lookups if lookups else 0.0,
+            }
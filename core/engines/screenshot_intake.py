@@ -0,0 +1,255 @@
+"""
+Size-guarded, streaming intake for ranking screenshot uploads.
+
+An upload is checked in order of cost, and rejected at the first failure:
+
+ 1. attachment metadata: declared content type and size, before any byte is fetched
+ 2. magic bytes of the first chunk: the payload really is PNG, JPEG or WebP
+ 3. the image header, parsed lazily by Pillow once enough bytes are buffered:
+    format and pixel dimensions, so an oversized image stops downloading early
+ 4. the byte cap while streaming: the buffer never grows past ``max_bytes`` even
+    when the metadata or ``Content-Length`` lied
+
+Only then are the bytes handed to OCR. Bytes are streamed from the attachment URL
+through the shared `HttpClientService`; without one the attachment is read whole
+(still behind the metadata and header checks). ``peak_bytes`` in :meth:`ScreenshotIntake.stats`
+is the largest buffer any single submission held.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+from discord_bot.core.engines.screenshot_processor import MAX_DIMENSION, MIN_DIMENSION
+
+logger = logging.getLogger("hippo_bot.screenshot_intake")
+
+MAX_SCREENSHOT_BYTES = 10 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+# Enough for the PNG/WebP header and a JPEG SOF behind typical EXIF data.
+HEADER_PROBE_BYTES = 64 * 1024
+
+ALLOWED_CONTENT_TYPES = {"image/png": "PNG", "image/jpeg": "JPEG", "image/jpg": "JPEG", "image/webp": "WEBP"}
+
+
+def sniff_format(head: bytes) -> Optional[str]:
+    """Image format from the leading magic bytes, or None if it is not an accepted one."""
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "PNG"
+    if head.startswith(b"\xff\xd8\xff"):
+        return "JPEG"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "WEBP"
+    return None
+
+
+def probe_header(data: bytes) -> Optional[Tuple[str, int, int]]:
+    """
+    Parse only the image header: ``(format, width, height)``.
+
+    ``Image.open`` is lazy and decodes no pixels. Returns None when ``data`` is
+    too short to hold the header yet.
+    """
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            width, height = image.size
+            return image.format, width, height
+    except Exception:
+        return None
+
+
+class ScreenshotRejected(Exception):
+    """An upload failed intake; ``str(exc)`` is safe to show the user."""
+
+    def __init__(self, message: str, reason: str) -> None:
+        super().__init__(message)
+        self.reason = reason
+
+
+@dataclass
+class ScreenshotUpload:
+    """Bytes that passed intake, with the header facts checked on the way."""
+    data: bytes
+    format: str
+    width: Optional[int]
+    height: Optional[int]
+
+
+class ScreenshotIntake:
+    """
+    Fetch ranking screenshots with size, type and header checks ahead of OCR.
+
+    Parameters:
+        http_client: shared `HttpClientService`; when None, ``attachment.read()`` is used.
+        max_bytes: largest upload accepted, and the most any one submission buffers.
+        chunk_size: streaming read size.
+    """
+
+    def __init__(
+        self,
+        http_client: Any = None,
+        *,
+        max_bytes: int = MAX_SCREENSHOT_BYTES,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        self.http_client = http_client
+        self.max_bytes = max(1, int(max_bytes))
+        self.chunk_size = max(1024, int(chunk_size))
+        self._lock = threading.Lock()
+        self._stats: Dict[str, int] = {
+            "accepted": 0,
+            "rejected": 0,
+            "bytes_read": 0,
+            "bytes_skipped": 0,
+            "peak_bytes": 0,
+        }
+        self._rejections: Dict[str, int] = {}
+
+    # ------------------------------------------------------------------
+    # Checks
+    # ------------------------------------------------------------------
+    def check_metadata(self, attachment: Any) -> None:
+        """Reject on the declared content type and size alone; nothing is downloaded."""
+        content_type = (getattr(attachment, "content_type", None) or "").split(";")[0].strip().lower()
+        if content_type not in ALLOWED_CONTENT_TYPES:
+            self._reject("content_type", getattr(attachment, "size", 0))
+        size = getattr(attachment, "size", None) or 0
+        if size > self.max_bytes:
+            self._reject("size", size)
+
+    def _check_header(self, header: Tuple[str, int, int], declared_size: int) -> None:
+        image_format, width, height = header
+        if image_format not in ALLOWED_CONTENT_TYPES.values():
+            self._reject("format", declared_size)
+        if width < MIN_DIMENSION or height < MIN_DIMENSION:
+            self._reject("too_small", declared_size)
+        if width > MAX_DIMENSION or height > MAX_DIMENSION:
+            self._reject("dimensions", declared_size)
+
+    # ------------------------------------------------------------------
+    # Intake
+    # ------------------------------------------------------------------
+    async def read(self, attachment: Any) -> ScreenshotUpload:
+        """
+        Check, stream and verify one attachment.
+
+        Raises:
+            ScreenshotRejected: the upload is unusable; nothing was passed to OCR.
+        """
+        self.check_metadata(attachment)
+        declared_size = getattr(attachment, "size", None) or 0
+        state = _IntakeState(declared_size)
+        try:
+            if self.http_client is not None:
+                await self._stream(attachment.url, state)
+            else:
+                self._feed(state, await attachment.read())
+        except ScreenshotRejected:
+            raise
+        except Exception:
+            logger.debug("Screenshot download failed", exc_info=True)
+            self._reject("download", declared_size - state.buffer.tell())
+        finally:
+            self._record_peak(state)
+
+        data = state.buffer.getvalue()
+        if not data:
+            self._reject("download", 0)
+        if state.format is None:
+            state.format = sniff_format(data[:12])
+            if state.format is None:
+                self._reject("format", 0)
+        if state.header is None and HAS_PIL:
+            state.header = probe_header(data)
+            if state.header is None:
+                self._reject("format", 0)
+            self._check_header(state.header, 0)
+
+        with self._lock:
+            self._stats["accepted"] += 1
+        _, width, height = state.header or (state.format, None, None)
+        return ScreenshotUpload(data, state.format, width, height)
+
+    async def _stream(self, url: str, state: "_IntakeState") -> None:
+        async with self.http_client.session().get(url) as response:
+            response.raise_for_status()
+            length = response.headers.get("Content-Length")
+            if length and length.isdigit() and int(length) > self.max_bytes:
+                self._reject("size", int(length))
+            async for chunk in response.content.iter_chunked(self.chunk_size):
+                self._feed(state, chunk)
+
+    def _feed(self, state: "_IntakeState", chunk: bytes) -> None:
+        """Append a chunk, enforcing the byte cap and the early magic/header checks."""
+        buffered = state.buffer.tell()
+        if buffered + len(chunk) > self.max_bytes:
+            self._reject("size", max(0, state.declared_size - buffered))
+        state.buffer.write(chunk)
+        buffered += len(chunk)
+        if len(state.head) >= HEADER_PROBE_BYTES:
+            return
+        state.head += chunk[:HEADER_PROBE_BYTES - len(state.head)]
+        remaining = max(0, state.declared_size - buffered)
+
+        if state.format is None and len(state.head) >= 12:
+            state.format = sniff_format(bytes(state.head[:12]))
+            if state.format is None:
+                self._reject("format", remaining)
+        if HAS_PIL and len(state.head) >= HEADER_PROBE_BYTES:
+            # One early attempt; if the header sits further in, it is parsed once complete.
+            state.header = probe_header(bytes(state.head))
+            if state.header is not None:
+                self._check_header(state.header, remaining)
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+    def _reject(self, reason: str, skipped_bytes: int = 0) -> None:
+        with self._lock:
+            self._stats["rejected"] += 1
+            self._stats["bytes_skipped"] += max(0, int(skipped_bytes or 0))
+            self._rejections[reason] = self._rejections.get(reason, 0) + 1
+        raise ScreenshotRejected(_REJECTION_MESSAGES[reason].format(max_mb=self.max_bytes // (1024 * 1024)), reason)
+
+    def _record_peak(self, state: "_IntakeState") -> None:
+        with self._lock:
+            self._stats["bytes_read"] += state.buffer.tell()
+            self._stats["peak_bytes"] = max(self._stats["peak_bytes"], state.buffer.tell())
+
+    def stats(self) -> Dict[str, Any]:
+        """Return accept/reject counters, rejections by reason and byte accounting."""
+        with self._lock:
+            return {**self._stats, "max_bytes": self.max_bytes, "rejections": dict(self._rejections)}
+
+
+class _IntakeState:
+    __slots__ = ("declared_size", "buffer", "head", "format", "header")
+
+    def __init__(self, declared_size: int) -> None:
+        self.declared_size = declared_size
+        # BytesIO.getvalue() hands over its buffer without a copy, so the peak is one upload.
+        self.buffer = io.BytesIO()
+        # Copy of the first HEADER_PROBE_BYTES for the magic and header checks.
+        self.head = bytearray()
+        self.format: Optional[str] = None
+        self.header: Optional[Tuple[str, int, int]] = None
+
+
+_REJECTION_MESSAGES = {
+    "content_type": "Please upload a PNG, JPG or WebP screenshot.",
+    "format": "That file is not a readable PNG, JPG or WebP image.",
+    "size": "Image too large. Please upload a screenshot under {max_mb}MB.",
+    "too_small": "Image too small. Please provide a clear screenshot.",
+    "dimensions": "Image too large. Please provide a normal screenshot.",
+    "download": "Could not read the uploaded screenshot. Please try again.",
+}
@@ -2,12 +2,18 @@
 Screenshot Processing Engine for Top Heroes Rankings.
 
 Uses OCR (Optical Character Recognition) to extract ranking data from game screenshots.
+
+Each screenshot goes through one pipeline: the worker process crops the region
+of interest, converts to grayscale, downscales and binarizes the image, then runs
+Tesseract once with a tuned page-segmentation mode and character whitelist. The
+resulting text is validated and parsed, once, in the bot process.
 """
 
 from __future__ import annotations
+import asyncio
 import io
 import re
-from typing import Optional, Dict, Any, List
+from typing import Hashable, NamedTuple, Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -24,6 +30,136 @@ try:
 except ImportError:
     HAS_OCR = False
 
+from discord_bot.core.engines.ocr_executor import OcrExecutor
+from discord_bot.core.engines.screenshot_cache import CachedScreenshot, ScreenshotCache, digest
+from discord_bot.core.engines.provider_executor import ExecutorSaturatedError
+
+# Accepted screenshot dimensions (pixels, either side)
+MIN_DIMENSION = 100
+MAX_DIMENSION = 4000
+
+# OCR preprocessing: fractional (left, top, right, bottom) region of interest that
+# drops the phone status and navigation bars, the width text is scaled down to,
+# and the gray level splitting text from background.
+OCR_REGION = (0.0, 0.06, 1.0, 0.94)
+OCR_MAX_WIDTH = 1280
+OCR_THRESHOLD = 150
+_BINARIZE = [0] * (OCR_THRESHOLD + 1) + [255] * (255 - OCR_THRESHOLD)
+_BINARIZE_INVERTED = [255 - level for level in _BINARIZE]
+
+# Ranking panels are one uniform block of text (psm 6); the whitelist keeps
+# Tesseract from guessing glyphs the parsers never look at.
+OCR_WHITELIST = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789#[](),:."
+OCR_CONFIG = f"--psm 6 -c tessedit_char_whitelist={OCR_WHITELIST}"
+
+
+def preprocess_for_ocr(image: "Image.Image") -> "Image.Image":
+    """Crop, grayscale, downscale and binarize a screenshot for Tesseract."""
+    width, height = image.size
+    left, top, right, bottom = OCR_REGION
+    image = image.crop((int(width * left), int(height * top), int(width * right), int(height * bottom)))
+    image = image.convert("L")
+    if image.width > OCR_MAX_WIDTH:
+        scaled_height = max(1, round(image.height * OCR_MAX_WIDTH / image.width))
+        image = image.resize((OCR_MAX_WIDTH, scaled_height), Image.BILINEAR, reducing_gap=2.0)
+    histogram = image.histogram()
+    if sum(histogram[: OCR_THRESHOLD + 1]) > image.width * image.height // 2:
+        # Light text on a dark panel; Tesseract reads dark-on-light best.
+        return image.point(_BINARIZE_INVERTED, "1")
+    # Bilevel output also shrinks the temporary PNG pytesseract hands to the binary.
+    return image.point(_BINARIZE, "1")
+
+
+def _read_screenshot(image_data: bytes, timeout: float = 0) -> Tuple[int, int, str]:
+    """
+    Return ``(width, height, text)`` for raw image bytes.
+
+    Executed inside an OcrExecutor worker process. Images outside the accepted
+    dimensions are not OCR'd (``text`` is empty) since validation rejects them.
+    """
+    image = Image.open(io.BytesIO(image_data))
+    width, height = image.size
+    if not (MIN_DIMENSION <= width <= MAX_DIMENSION and MIN_DIMENSION <= height <= MAX_DIMENSION):
+        return width, height, ""
+    # JPEG only: decode at a reduced scale when the full resolution is never used.
+    image.draft("L", (OCR_MAX_WIDTH, height * OCR_MAX_WIDTH // width))
+    text = pytesseract.image_to_string(preprocess_for_ocr(image), config=OCR_CONFIG, timeout=timeout)
+    return width, height, text
+
+
+# Field patterns, precompiled, in priority order: the first pattern that
+# matches anywhere wins. Ordered early-exit searches beat one fused
+# alternation here since the alternation has to scan the whole text.
+_RANK_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (r"#(\d+)", r"rank[:\s]+(\d+)", r"overall[:\s]+(\d+)")
+)
+_SCORE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (r"points?[:\s]+([\d,]+)", r"score[:\s]+([\d,]+)", r"(\d{1,3}(?:,\d{3})+)")
+)
+_PLAYER_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (r"#\d+\s+\[([A-Z]{3})\]\s+(\w+)", r"#\d+\s+\(([A-Z]{3})\)\s+(\w+)", r"#\d+\s+([A-Z]{3})\s+(\w+)")
+)
+_NAME_FALLBACK = re.compile(r"#\d+.*?([A-Z][a-z]+)")
+_TAG_PATTERNS = tuple(
+    re.compile(pattern) for pattern in (r"\[([A-Z]{3})\]", r"\(([A-Z]{3})\)", r"#\d+\s+([A-Z]{3})\s")
+)
+_DAY = re.compile(r"\b([1-5])\b")
+_VALIDATION_KEYWORDS = ("rank", "stage", "points", "score")
+
+
+class RankingFields(NamedTuple):
+    """Ranking values parsed from OCR text; any may be missing."""
+    rank: Optional[int]
+    score: Optional[int]
+    player_name: Optional[str]
+    guild_tag: Optional[str]
+
+
+def parse_ranking_fields(text: str) -> RankingFields:
+    """
+    Parse rank, score, player name and guild tag from OCR text.
+
+    Precedence matches the screenshot layouts: ``#N`` before ``rank:``/``overall:``
+    for the rank; ``points:`` then ``score:`` then any comma-grouped number for the
+    score (largest value above 1000 wins); bracketed, then parenthesised, then bare
+    tags for the guild tag and player name.
+    """
+    rank = None
+    for pattern in _RANK_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            rank = int(match.group(1))
+            break
+
+    score = None
+    for pattern in _SCORE_PATTERNS:
+        values = [int(digits) for digits in (raw.replace(",", "") for raw in pattern.findall(text)) if digits]
+        values = [value for value in values if value > 1000]
+        if values:
+            score = max(values)
+            break
+
+    player_name = None
+    for pattern in _PLAYER_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            player_name = match.group(2)
+            break
+    else:
+        fallback = _NAME_FALLBACK.search(text)
+        player_name = fallback.group(1) if fallback else None
+
+    guild_tag = None
+    for pattern in _TAG_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            guild_tag = match.group(1)
+            break
+    return RankingFields(rank, score, player_name, guild_tag)
+
 
 class StageType(Enum):
     """Event stage types."""
@@ -90,22 +226,83 @@ class RankingData:
         }
 
 
+@dataclass
+class ScreenshotAnalysis:
+    """Outcome of one OCR pass: validation result plus the parsed ranking, if any."""
+    is_valid: bool
+    error: str
+    text: str = ""
+    ranking: Optional[RankingData] = None
+    cache_hit: Optional[str] = None  # "exact" when OCR was skipped
+
+
 class ScreenshotProcessor:
-    """Process Top Heroes ranking screenshots to extract data."""
-    
-    def __init__(self):
+    """
+    Process Top Heroes ranking screenshots to extract data.
+
+    OCR runs on an `OcrExecutor` process pool so a submission never blocks the
+    event loop. Pass a shared executor to bound OCR across the whole bot; without
+    one a small private pool is created on first use. When the pool is full the
+    OCR methods raise `ExecutorSaturatedError` so callers can ask the user to retry.
+    With a `ScreenshotCache`, `analyze_screenshot` reuses the OCR result of a
+    byte-identical upload in the same cache scope instead of running OCR.
+    """
+
+    def __init__(
+        self,
+        ocr_executor: Optional[OcrExecutor] = None,
+        *,
+        ocr_timeout: float = 30.0,
+        screenshot_cache: Optional[ScreenshotCache] = None,
+    ):
         self.available = HAS_PIL and HAS_OCR
-    
+        self.ocr_executor = ocr_executor
+        self.ocr_timeout = ocr_timeout
+        self.screenshot_cache = screenshot_cache
+        # Module-level (picklable) callable run in the worker: bytes -> (width, height, text)
+        self.ocr_function = _read_screenshot
+
+    async def _read(self, image_data: bytes) -> Tuple[int, int, str]:
+        """Preprocess and OCR image bytes on the OCR process pool."""
+        if self.ocr_executor is None:
+            self.ocr_executor = OcrExecutor("ocr", max_workers=1, max_queue=4)
+        return await self.ocr_executor.run(
+            self.ocr_function,
+            image_data,
+            self.ocr_timeout,
+            timeout=self.ocr_timeout + 5 if self.ocr_timeout else None,
+        )
+
+    async def _read_cached(
+        self,
+        image_data: bytes,
+        user_id: str,
+        cache_scope: Optional[Hashable],
+    ) -> Tuple[int, int, str, Optional[str]]:
+        """`_read`, answered from the screenshot cache when this upload was seen before."""
+        cache = self.screenshot_cache
+        if cache is None or cache_scope is None:
+            return (*await self._read(image_data), None)
+
+        image_digest = await asyncio.to_thread(digest, image_data)
+        entry = cache.find_exact(cache_scope, image_digest)
+        if entry is not None:
+            return entry.width, entry.height, entry.text, "exact"
+
+        width, height, text = await self._read(image_data)
+        cache.store(cache_scope, CachedScreenshot(user_id, image_digest, width, height, text))
+        return width, height, text, None
+
     def _get_current_event_week(self, submitted_at: Optional[datetime] = None) -> str:
         """
         Get current event week in YYYY-WW format.
-        
+
         Events run Monday-Sunday (7 days: 5 event days + 1 war day + 1 rest).
         Week starts on Monday.
-        
+
         Args:
             submitted_at: Optional datetime, defaults to now
-            
+
         Returns:
             Event week string like "2025-43"
         """
@@ -113,7 +310,52 @@ class ScreenshotProcessor:
         # ISO week starts on Monday (1=Monday, 7=Sunday)
         year, week, _ = dt.isocalendar()
         return f"{year}-{week:02d}"
-        
+
+    async def analyze_screenshot(
+        self,
+        image_data: bytes,
+        user_id: str,
+        username: str,
+        guild_id: Optional[str] = None,
+        *,
+        cache_scope: Optional[Hashable] = None
+    ) -> ScreenshotAnalysis:
+        """
+        Validate a screenshot and extract its ranking data from a single OCR pass.
+
+        Args:
+            image_data: Raw image bytes
+            user_id: Discord user ID
+            username: Discord username
+            guild_id: Discord guild ID
+            cache_scope: `ScreenshotCache.scope(...)` to dedupe within; None disables the cache
+
+        Returns:
+            ScreenshotAnalysis; ``ranking`` is None when the text lacks a rank or score
+
+        Raises:
+            ExecutorSaturatedError: the OCR pool is full; ask the user to retry shortly.
+        """
+        if not self.available:
+            return ScreenshotAnalysis(False, "OCR not available. Install Pillow and pytesseract.")
+
+        try:
+            width, height, text, cache_hit = await self._read_cached(image_data, user_id, cache_scope)
+        except ExecutorSaturatedError:
+            raise
+        except asyncio.TimeoutError:
+            return ScreenshotAnalysis(
+                False, "Reading the screenshot took too long. Please try a smaller or clearer image."
+            )
+        except Exception as e:
+            return ScreenshotAnalysis(False, f"Error processing image: {str(e)}")
+
+        error = self._validation_error(width, height, text)
+        if error:
+            return ScreenshotAnalysis(False, error, text, cache_hit=cache_hit)
+        ranking = self._build_ranking(text, user_id, username, guild_id)
+        return ScreenshotAnalysis(True, "", text, ranking, cache_hit)
+
     async def process_screenshot(
         self,
         image_data: bytes,
@@ -123,59 +365,55 @@ class ScreenshotProcessor:
     ) -> Optional[RankingData]:
         """
         Process a screenshot and extract ranking data.
-        
+
         Args:
             image_data: Raw image bytes
             user_id: Discord user ID
             username: Discord username
             guild_id: Discord guild ID
-            
+
         Returns:
             RankingData if successful, None if processing fails
         """
         if not self.available:
             raise RuntimeError("PIL or pytesseract not installed. Install with: pip install Pillow pytesseract")
-        
+
         try:
-            # Load image
-            image = Image.open(io.BytesIO(image_data))
-            
-            # Extract text from image
-            text = pytesseract.image_to_string(image)
-            
-            # Parse the extracted text
-            stage_type = self._extract_stage_type(text)
-            day_number = self._extract_day_number(text)
-            category = self._get_category_from_day(day_number) if day_number else RankingCategory.UNKNOWN
-            rank = self._extract_rank(text)
-            score = self._extract_score(text)
-            player_name = self._extract_player_name(text)
-            guild_tag = self._extract_guild_tag(text)
-            
-            if rank is None or score is None:
-                return None
-            
-            # Get current event week
-            event_week = self._get_current_event_week(datetime.utcnow())
-            
-            return RankingData(
-                user_id=user_id,
-                username=username,
-                guild_tag=guild_tag,
-                event_week=event_week,
-                stage_type=stage_type,
-                day_number=day_number,
-                category=category,
-                rank=rank,
-                score=score,
-                player_name=player_name,
-                submitted_at=datetime.utcnow(),
-                guild_id=guild_id
-            )
-            
+            _, _, text = await self._read(image_data)
+            return self._build_ranking(text, user_id, username, guild_id)
+        except ExecutorSaturatedError:
+            raise
         except Exception:
             return None
-    
+
+    def _build_ranking(
+        self,
+        text: str,
+        user_id: str,
+        username: str,
+        guild_id: Optional[str]
+    ) -> Optional[RankingData]:
+        """Turn OCR text into RankingData, or None without a rank and score."""
+        fields = parse_ranking_fields(text)
+        if fields.rank is None or fields.score is None:
+            return None
+
+        day_number = self._extract_day_number(text)
+        return RankingData(
+            user_id=user_id,
+            username=username,
+            guild_tag=fields.guild_tag,
+            event_week=self._get_current_event_week(datetime.utcnow()),
+            stage_type=self._extract_stage_type(text),
+            day_number=day_number,
+            category=self._get_category_from_day(day_number) if day_number else RankingCategory.UNKNOWN,
+            rank=fields.rank,
+            score=fields.score,
+            player_name=fields.player_name,
+            submitted_at=datetime.utcnow(),
+            guild_id=guild_id
+        )
+
     def _extract_stage_type(self, text: str) -> StageType:
         """Extract stage type from OCR text."""
         text_lower = text.lower()
@@ -184,16 +422,12 @@ class ScreenshotProcessor:
         elif 'war stage' in text_lower:
             return StageType.WAR
         return StageType.UNKNOWN
-    
+
     def _extract_day_number(self, text: str) -> Optional[int]:
-        """Extract which day of the event (1-5)."""
-        # Look for day indicators - buttons labeled 1-5
-        for day in range(1, 6):
-            # Look for patterns like "day 1", "1", etc.
-            if re.search(rf'\b{day}\b', text):
-                return day
-        return None
-    
+        """Extract which day of the event (1-5): the lowest standalone digit present."""
+        days = _DAY.findall(text)
+        return int(min(days)) if days else None
+
     def _get_category_from_day(self, day_number: Optional[int]) -> RankingCategory:
         """Map day number to category."""
         category_map = {
@@ -204,134 +438,37 @@ class ScreenshotProcessor:
             5: RankingCategory.TROOP_TRAINING
         }
         return category_map.get(day_number, RankingCategory.UNKNOWN)
-    
-    def _extract_guild_tag(self, text: str) -> Optional[str]:
-        """
-        Extract 3-letter guild tag from player name.
-        
-        Format: "#10435 [TAO] Mars" -> "TAO"
-        """
-        # Look for 3-letter tags in brackets or parentheses
-        tag_patterns = [
-            r'\[([A-Z]{3})\]',  # [TAO]
-            r'\(([A-Z]{3})\)',  # (TAO)
-            r'#\d+\s+([A-Z]{3})\s',  # #10435 TAO Mars
-        ]
-        
-        for pattern in tag_patterns:
-            match = re.search(pattern, text)
-            if match:
-                return match.group(1)
-        
-        return None
-    
-    def _extract_player_name(self, text: str) -> Optional[str]:
-        """
-        Extract player name from screenshot.
-        
-        Format: "#10435 [TAO] Mars" -> "Mars"
-        """
-        # Look for pattern: #number [TAG] Name
-        name_patterns = [
-            r'#\d+\s+\[([A-Z]{3})\]\s+(\w+)',  # #10435 [TAO] Mars
-            r'#\d+\s+\(([A-Z]{3})\)\s+(\w+)',  # #10435 (TAO) Mars
-            r'#\d+\s+([A-Z]{3})\s+(\w+)',  # #10435 TAO Mars
-        ]
-        
-        for pattern in name_patterns:
-            match = re.search(pattern, text)
-            if match:
-                # Return the name (last group)
-                return match.group(match.lastindex)
-        
-        # Fallback: look for any name-like text after numbers
-        fallback = re.search(r'#\d+.*?([A-Z][a-z]+)', text)
-        if fallback:
-            return fallback.group(1)
-        
-        return None
-    
-    def _extract_rank(self, text: str) -> Optional[int]:
-        """Extract overall rank number."""
-        # Look for rank patterns like "#10435" or "Rank: 10435"
-        rank_patterns = [
-            r'#(\d+)',
-            r'rank[:\s]+(\d+)',
-            r'overall[:\s]+(\d+)',
-        ]
-        
-        for pattern in rank_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                try:
-                    return int(match.group(1))
-                except ValueError:
-                    continue
-        
-        return None
-    
-    def _extract_score(self, text: str) -> Optional[int]:
-        """Extract score/points."""
-        # Look for large numbers that represent scores
-        # Scores in your screenshots are like: 28,200,103 or 87,653,088
-        score_patterns = [
-            r'points?[:\s]+([\d,]+)',
-            r'score[:\s]+([\d,]+)',
-            r'(\d{1,3}(?:,\d{3})+)',  # Numbers with commas
-        ]
-        
-        for pattern in score_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                # Get the largest number (likely the score)
-                scores = []
-                for match in matches:
-                    try:
-                        score = int(match.replace(',', ''))
-                        if score > 1000:  # Filter out small numbers
-                            scores.append(score)
-                    except ValueError:
-                        continue
-                
-                if scores:
-                    return max(scores)
-        
-        return None
-    
+
+    def _validation_error(self, width: int, height: int, text: str) -> str:
+        """Return why a screenshot is unusable, or an empty string if it looks like a ranking."""
+        if width < MIN_DIMENSION or height < MIN_DIMENSION:
+            return "Image too small. Please provide a clear screenshot."
+
+        if width > MAX_DIMENSION or height > MAX_DIMENSION:
+            return "Image too large. Please provide a normal screenshot."
+
+        if not text or len(text.strip()) < 10:
+            return "Could not read text from image. Please provide a clearer screenshot."
+
+        # Check for ranking-related keywords
+        text_lower = text.lower()
+        if not any(keyword in text_lower for keyword in _VALIDATION_KEYWORDS):
+            return "Screenshot doesn't appear to contain ranking data."
+
+        return ""
+
     async def validate_screenshot(self, image_data: bytes) -> tuple[bool, str]:
         """
         Validate if screenshot contains ranking data.
-        
+
+        Prefer `analyze_screenshot` when the ranking is needed too; it reuses the
+        same OCR pass.
+
         Returns:
             (is_valid, error_message)
+
+        Raises:
+            ExecutorSaturatedError: the OCR pool is full; ask the user to retry shortly.
         """
-        if not self.available:
-            return False, "OCR not available. Install Pillow and pytesseract."
-        
-        try:
-            image = Image.open(io.BytesIO(image_data))
-            
-            # Check image size (should be reasonable)
-            width, height = image.size
-            if width < 100 or height < 100:
-                return False, "Image too small. Please provide a clear screenshot."
-            
-            if width > 4000 or height > 4000:
-                return False, "Image too large. Please provide a normal screenshot."
-            
-            # Try to extract text
-            text = pytesseract.image_to_string(image)
-            
-            if not text or len(text.strip()) < 10:
-                return False, "Could not read text from image. Please provide a clearer screenshot."
-            
-            # Check for ranking-related keywords
-            keywords = ['rank', 'stage', 'points', 'score']
-            text_lower = text.lower()
-            if not any(keyword in text_lower for keyword in keywords):
-                return False, "Screenshot doesn't appear to contain ranking data."
-            
-            return True, ""
-            
-        except Exception as e:
-            return False, f"Error processing image: {str(e)}"
+        analysis = await self.analyze_screenshot(image_data, "", "")
+        return analysis.is_valid, analysis.error
@@ -7,9 +7,10 @@ This is a template - you'll need to customize based on available APIs or website
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any
 import aiohttp
 import json
 
@@ -21,7 +22,10 @@ logger = logging.getLogger("hippo_bot.event_scraper")
 class TopHeroesEventScraper:
     """Scraper for Top Heroes game events."""
     
-    def __init__(self):
+    def __init__(self, http_client: Optional[Any] = None):
+        # Shared pooled HttpClientService; a per-call session is used when absent
+        self.http_client = http_client
+
         # These would need to be actual Top Heroes API endpoints
         # Check if Top Heroes has:
         # - Official API
@@ -87,11 +91,19 @@ class TopHeroesEventScraper:
         logger.info("Scraped %d events for guild %d", len(reminders), guild_id)
         return reminders
     
+    @contextlib.asynccontextmanager
+    async def _http_session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        if self.http_client is not None:
+            yield self.http_client.session()
+            return
+        async with aiohttp.ClientSession() as session:
+            yield session
+
     async def _scrape_from_api(self) -> List[Dict[str, Any]]:
         """Scrape events from official Top Heroes API."""
         events = []
         
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             for event_type, endpoint in self.event_endpoints.items():
                 try:
                     url = f"{self.api_base_url}{endpoint}"
@@ -161,7 +173,7 @@ class TopHeroesEventScraper:
             "https://topheroes.com/news"
         ]
         
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             for url in urls_to_check:
                 try:
                     async with session.get(url, timeout=10) as response:
@@ -299,9 +311,11 @@ class TopHeroesEventScraper:
 
 
 # Helper function to set up automatic scraping
-async def setup_auto_scraping(event_engine: Any, guilds: List[int], interval_hours: int = 6):
+async def setup_auto_scraping(
+    event_engine: Any, guilds: List[int], interval_hours: int = 6, http_client: Optional[Any] = None
+):
     """Set up automatic event scraping for specified guilds."""
-    scraper = TopHeroesEventScraper()
+    scraper = TopHeroesEventScraper(http_client=http_client)
     
     async def scraping_loop():
         while True:
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import asyncio
+import logging
+import time
+import unicodedata
+from pathlib import Path
+
+import aiosqlite
+
+logger = logging.getLogger("hippo_bot.translation_cache")
+
+CacheKey = Tuple[str, str, str, str]
+
+
+def normalize_cache_text(text: str) -> str:
+    """
+    Normalize text for cache keys: NFKC, spaces and tabs collapsed within each
+    line, case preserved. Line breaks are kept; they shape the translation.
+    """
+    lines = unicodedata.normalize("NFKC", text or "").splitlines()
+    return "\n".join(" ".join(line.split()) for line in lines).strip("\n")
+
+
+class TranslationCache:
+    """
+    Two-level cache for translation results.
+
+      L1: in-process LRU with TTL, bounded by `max_entries`
+      L2: optional SQLite table that survives restarts (`db_path=None` disables it)
+
+    Keys are (normalized text, src, tgt, provider policy); values are
+    (translated_text, provider_id). L2 failures are logged and treated as misses
+    so the translation path never breaks because of the cache. An L2 hit refreshes
+    the row's `last_access` at most once per `touch_interval` seconds, so repeat
+    hits stay read-only.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 2048,
+        ttl: float = 60 * 60 * 24,
+        db_path: Optional[str] = None,
+        persistent_ttl: float = 60 * 60 * 24 * 30,
+        max_persistent_entries: int = 50_000,
+        prune_every: int = 256,
+        touch_interval: float = 60 * 60,
+    ) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.ttl = float(ttl)
+        self.db_path = db_path
+        self.persistent_ttl = float(persistent_ttl)
+        self.max_persistent_entries = max(1, int(max_persistent_entries))
+        self.prune_every = max(1, int(prune_every))
+        self.touch_interval = max(0.0, float(touch_interval))
+
+        self._l1: "OrderedDict[CacheKey, Tuple[str, str, float]]" = OrderedDict()
+        self._db: Optional[aiosqlite.Connection] = None
+        self._db_lock = asyncio.Lock()
+        self._db_failed = False
+        self._writes_since_prune = 0
+
+        self._stats: Dict[str, int] = {
+            "hits_memory": 0,
+            "hits_persistent": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "writes": 0,
+        }
+
+    # ----------------------
+    # Keys
+    # ----------------------
+
+    @staticmethod
+    def make_key(text: str, src: Optional[str], tgt: str, policy: str) -> CacheKey:
+        return (normalize_cache_text(text), (src or "auto").lower(), (tgt or "").lower(), policy)
+
+    # ----------------------
+    # Public API
+    # ----------------------
+
+    async def get(self, text: str, src: Optional[str], tgt: str, policy: str) -> Optional[Tuple[str, str]]:
+        """Return (translated_text, provider) or None on miss."""
+        key = self.make_key(text, src, tgt, policy)
+        if not key[0]:
+            return None
+
+        hit = self._l1_get(key)
+        if hit is not None:
+            self._stats["hits_memory"] += 1
+            return hit
+
+        row = await self._l2_get(key)
+        if row is not None:
+            self._stats["hits_persistent"] += 1
+            self._l1_put(key, row[0], row[1])
+            return row
+
+        self._stats["misses"] += 1
+        return None
+
+    async def set(self, text: str, src: Optional[str], tgt: str, policy: str, translated: str, provider: str) -> None:
+        key = self.make_key(text, src, tgt, policy)
+        if not key[0] or not translated:
+            return
+        self._stats["writes"] += 1
+        self._l1_put(key, translated, provider)
+        await self._l2_put(key, translated, provider)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters plus derived hit ratio and current sizes."""
+        hits = self._stats["hits_memory"] + self._stats["hits_persistent"]
+        lookups = hits + self._stats["misses"]
+        out: Dict[str, Any] = dict(self._stats)
+        out["hits"] = hits
+        out["lookups"] = lookups
+        out["hit_ratio"] = (hits / lookups) if lookups else 0.0
+        out["memory_entries"] = len(self._l1)
+        out["persistent"] = bool(self.db_path) and not self._db_failed
+        return out
+
+    def clear_memory(self) -> None:
+        self._l1.clear()
+
+    async def close(self) -> None:
+        async with self._db_lock:
+            if self._db is not None:
+                try:
+                    await self._db.close()
+                except Exception:
+                    logger.debug("Failed to close translation cache database", exc_info=True)
+                self._db = None
+
+    # ----------------------
+    # L1 (memory)
+    # ----------------------
+
+    def _l1_get(self, key: CacheKey) -> Optional[Tuple[str, str]]:
+        entry = self._l1.get(key)
+        if entry is None:
+            return None
+        translated, provider, expires = entry
+        if expires < time.time():
+            del self._l1[key]
+            self._stats["expirations"] += 1
+            return None
+        self._l1.move_to_end(key)
+        return translated, provider
+
+    def _l1_put(self, key: CacheKey, translated: str, provider: str) -> None:
+        self._l1[key] = (translated, provider, time.time() + self.ttl)
+        self._l1.move_to_end(key)
+        while len(self._l1) > self.max_entries:
+            self._l1.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    # ----------------------
+    # L2 (SQLite)
+    # ----------------------
+
+    async def _connection(self) -> Optional[aiosqlite.Connection]:
+        if not self.db_path or self._db_failed:
+            return None
+        if self._db is not None:
+            return self._db
+        async with self._db_lock:
+            if self._db is not None:
+                return self._db
+            try:
+                if self.db_path != ":memory:":
+                    Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+                db = await aiosqlite.connect(self.db_path)
+                await db.execute("PRAGMA journal_mode=WAL;")
+                await db.execute("PRAGMA synchronous=NORMAL;")
+                await db.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS translation_cache (
+                        text TEXT NOT NULL,
+                        src TEXT NOT NULL,
+                        tgt TEXT NOT NULL,
+                        policy TEXT NOT NULL,
+                        translated TEXT NOT NULL,
+                        provider TEXT,
+                        expires_at REAL NOT NULL,
+                        last_access REAL NOT NULL,
+                        PRIMARY KEY (text, src, tgt, policy)
+                    )
+                    """
+                )
+                await db.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_translation_cache_access ON translation_cache(last_access)"
+                )
+                await db.commit()
+                self._db = db
+            except Exception:
+                self._db_failed = True
+                logger.warning("Translation cache database unavailable (%s); using memory only", self.db_path, exc_info=True)
+                return None
+        return self._db
+
+    async def _l2_get(self, key: CacheKey) -> Optional[Tuple[str, str]]:
+        db = await self._connection()
+        if db is None:
+            return None
+        now = time.time()
+        try:
+            cursor = await db.execute(
+                "SELECT translated, provider, expires_at, last_access FROM translation_cache "
+                "WHERE text = ? AND src = ? AND tgt = ? AND policy = ?",
+                key,
+            )
+            row = await cursor.fetchone()
+            await cursor.close()
+            if row is None:
+                return None
+            if row[2] < now:
+                await db.execute(
+                    "DELETE FROM translation_cache WHERE text = ? AND src = ? AND tgt = ? AND policy = ?",
+                    key,
+                )
+                await db.commit()
+                self._stats["expirations"] += 1
+                return None
+            if now - row[3] >= self.touch_interval:
+                await db.execute(
+                    "UPDATE translation_cache SET last_access = ? "
+                    "WHERE text = ? AND src = ? AND tgt = ? AND policy = ?",
+                    (now, *key),
+                )
+                await db.commit()
+            return row[0], row[1] or ""
+        except Exception:
+            logger.debug("Translation cache lookup failed", exc_info=True)
+            return None
+
+    async def _l2_put(self, key: CacheKey, translated: str, provider: str) -> None:
+        db = await self._connection()
+        if db is None:
+            return
+        now = time.time()
+        try:
+            await db.execute(
+                "INSERT OR REPLACE INTO translation_cache "
+                "(text, src, tgt, policy, translated, provider, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (*key, translated, provider, now + self.persistent_ttl, now),
+            )
+            await db.commit()
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= self.prune_every:
+                self._writes_since_prune = 0
+                await self._l2_prune(db, now)
+        except Exception:
+            logger.debug("Translation cache write failed", exc_info=True)
+
+    async def _l2_prune(self, db: aiosqlite.Connection, now: float) -> None:
+        """Drop expired rows and trim the table to `max_persistent_entries` (least recently used first)."""
+        cursor = await db.execute("DELETE FROM translation_cache WHERE expires_at < ?", (now,))
+        self._stats["expirations"] += max(0, cursor.rowcount or 0)
+        await cursor.close()
+        cursor = await db.execute("SELECT COUNT(*) FROM translation_cache")
+        (count,) = await cursor.fetchone()
+        await cursor.close()
+        overflow = count - self.max_persistent_entries
+        if overflow > 0:
+            cursor = await db.execute(
+                "DELETE FROM translation_cache WHERE rowid IN "
+                "(SELECT rowid FROM translation_cache ORDER BY last_access ASC LIMIT ?)",
+                (overflow,),
+            )
+            self._stats["evictions"] += max(0, cursor.rowcount or 0)
+            await cursor.close()
+        await db.commit()
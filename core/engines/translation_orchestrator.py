@@ -1,15 +1,34 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
 
 import asyncio
 import logging
+import time
+from collections import deque
+from dataclasses import dataclass
 
 from discord_bot.core.engines.base.engine_plugin import EnginePlugin
+from discord_bot.core.engines.provider_health import ProviderHealth
+from discord_bot.core.engines.translation_cache import TranslationCache, normalize_cache_text
 from discord_bot.language_context.translation_job import TranslationJob
 
 logger = logging.getLogger("hippo_bot.translation_orchestrator")
 
+TierResult = Tuple[Optional[str], Optional[str]]
+
+# Hedge delay used until enough latency samples exist to estimate a tier's p90.
+DEFAULT_HEDGE_DELAY = 1.0
+_LATENCY_WINDOW = 100
+_MIN_LATENCY_SAMPLES = 10
+
+
+@dataclass
+class _InFlight:
+    """Shared upstream call plus the number of callers currently awaiting it."""
+    task: "asyncio.Future[TierResult]"
+    waiters: int = 0
+
 
 class TranslationOrchestratorEngine(EnginePlugin):
     """
@@ -19,6 +38,21 @@ class TranslationOrchestratorEngine(EnginePlugin):
       3) Google Translate (free tier, 100+ languages, final fallback)
     This engine expects adapters to implement `translate(text, src, tgt) -> Optional[str]`
     and optional `supported_languages() -> List[str]`.
+    An optional `TranslationCache` short-circuits repeated (text, src, tgt) requests, and
+    identical requests that are in flight at the same time share a single upstream call.
+
+    With `hedge=True` the tiers race instead of running strictly in sequence: when a tier
+    has not answered within the hedge delay, the next tier starts alongside it and the
+    first usable answer wins (the slower call is cancelled). `hedge_delay=None` uses the
+    observed p90 latency of the waiting tier, falling back to DEFAULT_HEDGE_DELAY.
+
+    Every tier sits behind a circuit breaker (see `ProviderHealth`): providers whose
+    circuit is open are skipped without an attempt. With `adaptive_order=True`, healthy
+    tiers are reordered per language pair by their measured latency and error rate.
+
+    Texts longer than `chunk_size` are split at paragraph (then line/sentence) boundaries
+    via `NLPProcessor.split_into_chunks`; the chunks are translated concurrently, each
+    with its own cache lookup, and reassembled in order with the original separators.
     """
 
     def __init__(
@@ -29,6 +63,13 @@ class TranslationOrchestratorEngine(EnginePlugin):
         google_adapter: Any = None,
         detection_service: Any = None,
         nlp_processor: Any = None,
+        cache: Optional[TranslationCache] = None,
+        hedge: bool = False,
+        hedge_delay: Optional[float] = None,
+        health: Optional[ProviderHealth] = None,
+        adaptive_order: bool = False,
+        chunk_size: int = 1500,
+        max_chunk_concurrency: int = 4,
     ) -> None:
         super().__init__()
         self.deepl = deepl_adapter
@@ -36,6 +77,18 @@ class TranslationOrchestratorEngine(EnginePlugin):
         self.google = google_adapter
         self.detector = detection_service
         self.nlp = nlp_processor
+        self.cache = cache
+        self._inflight: Dict[Tuple[str, str, str], _InFlight] = {}
+        self._singleflight_stats: Dict[str, int] = {"leaders": 0, "coalesced": 0}
+        self._detection_stats: Dict[str, int] = {"detections": 0, "reused": 0}
+        self.hedge = hedge
+        self.hedge_delay = hedge_delay
+        self._latencies: Dict[str, "deque[float]"] = {}
+        self._hedge_stats: Dict[str, int] = {"hedged": 0, "hedge_wins": 0}
+        self.health = health if health is not None else ProviderHealth()
+        self.adaptive_order = adaptive_order
+        self.chunk_size = max(1, int(chunk_size))
+        self.max_chunk_concurrency = max(1, int(max_chunk_concurrency))
 
     async def _detect(self, text: str) -> Tuple[str, float]:
         if self.detector and hasattr(self.detector, "detect_language"):
@@ -104,69 +157,422 @@ class TranslationOrchestratorEngine(EnginePlugin):
             logger.warning("%s adapter raised %s", provider, exc, exc_info=True)
             return None
 
+    def _tiers(self) -> List[Tuple[str, Any]]:
+        """Return configured (provider_id, adapter) pairs in tier order."""
+        return [
+            (provider, adapter)
+            for provider, adapter in (("deepl", self.deepl), ("mymemory", self.mymemory), ("google", self.google))
+            if adapter
+        ]
+
+    def provider_policy(self) -> str:
+        """Identify the active tier configuration; part of every cache key."""
+        return ">".join(provider for provider, _ in self._tiers()) or "none"
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Return translation cache counters (empty when caching is disabled)."""
+        if self.cache is None:
+            return {}
+        return self.cache.stats()
+
+    def singleflight_stats(self) -> Dict[str, int]:
+        """Return upstream calls started (leaders) vs. callers that joined one (coalesced)."""
+        return {**self._singleflight_stats, "inflight": len(self._inflight)}
+
+    async def _coalesce(self, key: Tuple[str, str, str], factory: Callable[[], Awaitable[TierResult]]) -> TierResult:
+        """
+        Single-flight: concurrent callers with the same key await one shared task.
+
+        Each caller awaits the task through `asyncio.shield`, so cancelling one caller
+        does not cancel the upstream call for the others; the task is cancelled only
+        when its last waiter goes away. Errors propagate to every waiter and the key
+        is released as soon as the task finishes, so failures are never shared with
+        later requests.
+        """
+        entry = self._inflight.get(key)
+        if entry is None:
+            entry = _InFlight(task=asyncio.ensure_future(factory()))
+            self._inflight[key] = entry
+            self._singleflight_stats["leaders"] += 1
+
+            def _release(_task: "asyncio.Future[TierResult]", _entry: _InFlight = entry) -> None:
+                if self._inflight.get(key) is _entry:
+                    del self._inflight[key]
+
+            entry.task.add_done_callback(_release)
+        else:
+            self._singleflight_stats["coalesced"] += 1
+
+        entry.waiters += 1
+        try:
+            return await asyncio.shield(entry.task)
+        except asyncio.CancelledError:
+            if entry.waiters == 1 and not entry.task.done():
+                if self._inflight.get(key) is entry:
+                    del self._inflight[key]
+                entry.task.cancel()
+            raise
+        finally:
+            entry.waiters -= 1
+
+    def _record_latency(self, provider: str, elapsed: float) -> None:
+        samples = self._latencies.get(provider)
+        if samples is None:
+            samples = self._latencies[provider] = deque(maxlen=_LATENCY_WINDOW)
+        samples.append(elapsed)
+
+    def latency_p90(self, provider: str) -> Optional[float]:
+        """Return the p90 of recent successful calls to `provider`, or None with too few samples."""
+        samples = self._latencies.get(provider)
+        if not samples or len(samples) < _MIN_LATENCY_SAMPLES:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))]
+
+    def _hedge_delay_for(self, provider: str) -> float:
+        if self.hedge_delay is not None:
+            return max(0.0, float(self.hedge_delay))
+        p90 = self.latency_p90(provider)
+        return p90 if p90 is not None else DEFAULT_HEDGE_DELAY
+
+    def hedge_stats(self) -> Dict[str, int]:
+        """Return how often a backup tier was started early (hedged) and how often it won."""
+        return dict(self._hedge_stats)
+
+    def provider_health(self) -> Dict[str, Dict[str, Any]]:
+        """Return circuit breaker state, EWMA latency and error rate for every configured tier."""
+        for provider, _ in self._tiers():
+            self.health.breaker(provider)
+        return self.health.snapshot()
+
+    async def _attempt(self, provider: str, adapter: Any, text: str, src: str, tgt: str) -> Optional[str]:
+        """Call one tier through its circuit breaker, recording latency and outcome."""
+        breaker = self.health.breaker(provider)
+        if not breaker.acquire():
+            logger.debug("Skipping %s: circuit %s", provider, breaker.state)
+            return None
+        if provider == "google":
+            logger.info("Falling back to Google Translate for target=%s", tgt)
+        started = time.monotonic()
+        try:
+            out = await self._try_adapter(adapter, text, src, tgt, provider)
+        except asyncio.CancelledError:
+            breaker.release()
+            raise
+        elapsed = time.monotonic() - started
+        if out:
+            self._record_latency(provider, elapsed)
+            self.health.record_success(provider, src, tgt, elapsed)
+        else:
+            self.health.record_failure(provider, src, tgt)
+        return out
+
+    def _eligible_tiers(self, src: str, tgt: str) -> List[Tuple[str, Any]]:
+        tiers = []
+        for provider, adapter in self._tiers():
+            if not self._supports(adapter, tgt):
+                logger.debug("%s does not support target %s", provider, tgt)
+                continue
+            if not self.health.breaker(provider).available():
+                logger.debug("%s skipped: circuit open", provider)
+                continue
+            tiers.append((provider, adapter))
+        if self.adaptive_order:
+            tiers = self.health.order(tiers, src, tgt)
+        return tiers
+
+    def _postprocess(self, out: str) -> str:
+        if self.nlp and hasattr(self.nlp, "postprocess"):
+            return self.nlp.postprocess(out)
+        return out
+
+    async def _run_tiers(self, text: str, src: str, tgt: str) -> Tuple[Optional[str], Optional[str]]:
+        """Run DeepL -> MyMemory -> Google in order; return (translated_text, provider_id)."""
+        tiers = self._eligible_tiers(src, tgt)
+        if self.hedge and len(tiers) > 1:
+            return await self._run_tiers_hedged(tiers, text, src, tgt)
+        for provider, adapter in tiers:
+            out = await self._attempt(provider, adapter, text, src, tgt)
+            if out:
+                return self._postprocess(out), provider
+        return None, None
+
+    async def _run_tiers_hedged(
+        self, tiers: List[Tuple[str, Any]], text: str, src: str, tgt: str
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Race the tiers: start the next tier when the latest one has not answered within
+        its hedge delay, or immediately when a running tier fails. The first usable
+        answer wins; every other attempt still running is cancelled.
+        """
+        running: Dict["asyncio.Future[Optional[str]]", str] = {}
+        remaining = list(tiers)
+        rank = {provider: idx for idx, (provider, _) in enumerate(tiers)}
+        loop = asyncio.get_running_loop()
+        hedge_at = 0.0  # when the next tier starts if the latest one is still silent
+
+        def _start_next() -> str:
+            nonlocal hedge_at
+            provider, adapter = remaining.pop(0)
+            task = asyncio.ensure_future(self._attempt(provider, adapter, text, src, tgt))
+            running[task] = provider
+            hedge_at = loop.time() + self._hedge_delay_for(provider)
+            return provider
+
+        latest = _start_next()
+        try:
+            while running:
+                # Wait only for what is left of the latest tier's delay; an earlier tier
+                # failing in the meantime must not restart the hedge timer.
+                timeout = max(0.0, hedge_at - loop.time()) if remaining else None
+                done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    self._hedge_stats["hedged"] += 1
+                    latest = _start_next()
+                    logger.debug("Hedging: %s started while waiting on slower tier(s)", latest)
+                    continue
+                for task in sorted(done, key=lambda t: rank[running[t]]):
+                    provider = running.pop(task)
+                    out = task.result()
+                    if out:
+                        if rank[provider] > 0:
+                            self._hedge_stats["hedge_wins"] += 1
+                        return self._postprocess(out), provider
+                # The newest tier failed outright: no reason to wait out its hedge delay.
+                if remaining and latest not in running.values():
+                    latest = _start_next()
+            return None, None
+        finally:
+            for task in running:
+                task.cancel()
+
     async def translate_text_for_user(
         self, *, text: str, guild_id: int, user_id: int, tgt_lang: Optional[str] = None
     ) -> Tuple[Optional[str], str, Optional[str]]:
         """
         High-level helper: detects source, runs 3-tier pipeline, returns (translated_text, src_lang, provider_id)
         provider_id is "deepl", "mymemory", "google", or None on failure.
+        Successful results are served from / stored in the translation cache when one is attached.
+        """
+        return await self._translate(text=text, guild_id=guild_id, user_id=user_id, tgt_lang=tgt_lang)
+
+    async def translate_planned_job(self, job: TranslationJob) -> Dict[str, Any]:
+        """
+        Translate a job planned by ContextEngine without detecting the source again.
+
+        The job's `src_lang` (and `src_confidence`) are trusted when set; detection only
+        runs for jobs without a source. Returns the project result shape:
+        {"text", "src", "tgt", "provider", "confidence", "meta"}.
         """
+        src = job.src_lang if job.src_lang and job.src_lang.lower() != "auto" else None
+        conf = job.src_confidence if job.src_confidence is not None else 0.0
+        translated, used_src, provider = await self._translate(
+            text=job.text,
+            guild_id=job.guild_id,
+            user_id=job.author_id,
+            tgt_lang=job.tgt_lang,
+            src=src,
+            src_confidence=conf,
+        )
+        return {
+            "text": translated,
+            "src": used_src,
+            "tgt": (job.tgt_lang or "en").lower(),
+            "provider": provider,
+            "confidence": conf if src else 0.0,
+            "meta": {"job_id": job.job_id, "detection_reused": bool(src)},
+        }
+
+    async def translate_to_many(
+        self,
+        text: str,
+        targets: Iterable[str],
+        *,
+        guild_id: int = 0,
+        user_id: int = 0,
+        src: Optional[str] = None,
+        max_concurrency: int = 4,
+    ) -> Dict[str, TierResult]:
+        """
+        Translate one text into several target languages.
+
+        Targets are lower-cased and de-duplicated, the source is detected once (unless
+        given), and the per-language translations run with at most `max_concurrency`
+        in flight, each going through the cache and single-flight layers. Returns
+        {tgt: (translated_text, provider_id)}; a target equal to the source maps to
+        (text, None) and a failed target to (None, None). ``user_id`` only attributes
+        the call; every target is translated once for all of its readers.
+        """
+        wanted = list(dict.fromkeys((t or "").strip().lower() for t in targets if t and t.strip()))
+        if not text or not wanted:
+            return {tgt: (None, None) for tgt in wanted}
+
+        conf = 0.0
+        if not src or src.lower() == "auto":
+            pre = self.nlp.preprocess(text) if self.nlp and hasattr(self.nlp, "preprocess") else text
+            src, conf = await self._detect(pre)
+            self._detection_stats["detections"] += 1
+        src = src.lower()
+
+        semaphore = asyncio.Semaphore(max(1, int(max_concurrency)))
+
+        async def _one(tgt: str) -> TierResult:
+            if tgt == src:
+                return text, None
+            async with semaphore:
+                out, _, provider = await self._translate(
+                    text=text, guild_id=guild_id, user_id=user_id, tgt_lang=tgt, src=src, src_confidence=conf
+                )
+            return out, provider
+
+        results = await asyncio.gather(*(_one(tgt) for tgt in wanted), return_exceptions=True)
+        fanned: Dict[str, TierResult] = {}
+        for tgt, result in zip(wanted, results):
+            if isinstance(result, BaseException):
+                logger.warning("translate_to_many failed for target=%s: %s", tgt, result)
+                fanned[tgt] = (None, None)
+            else:
+                fanned[tgt] = result
+        return fanned
+
+    def detection_stats(self) -> Dict[str, int]:
+        """Return how often the orchestrator ran its detector vs. reused a planned source."""
+        return dict(self._detection_stats)
+
+    async def _translate(
+        self,
+        *,
+        text: str,
+        guild_id: int,
+        user_id: int,
+        tgt_lang: Optional[str],
+        src: Optional[str] = None,
+        src_confidence: float = 0.0,
+    ) -> Tuple[Optional[str], str, Optional[str]]:
         if not text:
             logger.debug("translate_text_for_user called with empty text")
             return None, "en", None
 
-        pre = text
-        if self.nlp and hasattr(self.nlp, "preprocess"):
-            try:
-                pre = self.nlp.preprocess(text)
-            except Exception:
-                pre = text
+        pre = self._preprocess(text)
 
-        src, conf = await self._detect(pre)
+        if src:
+            conf = src_confidence
+            self._detection_stats["reused"] += 1
+        else:
+            src, conf = await self._detect(pre)
+            self._detection_stats["detections"] += 1
         logger.debug("Detection result src=%s confidence=%.2f target_hint=%s", src, conf, tgt_lang)
 
         tgt = (tgt_lang or "en").lower()
+        policy = self.provider_policy()
 
-        # Tier 1: DeepL if it supports target (highest quality)
-        if self._supports(self.deepl, tgt):
-            out = await self._try_adapter(self.deepl, pre, src, tgt, "deepl")
-            if out:
-                if self.nlp and hasattr(self.nlp, "postprocess"):
-                    out = self.nlp.postprocess(out)
-                return out, src, "deepl"
-        else:
-            logger.debug("DeepL does not support target %s", tgt)
-
-        # Tier 2: MyMemory (good quality fallback)
-        if self._supports(self.mymemory, tgt):
-            out = await self._try_adapter(self.mymemory, pre, src, tgt, "mymemory")
-            if out:
-                if self.nlp and hasattr(self.nlp, "postprocess"):
-                    out = self.nlp.postprocess(out)
-                return out, src, "mymemory"
-        else:
-            logger.debug("MyMemory skipped for target %s", tgt)
-
-        # Tier 3: Google Translate (free tier, 100+ languages, final fallback)
-        if self._supports(self.google, tgt):
-            logger.info("Falling back to Google Translate for target=%s", tgt)
-            out = await self._try_adapter(self.google, pre, src, tgt, "google")
-            if out:
-                if self.nlp and hasattr(self.nlp, "postprocess"):
-                    out = self.nlp.postprocess(out)
-                return out, src, "google"
+        chunks, separators = self._split_chunks(pre)
+        if len(chunks) <= 1:
+            out, provider = await self._translate_segment(pre, src, tgt, policy)
         else:
-            logger.debug("Google Translate does not support target %s", tgt)
+            out, provider = await self._translate_chunks(chunks, separators, src, tgt, policy)
+        if out:
+            return out, src, provider
 
         logger.warning("All 3 providers failed for guild=%s user=%s target=%s", guild_id, user_id, tgt)
         return None, src, None
 
+    def _preprocess(self, text: str) -> str:
+        if not (self.nlp and hasattr(self.nlp, "preprocess")):
+            return text
+        try:
+            if hasattr(self.nlp, "split_into_chunks"):
+                # Long inputs are chunked below instead of being truncated.
+                return self.nlp.preprocess(text, truncate=False)
+            return self.nlp.preprocess(text)
+        except Exception:
+            return text
+
+    def _split_chunks(self, pre: str) -> Tuple[List[str], List[str]]:
+        """Return (chunks, separators) where separators[i] is the original text between chunk i and i+1."""
+        if len(pre) <= self.chunk_size or not (self.nlp and hasattr(self.nlp, "split_into_chunks")):
+            return [pre], []
+        try:
+            chunks = [c for c in self.nlp.split_into_chunks(pre, max_size=self.chunk_size) if c]
+        except Exception:
+            logger.debug("split_into_chunks failed; splitting on the size limit", exc_info=True)
+            return self._split_on_size(pre)
+        separators: List[str] = []
+        pos = 0
+        for idx, chunk in enumerate(chunks):
+            found = pre.find(chunk, pos)
+            if found < 0:
+                logger.debug("split_into_chunks altered the text; splitting on the size limit")
+                return self._split_on_size(pre)
+            if idx:
+                separators.append(pre[pos:found] or " ")
+            pos = found + len(chunk)
+        return chunks, separators
+
+    def _split_on_size(self, pre: str) -> Tuple[List[str], List[str]]:
+        """Fallback split into pieces of at most `chunk_size`, cut at the last space or newline when there is one."""
+        chunks: List[str] = []
+        separators: List[str] = []
+        pos = 0
+        while len(pre) - pos > self.chunk_size:
+            end = pos + self.chunk_size
+            cut = max(pre.rfind(" ", pos + 1, end + 1), pre.rfind("\n", pos + 1, end + 1))
+            if cut < 0:
+                chunks.append(pre[pos:end])
+                separators.append("")
+                pos = end
+            else:
+                chunks.append(pre[pos:cut])
+                separators.append(pre[cut])
+                pos = cut + 1
+        chunks.append(pre[pos:])
+        return chunks, separators
+
+    async def _translate_chunks(
+        self, chunks: List[str], separators: List[str], src: str, tgt: str, policy: str
+    ) -> TierResult:
+        """Translate chunks concurrently (bounded) and stitch them back together in order."""
+        semaphore = asyncio.Semaphore(self.max_chunk_concurrency)
+
+        async def _one(chunk: str) -> TierResult:
+            async with semaphore:
+                return await self._translate_segment(chunk, src, tgt, policy)
+
+        logger.debug("Translating %d chunks concurrently (src=%s tgt=%s)", len(chunks), src, tgt)
+        results = await asyncio.gather(*(_one(chunk) for chunk in chunks))
+        if any(not out for out, _ in results):
+            return None, None
+
+        parts: List[str] = []
+        for idx, (out, _) in enumerate(results):
+            if idx:
+                parts.append(separators[idx - 1])
+            parts.append(out or "")
+        providers = [provider for _, provider in results if provider]
+        provider = max(set(providers), key=providers.count) if providers else None
+        return "".join(parts), provider
+
+    async def _translate_segment(self, pre: str, src: str, tgt: str, policy: str) -> TierResult:
+        """Translate one segment through the cache, single-flight and provider tiers."""
+        if self.cache is not None:
+            cached = await self.cache.get(pre, src, tgt, policy)
+            if cached is not None:
+                logger.debug("Translation cache hit (src=%s tgt=%s provider=%s)", src, tgt, cached[1])
+                return cached
+
+        async def _upstream() -> TierResult:
+            result, used = await self._run_tiers(pre, src, tgt)
+            if result and self.cache is not None:
+                await self.cache.set(pre, src, tgt, policy, result, used or "")
+            return result, used
+
+        return await self._coalesce((normalize_cache_text(pre), src, tgt), _upstream)
+
     async def translate_job(self, job: TranslationJob) -> Optional[str]:
         """
         Backwards-compatible method: accept a TranslationJob and return translated text
         (keeps compatibility with existing processing_engine.execute_job usage).
+        A source already planned on the job is reused rather than detected again.
         """
-        translated, _, _ = await self.translate_text_for_user(
-            text=job.text, guild_id=job.guild_id, user_id=job.author_id, tgt_lang=job.tgt_lang
-        )
-        return translated
+        result = await self.translate_planned_job(job)
+        return result["text"]
@@ -0,0 +1,286 @@
+"""
+Scheduled online backups for the bot's SQLite databases.
+
+Key features:
+ - Uses SQLite's incremental backup API from a dedicated read-only connection,
+   copying ``pages_per_step`` pages at a time and sleeping between steps, so
+   the source is never locked for longer than one short step
+ - A backup that keeps restarting because writers modify the source between
+   steps falls back to a single-pass copy; under WAL that holds only a read
+   snapshot and does not block writers either
+ - Snapshots are gzip-compressed, written atomically and rotated per database
+ - Each run reports duration, steps, pages per step and restarts
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import gzip
+import logging
+import os
+import shutil
+import sqlite3
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Union
+
+logger = logging.getLogger("hippo_bot.backup_service")
+
+
+@dataclass
+class BackupResult:
+    """Outcome of one database backup."""
+
+    name: str
+    path: Optional[Path]
+    started_at: datetime
+    duration_s: float
+    pages: int
+    steps: int
+    pages_per_step: int
+    restarts: int
+    single_pass: bool
+    size_bytes: int
+    compressed_bytes: int
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class _TooManyRestarts(Exception):
+    pass
+
+
+class BackupService:
+    """
+    Periodically snapshot registered SQLite databases into ``backup_dir``.
+
+    Parameters:
+        backup_dir: directory receiving ``<name>-<UTC timestamp>.db.gz`` files.
+        interval_hours: time between scheduled runs started by :meth:`start`.
+        keep: snapshots retained per database; older ones are deleted.
+        pages_per_step: pages copied per backup step.
+        step_sleep_ms: pause between steps, giving writers the database back.
+        max_restarts: stepped restarts tolerated before a single-pass copy.
+        compress: gzip the snapshot (``.db.gz``) instead of keeping the raw file.
+    """
+
+    def __init__(
+        self,
+        backup_dir: Union[str, Path] = "data/backups",
+        *,
+        interval_hours: float = 6.0,
+        keep: int = 7,
+        pages_per_step: int = 256,
+        step_sleep_ms: int = 25,
+        max_restarts: int = 3,
+        compress: bool = True,
+    ) -> None:
+        self.backup_dir = Path(backup_dir)
+        self.interval = max(60.0, float(interval_hours) * 3600)
+        self.keep = max(1, int(keep))
+        self.pages_per_step = max(1, int(pages_per_step))
+        self.step_sleep = max(0, int(step_sleep_ms)) / 1000.0
+        self.max_restarts = max(0, int(max_restarts))
+        self.compress = compress
+        self._databases: Dict[str, Path] = {}
+        self._run_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.history: Deque[BackupResult] = deque(maxlen=50)
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+    def add_database(self, name: str, db_path: Union[str, Path]) -> bool:
+        """Register a database file; in-memory and URI databases are skipped."""
+        if not isinstance(db_path, Path) and (str(db_path) == ":memory:" or str(db_path).startswith("file:")):
+            logger.debug("Skipping backup registration for non-file database %s", name)
+            return False
+        path = Path(db_path).resolve()
+        if path in self._databases.values():
+            return False
+        self._databases[name] = path
+        return True
+
+    def add_engine(self, name: str, engine: Any) -> bool:
+        """Register the database behind a StorageEngine, GameStorageEngine or RankingStorageEngine."""
+        shared = getattr(engine, "storage", None)
+        if shared is not None and hasattr(shared, "conn"):
+            # RankingStorageEngine backed by GameStorageEngine shares its file.
+            engine = shared
+        db_path = getattr(engine, "db_path", None)
+        if db_path is None:
+            return False
+        return self.add_database(name, db_path)
+
+    @property
+    def databases(self) -> Dict[str, Path]:
+        return dict(self._databases)
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        """Start the periodic backup loop on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._loop())
+            logger.info(
+                "Database backups scheduled every %.1fh for %s",
+                self.interval / 3600,
+                ", ".join(self._databases) or "no databases",
+            )
+
+    async def stop(self) -> None:
+        """Cancel the loop, letting a backup already in progress finish."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                # Shielded so stop() never leaves a half-written snapshot behind.
+                await asyncio.shield(self.backup_all())
+            except Exception:
+                logger.exception("Scheduled database backup failed")
+
+    # ------------------------------------------------------------------
+    # Backups
+    # ------------------------------------------------------------------
+    async def backup_all(self) -> List[BackupResult]:
+        """Back up every registered database, one at a time."""
+        results = []
+        async with self._run_lock:
+            for name, path in list(self._databases.items()):
+                results.append(await asyncio.to_thread(self._backup_one, name, path))
+        return results
+
+    async def backup(self, name: str) -> BackupResult:
+        """Back up one registered database now."""
+        async with self._run_lock:
+            return await asyncio.to_thread(self._backup_one, name, self._databases[name])
+
+    def _backup_one(self, name: str, source_path: Path) -> BackupResult:
+        started_at = datetime.utcnow()
+        clock = time.monotonic()
+        stamp = started_at.strftime("%Y%m%dT%H%M%S%fZ")
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        raw_path = self.backup_dir / f"{name}-{stamp}.db.tmp"
+        final_path = self.backup_dir / (f"{name}-{stamp}.db.gz" if self.compress else f"{name}-{stamp}.db")
+        progress = {"steps": 0, "restarts": 0, "pages": 0, "remaining": None}
+        single_pass = False
+        try:
+            if not source_path.exists():
+                raise FileNotFoundError(source_path)
+            try:
+                self._copy(source_path, raw_path, self.pages_per_step, self.step_sleep, progress)
+            except _TooManyRestarts:
+                single_pass = True
+                raw_path.unlink(missing_ok=True)
+                self._copy(source_path, raw_path, -1, 0, progress)
+
+            size = raw_path.stat().st_size
+            staging = final_path.with_name(final_path.name + ".tmp")
+            if self.compress:
+                with raw_path.open("rb") as src, gzip.open(staging, "wb", compresslevel=6) as dst:
+                    shutil.copyfileobj(src, dst, 1024 * 1024)
+                raw_path.unlink()
+            else:
+                os.replace(raw_path, staging)
+            os.replace(staging, final_path)
+            result = BackupResult(
+                name=name,
+                path=final_path,
+                started_at=started_at,
+                duration_s=time.monotonic() - clock,
+                pages=progress["pages"],
+                steps=progress["steps"],
+                pages_per_step=progress["pages"] if single_pass else self.pages_per_step,
+                restarts=progress["restarts"],
+                single_pass=single_pass,
+                size_bytes=size,
+                compressed_bytes=final_path.stat().st_size,
+            )
+            self._rotate(name)
+            logger.info(
+                "Backed up %s in %.2fs: %d pages in %d steps of %d (%d restarts%s), %d -> %d bytes",
+                name,
+                result.duration_s,
+                result.pages,
+                result.steps,
+                result.pages_per_step,
+                result.restarts,
+                ", single pass" if single_pass else "",
+                result.size_bytes,
+                result.compressed_bytes,
+            )
+        except Exception as exc:
+            for leftover in (raw_path, final_path.with_name(final_path.name + ".tmp")):
+                leftover.unlink(missing_ok=True)
+            result = BackupResult(
+                name=name,
+                path=None,
+                started_at=started_at,
+                duration_s=time.monotonic() - clock,
+                pages=progress["pages"],
+                steps=progress["steps"],
+                pages_per_step=self.pages_per_step,
+                restarts=progress["restarts"],
+                single_pass=single_pass,
+                size_bytes=0,
+                compressed_bytes=0,
+                error=f"{type(exc).__name__}: {exc}",
+            )
+            logger.error("Backup of %s failed: %s", name, result.error)
+        self.history.append(result)
+        return result
+
+    def _copy(self, source_path: Path, target_path: Path, pages: int, sleep: float, progress: Dict[str, Any]) -> None:
+        def on_step(status: int, remaining: int, total: int) -> None:
+            previous = progress["remaining"]
+            if previous is not None and remaining >= previous and pages > 0:
+                # The source changed underneath us and SQLite started over.
+                progress["restarts"] += 1
+                if progress["restarts"] > self.max_restarts:
+                    raise _TooManyRestarts()
+            progress["steps"] += 1
+            progress["remaining"] = remaining
+            progress["pages"] = total
+            if remaining and sleep:
+                # sqlite3's own ``sleep`` only applies after BUSY/LOCKED, so pause here.
+                time.sleep(sleep)
+
+        progress["remaining"] = None
+        source = sqlite3.connect(f"{source_path.as_uri()}?mode=ro", uri=True, check_same_thread=False)
+        target = sqlite3.connect(target_path)
+        try:
+            source.backup(target, pages=pages, progress=on_step, sleep=max(sleep, 0.001))
+        finally:
+            target.close()
+            source.close()
+
+    def _rotate(self, name: str) -> None:
+        pattern = f"{name}-*.db.gz" if self.compress else f"{name}-*.db"
+        snapshots = sorted(self.backup_dir.glob(pattern))
+        for stale in snapshots[: -self.keep]:
+            stale.unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the registered databases and the most recent result for each."""
+        latest: Dict[str, Dict[str, Any]] = {}
+        for result in self.history:
+            latest[result.name] = {**asdict(result), "path": str(result.path) if result.path else None}
+        return {
+            "databases": {name: str(path) for name, path in self._databases.items()},
+            "running": self._task is not None and not self._task.done(),
+            "last": latest,
+        }
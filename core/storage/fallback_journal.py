@@ -0,0 +1,260 @@
+"""
+Segmented JSON-lines journal with a byte-offset index.
+
+StorageEngine writes rows here while SQLite is unavailable. For a journal whose
+active file is ``error_logs.jsonl`` the files on disk are:
+
+ - ``error_logs.jsonl``              active segment, one JSON object per line
+ - ``error_logs.jsonl.idx``          start offset of every line (8-byte little-endian)
+ - ``error_logs.0000004096.jsonl``   sealed segments (plus ``.idx``), named by first sequence
+ - ``error_logs.journal.json``       manifest: generation id and active file name
+
+Records are numbered from 0 within a generation. The index lets readers seek
+straight to any record, or to the last N, without parsing what comes before.
+Once a generation has been replayed into SQLite it is retired: its files are
+removed and numbering restarts under a new generation id, so replay
+checkpoints keyed by ``(stream, generation)`` never collide.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import uuid
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+_SEQ_DIGITS = 10
+
+
+class _Segment:
+    __slots__ = ("first_seq", "path", "index_path", "offsets", "size")
+
+    def __init__(self, first_seq: int, path: Path) -> None:
+        self.first_seq = first_seq
+        self.path = path
+        self.index_path = path.with_name(path.name + ".idx")
+        self.offsets = array("Q")
+        self.size = 0
+
+    @property
+    def end_seq(self) -> int:
+        return self.first_seq + len(self.offsets)
+
+
+class FallbackJournal:
+    """
+    Append-only journal for one backup file.
+
+    Parameters:
+        path: the active segment (``<dir>/<table>.jsonl`` or the configured backup file).
+        segment_bytes: size at which the active segment is sealed and a new one started.
+
+    All methods are blocking and thread-safe; StorageEngine calls them via
+    ``asyncio.to_thread``.
+    """
+
+    def __init__(self, path: Path, *, segment_bytes: int = 4 * 1024 * 1024) -> None:
+        self.path = Path(path)
+        self.segment_bytes = max(1, int(segment_bytes))
+        self.manifest_path = self.path.with_name(f"{self.path.stem}.journal.json")
+        self.generation = ""
+        self._segments: List[_Segment] = []
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def append(self, payload: Dict[str, Any]) -> int:
+        """Append one record and return its sequence number."""
+        line = (json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            self._load()
+            if not self.manifest_path.exists():
+                self._write_manifest()
+            active = self._segments[-1]
+            if active.size and active.size + len(line) > self.segment_bytes:
+                active = self._rotate()
+            with active.path.open("ab") as fh:
+                fh.write(line)
+            with active.index_path.open("ab") as fh:
+                fh.write(_pack([active.size]))
+            active.offsets.append(active.size)
+            active.size += len(line)
+            return active.end_seq - 1
+
+    def count(self) -> int:
+        """Return the number of records in the current generation."""
+        with self._lock:
+            self._load()
+            return self._segments[-1].end_seq
+
+    def read(self, start: int, count: int) -> List[Tuple[int, Dict[str, Any]]]:
+        """Return ``(seq, record)`` for sequences ``start .. start+count-1``; unreadable lines are skipped."""
+        records: List[Tuple[int, Dict[str, Any]]] = []
+        with self._lock:
+            self._load()
+            seq = max(0, start)
+            stop = min(seq + max(0, count), self._segments[-1].end_seq)
+            for segment in self._segments:
+                if seq >= stop:
+                    break
+                if seq >= segment.end_seq:
+                    continue
+                first = seq - segment.first_seq
+                last = min(stop, segment.end_seq) - segment.first_seq
+                begin = segment.offsets[first]
+                end = segment.offsets[last] if last < len(segment.offsets) else segment.size
+                with segment.path.open("rb") as fh:
+                    fh.seek(begin)
+                    chunk = fh.read(end - begin)
+                for position, raw in enumerate(chunk.splitlines(), start=segment.first_seq + first):
+                    try:
+                        records.append((position, json.loads(raw)))
+                    except ValueError:
+                        continue
+                seq = segment.first_seq + last
+        return records
+
+    def tail(self, limit: int) -> List[Dict[str, Any]]:
+        """Return the newest ``limit`` records, oldest first."""
+        total = self.count()
+        start = max(0, total - max(0, limit))
+        return [record for _, record in self.read(start, total - start)]
+
+    def retire(self, replayed: int) -> bool:
+        """Drop this generation if exactly ``replayed`` records exist; returns whether it did."""
+        with self._lock:
+            self._load()
+            if self._segments[-1].end_seq != replayed:
+                return False
+            for segment in self._segments:
+                segment.path.unlink(missing_ok=True)
+                segment.index_path.unlink(missing_ok=True)
+            self.generation = uuid.uuid4().hex
+            self._segments = [_Segment(0, self.path)]
+            self._write_manifest()
+            return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Return generation, record count, segment count and on-disk size."""
+        with self._lock:
+            self._load()
+            return {
+                "generation": self.generation,
+                "records": self._segments[-1].end_seq,
+                "segments": len(self._segments),
+                "bytes": sum(segment.size for segment in self._segments),
+            }
+
+    @staticmethod
+    def discover(directory: Path) -> List[Path]:
+        """Return the active paths of journals with a manifest in ``directory``."""
+        found = []
+        for manifest in sorted(Path(directory).glob("*.journal.json")):
+            try:
+                name = json.loads(manifest.read_text(encoding="utf-8"))["file"]
+            except (OSError, ValueError, KeyError, TypeError):
+                continue
+            found.append(manifest.with_name(name))
+        return found
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self.generation = ""
+        if self.manifest_path.exists():
+            try:
+                self.generation = json.loads(self.manifest_path.read_text(encoding="utf-8"))["generation"]
+            except (OSError, ValueError, KeyError, TypeError):
+                self.generation = ""
+        if not self.generation:
+            self.generation = uuid.uuid4().hex
+
+        sealed = []
+        for candidate in self.path.parent.glob(f"{self.path.stem}.{'[0-9]' * _SEQ_DIGITS}{self.path.suffix}"):
+            sealed.append(_Segment(int(candidate.name[len(self.path.stem) + 1:][:_SEQ_DIGITS]), candidate))
+        sealed.sort(key=lambda segment: segment.first_seq)
+        for segment in sealed:
+            self._index(segment, repair=False)
+        active = _Segment(sealed[-1].end_seq if sealed else 0, self.path)
+        self._index(active, repair=True)
+        self._segments = sealed + [active]
+        self._loaded = True
+        if active.end_seq and not self.manifest_path.exists():
+            self._write_manifest()  # adopt a pre-journal backup file under a fixed generation
+
+    def _index(self, segment: _Segment, *, repair: bool) -> None:
+        """Load a segment's offsets, indexing any lines written after the last entry."""
+        size = segment.path.stat().st_size if segment.path.exists() else 0
+        offsets = array("Q")
+        if segment.index_path.exists():
+            data = segment.index_path.read_bytes()
+            offsets.frombytes(data[: len(data) - len(data) % offsets.itemsize])
+            if sys.byteorder == "big":
+                offsets.byteswap()
+        while offsets and offsets[-1] >= size:
+            offsets.pop()
+
+        indexed = len(offsets)
+        end = size
+        if size:
+            with segment.path.open("rb") as fh:
+                position = offsets[-1] if offsets else 0
+                fh.seek(position)
+                if offsets:
+                    position += len(fh.readline())
+                for line in iter(fh.readline, b""):
+                    if not line.endswith(b"\n"):
+                        end = position  # torn final write
+                        break
+                    offsets.append(position)
+                    position += len(line)
+        if repair and end < size:
+            with segment.path.open("r+b") as fh:
+                fh.truncate(end)
+            size = end
+        if len(offsets) != indexed or (segment.index_path.exists() and segment.index_path.stat().st_size != 8 * len(offsets)):
+            tmp = segment.index_path.with_name(segment.index_path.name + ".tmp")
+            tmp.write_bytes(_pack(offsets))
+            os.replace(tmp, segment.index_path)
+        segment.offsets = offsets
+        segment.size = size
+
+    def _rotate(self) -> _Segment:
+        active = self._segments[-1]
+        sealed_path = self.path.with_name(
+            f"{self.path.stem}.{active.first_seq:0{_SEQ_DIGITS}d}{self.path.suffix}"
+        )
+        sealed = _Segment(active.first_seq, sealed_path)
+        # Data first: a crash in between leaves an unindexed sealed file, which _index rebuilds.
+        os.replace(active.path, sealed.path)
+        os.replace(active.index_path, sealed.index_path)
+        sealed.offsets, sealed.size = active.offsets, active.size
+        fresh = _Segment(sealed.end_seq, self.path)
+        self._segments[-1:] = [sealed, fresh]
+        return fresh
+
+    def _write_manifest(self) -> None:
+        tmp = self.manifest_path.with_name(self.manifest_path.name + ".tmp")
+        tmp.write_text(json.dumps({"generation": self.generation, "file": self.path.name}), encoding="utf-8")
+        os.replace(tmp, self.manifest_path)
+
+
+def _pack(offsets: Any) -> bytes:
+    packed = array("Q", offsets)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
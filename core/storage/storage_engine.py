@@ -3,8 +3,13 @@ Asynchronous storage engine with self-healing SQLite support and JSON fallback.
 
 Key features:
  - Async API using `aiosqlite`
+ - One long-lived writer connection plus a small pool of read-only readers
+   (WAL lets readers run concurrently with the writer; PRAGMAs are applied once)
+ - Write-behind queue that group-commits error/log inserts with `executemany`,
+   one transaction per table; rows SQLite rejects are journaled on their own
  - Automatic schema loading from `schema.sql` (optional)
- - Graceful fallback to JSON log/backup when SQLite is unavailable
+ - Graceful fallback to a segmented, offset-indexed JSON journal when SQLite is
+   unavailable; the journal is replayed into SQLite after recovery
  - Self-recovery attempts when corruption is detected
  - Optional integration with ErrorEngine for structured logging
 """
@@ -12,11 +17,14 @@ Key features:
 from __future__ import annotations
 
 import asyncio
-import json
+import contextlib
+import logging
 import os
+import re
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional, Sequence, Tuple, Union
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Sequence, Tuple, Union
 
 import aiosqlite
 
@@ -30,6 +38,56 @@ try:
 except Exception:  # pragma: no cover - optional dependency
     get_error_engine = None
 
+from discord_bot.core.storage.fallback_journal import FallbackJournal
+
+logger = logging.getLogger("hippo_bot.storage_engine")
+
+# Queries used by the write-behind queue, keyed by target table.
+_QUEUED_INSERTS: Dict[str, str] = {
+    "error_logs": """
+        INSERT INTO error_logs (error_type, message, traceback, timestamp, context)
+        VALUES (?, ?, ?, ?, ?)
+    """,
+    "logs": """
+        INSERT INTO logs (timestamp, severity, context, message)
+        VALUES (?, ?, ?, ?)
+    """,
+}
+
+
+def _error_log_params(error_info: Dict[str, Any]) -> Tuple[Any, ...]:
+    return (
+        error_info.get("type", "Unknown"),
+        error_info.get("message", ""),
+        error_info.get("traceback", ""),
+        error_info.get("timestamp", datetime.utcnow().isoformat()),
+        error_info.get("context", "Unknown"),
+    )
+
+
+def _log_entry_params(entry: Dict[str, Any]) -> Tuple[Any, ...]:
+    return (
+        entry.get("timestamp", datetime.utcnow().isoformat()),
+        entry.get("severity", "INFO"),
+        entry.get("context", "General"),
+        entry.get("message", ""),
+    )
+
+
+# Builds queued-insert parameters from a raw row; also used to replay journaled rows.
+_QUEUED_PARAMS = {"error_logs": _error_log_params, "logs": _log_entry_params}
+
+_FROM_TABLE = re.compile(r"\bFROM\s+[\"`\[]?(\w+)", re.IGNORECASE)
+
+_REPLAY_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS journal_replay (
+        stream TEXT NOT NULL,
+        generation TEXT NOT NULL,
+        replayed INTEGER NOT NULL,
+        PRIMARY KEY (stream, generation)
+    )
+"""
+
 
 class StorageEngine:
     """
@@ -39,6 +97,14 @@ class StorageEngine:
         db_path: path to SQLite database file.
         json_backup: line-delimited JSON fallback file.
         schema_file: optional SQL schema to bootstrap the database.
+        readers: number of pooled read-only connections used by `fetch`.
+        busy_timeout_ms: SQLite busy timeout applied to every pooled connection.
+        flush_interval_ms: how long queued log rows may wait before a group commit.
+        flush_batch_size: queued row count that triggers an immediate group commit.
+        max_pending: cap on queued rows; the oldest rows are dropped beyond it.
+        journal_segment_bytes: size at which a fallback journal segment is sealed.
+        fallback_fetch_limit: newest journaled rows returned by `fetch` while SQLite is down.
+        replay_batch_size: journaled rows written per transaction when replaying.
     """
 
     def __init__(
@@ -47,12 +113,44 @@ class StorageEngine:
         db_path: str = "data/database.db",
         json_backup: str = "data/storage_backup.json",
         schema_file: str = "data/schema.sql",
+        readers: int = 3,
+        busy_timeout_ms: int = 5000,
+        flush_interval_ms: int = 250,
+        flush_batch_size: int = 200,
+        max_pending: int = 10000,
+        journal_segment_bytes: int = 4 * 1024 * 1024,
+        fallback_fetch_limit: int = 1000,
+        replay_batch_size: int = 500,
     ) -> None:
         self.db_path = db_path
         self.json_backup = json_backup
         self._json_backup_is_default = json_backup == "data/storage_backup.json"
         self.schema_file = schema_file
-        self._lock = asyncio.Lock()
+        self.reader_count = max(1, int(readers))
+        self.busy_timeout_ms = int(busy_timeout_ms)
+        self._lock = asyncio.Lock()  # serialises use of the writer connection
+        self._open_lock = asyncio.Lock()
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._readers: List[aiosqlite.Connection] = []
+        self._idle_readers: Optional[asyncio.Queue] = None
+        # Cleared while recovery swaps the database file; `fetch` waits on it.
+        self._ready = asyncio.Event()
+        self._ready.set()
+        self._pool_stats: Dict[str, int] = {"writes": 0, "reads": 0, "reads_on_writer": 0, "reopens": 0}
+        self.flush_interval = max(0, int(flush_interval_ms)) / 1000.0
+        self.flush_batch_size = max(1, int(flush_batch_size))
+        self.max_pending = max(1, int(max_pending))
+        self._pending: Deque[Tuple[str, Tuple[Any, ...], Dict[str, Any]]] = deque()
+        self._flush_lock = asyncio.Lock()
+        self._flush_wakeup: Optional[asyncio.Event] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._queue_stats: Dict[str, int] = {"queued": 0, "flushed": 0, "dropped": 0, "fallback": 0, "batches": 0}
+        self.journal_segment_bytes = max(1, int(journal_segment_bytes))
+        self.fallback_fetch_limit = max(1, int(fallback_fetch_limit))
+        self.replay_batch_size = max(1, int(replay_batch_size))
+        self._journals: Dict[Path, FallbackJournal] = {}
+        self._replay_lock = asyncio.Lock()
+        self._replay_stats: Dict[str, int] = {"runs": 0, "batches": 0, "replayed": 0, "skipped": 0, "retired": 0}
         self._error_engine = get_error_engine() if get_error_engine else None
 
         db_dir = Path(self.db_path).parent
@@ -64,14 +162,108 @@ class StorageEngine:
     async def initialize(self) -> None:
         """Ensure database exists and schema is present."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("PRAGMA journal_mode=WAL;")
-                await db.execute("PRAGMA synchronous=NORMAL;")
-                await self._apply_schema(db)
+            async with self._lock:
+                await self._initialize_locked()
         except Exception as exc:
             await self._log_internal(exc, "StorageEngine.initialize")
             await self._recover_database()
 
+    async def _initialize_locked(self) -> None:
+        db = await self._writer_connection()
+        await self._apply_schema(db)
+
+    # ------------------------------------------------------------------
+    # Connection pool
+    # ------------------------------------------------------------------
+    @property
+    def _reads_use_writer(self) -> bool:
+        # An in-memory database is private to one connection, so reads must use the writer.
+        return str(self.db_path) == ":memory:"
+
+    async def _writer_connection(self) -> aiosqlite.Connection:
+        if self._writer is not None:
+            return self._writer
+        async with self._open_lock:
+            if self._writer is None:
+                db = await aiosqlite.connect(self.db_path)
+                try:
+                    await db.execute("PRAGMA journal_mode=WAL;")
+                    await db.execute("PRAGMA synchronous=NORMAL;")
+                    await db.execute("PRAGMA foreign_keys=ON;")
+                    await db.execute(f"PRAGMA busy_timeout={self.busy_timeout_ms};")
+                except BaseException:
+                    await db.close()
+                    raise
+                self._writer = db
+        return self._writer
+
+    async def _open_readers(self) -> asyncio.Queue:
+        if self._idle_readers is not None:
+            return self._idle_readers
+        await self._writer_connection()  # creates the file (and WAL mode) before read-only opens
+        async with self._open_lock:
+            if self._idle_readers is None:
+                uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+                readers: List[aiosqlite.Connection] = []
+                try:
+                    for _ in range(self.reader_count):
+                        db = await aiosqlite.connect(uri, uri=True)
+                        readers.append(db)
+                        await db.execute(f"PRAGMA busy_timeout={self.busy_timeout_ms};")
+                        await db.execute("PRAGMA query_only=ON;")
+                except BaseException:
+                    for db in readers:
+                        await db.close()
+                    raise
+                queue: asyncio.Queue = asyncio.Queue()
+                for db in readers:
+                    queue.put_nowait(db)
+                self._readers = readers
+                self._idle_readers = queue
+        return self._idle_readers
+
+    @contextlib.asynccontextmanager
+    async def _reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        if self._reads_use_writer:
+            async with self._lock:
+                self._pool_stats["reads_on_writer"] += 1
+                yield await self._writer_connection()
+            return
+        await self._ready.wait()
+        idle = await self._open_readers()
+        db = await idle.get()
+        try:
+            yield db
+        finally:
+            idle.put_nowait(db)
+
+    async def close(self) -> None:
+        """Close the writer and every pooled reader."""
+        async with self._open_lock:
+            connections = list(self._readers)
+            if self._writer is not None:
+                connections.append(self._writer)
+            self._writer = None
+            self._readers = []
+            self._idle_readers = None
+        for db in connections:
+            try:
+                await db.close()
+            except Exception:
+                pass
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Return pool size/occupancy plus read and write counters."""
+        idle = self._idle_readers.qsize() if self._idle_readers is not None else 0
+        return {
+            "writer_open": self._writer is not None,
+            "readers": len(self._readers),
+            "readers_idle": idle,
+            "readers_busy": len(self._readers) - idle,
+            "writer_busy": self._lock.locked(),
+            **self._pool_stats,
+        }
+
     async def _apply_schema(self, db: aiosqlite.Connection) -> None:
         if not self.schema_file or not Path(self.schema_file).exists():
             await db.execute(
@@ -111,21 +303,21 @@ class StorageEngine:
         commit: bool = True,
     ) -> bool:
         """Execute a write query with automatic recovery on failure."""
-        async with self._lock:
-            try:
-                async with aiosqlite.connect(self.db_path) as db:
-                    await db.execute("PRAGMA foreign_keys=ON;")
-                    await db.execute(query, params or ())
-                    if commit:
-                        await db.commit()
-                return True
-            except aiosqlite.Error as exc:
-                await self._log_internal(exc, "StorageEngine.execute")
-                await self._recover_database()
-                return False
-            except Exception as exc:
-                await self._log_internal(exc, "StorageEngine.execute:unexpected")
-                return False
+        try:
+            async with self._lock:
+                db = await self._writer_connection()
+                await db.execute(query, params or ())
+                if commit:
+                    await db.commit()
+                self._pool_stats["writes"] += 1
+            return True
+        except aiosqlite.Error as exc:
+            await self._log_internal(exc, "StorageEngine.execute")
+            await self._recover_database()
+            return False
+        except Exception as exc:
+            await self._log_internal(exc, "StorageEngine.execute:unexpected")
+            return False
 
     async def fetch(
         self,
@@ -133,143 +325,406 @@ class StorageEngine:
         params: Optional[Union[Sequence[Any], Tuple[Any, ...]]] = None,
     ) -> Optional[list]:
         """Execute a read query. Falls back to JSON snapshot for specific tables."""
-        async with self._lock:
-            try:
-                async with aiosqlite.connect(self.db_path) as db:
-                    cursor = await db.execute(query, params or ())
-                    rows = await cursor.fetchall()
-                    await cursor.close()
-                    return rows
-            except aiosqlite.Error as exc:
-                await self._log_internal(exc, "StorageEngine.fetch")
-                return await self._json_fallback_fetch()
-            except Exception as exc:
-                await self._log_internal(exc, "StorageEngine.fetch:unexpected")
-                return None
+        try:
+            async with self._reader() as db:
+                cursor = await db.execute(query, params or ())
+                rows = await cursor.fetchall()
+                await cursor.close()
+                self._pool_stats["reads"] += 1
+                return rows
+        except aiosqlite.Error as exc:
+            await self._log_internal(exc, "StorageEngine.fetch")
+            return await self._json_fallback_fetch(query)
+        except Exception as exc:
+            await self._log_internal(exc, "StorageEngine.fetch:unexpected")
+            return None
 
     # ------------------------------------------------------------------
     # JSON fallback utilities
     # ------------------------------------------------------------------
-    async def _json_fallback_fetch(self) -> list:
-        """Return records from the JSON backup (best effort)."""
-        if not Path(self.json_backup).exists():
+    async def _json_fallback_fetch(self, query: Optional[str] = None) -> list:
+        """Return the newest journaled records for the queried table (best effort)."""
+        match = _FROM_TABLE.search(query or "")
+        table = match.group(1) if match else None
+        path = self._journal_path(table) if table else Path(self.json_backup)
+        if not path.parent.exists():
             return []
         try:
-            return await asyncio.to_thread(self._read_json_lines)
+            records = await asyncio.to_thread(self._journal(path).tail, self.fallback_fetch_limit)
         except Exception as exc:
             await self._log_internal(exc, "StorageEngine._json_fallback_fetch")
             return []
-
-    def _read_json_lines(self) -> list:
-        records: list = []
-        with Path(self.json_backup).open("r", encoding="utf-8") as fh:
-            for line in fh:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    records.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
+        if table:
+            # Explicitly configured backup files hold every table.
+            records = [record for record in records if record.get("table") == table]
         return records
 
-    async def _json_backup_write(self, table: str, data: Dict[str, Any]) -> None:
-        payload = {"timestamp": datetime.utcnow().isoformat(), "table": table}
-        payload.update(data)
-        try:
-            cfg_path = Path(self.json_backup)
-            suffix = cfg_path.suffix.lower()
-
-            explicit_file = suffix in {".json", ".jsonl"}
-            if explicit_file:
-                target_dir = cfg_path.parent
-                target_name = cfg_path.name
-                if self._json_backup_is_default:
-                    db_dir = Path(self.db_path).parent
-                    if db_dir.exists():
-                        target_dir = db_dir
-                        target_name = f"{table}.jsonl"
-            else:
-                target_dir = cfg_path
-                target_name = f"{table}.jsonl"
+    def _journal(self, path: Path) -> FallbackJournal:
+        key = Path(path).resolve()
+        journal = self._journals.get(key)
+        if journal is None:
+            journal = self._journals[key] = FallbackJournal(key, segment_bytes=self.journal_segment_bytes)
+        return journal
+
+    def _journal_path(self, table: str) -> Path:
+        """Resolve the journal file that backs ``table``."""
+        cfg_path = Path(self.json_backup)
+        suffix = cfg_path.suffix.lower()
 
-            if not target_dir.exists() or target_dir == Path("."):
+        explicit_file = suffix in {".json", ".jsonl"}
+        if explicit_file:
+            target_dir = cfg_path.parent
+            target_name = cfg_path.name
+            if self._json_backup_is_default:
                 db_dir = Path(self.db_path).parent
                 if db_dir.exists():
                     target_dir = db_dir
                     target_name = f"{table}.jsonl"
+        else:
+            target_dir = cfg_path
+            target_name = f"{table}.jsonl"
+
+        if not target_dir.exists() or target_dir == Path("."):
+            db_dir = Path(self.db_path).parent
+            if db_dir.exists():
+                target_dir = db_dir
+                target_name = f"{table}.jsonl"
+        return target_dir / target_name
 
-            target_dir.mkdir(parents=True, exist_ok=True)
-            backup_path = target_dir / target_name
+    async def _json_backup_write(self, table: str, data: Dict[str, Any]) -> None:
+        payload = {"timestamp": datetime.utcnow().isoformat(), "table": table}
+        payload.update(data)
+        try:
+            backup_path = self._journal_path(table)
+            backup_path.parent.mkdir(parents=True, exist_ok=True)
             self._last_backup_path = backup_path
 
-            await asyncio.to_thread(self._append_json_line, backup_path, payload)
+            await asyncio.to_thread(self._journal(backup_path).append, payload)
         except Exception as exc:
             await self._log_internal(exc, "StorageEngine._json_backup_write")
 
-    def _append_json_line(self, backup_path: Path, payload: Dict[str, Any]) -> None:
-        with backup_path.open("a", encoding="utf-8") as fh:
-            json.dump(payload, fh, ensure_ascii=False)
-            fh.write("\n")
+    async def replay_journal(
+        self,
+        *,
+        batch_size: Optional[int] = None,
+        progress: Optional[Callable[[str, int, int], Any]] = None,
+    ) -> Dict[str, int]:
+        """
+        Write journaled rows back into SQLite.
+
+        Each batch commits together with a ``journal_replay`` checkpoint, so an
+        interrupted replay resumes where it stopped and never inserts a row twice.
+        Fully replayed journals are retired. ``progress(stream, done, total)`` is
+        called after every batch. Returns rows replayed per stream.
+        """
+        size = max(1, int(batch_size or self.replay_batch_size))
+        done: Dict[str, int] = {}
+        async with self._replay_lock:
+            self._replay_stats["runs"] += 1
+            for path in await asyncio.to_thread(self._journal_candidates):
+                journal = self._journal(path)
+                try:
+                    done[journal.name] = await self._replay_one(journal, size, progress)
+                except Exception as exc:
+                    await self._log_internal(exc, f"StorageEngine.replay_journal:{journal.name}")
+        return done
+
+    def _journal_candidates(self) -> List[Path]:
+        directories = {Path(self.db_path).parent.resolve()}
+        cfg_path = Path(self.json_backup)
+        directories.add((cfg_path if cfg_path.suffix.lower() not in {".json", ".jsonl"} else cfg_path.parent).resolve())
+        paths = {path.resolve() for directory in directories if directory.exists() for path in FallbackJournal.discover(directory)}
+        paths.update(self._journals)
+        return sorted(paths)
+
+    async def _replay_one(
+        self,
+        journal: FallbackJournal,
+        size: int,
+        progress: Optional[Callable[[str, int, int], Any]],
+    ) -> int:
+        stats = await asyncio.to_thread(journal.stats)
+        generation, total = stats["generation"], stats["records"]
+        if not total:
+            return 0
+        async with self._lock:
+            db = await self._writer_connection()
+            await db.execute(_REPLAY_SCHEMA)
+            await db.commit()
+            cursor = await db.execute(
+                "SELECT replayed FROM journal_replay WHERE stream = ? AND generation = ?",
+                (journal.name, generation),
+            )
+            row = await cursor.fetchone()
+            await cursor.close()
+        position = row[0] if row else 0
+        start = position
+
+        while True:
+            total = await asyncio.to_thread(journal.count)
+            if position >= total:
+                break
+            end = min(position + size, total)
+            records = await asyncio.to_thread(journal.read, position, end - position)
+
+            grouped: Dict[str, List[Tuple[Any, ...]]] = {}
+            skipped = end - position
+            for _, record in records:
+                build = _QUEUED_PARAMS.get(record.get("table", ""))
+                if build is not None:
+                    grouped.setdefault(record["table"], []).append(build(record))
+                    skipped -= 1
+
+            async with self._lock:
+                db = await self._writer_connection()
+                try:
+                    for table, rows in grouped.items():
+                        await db.executemany(_QUEUED_INSERTS[table], rows)
+                    await db.execute(
+                        """
+                        INSERT INTO journal_replay (stream, generation, replayed) VALUES (?, ?, ?)
+                        ON CONFLICT(stream, generation) DO UPDATE SET replayed = excluded.replayed
+                        """,
+                        (journal.name, generation, end),
+                    )
+                    await db.commit()
+                except BaseException:
+                    await db.rollback()
+                    raise
+                self._pool_stats["writes"] += end - position - skipped
+
+            self._replay_stats["batches"] += 1
+            self._replay_stats["replayed"] += end - position - skipped
+            self._replay_stats["skipped"] += skipped
+            position = end
+            logger.info("Replayed %s: %d/%d journaled rows", journal.name, position, total)
+            if progress is not None:
+                maybe = progress(journal.name, position, total)
+                if asyncio.iscoroutine(maybe):
+                    await maybe
+
+        if await asyncio.to_thread(journal.retire, position):
+            self._replay_stats["retired"] += 1
+            async with self._lock:
+                db = await self._writer_connection()
+                await db.execute(
+                    "DELETE FROM journal_replay WHERE stream = ? AND generation = ?",
+                    (journal.name, generation),
+                )
+                await db.commit()
+        return position - start
+
+    def journal_stats(self) -> Dict[str, Any]:
+        """Return replay counters plus per-journal record counts."""
+        return {
+            **self._replay_stats,
+            "journals": {journal.name: journal.stats() for journal in self._journals.values()},
+        }
 
     # ------------------------------------------------------------------
     # Higher-level helpers
     # ------------------------------------------------------------------
     async def insert_error_log(self, error_info: Dict[str, Any]) -> None:
-        query = """
-            INSERT INTO error_logs (error_type, message, traceback, timestamp, context)
-            VALUES (?, ?, ?, ?, ?)
-        """
-        params = (
-            error_info.get("type", "Unknown"),
-            error_info.get("message", ""),
-            error_info.get("traceback", ""),
-            error_info.get("timestamp", datetime.utcnow().isoformat()),
-            error_info.get("context", "Unknown"),
-        )
-        if not await self.execute(query, params):
-            await self._json_backup_write("error_logs", error_info)
+        self._enqueue("error_logs", _error_log_params(error_info), error_info)
 
     async def insert_log_entry(self, entry: Dict[str, Any]) -> None:
-        query = """
-            INSERT INTO logs (timestamp, severity, context, message)
-            VALUES (?, ?, ?, ?)
+        self._enqueue("logs", _log_entry_params(entry), entry)
+
+    # ------------------------------------------------------------------
+    # Write-behind queue
+    # ------------------------------------------------------------------
+    def _enqueue(self, table: str, params: Tuple[Any, ...], raw: Dict[str, Any]) -> None:
+        if len(self._pending) >= self.max_pending:
+            self._pending.popleft()
+            self._queue_stats["dropped"] += 1
+        self._pending.append((table, params, raw))
+        self._queue_stats["queued"] += 1
+        self._ensure_flusher()
+        if len(self._pending) >= self.flush_batch_size and self._flush_wakeup is not None:
+            self._flush_wakeup.set()
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is not None and not self._flusher.done():
+            return
+        self._flush_wakeup = asyncio.Event()
+        self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        assert self._flush_wakeup is not None
+        wakeup = self._flush_wakeup
+        while True:
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=self.flush_interval or None)
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
+            try:
+                # Shielded so shutdown() cancelling the loop cannot strand a half-written batch.
+                await asyncio.shield(self.flush())
+            except Exception as exc:  # pragma: no cover - flush() logs its own failures
+                await self._log_internal(exc, "StorageEngine._flush_loop")
+
+    async def flush(self) -> int:
+        """
+        Group-commit every queued row; returns the number written to SQLite.
+
+        Each table commits in its own transaction. A table whose batch fails is
+        retried row by row, so only the rows SQLite rejects go to the journal;
+        recovery runs only when the connection fails or every row of a table does.
         """
-        params = (
-            entry.get("timestamp", datetime.utcnow().isoformat()),
-            entry.get("severity", "INFO"),
-            entry.get("context", "General"),
-            entry.get("message", ""),
-        )
-        if not await self.execute(query, params):
-            await self._json_backup_write("logs", entry)
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            batch = list(self._pending)
+            self._pending.clear()
+
+            grouped: Dict[str, List[Tuple[Tuple[Any, ...], Dict[str, Any]]]] = {}
+            for table, params, raw in batch:
+                grouped.setdefault(table, []).append((params, raw))
+
+            written = 0
+            rejected: List[Tuple[str, Dict[str, Any]]] = []
+            db_error: Optional[Exception] = None
+            async with self._lock:
+                try:
+                    db = await self._writer_connection()
+                except Exception as exc:
+                    db, db_error = None, exc
+                    await self._log_internal(exc, "StorageEngine.flush")
+                for table, entries in grouped.items():
+                    if db is None:
+                        rejected.extend((table, raw) for _, raw in entries)
+                        continue
+                    try:
+                        done, failed, error = await self._flush_table(db, table, entries)
+                    except Exception as exc:
+                        # Commit or rollback failed: the connection is at fault, not a row.
+                        done, failed, error = 0, [raw for _, raw in entries], exc
+                        db_error = exc
+                        await self._log_internal(exc, f"StorageEngine.flush:{table}")
+                    if error is not None and not done and not isinstance(error, aiosqlite.IntegrityError):
+                        db_error = error
+                    written += done
+                    rejected.extend((table, raw) for raw in failed)
+                self._pool_stats["writes"] += written
+
+            for table, raw in rejected:
+                await self._json_backup_write(table, raw)
+            self._queue_stats["fallback"] += len(rejected)
+            self._queue_stats["flushed"] += written
+            if written:
+                self._queue_stats["batches"] += 1
+            if isinstance(db_error, aiosqlite.Error):
+                await self._recover_database()
+            return written
+
+    async def _flush_table(
+        self,
+        db: aiosqlite.Connection,
+        table: str,
+        entries: List[Tuple[Tuple[Any, ...], Dict[str, Any]]],
+    ) -> Tuple[int, List[Dict[str, Any]], Optional[Exception]]:
+        """Insert one table's rows; returns (rows written, rejected raw rows, last row error)."""
+        sql = _QUEUED_INSERTS[table]
+        try:
+            await db.executemany(sql, [params for params, _ in entries])
+            await db.commit()
+            return len(entries), [], None
+        except BaseException as exc:
+            await db.rollback()
+            if not isinstance(exc, Exception):
+                raise
+            await self._log_internal(exc, f"StorageEngine.flush:{table}")
+
+        # A failed statement only undoes itself, so the good rows still commit together.
+        failed: List[Dict[str, Any]] = []
+        error: Optional[Exception] = None
+        try:
+            for params, raw in entries:
+                try:
+                    await db.execute(sql, params)
+                except Exception as exc:
+                    failed.append(raw)
+                    error = exc
+            await db.commit()
+        except BaseException:
+            await db.rollback()
+            raise
+        return len(entries) - len(failed), failed, error
+
+    def attach_event_bus(self, event_bus: Any) -> None:
+        """Flush queued rows and stop the flusher when shutdown is announced."""
+        from discord_bot.core.event_topics import SHUTDOWN_INITIATED
+
+        event_bus.subscribe(SHUTDOWN_INITIATED, self._on_shutdown)
+
+    async def _on_shutdown(self, **_: Any) -> None:
+        await self.shutdown()
+
+    async def shutdown(self) -> None:
+        """Stop the background flusher, write out the queue, and close the pool."""
+        flusher, self._flusher = self._flusher, None
+        if flusher is not None:
+            flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await flusher
+        await self.flush()
+        await self.close()
+
+    def queue_stats(self) -> Dict[str, int]:
+        """Return write-behind counters plus the current backlog size."""
+        return {"pending": len(self._pending), **self._queue_stats}
 
     # ------------------------------------------------------------------
     # Health + recovery
     # ------------------------------------------------------------------
     async def ping(self) -> bool:
+        """Check that the writer and a pooled reader both answer."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("SELECT 1;")
+            async with self._lock:
+                writer = await self._writer_connection()
+                await writer.execute("SELECT 1;")
+            async with self._reader() as reader:
+                await reader.execute("SELECT 1;")
             return True
         except Exception:
             return False
 
     async def _recover_database(self) -> None:
-        try:
-            db_path = Path(self.db_path)
-            if not db_path.exists():
-                await self.initialize()
+        # Holding the writer lock keeps other writes off the connection being closed.
+        async with self._lock:
+            self._ready.clear()
+            try:
+                # Pooled handles point at the damaged file; wait for checked-out
+                # readers to come back, then drop them all before moving it aside.
+                await self._drain_readers()
+                await self.close()
+                self._pool_stats["reopens"] += 1
+                db_path = Path(self.db_path)
+                if db_path.exists():
+                    backup = db_path.with_suffix(".bak")
+                    if backup.exists():
+                        backup.unlink(missing_ok=True)
+                    db_path.rename(backup)
+                    await self._initialize_locked()
+                    backup.unlink(missing_ok=True)
+                else:
+                    await self._initialize_locked()
+            except Exception as exc:
+                await self._log_internal(exc, "StorageEngine._recover_database")
                 return
+            finally:
+                self._ready.set()
+        # Rows written to the journal during the outage go back into the fresh database.
+        await self.replay_journal()
 
-            backup = db_path.with_suffix(".bak")
-            if backup.exists():
-                backup.unlink(missing_ok=True)
-            db_path.rename(backup)
-            await self.initialize()
-            backup.unlink(missing_ok=True)
-        except Exception as exc:
-            await self._log_internal(exc, "StorageEngine._recover_database")
+    async def _drain_readers(self) -> None:
+        """Take every pooled reader out of the idle queue (new checkouts wait on `_ready`)."""
+        idle = self._idle_readers
+        if idle is None:
+            return
+        for _ in range(len(self._readers)):
+            await idle.get()
 
     # ------------------------------------------------------------------
     # Logging helper
@@ -0,0 +1,350 @@
+"""
+Async facade over :class:`GameStorageEngine` for use from cogs.
+
+Key features:
+ - Every public engine method is available as an awaitable of the same name
+ - Writes (including read-modify-write helpers) are serialized on one dedicated
+   writer thread, so the gateway loop never waits on SQLite locks or fsyncs
+ - run() puts manager helpers that write through the engine (cookies, relationships,
+   Pokemon) on the same writer thread
+ - Pure reads run on a small pool of read-only connections; WAL lets them
+   proceed while the writer holds a transaction
+ - In-memory and URI databases cannot be shared between connections, so for
+   those every call runs on the writer thread against the engine's own handle
+ - A background task flushes the engine's user-state cache every
+   ``flush_interval_ms``; close() writes out whatever is still dirty. A flush
+   triggered by the dirty-row limit is queued on the writer thread too, even
+   when the staging call came from another thread
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import copy
+import functools
+import logging
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Optional
+
+from discord_bot.games.storage.game_storage_engine import GameStorageEngine
+
+logger = logging.getLogger("hippo_bot.game_storage")
+
+# Methods that only read. Anything not listed here is routed to the writer thread,
+# including getters with side effects (is_muted clears expired mutes,
+# get_admin_gift_remaining creates today's allowance row).
+READ_METHODS: FrozenSet[str] = frozenset(
+    {
+        "get_user_data",
+        "get_user_cookies",
+        "is_game_unlocked",
+        "get_user_pokemon",
+        "get_pokemon_count_by_species",
+        "get_pokemon_by_id",
+        "get_daily_easter_egg_stats",
+        "get_aggravation_level",
+        "get_mute_until",
+        "get_stat",
+        "get_all_stats",
+        "get_cookie_leaderboard",
+        "get_event_reminders",
+        "check_duplicate_event_submission",
+        "check_duplicate_submission",
+        "get_user_event_rankings",
+        "get_guild_event_leaderboard",
+        "get_current_event_week",
+        "get_event_ranking_history",
+        "get_event_submission_stats",
+        "user_state_stats",
+        "schema_version",
+        "stale_event_weeks",
+    }
+)
+
+WRITE_METHODS: FrozenSet[str] = frozenset(
+    {
+        "create_tables",
+        "migrate",
+        "add_user",
+        "update_cookies",
+        "add_cookies",
+        "add_gift_cookies",
+        "add_cookies_bulk",
+        "spend_cookies",
+        "try_spend_cookies",
+        "get_admin_gift_remaining",
+        "consume_admin_gift_allowance",
+        "update_relationship",
+        "increment_interactions",
+        "unlock_game",
+        "add_pokemon",
+        "update_pokemon_stats",
+        "remove_pokemon",
+        "update_pokemon_xp",
+        "update_daily_check",
+        "record_easter_egg_attempt",
+        "reset_daily_easter_egg_stats",
+        "increase_aggravation",
+        "reset_aggravation",
+        "maybe_reset_aggravation",
+        "set_mute_until",
+        "clear_mute",
+        "is_muted",
+        "increment_stat",
+        "store_event_reminder",
+        "update_event_reminder",
+        "delete_event_reminder",
+        "save_event_ranking",
+        "update_event_ranking",
+        "save_ranking",
+        "update_ranking",
+        "log_submission",
+        "prune_event_weeks",
+        "log_event_submission",
+        "delete_old_event_rankings",
+        "delete_event_rankings_batch",
+        "rollup_interactions_batch",
+        "rollup_event_submissions_batch",
+        "get_user_state",
+        "stage_user_state",
+        "stage_interaction",
+        "flush_user_state",
+    }
+)
+
+
+class AsyncGameStorage:
+    """
+    Awaitable view of a :class:`GameStorageEngine`.
+
+    Parameters:
+        engine: the synchronous engine whose schema and database are used.
+        readers: number of read-only connections (and reader threads).
+        busy_timeout_ms: SQLite busy timeout applied to the pooled connections.
+        flush_interval_ms: how often staged user-state changes are written back.
+
+    Use :meth:`for_engine` to share one facade (and one writer thread) per engine.
+    """
+
+    def __init__(
+        self,
+        engine: GameStorageEngine,
+        *,
+        readers: int = 3,
+        busy_timeout_ms: int = 5000,
+        flush_interval_ms: int = 5000,
+    ) -> None:
+        self.engine = engine
+        self.reader_count = max(1, int(readers))
+        self.busy_timeout_ms = int(busy_timeout_ms)
+        self.flush_interval = max(1, int(flush_interval_ms)) / 1000.0
+        self._flusher: Optional[asyncio.Task] = None
+        self._shared = self._reads_use_writer(engine)
+        self._writer_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="game-db-writer", initializer=self._mark_writer_thread
+        )
+        self._reader_pool: Optional[ThreadPoolExecutor] = None
+        if not self._shared:
+            self._reader_pool = ThreadPoolExecutor(
+                max_workers=self.reader_count, thread_name_prefix="game-db-reader"
+            )
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._stats: Dict[str, int] = {"reads": 0, "writes": 0, "reads_on_writer": 0}
+        self._flush_queued = False
+        self._closed = False
+        if not self._shared:
+            engine.conn.execute("PRAGMA journal_mode=WAL;")
+
+    @classmethod
+    def for_engine(cls, engine: "GameStorageEngine | AsyncGameStorage", **kwargs: Any) -> "AsyncGameStorage":
+        """Return the facade attached to ``engine``, creating it on first use."""
+        if isinstance(engine, AsyncGameStorage):
+            return engine
+        facade = getattr(engine, "_async_facade", None)
+        if facade is None or facade._closed:
+            facade = cls(engine, **kwargs)
+            engine._async_facade = facade  # type: ignore[attr-defined]
+        return facade
+
+    @staticmethod
+    def _reads_use_writer(engine: GameStorageEngine) -> bool:
+        # ":memory:" and "file:" URIs are private to the engine's connection.
+        return not isinstance(getattr(engine, "db_path", None), Path)
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if name in READ_METHODS:
+            method = functools.partial(self._call, name, False)
+        elif name in WRITE_METHODS:
+            method = functools.partial(self._call, name, True)
+        else:
+            raise AttributeError(f"{type(self).__name__!s} has no storage method {name!r}")
+        functools.update_wrapper(method, getattr(GameStorageEngine, name))
+        return method
+
+    async def _call(self, name: str, write: bool, *args: Any, **kwargs: Any) -> Any:
+        if self._closed:
+            raise RuntimeError("AsyncGameStorage is closed")
+        self._ensure_flusher()
+        return await self._dispatch(name, write, args, kwargs)
+
+    async def _dispatch(self, name: str, write: bool, args: tuple, kwargs: dict) -> Any:
+        if write or self._shared:
+            pool = self._writer_pool
+            target = self._writer_view
+            self._stats["writes" if write else "reads_on_writer"] += 1
+        else:
+            assert self._reader_pool is not None
+            pool = self._reader_pool
+            target = self._reader_view
+            self._stats["reads"] += 1
+        loop = asyncio.get_running_loop()
+        job = functools.partial(self._run, target, name, args, kwargs)
+        return await loop.run_in_executor(pool, job)
+
+    @staticmethod
+    def _run(target: Callable[[], GameStorageEngine], name: str, args: tuple, kwargs: dict) -> Any:
+        return getattr(target(), name)(*args, **kwargs)
+
+    async def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a synchronous helper that writes through the engine (a CookieManager,
+        RelationshipManager or PokemonGame method) on the writer thread, in turn
+        with every other write, and return its result.
+        """
+        if self._closed:
+            raise RuntimeError("AsyncGameStorage is closed")
+        self._ensure_flusher()
+        self._stats["writes"] += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._writer_pool, functools.partial(fn, *args, **kwargs))
+
+    # ------------------------------------------------------------------
+    # User-state flusher
+    # ------------------------------------------------------------------
+    def _ensure_flusher(self) -> None:
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.get_running_loop().create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            if not self.engine.user_state_stats()["dirty"]:
+                continue
+            try:
+                # Shielded so close() cancelling the loop cannot abandon a batch mid-write.
+                await asyncio.shield(self._dispatch("flush_user_state", True, (), {}))
+            except Exception:
+                logger.exception("Periodic user-state flush failed")
+
+    def schedule_flush(self) -> bool:
+        """
+        Queue a user-state flush on the writer thread; the engine calls this when
+        its dirty-row limit is reached. Returns False when the caller should flush
+        inline: on the writer thread itself, or once the facade is closed.
+        """
+        if self._closed or getattr(self._local, "writer", False):
+            return False
+        if self._flush_queued:
+            return True
+        self._flush_queued = True
+        try:
+            self._writer_pool.submit(self._flush_on_writer)
+        except RuntimeError:  # pool already shut down
+            self._flush_queued = False
+            return False
+        return True
+
+    def _flush_on_writer(self) -> None:
+        self._flush_queued = False
+        try:
+            self._writer_view().flush_user_state()
+        except Exception:
+            logger.exception("Size-triggered user-state flush failed")
+
+    # ------------------------------------------------------------------
+    # Per-thread engine views
+    # ------------------------------------------------------------------
+    def _mark_writer_thread(self) -> None:
+        self._local.writer = True
+
+    def _writer_view(self) -> GameStorageEngine:
+        if self._shared:
+            return self.engine
+        view = getattr(self._local, "view", None)
+        if view is None:
+            conn = sqlite3.connect(
+                self.engine.db_path, timeout=self.busy_timeout_ms / 1000, check_same_thread=False
+            )
+            view = self._bind(conn)
+        return view
+
+    def _reader_view(self) -> GameStorageEngine:
+        view = getattr(self._local, "view", None)
+        if view is None:
+            uri = f"{Path(self.engine.db_path).resolve().as_uri()}?mode=ro"
+            conn = sqlite3.connect(
+                uri, uri=True, timeout=self.busy_timeout_ms / 1000, check_same_thread=False
+            )
+            conn.execute("PRAGMA query_only=ON;")
+            view = self._bind(conn)
+        return view
+
+    def _bind(self, conn: sqlite3.Connection) -> GameStorageEngine:
+        """Clone the engine onto ``conn`` and cache it for the calling thread."""
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA busy_timeout={self.busy_timeout_ms};")
+        view = copy.copy(self.engine)
+        view.conn = conn
+        self._local.view = view
+        with self._connections_lock:
+            self._connections.append(conn)
+        return view
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    async def close(self) -> None:
+        """Flush dirty user state, drain both pools and close the pooled connections (not the engine's own)."""
+        if self._closed:
+            return
+        flusher, self._flusher = self._flusher, None
+        if flusher is not None:
+            flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await flusher
+        self._closed = True
+        try:
+            await self._dispatch("flush_user_state", True, (), {})
+        except Exception:
+            logger.exception("Final user-state flush failed")
+        pools = [self._writer_pool] + ([self._reader_pool] if self._reader_pool else [])
+        await asyncio.get_running_loop().run_in_executor(
+            None, lambda: [pool.shutdown(wait=True) for pool in pools]
+        )
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        if getattr(self.engine, "_async_facade", None) is self:
+            self.engine._async_facade = None  # type: ignore[attr-defined]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return dispatch counters and pool shape."""
+        return {
+            "shared_connection": self._shared,
+            "readers": 0 if self._shared else self.reader_count,
+            "open_connections": len(self._connections),
+            **self._stats,
+        }
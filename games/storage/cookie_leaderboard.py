@@ -0,0 +1,92 @@
+"""
+In-memory top-K cookie leaderboard maintained alongside ``users``.
+
+The board is seeded once with the best ``capacity`` rows and then updated in
+place from the values the engine's cookie statements return. Reads copy the
+first ``limit`` entries and never touch SQLite.
+
+Ordering matches ``get_cookie_leaderboard``: ``total_cookies DESC, user_id ASC``,
+users with no earned cookies excluded. Totals only grow through awards, so the
+board stays exact; a decrease for a user on a truncated board (possible via
+``update_cookies``) drops the board and the next read reseeds it.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class CookieLeaderboard:
+    """Sorted top-``capacity`` view of users by total cookies earned."""
+
+    def __init__(self, capacity: int = 50) -> None:
+        self.capacity = max(1, int(capacity))
+        self.lock = threading.RLock()
+        self.seeded = False
+        self._complete = False  # True when every user with cookies fits on the board
+        self._entries: Dict[str, Tuple[int, int]] = {}
+        self._order: List[Tuple[int, str]] = []  # (-total, user_id), ascending
+
+    def seed(self, rows: Iterable[Tuple[str, int, int]]) -> None:
+        """Replace the board with ``(user_id, total, current)`` rows from SQLite."""
+        with self.lock:
+            self._entries = {user_id: (total, current) for user_id, total, current in rows}
+            self._order = sorted((-total, user_id) for user_id, (total, _) in self._entries.items())
+            self._complete = len(self._entries) < self.capacity
+            self.seeded = True
+
+    def invalidate(self) -> None:
+        """Forget the board; the next read reseeds it."""
+        with self.lock:
+            self.seeded = False
+            self._entries = {}
+            self._order = []
+
+    def top(self, limit: int) -> Optional[List[Dict[str, Any]]]:
+        """Return the first ``limit`` rows, or None when the board cannot answer."""
+        with self.lock:
+            if not self.seeded or limit > self.capacity:
+                return None
+            rows = []
+            for _, user_id in self._order[: max(0, limit)]:
+                total, current = self._entries[user_id]
+                rows.append({"user_id": user_id, "total_cookies": total, "cookies_left": current})
+            return rows
+
+    def observe(self, user_id: str, total: int, current: int) -> None:
+        """Apply a user's committed totals."""
+        with self.lock:
+            if not self.seeded:
+                return
+            previous = self._entries.get(user_id)
+            if previous is not None:
+                if total < previous[0] and not self._complete:
+                    # Someone off the board may now outrank this user.
+                    self.invalidate()
+                    return
+                self._remove(user_id, previous[0])
+            if total <= 0:
+                return
+            key = (-total, user_id)
+            if not self._complete and len(self._order) >= self.capacity and key > self._order[-1]:
+                return
+            bisect.insort(self._order, key)
+            self._entries[user_id] = (total, current)
+            if len(self._order) > self.capacity:
+                _, evicted = self._order.pop()
+                del self._entries[evicted]
+                self._complete = False
+
+    def observe_balance(self, user_id: str, current: int) -> None:
+        """Apply a new spendable balance; ranking is unaffected."""
+        with self.lock:
+            entry = self._entries.get(user_id)
+            if entry is not None:
+                self._entries[user_id] = (entry[0], current)
+
+    def _remove(self, user_id: str, total: int) -> None:
+        index = bisect.bisect_left(self._order, (-total, user_id))
+        del self._order[index]
+        del self._entries[user_id]
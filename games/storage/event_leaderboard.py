@@ -0,0 +1,122 @@
+"""
+Scoped event-ranking leaderboards: scope keys plus an in-memory mirror.
+
+A scope is one combination of leaderboard filters:
+``(guild_id, event_week, stage_type, day_number, guild_tag)`` where ``"*"``
+(or ``0`` for the day) means "not filtered". Every ranking contributes to the
+16 scopes formed by keeping or wildcarding each filter; the engine keeps one
+pre-aggregated row per user per scope in ``event_leaderboard``.
+
+The mirror caches the best ``depth`` rows of recently read scopes and applies
+per-user changes in place. A change it cannot place exactly (a user dropping
+down a truncated list) evicts the scope so the next read reloads it.
+"""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+ALL = "*"
+ALL_DAYS = 0
+
+Scope = Tuple[str, str, str, int, str]
+
+
+def scope_for(
+    guild_id: str,
+    event_week: Optional[str],
+    stage_type: Optional[str],
+    day_number: Optional[int],
+    guild_tag: Optional[str],
+) -> Scope:
+    """Map leaderboard filters (falsy meaning "any") onto a scope key."""
+    return (guild_id, event_week or ALL, stage_type or ALL, day_number or ALL_DAYS, guild_tag or ALL)
+
+
+def scopes_for_ranking(
+    guild_id: str,
+    event_week: str,
+    stage_type: str,
+    day_number: Optional[int],
+    guild_tag: Optional[str],
+) -> Iterator[Scope]:
+    """Yield every scope a ranking row with these values belongs to."""
+    weeks = (event_week, ALL) if event_week else (ALL,)
+    stages = (stage_type, ALL) if stage_type else (ALL,)
+    days = (day_number, ALL_DAYS) if day_number else (ALL_DAYS,)
+    tags = (guild_tag, ALL) if guild_tag else (ALL,)
+    for week, stage, day, tag in itertools.product(weeks, stages, days, tags):
+        yield (guild_id, week, stage, day, tag)
+
+
+def order_key(row: Dict[str, Any]) -> Tuple[int, int, str]:
+    """Leaderboard order: best rank, then highest score, then user id."""
+    return (row["best_rank"], -row["highest_score"], row["user_id"])
+
+
+class EventLeaderboardMirror:
+    """LRU of scope -> best ``depth`` leaderboard rows."""
+
+    def __init__(self, depth: int = 100, max_scopes: int = 512) -> None:
+        self.depth = max(1, int(depth))
+        self.max_scopes = max(1, int(max_scopes))
+        self.lock = threading.RLock()
+        # scope -> (sorted keys, user_id -> row, complete)
+        self._scopes: "OrderedDict[Scope, Tuple[List[Tuple[int, int, str]], Dict[str, Dict[str, Any]], bool]]" = (
+            OrderedDict()
+        )
+
+    def get(self, scope: Scope, limit: int) -> Optional[List[Dict[str, Any]]]:
+        """Return the first ``limit`` rows for a cached scope, or None."""
+        with self.lock:
+            cached = self._scopes.get(scope)
+            if cached is None or limit > self.depth:
+                return None
+            self._scopes.move_to_end(scope)
+            keys, rows, _ = cached
+            return [dict(rows[user_id]) for _, _, user_id in keys[: max(0, limit)]]
+
+    def load(self, scope: Scope, rows: List[Dict[str, Any]]) -> None:
+        """Cache the leading rows of a scope as read from SQLite (already ordered)."""
+        with self.lock:
+            by_user = {row["user_id"]: dict(row) for row in rows[: self.depth]}
+            keys = sorted(order_key(row) for row in by_user.values())
+            self._scopes[scope] = (keys, by_user, len(rows) < self.depth)
+            self._scopes.move_to_end(scope)
+            while len(self._scopes) > self.max_scopes:
+                self._scopes.popitem(last=False)
+
+    def apply(self, scope: Scope, user_id: str, row: Optional[Dict[str, Any]]) -> None:
+        """Replace (or with ``row=None`` remove) one user's row in a cached scope."""
+        with self.lock:
+            cached = self._scopes.get(scope)
+            if cached is None:
+                return
+            keys, by_user, complete = cached
+            previous = by_user.pop(user_id, None)
+            if previous is not None:
+                del keys[bisect.bisect_left(keys, order_key(previous))]
+            if row is None:
+                if previous is not None and not complete:
+                    del self._scopes[scope]
+                return
+            key = order_key(row)
+            if previous is not None and key > order_key(previous) and not complete:
+                del self._scopes[scope]
+                return
+            if not complete and len(keys) >= self.depth and key > keys[-1]:
+                return
+            bisect.insort(keys, key)
+            by_user[user_id] = dict(row)
+            if len(keys) > self.depth:
+                _, _, evicted = keys.pop()
+                del by_user[evicted]
+                self._scopes[scope] = (keys, by_user, False)
+
+    def clear(self) -> None:
+        with self.lock:
+            self._scopes.clear()
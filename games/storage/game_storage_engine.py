@@ -1,12 +1,45 @@
 import sqlite3
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from pathlib import Path
 
 from discord_bot.core.engines.screenshot_processor import RankingData, StageType, RankingCategory
+from discord_bot.games.storage.cookie_leaderboard import CookieLeaderboard
+from discord_bot.games.storage.event_leaderboard import (
+    EventLeaderboardMirror,
+    Scope,
+    scope_for,
+    scopes_for_ranking,
+)
+
+# Number of steps in GameStorageEngine._migrations(); PRAGMA user_version tracks progress.
+SCHEMA_VERSION = 4
+
+# Cookie and aggravation writes use UPDATE ... RETURNING (SQLite 3.35+).
+MIN_SQLITE_VERSION = (3, 35, 0)
+
+# Relationship columns held in the user-state cache and written back by flush_user_state().
+USER_STATE_FIELDS = (
+    "relationship_index",
+    "daily_streak",
+    "last_interaction",
+    "last_daily_check",
+    "relationship_anchor_at",
+    "total_interactions",
+)
+
 
 class GameStorageEngine:
-    def __init__(self, db_path="data/game_data.db"):
+    def __init__(self, db_path="data/game_data.db", *, user_cache_size: int = 5000,
+                 user_flush_batch: int = 200, leaderboard_capacity: int = 50,
+                 event_leaderboard_depth: int = 100):
+        if sqlite3.sqlite_version_info < MIN_SQLITE_VERSION:
+            raise RuntimeError(
+                f"GameStorageEngine needs SQLite {'.'.join(map(str, MIN_SQLITE_VERSION))} or newer "
+                f"(UPDATE ... RETURNING); the linked library is {sqlite3.sqlite_version}"
+            )
         if isinstance(db_path, str) and (db_path == ":memory:" or db_path.startswith("file:")):
             resolved_path = db_path
         else:
@@ -17,234 +50,366 @@ class GameStorageEngine:
             path_obj.parent.mkdir(parents=True, exist_ok=True)
             resolved_path = path_obj
 
-        self.conn = sqlite3.connect(resolved_path)
+        self.db_path = resolved_path
+        # AsyncGameStorage drives this connection from its writer thread.
+        self.conn = sqlite3.connect(resolved_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
+        # Write-behind cache of relationship state; shared by every view of this engine.
+        self.user_cache_size = max(1, int(user_cache_size))
+        self.user_flush_batch = max(1, int(user_flush_batch))
+        self._user_state: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._dirty_users: Dict[str, int] = {}  # user_id -> pending total_interactions delta
+        self._pending_interactions: List[Tuple[str, str, str, int]] = []
+        self._user_state_lock = threading.RLock()
+        # Held across snapshot and commit, so flushes from any view land in order.
+        self._user_flush_lock = threading.Lock()
+        # Top-K cookie board; cookie writers hold its lock across commit + update.
+        self._cookie_board = CookieLeaderboard(capacity=leaderboard_capacity)
+        # Mirror of recently read event_leaderboard scopes; ranking writers hold its lock.
+        self._event_board = EventLeaderboardMirror(depth=event_leaderboard_depth)
         self.create_tables()
 
-    def create_tables(self):
-        with self.conn:
-            # Enhanced users table with relationship and game unlock tracking
-            self.conn.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                user_id TEXT PRIMARY KEY,
-                total_cookies INTEGER DEFAULT 0,
-                cookies_left INTEGER DEFAULT 0,
-                relationship_index INTEGER DEFAULT 0,
-                last_interaction TEXT,
-                daily_streak INTEGER DEFAULT 0,
-                game_unlocked INTEGER DEFAULT 0,
-                total_interactions INTEGER DEFAULT 0,
-                last_daily_check TEXT,
-                aggravation_level INTEGER DEFAULT 0,
-                relationship_anchor_at TEXT,
-                aggravation_updated_at TEXT,
-                mute_until TEXT
-            );
-            """)
-            self._ensure_user_aux_columns()
-            
-            # Enhanced pokemon table with species tracking for duplicates
-            self.conn.execute("""
-            CREATE TABLE IF NOT EXISTS pokemon (
-                pokemon_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id TEXT,
-                species TEXT,
-                nickname TEXT,
-                level INTEGER DEFAULT 1,
-                experience INTEGER DEFAULT 0,
-                hp INTEGER,
-                attack INTEGER,
-                defense INTEGER,
-                special_attack INTEGER,
-                special_defense INTEGER,
-                speed INTEGER,
-                iv_hp INTEGER,
-                iv_attack INTEGER,
-                iv_defense INTEGER,
-                iv_special_attack INTEGER,
-                iv_special_defense INTEGER,
-                iv_speed INTEGER,
-                nature TEXT,
-                caught_date TEXT,
-                is_favorite INTEGER DEFAULT 0,
-                FOREIGN KEY (user_id) REFERENCES users(user_id)
-            );
-            """)
-            
-            # Battles table
-            self.conn.execute("""
-            CREATE TABLE IF NOT EXISTS battles (
-                battle_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user1_id TEXT,
-                user2_id TEXT,
-                winner_id TEXT,
-                log TEXT,
-                battle_date TEXT,
-                FOREIGN KEY (user1_id) REFERENCES users(user_id),
-                FOREIGN KEY (user2_id) REFERENCES users(user_id)
-            );
-            """)
-            
-            # Interaction history for relationship tracking
-            self.conn.execute("""
-            CREATE TABLE IF NOT EXISTS interactions (
-                interaction_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id TEXT,
-                interaction_type TEXT,
-                timestamp TEXT,
-                cookies_earned INTEGER DEFAULT 0,
-                FOREIGN KEY (user_id) REFERENCES users(user_id)
-            );
-            """)
-            
-            # Daily easter egg tracking
-            self.conn.execute("""
-            CREATE TABLE IF NOT EXISTS daily_easter_egg_stats (
-                stat_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id TEXT,
-                date TEXT,
-                cookies_earned INTEGER DEFAULT 0,
-                attempts INTEGER DEFAULT 0,
-                spam_count INTEGER DEFAULT 0,
-                FOREIGN KEY (user_id) REFERENCES users(user_id),
-                UNIQUE(user_id, date)
-            );
-            """)
-
-            # Admin/helper daily gift allowances
-            self.conn.execute("""
-            CREATE TABLE IF NOT EXISTS admin_cookie_allowances (
-                user_id TEXT PRIMARY KEY,
-                last_date TEXT,
-                remaining INTEGER DEFAULT 0
-            );
-            """)
-            
-            # Game statistics tracking
-            self.conn.execute("""
-            CREATE TABLE IF NOT EXISTS game_stats (
-                stat_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id TEXT,
-                stat_type TEXT,
-                stat_value INTEGER DEFAULT 0,
-                last_updated TEXT,
-                FOREIGN KEY (user_id) REFERENCES users(user_id),
-                UNIQUE(user_id, stat_type)
-            );
-            """)
-            
-            # Event reminders for Top Heroes coordination
-            self.conn.execute("""
-            CREATE TABLE IF NOT EXISTS event_reminders (
-                event_id TEXT PRIMARY KEY,
-                guild_id INTEGER NOT NULL,
-                title TEXT NOT NULL,
-                description TEXT,
-                category TEXT NOT NULL,
-                event_time_utc TEXT NOT NULL,
-                recurrence TEXT DEFAULT 'once',
-                custom_interval_hours INTEGER,
-                reminder_times TEXT,
-                channel_id INTEGER,
-                role_to_ping INTEGER,
-                created_by INTEGER,
-                is_active INTEGER DEFAULT 1,
-                auto_scraped INTEGER DEFAULT 0,
-                source_url TEXT,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            );
-            """)
-
-            # Event rankings for Top Heroes coordination
-            self.conn.execute("""
-            CREATE TABLE IF NOT EXISTS event_rankings (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id TEXT NOT NULL,
-                username TEXT NOT NULL,
-                guild_id TEXT,
-                guild_tag TEXT,
-                player_name TEXT,
-                event_week TEXT NOT NULL,
-                stage_type TEXT NOT NULL,
-                day_number INTEGER,
-                category TEXT NOT NULL,
-                rank INTEGER NOT NULL,
-                score INTEGER NOT NULL,
-                submitted_at TEXT NOT NULL,
-                screenshot_url TEXT,
-                created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(user_id, guild_id, event_week, stage_type, day_number)
-            );
-            """)
-
-            # Indexes for fast ranking lookups
-            self.conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_rankings_user 
-            ON event_rankings(user_id, guild_id);
-            """)
-            self.conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_rankings_guild_stage 
-            ON event_rankings(guild_id, stage_type, day_number);
-            """)
-            self.conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_rankings_guild_tag 
-            ON event_rankings(guild_tag);
-            """)
-            self.conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_rankings_event_week 
-            ON event_rankings(event_week, guild_id);
-            """)
-
-            # Submission log for ranking processing
-            self.conn.execute("""
-            CREATE TABLE IF NOT EXISTS event_submissions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id TEXT NOT NULL,
-                guild_id TEXT,
-                submitted_at TEXT NOT NULL,
-                status TEXT NOT NULL,
-                error_message TEXT,
-                ranking_id INTEGER,
-                FOREIGN KEY(ranking_id) REFERENCES event_rankings(id)
-            );
-            """)
-
-            # KVK run lifecycle tracking
-            self.conn.execute("""
-            CREATE TABLE IF NOT EXISTS kvk_runs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id TEXT NOT NULL,
-                title TEXT NOT NULL,
-                initiated_by TEXT,
-                event_id TEXT,
-                channel_id INTEGER,
-                run_number INTEGER,
-                is_test INTEGER DEFAULT 0,
-                started_at TEXT NOT NULL,
-                ends_at TEXT NOT NULL,
-                closed_at TEXT,
-                status TEXT NOT NULL DEFAULT 'active',
-                UNIQUE(guild_id, run_number) 
-            );
-            """)
-
-            self.conn.execute("""
-            CREATE TABLE IF NOT EXISTS kvk_submissions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                kvk_run_id INTEGER NOT NULL,
-                ranking_id INTEGER NOT NULL,
-                user_id TEXT NOT NULL,
-                day_number INTEGER NOT NULL,
-                stage_type TEXT NOT NULL,
-                submitted_at TEXT NOT NULL,
-                is_test INTEGER DEFAULT 0,
-                FOREIGN KEY(kvk_run_id) REFERENCES kvk_runs(id),
-                FOREIGN KEY(ranking_id) REFERENCES event_rankings(id),
-                UNIQUE(kvk_run_id, user_id, day_number, stage_type)
-            );
-            """)
-
-            self._ensure_event_ranking_columns()
+    # ------------------------------------------------------------------ #
+    # Schema migrations (PRAGMA user_version records the last step applied)
+    # ------------------------------------------------------------------ #
+    def create_tables(self) -> None:
+        """Bring the schema up to date; each migration runs once per database."""
+        self.migrate()
+
+    def schema_version(self) -> int:
+        """Return the migration step recorded in ``PRAGMA user_version``."""
+        return self.conn.execute("PRAGMA user_version").fetchone()[0]
+
+    def migrate(self) -> int:
+        """Apply pending migrations in order, one transaction per step."""
+        current = self.schema_version()
+        for version, step in enumerate(self._migrations(), start=1):
+            if version <= current:
+                continue
+            # DDL does not open an implicit transaction, so begin one explicitly.
+            self.conn.execute("BEGIN")
+            try:
+                step()
+                self.conn.execute(f"PRAGMA user_version = {version}")
+                self.conn.commit()
+            except BaseException:
+                self.conn.rollback()
+                raise
+        return self.schema_version()
+
+    def _migrations(self) -> List[Any]:
+        """Ordered migration steps; append new ones, never reorder or edit shipped ones."""
+        return [
+            self._migration_001_base_schema,
+            self._migration_002_hot_path_indexes,
+            self._migration_003_event_leaderboard,
+            self._migration_004_retention_rollups,
+        ]
+
+    def _migration_001_base_schema(self) -> None:
+        """Original schema. Idempotent so databases created before versioning adopt it cleanly."""
+        # Enhanced users table with relationship and game unlock tracking
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS users (
+            user_id TEXT PRIMARY KEY,
+            total_cookies INTEGER DEFAULT 0,
+            cookies_left INTEGER DEFAULT 0,
+            relationship_index INTEGER DEFAULT 0,
+            last_interaction TEXT,
+            daily_streak INTEGER DEFAULT 0,
+            game_unlocked INTEGER DEFAULT 0,
+            total_interactions INTEGER DEFAULT 0,
+            last_daily_check TEXT,
+            aggravation_level INTEGER DEFAULT 0,
+            relationship_anchor_at TEXT,
+            aggravation_updated_at TEXT,
+            mute_until TEXT
+        );
+        """)
+        self._ensure_user_aux_columns()
+        
+        # Enhanced pokemon table with species tracking for duplicates
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS pokemon (
+            pokemon_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT,
+            species TEXT,
+            nickname TEXT,
+            level INTEGER DEFAULT 1,
+            experience INTEGER DEFAULT 0,
+            hp INTEGER,
+            attack INTEGER,
+            defense INTEGER,
+            special_attack INTEGER,
+            special_defense INTEGER,
+            speed INTEGER,
+            iv_hp INTEGER,
+            iv_attack INTEGER,
+            iv_defense INTEGER,
+            iv_special_attack INTEGER,
+            iv_special_defense INTEGER,
+            iv_speed INTEGER,
+            nature TEXT,
+            caught_date TEXT,
+            is_favorite INTEGER DEFAULT 0,
+            FOREIGN KEY (user_id) REFERENCES users(user_id)
+        );
+        """)
+        
+        # Battles table
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS battles (
+            battle_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user1_id TEXT,
+            user2_id TEXT,
+            winner_id TEXT,
+            log TEXT,
+            battle_date TEXT,
+            FOREIGN KEY (user1_id) REFERENCES users(user_id),
+            FOREIGN KEY (user2_id) REFERENCES users(user_id)
+        );
+        """)
+        
+        # Interaction history for relationship tracking
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS interactions (
+            interaction_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT,
+            interaction_type TEXT,
+            timestamp TEXT,
+            cookies_earned INTEGER DEFAULT 0,
+            FOREIGN KEY (user_id) REFERENCES users(user_id)
+        );
+        """)
+        
+        # Daily easter egg tracking
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS daily_easter_egg_stats (
+            stat_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT,
+            date TEXT,
+            cookies_earned INTEGER DEFAULT 0,
+            attempts INTEGER DEFAULT 0,
+            spam_count INTEGER DEFAULT 0,
+            FOREIGN KEY (user_id) REFERENCES users(user_id),
+            UNIQUE(user_id, date)
+        );
+        """)
+
+        # Admin/helper daily gift allowances
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS admin_cookie_allowances (
+            user_id TEXT PRIMARY KEY,
+            last_date TEXT,
+            remaining INTEGER DEFAULT 0
+        );
+        """)
+        
+        # Game statistics tracking
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS game_stats (
+            stat_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT,
+            stat_type TEXT,
+            stat_value INTEGER DEFAULT 0,
+            last_updated TEXT,
+            FOREIGN KEY (user_id) REFERENCES users(user_id),
+            UNIQUE(user_id, stat_type)
+        );
+        """)
+        
+        # Event reminders for Top Heroes coordination
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS event_reminders (
+            event_id TEXT PRIMARY KEY,
+            guild_id INTEGER NOT NULL,
+            title TEXT NOT NULL,
+            description TEXT,
+            category TEXT NOT NULL,
+            event_time_utc TEXT NOT NULL,
+            recurrence TEXT DEFAULT 'once',
+            custom_interval_hours INTEGER,
+            reminder_times TEXT,
+            channel_id INTEGER,
+            role_to_ping INTEGER,
+            created_by INTEGER,
+            is_active INTEGER DEFAULT 1,
+            auto_scraped INTEGER DEFAULT 0,
+            source_url TEXT,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        );
+        """)
+
+        # Event rankings for Top Heroes coordination
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS event_rankings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT NOT NULL,
+            username TEXT NOT NULL,
+            guild_id TEXT,
+            guild_tag TEXT,
+            player_name TEXT,
+            event_week TEXT NOT NULL,
+            stage_type TEXT NOT NULL,
+            day_number INTEGER,
+            category TEXT NOT NULL,
+            rank INTEGER NOT NULL,
+            score INTEGER NOT NULL,
+            submitted_at TEXT NOT NULL,
+            screenshot_url TEXT,
+            created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(user_id, guild_id, event_week, stage_type, day_number)
+        );
+        """)
+
+        # Indexes for fast ranking lookups
+        self.conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_rankings_user 
+        ON event_rankings(user_id, guild_id);
+        """)
+        self.conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_rankings_guild_stage 
+        ON event_rankings(guild_id, stage_type, day_number);
+        """)
+        self.conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_rankings_guild_tag 
+        ON event_rankings(guild_tag);
+        """)
+        self.conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_rankings_event_week 
+        ON event_rankings(event_week, guild_id);
+        """)
+
+        # Submission log for ranking processing
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS event_submissions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT NOT NULL,
+            guild_id TEXT,
+            submitted_at TEXT NOT NULL,
+            status TEXT NOT NULL,
+            error_message TEXT,
+            ranking_id INTEGER,
+            FOREIGN KEY(ranking_id) REFERENCES event_rankings(id)
+        );
+        """)
+
+        # KVK run lifecycle tracking
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS kvk_runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT NOT NULL,
+            title TEXT NOT NULL,
+            initiated_by TEXT,
+            event_id TEXT,
+            channel_id INTEGER,
+            run_number INTEGER,
+            is_test INTEGER DEFAULT 0,
+            started_at TEXT NOT NULL,
+            ends_at TEXT NOT NULL,
+            closed_at TEXT,
+            status TEXT NOT NULL DEFAULT 'active',
+            UNIQUE(guild_id, run_number) 
+        );
+        """)
+
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS kvk_submissions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kvk_run_id INTEGER NOT NULL,
+            ranking_id INTEGER NOT NULL,
+            user_id TEXT NOT NULL,
+            day_number INTEGER NOT NULL,
+            stage_type TEXT NOT NULL,
+            submitted_at TEXT NOT NULL,
+            is_test INTEGER DEFAULT 0,
+            FOREIGN KEY(kvk_run_id) REFERENCES kvk_runs(id),
+            FOREIGN KEY(ranking_id) REFERENCES event_rankings(id),
+            UNIQUE(kvk_run_id, user_id, day_number, stage_type)
+        );
+        """)
+
+        self._ensure_event_ranking_columns()
+
+    def _migration_002_hot_path_indexes(self) -> None:
+        """Covering indexes for the leaderboard, collection, interaction and submission lookups."""
+        statements = (
+            # get_cookie_leaderboard: range + ORDER BY served straight from the index
+            "CREATE INDEX IF NOT EXISTS idx_users_total_cookies "
+            "ON users(total_cookies DESC, user_id, cookies_left)",
+            # get_user_pokemon (ORDER BY caught_date) and the per-species duplicate count
+            "CREATE INDEX IF NOT EXISTS idx_pokemon_user_caught ON pokemon(user_id, caught_date)",
+            "CREATE INDEX IF NOT EXISTS idx_pokemon_user_species ON pokemon(user_id, species)",
+            "CREATE INDEX IF NOT EXISTS idx_interactions_user_time ON interactions(user_id, timestamp)",
+            # get_event_submission_stats with and without a guild filter
+            "CREATE INDEX IF NOT EXISTS idx_submissions_guild_time "
+            "ON event_submissions(guild_id, submitted_at, status, user_id)",
+            "CREATE INDEX IF NOT EXISTS idx_submissions_time "
+            "ON event_submissions(submitted_at, status, user_id, guild_id)",
+            # get_user_event_rankings / history ordering and age-based deletes
+            "CREATE INDEX IF NOT EXISTS idx_rankings_user_submitted ON event_rankings(user_id, submitted_at)",
+            "CREATE INDEX IF NOT EXISTS idx_rankings_submitted ON event_rankings(submitted_at)",
+            "CREATE INDEX IF NOT EXISTS idx_event_reminders_guild ON event_reminders(guild_id)",
+        )
+        for statement in statements:
+            self.conn.execute(statement)
+
+    def _migration_003_event_leaderboard(self) -> None:
+        """Materialized per-scope event leaderboards, backfilled from event_rankings."""
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS event_leaderboard (
+            guild_id TEXT NOT NULL,
+            scope_week TEXT NOT NULL,
+            scope_stage TEXT NOT NULL,
+            scope_day INTEGER NOT NULL,
+            scope_tag TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            username TEXT,
+            guild_tag TEXT,
+            player_name TEXT,
+            event_week TEXT,
+            stage_type TEXT,
+            day_number INTEGER,
+            category TEXT,
+            best_rank INTEGER NOT NULL,
+            highest_score INTEGER NOT NULL,
+            last_submission TEXT,
+            PRIMARY KEY (guild_id, scope_week, scope_stage, scope_day, scope_tag, user_id)
+        );
+        """)
+        # Serves the scope lookup and its ORDER BY ... LIMIT straight from the index.
+        self.conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_event_leaderboard_order
+        ON event_leaderboard(guild_id, scope_week, scope_stage, scope_day, scope_tag,
+                             best_rank, highest_score DESC, user_id);
+        """)
+        self._rebuild_event_leaderboard()
+
+    def _migration_004_retention_rollups(self) -> None:
+        """Daily rollups that replace raw interaction/submission rows past retention."""
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS interaction_daily (
+            day TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            interaction_type TEXT NOT NULL,
+            interactions INTEGER NOT NULL DEFAULT 0,
+            cookies_earned INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, user_id, interaction_type)
+        );
+        """)
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS event_submission_daily (
+            day TEXT NOT NULL,
+            guild_id TEXT NOT NULL,
+            status TEXT NOT NULL,
+            submissions INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, guild_id, status)
+        );
+        """)
+        # Batched ranking retention re-aggregates the affected users' leaderboard rows.
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_event_leaderboard_user ON event_leaderboard(guild_id, user_id)"
+        )
 
     def _ensure_user_aux_columns(self) -> None:
         """Ensure auxiliary tracking columns exist on the users table."""
@@ -280,7 +445,144 @@ class GameStorageEngine:
         cursor = self.conn.cursor()
         cursor.execute("SELECT * FROM users WHERE user_id = ?", (user_id,))
         row = cursor.fetchone()
-        return dict(row) if row else None
+        if not row:
+            return None
+        data = dict(row)
+        with self._user_state_lock:
+            cached = self._user_state.get(user_id)
+            if cached is not None:
+                data.update(cached)
+        return data
+
+    # User-state cache
+    def get_user_state(self, user_id: str) -> Dict[str, Any]:
+        """
+        Return the cached relationship state for a user, loading it on a miss.
+
+        The result reflects staged-but-unflushed changes. Only a first sighting
+        of an unknown user writes (to create the row).
+        """
+        with self._user_state_lock:
+            cached = self._user_state.get(user_id)
+            if cached is not None:
+                self._user_state.move_to_end(user_id)
+                return dict(cached)
+
+        columns = ", ".join(USER_STATE_FIELDS)
+        row = self.conn.execute(f"SELECT {columns} FROM users WHERE user_id = ?", (user_id,)).fetchone()
+        if row is None:
+            self.add_user(user_id)
+            row = self.conn.execute(f"SELECT {columns} FROM users WHERE user_id = ?", (user_id,)).fetchone()
+        state = {field: row[field] for field in USER_STATE_FIELDS}
+
+        with self._user_state_lock:
+            # Another thread may have staged changes while we were reading.
+            cached = self._user_state.setdefault(user_id, state)
+            self._evict_clean_users()
+            return dict(cached)
+
+    def stage_user_state(self, user_id: str, **fields: Any) -> None:
+        """Update cached relationship fields; they reach SQLite on the next flush."""
+        # total_interactions only moves through stage_interaction().
+        unknown = set(fields) - set(USER_STATE_FIELDS[:-1])
+        if unknown:
+            raise ValueError(f"Not a stageable user field: {sorted(unknown)}")
+        self.get_user_state(user_id)
+        with self._user_state_lock:
+            self._user_state[user_id].update(fields)
+            self._dirty_users.setdefault(user_id, 0)
+        self._maybe_flush_user_state()
+
+    def stage_interaction(self, user_id: str, interaction_type: str, cookies_earned: int = 0) -> None:
+        """Buffer an interaction row and bump the cached interaction counter."""
+        now = datetime.utcnow().isoformat()
+        self.get_user_state(user_id)
+        with self._user_state_lock:
+            state = self._user_state[user_id]
+            state["total_interactions"] = (state["total_interactions"] or 0) + 1
+            state["last_interaction"] = now
+            self._dirty_users[user_id] = self._dirty_users.get(user_id, 0) + 1
+            self._pending_interactions.append((user_id, interaction_type, now, cookies_earned))
+        self._maybe_flush_user_state()
+
+    def flush_user_state(self) -> int:
+        """Write every dirty user row and buffered interaction in one transaction."""
+        with self._user_flush_lock:
+            with self._user_state_lock:
+                if not self._dirty_users:
+                    return 0
+                # Mutate in place: per-thread engine views share these containers.
+                dirty = dict(self._dirty_users)
+                self._dirty_users.clear()
+                interactions = list(self._pending_interactions)
+                del self._pending_interactions[:]
+                rows = [
+                    (
+                        *(self._user_state[user_id][field] for field in USER_STATE_FIELDS[:-1]),
+                        delta,
+                        user_id,
+                    )
+                    for user_id, delta in dirty.items()
+                ]
+
+            assignments = ", ".join(f"{field} = ?" for field in USER_STATE_FIELDS[:-1])
+            try:
+                with self.conn:
+                    self.conn.executemany(
+                        f"UPDATE users SET {assignments}, total_interactions = total_interactions + ? "
+                        "WHERE user_id = ?",
+                        rows,
+                    )
+                    if interactions:
+                        self.conn.executemany(
+                            """
+                            INSERT INTO interactions (user_id, interaction_type, timestamp, cookies_earned)
+                            VALUES (?, ?, ?, ?)
+                            """,
+                            interactions,
+                        )
+            except Exception:
+                with self._user_state_lock:
+                    for user_id, delta in dirty.items():
+                        self._dirty_users[user_id] = self._dirty_users.get(user_id, 0) + delta
+                    self._pending_interactions[:0] = interactions
+                raise
+            return len(rows)
+
+    def user_state_stats(self) -> Dict[str, int]:
+        """Return cache size and pending write-behind counts."""
+        with self._user_state_lock:
+            return {
+                "cached": len(self._user_state),
+                "dirty": len(self._dirty_users),
+                "pending_interactions": len(self._pending_interactions),
+            }
+
+    def _maybe_flush_user_state(self) -> None:
+        if len(self._dirty_users) < self.user_flush_batch:
+            return
+        # With an AsyncGameStorage attached, the flush belongs on its writer thread.
+        facade = getattr(self, "_async_facade", None)
+        if facade is not None and facade.schedule_flush():
+            return
+        self.flush_user_state()
+
+    def _evict_clean_users(self) -> None:
+        while len(self._user_state) > self.user_cache_size:
+            victim = next((uid for uid in self._user_state if uid not in self._dirty_users), None)
+            if victim is None:
+                return
+            del self._user_state[victim]
+
+    def _forget_user_state(self, user_id: str) -> None:
+        """Flush and drop a user's cache entry ahead of a direct write to the row."""
+        with self._user_state_lock:
+            dirty = user_id in self._dirty_users
+        if dirty:
+            self.flush_user_state()
+        with self._user_state_lock:
+            if user_id not in self._dirty_users:
+                self._user_state.pop(user_id, None)
 
     def get_user_cookies(self, user_id: str) -> tuple[int, int]:
         """Get total and current cookies for a user."""
@@ -292,26 +594,28 @@ class GameStorageEngine:
     def update_cookies(self, user_id: str, total_cookies: Optional[int] = None, 
                       cookies_left: Optional[int] = None) -> None:
         """Update user cookie counts."""
-        with self.conn:
-            if total_cookies is not None and cookies_left is not None:
-                self.conn.execute("""
-                    UPDATE users SET total_cookies = ?, cookies_left = ? WHERE user_id = ?
-                """, (total_cookies, cookies_left, user_id))
-            elif total_cookies is not None:
-                self.conn.execute("UPDATE users SET total_cookies = ? WHERE user_id = ?", 
-                                (total_cookies, user_id))
+        board = self._cookie_board
+        with board.lock:
+            with self.conn:
+                if total_cookies is not None and cookies_left is not None:
+                    self.conn.execute("""
+                        UPDATE users SET total_cookies = ?, cookies_left = ? WHERE user_id = ?
+                    """, (total_cookies, cookies_left, user_id))
+                elif total_cookies is not None:
+                    self.conn.execute("UPDATE users SET total_cookies = ? WHERE user_id = ?", 
+                                    (total_cookies, user_id))
+                elif cookies_left is not None:
+                    self.conn.execute("UPDATE users SET cookies_left = ? WHERE user_id = ?", 
+                                    (cookies_left, user_id))
+            if total_cookies is not None:
+                # Absolute totals may go down; let the next read reseed.
+                board.invalidate()
             elif cookies_left is not None:
-                self.conn.execute("UPDATE users SET cookies_left = ? WHERE user_id = ?", 
-                                (cookies_left, user_id))
+                board.observe_balance(user_id, cookies_left)
 
     def add_cookies(self, user_id: str, amount: int) -> tuple[int, int]:
         """Add cookies to user and return new totals."""
-        self.add_user(user_id)
-        total, current = self.get_user_cookies(user_id)
-        new_total = total + amount
-        new_current = current + amount
-        self.update_cookies(user_id, new_total, new_current)
-        return (new_total, new_current)
+        return self.add_cookies_bulk({user_id: amount})[user_id]
 
     def add_gift_cookies(self, user_id: str, amount: int) -> tuple[int, int]:
         """
@@ -320,19 +624,52 @@ class GameStorageEngine:
         """
         if amount <= 0:
             return self.get_user_cookies(user_id)
-        self.add_user(user_id)
-        total, current = self.get_user_cookies(user_id)
-        new_current = current + amount
-        self.update_cookies(user_id, cookies_left=new_current)
-        return (total, new_current)
+        with self._cookie_board.lock:
+            with self.conn:
+                totals = self._award_cookies(user_id, 0, amount)
+            self._cookie_board.observe(user_id, *totals)
+        return totals
+
+    def add_cookies_bulk(self, awards: Dict[str, int]) -> Dict[str, tuple[int, int]]:
+        """Award cookies to many users in one transaction and return each user's new totals."""
+        with self._cookie_board.lock:
+            with self.conn:
+                totals = {user_id: self._award_cookies(user_id, amount, amount) for user_id, amount in awards.items()}
+            for user_id, (total, current) in totals.items():
+                self._cookie_board.observe(user_id, total, current)
+        return totals
+
+    def _award_cookies(self, user_id: str, total_delta: int, current_delta: int) -> tuple[int, int]:
+        """Create-or-increment a user's counters in one statement (caller owns the transaction)."""
+        now = datetime.utcnow().isoformat()
+        row = self.conn.execute("""
+            INSERT INTO users (user_id, total_cookies, cookies_left,
+                               last_interaction, last_daily_check, relationship_anchor_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(user_id) DO UPDATE SET
+                total_cookies = total_cookies + excluded.total_cookies,
+                cookies_left = cookies_left + excluded.cookies_left
+            RETURNING total_cookies, cookies_left
+        """, (user_id, total_delta, current_delta, now, now, now)).fetchone()
+        return (row['total_cookies'], row['cookies_left'])
 
     def spend_cookies(self, user_id: str, amount: int) -> bool:
         """Spend cookies if user has enough. Returns True if successful."""
-        _, current = self.get_user_cookies(user_id)
-        if current < amount:
-            return False
-        self.update_cookies(user_id, cookies_left=current - amount)
-        return True
+        return self.try_spend_cookies(user_id, amount) is not None
+
+    def try_spend_cookies(self, user_id: str, amount: int) -> Optional[int]:
+        """Atomically spend ``amount`` if the balance covers it; returns the new balance or None."""
+        with self._cookie_board.lock:
+            with self.conn:
+                row = self.conn.execute("""
+                    UPDATE users SET cookies_left = cookies_left - ?
+                     WHERE user_id = ? AND cookies_left >= ?
+                    RETURNING cookies_left
+                """, (amount, user_id, amount)).fetchone()
+            if row is None:
+                return None
+            self._cookie_board.observe_balance(user_id, row['cookies_left'])
+        return row['cookies_left']
 
     def get_admin_gift_remaining(self, user_id: str, daily_limit: int) -> int:
         """Return how many gift cookies the admin/helper has left today."""
@@ -343,22 +680,30 @@ class GameStorageEngine:
         if amount <= 0:
             return False
 
-        remaining = self._ensure_admin_gift_record(user_id, daily_limit)
-        if amount > remaining:
-            return False
-
-        new_remaining = remaining - amount
         today = datetime.utcnow().date().isoformat()
         with self.conn:
+            # Roll the allowance over to today first, then decrement only if it still covers `amount`.
             self.conn.execute(
                 """
-                UPDATE admin_cookie_allowances
-                SET remaining = ?, last_date = ?
-                WHERE user_id = ?
+                INSERT INTO admin_cookie_allowances (user_id, last_date, remaining)
+                VALUES (?, ?, ?)
+                ON CONFLICT(user_id) DO UPDATE SET
+                    last_date = excluded.last_date,
+                    remaining = excluded.remaining
+                WHERE admin_cookie_allowances.last_date IS NOT excluded.last_date
                 """,
-                (new_remaining, today, user_id),
+                (user_id, today, daily_limit),
             )
-        return True
+            row = self.conn.execute(
+                """
+                UPDATE admin_cookie_allowances
+                SET remaining = remaining - ?
+                WHERE user_id = ? AND remaining >= ?
+                RETURNING remaining
+                """,
+                (amount, user_id, amount),
+            ).fetchone()
+        return row is not None
 
     def _ensure_admin_gift_record(self, user_id: str, daily_limit: int) -> int:
         """Ensure an allowance record exists for today and return remaining amount."""
@@ -426,6 +771,7 @@ class GameStorageEngine:
         params.append(user_id)
 
         set_clause = ", ".join(updates)
+        self._forget_user_state(user_id)
         with self.conn:
             self.conn.execute(
                 f"UPDATE users SET {set_clause} WHERE user_id = ?",
@@ -436,6 +782,7 @@ class GameStorageEngine:
                               cookies_earned: int = 0) -> None:
         """Record an interaction and increment counter."""
         self.add_user(user_id)
+        self._forget_user_state(user_id)
         with self.conn:
             # Update total interactions
             self.conn.execute("""
@@ -592,6 +939,7 @@ class GameStorageEngine:
 
     def update_daily_check(self, user_id: str) -> None:
         """Update the last daily check timestamp."""
+        self._forget_user_state(user_id)
         with self.conn:
             self.conn.execute("""
                 UPDATE users SET last_daily_check = ? WHERE user_id = ?
@@ -651,19 +999,18 @@ class GameStorageEngine:
     def increase_aggravation(self, user_id: str, amount: int = 1) -> int:
         """Increase user's aggravation level. Returns new level."""
         self.add_user(user_id)
-        record = self._get_aggravation_record(user_id)
-        current = record['aggravation_level'] if record else 0
-        new_level = current + amount
         now = datetime.utcnow().isoformat()
         
         with self.conn:
-            self.conn.execute("""
+            row = self.conn.execute("""
                 UPDATE users
-                   SET aggravation_level = ?, aggravation_updated_at = ?
+                   SET aggravation_level = COALESCE(aggravation_level, 0) + ?,
+                       aggravation_updated_at = ?
                  WHERE user_id = ?
-            """, (new_level, now, user_id))
+                RETURNING aggravation_level
+            """, (amount, now, user_id)).fetchone()
         
-        return new_level
+        return row['aggravation_level']
     
     def reset_aggravation(self, user_id: str) -> None:
         """Reset user's aggravation level to 0."""
@@ -790,13 +1137,28 @@ class GameStorageEngine:
         return {row['stat_type']: row['stat_value'] for row in cursor.fetchall()}
     
     def get_cookie_leaderboard(self, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get top users by total cookies earned."""
+        """Get top users by total cookies earned (served from the in-memory board)."""
+        board = self._cookie_board
+        rows = board.top(limit)
+        if rows is not None:
+            return rows
+        if limit > board.capacity:
+            return self._query_cookie_leaderboard(limit)
+        with board.lock:
+            if not board.seeded:
+                board.seed(
+                    (row['user_id'], row['total_cookies'], row['cookies_left'])
+                    for row in self._query_cookie_leaderboard(board.capacity)
+                )
+            return board.top(limit) or []
+
+    def _query_cookie_leaderboard(self, limit: int) -> List[Dict[str, Any]]:
         cursor = self.conn.cursor()
         cursor.execute("""
             SELECT user_id, total_cookies, cookies_left
             FROM users
             WHERE total_cookies > 0
-            ORDER BY total_cookies DESC
+            ORDER BY total_cookies DESC, user_id ASC
             LIMIT ?
         """, (limit,))
         return [dict(row) for row in cursor.fetchall()]
@@ -894,37 +1256,175 @@ class GameStorageEngine:
         return results
 
     # Event Rankings Management
-    def save_event_ranking(self, ranking: RankingData) -> int:
-        """Persist a ranking entry and return its row ID."""
-        with self.conn:
-            cursor = self.conn.execute(
+    # ------------------------------------------------------------------
+    # Materialized event leaderboards
+    # ------------------------------------------------------------------
+    _EVENT_LEADERBOARD_COLUMNS = (
+        "user_id", "username", "guild_tag", "player_name", "event_week", "best_rank",
+        "highest_score", "stage_type", "day_number", "category", "last_submission",
+    )
+
+    @staticmethod
+    def _aggregate_event_rows(rows: List[sqlite3.Row]) -> Dict[Scope, Dict[str, Any]]:
+        """Fold one user's ranking rows (oldest first) into a leaderboard row per scope."""
+        result: Dict[Scope, Dict[str, Any]] = {}
+        for row in rows:
+            latest = {
+                "user_id": row["user_id"],
+                "username": row["username"],
+                "guild_tag": row["guild_tag"],
+                "player_name": row["player_name"],
+                "event_week": row["event_week"],
+                "stage_type": row["stage_type"],
+                "day_number": row["day_number"],
+                "category": row["category"],
+                "last_submission": row["submitted_at"],
+            }
+            for scope in scopes_for_ranking(
+                row["guild_id"], row["event_week"], row["stage_type"], row["day_number"], row["guild_tag"]
+            ):
+                entry = result.get(scope)
+                if entry is None:
+                    result[scope] = {**latest, "best_rank": row["rank"], "highest_score": row["score"]}
+                    continue
+                entry["best_rank"] = min(entry["best_rank"], row["rank"])
+                entry["highest_score"] = max(entry["highest_score"], row["score"])
+                if row["submitted_at"] >= entry["last_submission"]:
+                    entry.update(latest)
+        return result
+
+    def _write_event_leaderboard_rows(self, rows: Dict[Scope, Dict[str, Any]]) -> None:
+        columns = self._EVENT_LEADERBOARD_COLUMNS
+        self.conn.executemany(
+            f"""
+            INSERT OR REPLACE INTO event_leaderboard (
+                guild_id, scope_week, scope_stage, scope_day, scope_tag, {", ".join(columns)}
+            )
+            VALUES ({", ".join("?" for _ in range(5 + len(columns)))})
+            """,
+            [(*scope, *(row[column] for column in columns)) for scope, row in rows.items()],
+        )
+
+    def _refresh_event_leaderboard(self, ranking_id: int) -> List[Tuple[Scope, str, Dict[str, Any]]]:
+        """Re-aggregate the scopes touched by one ranking row; call inside the write transaction."""
+        changed = self.conn.execute(
+            "SELECT guild_id, user_id, event_week, stage_type, day_number, guild_tag FROM event_rankings WHERE id = ?",
+            (ranking_id,),
+        ).fetchone()
+        if changed is None or changed["guild_id"] is None:
+            return []
+        rows = self.conn.execute(
+            """
+            SELECT * FROM event_rankings
+             WHERE guild_id = ? AND user_id = ?
+             ORDER BY submitted_at ASC, id ASC
+            """,
+            (changed["guild_id"], changed["user_id"]),
+        ).fetchall()
+        aggregated = self._aggregate_event_rows(rows)
+        touched = {
+            scope: aggregated[scope]
+            for scope in scopes_for_ranking(
+                changed["guild_id"],
+                changed["event_week"],
+                changed["stage_type"],
+                changed["day_number"],
+                changed["guild_tag"],
+            )
+        }
+        self._write_event_leaderboard_rows(touched)
+        return [(scope, changed["user_id"], row) for scope, row in touched.items()]
+
+    def _reaggregate_event_leaderboard_users(
+        self, users: List[Tuple[str, str]]
+    ) -> List[Tuple[Scope, str, Optional[Dict[str, Any]]]]:
+        """Recompute every scope row of the given (guild, user) pairs after deletes."""
+        changes: List[Tuple[Scope, str, Optional[Dict[str, Any]]]] = []
+        for guild_id, user_id in users:
+            previous = self.conn.execute(
                 """
-                INSERT INTO event_rankings (
-                    user_id, username, guild_id, guild_tag, player_name,
-                    event_week, stage_type, day_number, category,
-                    rank, score, submitted_at, screenshot_url,
-                    kvk_run_id, is_test_run
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                SELECT guild_id, scope_week, scope_stage, scope_day, scope_tag
+                  FROM event_leaderboard WHERE guild_id = ? AND user_id = ?
                 """,
-                (
-                    ranking.user_id,
-                    ranking.username,
-                    ranking.guild_id,
-                    ranking.guild_tag,
-                    ranking.player_name,
-                    ranking.event_week,
-                    ranking.stage_type.value,
-                    ranking.day_number,
-                    ranking.category.value,
-                    ranking.rank,
-                    ranking.score,
-                    ranking.submitted_at.isoformat(),
-                    ranking.screenshot_url,
-                    ranking.kvk_run_id,
-                    1 if ranking.is_test_run else 0,
-                ),
+                (guild_id, user_id),
+            ).fetchall()
+            self.conn.execute(
+                "DELETE FROM event_leaderboard WHERE guild_id = ? AND user_id = ?", (guild_id, user_id)
             )
+            rows = self.conn.execute(
+                """
+                SELECT * FROM event_rankings
+                 WHERE guild_id = ? AND user_id = ?
+                 ORDER BY submitted_at ASC, id ASC
+                """,
+                (guild_id, user_id),
+            ).fetchall()
+            aggregated = self._aggregate_event_rows(rows)
+            self._write_event_leaderboard_rows(aggregated)
+            for scope in {tuple(row) for row in previous} | set(aggregated):
+                changes.append((scope, user_id, aggregated.get(scope)))
+        return changes
+
+    def _apply_event_leaderboard_changes(
+        self, changes: List[Tuple[Scope, str, Optional[Dict[str, Any]]]]
+    ) -> None:
+        for scope, user_id, row in changes:
+            self._event_board.apply(scope, user_id, row)
+
+    def _rebuild_event_leaderboard(self) -> None:
+        """Recompute every materialized row (migration backfill); call inside a transaction."""
+        self.conn.execute("DELETE FROM event_leaderboard")
+        cursor = self.conn.execute(
+            """
+            SELECT * FROM event_rankings
+             WHERE guild_id IS NOT NULL
+             ORDER BY guild_id, user_id, submitted_at ASC, id ASC
+            """
+        )
+        user_rows: List[sqlite3.Row] = []
+        for row in cursor:
+            if user_rows and (row["guild_id"], row["user_id"]) != (user_rows[0]["guild_id"], user_rows[0]["user_id"]):
+                self._write_event_leaderboard_rows(self._aggregate_event_rows(user_rows))
+                user_rows = []
+            user_rows.append(row)
+        if user_rows:
+            self._write_event_leaderboard_rows(self._aggregate_event_rows(user_rows))
+        self._event_board.clear()
+
+    def save_event_ranking(self, ranking: RankingData) -> int:
+        """Persist a ranking entry and return its row ID."""
+        with self._event_board.lock:
+            with self.conn:
+                cursor = self.conn.execute(
+                    """
+                    INSERT INTO event_rankings (
+                        user_id, username, guild_id, guild_tag, player_name,
+                        event_week, stage_type, day_number, category,
+                        rank, score, submitted_at, screenshot_url,
+                        kvk_run_id, is_test_run
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        ranking.user_id,
+                        ranking.username,
+                        ranking.guild_id,
+                        ranking.guild_tag,
+                        ranking.player_name,
+                        ranking.event_week,
+                        ranking.stage_type.value,
+                        ranking.day_number,
+                        ranking.category.value,
+                        ranking.rank,
+                        ranking.score,
+                        ranking.submitted_at.isoformat(),
+                        ranking.screenshot_url,
+                        ranking.kvk_run_id,
+                        1 if ranking.is_test_run else 0,
+                    ),
+                )
+                changes = self._refresh_event_leaderboard(cursor.lastrowid)
+            self._apply_event_leaderboard_changes(changes)
         return cursor.lastrowid
 
     def check_duplicate_event_submission(
@@ -969,15 +1469,18 @@ class GameStorageEngine:
         screenshot_url: Optional[str] = None,
     ) -> bool:
         """Update rank/score metadata for an existing ranking."""
-        with self.conn:
-            cursor = self.conn.execute(
-                """
-                UPDATE event_rankings
-                   SET rank = ?, score = ?, screenshot_url = ?, submitted_at = ?
-                 WHERE id = ?
-                """,
-                (rank, score, screenshot_url, datetime.utcnow().isoformat(), ranking_id),
-            )
+        with self._event_board.lock:
+            with self.conn:
+                cursor = self.conn.execute(
+                    """
+                    UPDATE event_rankings
+                       SET rank = ?, score = ?, screenshot_url = ?, submitted_at = ?
+                     WHERE id = ?
+                    """,
+                    (rank, score, screenshot_url, datetime.utcnow().isoformat(), ranking_id),
+                )
+                changes = self._refresh_event_leaderboard(ranking_id) if cursor.rowcount else []
+            self._apply_event_leaderboard_changes(changes)
         return cursor.rowcount > 0
 
     def get_user_event_rankings(
@@ -1068,6 +1571,49 @@ class GameStorageEngine:
         limit: int = 20,
     ) -> List[Dict[str, Any]]:
         """Summarise best rankings per user for a guild."""
+        if category:
+            # Category is not a materialized dimension; aggregate directly.
+            return self._query_guild_event_leaderboard(
+                guild_id, event_week, stage_type, day_number, category, guild_tag, limit
+            )
+        scope = scope_for(guild_id, event_week, stage_type.value if stage_type else None, day_number, guild_tag)
+        board = self._event_board
+        rows = board.get(scope, limit)
+        if rows is not None:
+            return rows
+        if limit > board.depth:
+            return self._read_event_leaderboard_scope(scope, limit)
+        with board.lock:
+            rows = board.get(scope, limit)
+            if rows is None:
+                board.load(scope, self._read_event_leaderboard_scope(scope, board.depth))
+                rows = board.get(scope, limit) or []
+        return rows
+
+    def _read_event_leaderboard_scope(self, scope: Scope, limit: int) -> List[Dict[str, Any]]:
+        cursor = self.conn.execute(
+            """
+            SELECT user_id, username, guild_tag, player_name, event_week,
+                   best_rank, highest_score, stage_type, day_number, category, last_submission
+              FROM event_leaderboard
+             WHERE guild_id = ? AND scope_week = ? AND scope_stage = ? AND scope_day = ? AND scope_tag = ?
+             ORDER BY best_rank ASC, highest_score DESC, user_id ASC
+             LIMIT ?
+            """,
+            (*scope, limit),
+        )
+        return [dict(row) for row in cursor.fetchall()]
+
+    def _query_guild_event_leaderboard(
+        self,
+        guild_id: str,
+        event_week: Optional[str],
+        stage_type: Optional[StageType],
+        day_number: Optional[int],
+        category: Optional[RankingCategory],
+        guild_tag: Optional[str],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
         query = """
             SELECT 
                 user_id,
@@ -1119,10 +1665,20 @@ class GameStorageEngine:
         processor = ScreenshotProcessor()
         return processor._get_current_event_week()
 
-    def prune_event_weeks(self, weeks_to_keep: int = 4) -> int:
+    def prune_event_weeks(self, weeks_to_keep: int = 4, batch_size: int = 500) -> int:
         """Remove ranking data older than the specified number of weeks."""
-        cursor = self.conn.cursor()
-        cursor.execute(
+        weeks_to_delete = self.stale_event_weeks(weeks_to_keep)
+        deleted = 0
+        while weeks_to_delete:
+            removed = self.delete_event_rankings_batch(weeks=weeks_to_delete, batch_size=batch_size)
+            if not removed:
+                break
+            deleted += removed
+        return deleted
+
+    def stale_event_weeks(self, weeks_to_keep: int = 4) -> List[str]:
+        """Return event weeks beyond the newest ``weeks_to_keep``."""
+        cursor = self.conn.execute(
             """
             SELECT DISTINCT event_week
               FROM event_rankings
@@ -1130,20 +1686,7 @@ class GameStorageEngine:
             """
         )
         all_weeks = [row["event_week"] for row in cursor.fetchall()]
-        if len(all_weeks) <= weeks_to_keep:
-            return 0
-
-        weeks_to_delete = all_weeks[weeks_to_keep:]
-        placeholders = ", ".join("?" for _ in weeks_to_delete)
-        with self.conn:
-            cursor = self.conn.execute(
-                f"""
-                DELETE FROM event_rankings
-                      WHERE event_week IN ({placeholders})
-                """,
-                weeks_to_delete,
-            )
-        return cursor.rowcount
+        return all_weeks[weeks_to_keep:]
 
     def get_event_ranking_history(
         self,
@@ -1220,15 +1763,113 @@ class GameStorageEngine:
         row = cursor.fetchone()
         return dict(row) if row else {}
 
-    def delete_old_event_rankings(self, days: int = 30) -> int:
+    def delete_old_event_rankings(self, days: int = 30, batch_size: int = 500) -> int:
         """Delete ranking entries older than the given number of days."""
-        cutoff = datetime.utcnow() - timedelta(days=days)
+        cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
+        deleted = 0
+        while True:
+            removed = self.delete_event_rankings_batch(before=cutoff, batch_size=batch_size)
+            if not removed:
+                return deleted
+            deleted += removed
+
+    # ------------------------------------------------------------------
+    # Retention batches (one short transaction each; see RetentionService)
+    # ------------------------------------------------------------------
+    def delete_event_rankings_batch(
+        self,
+        *,
+        before: Optional[str] = None,
+        weeks: Optional[List[str]] = None,
+        batch_size: int = 500,
+    ) -> int:
+        """Delete up to ``batch_size`` of the oldest matching rankings; returns rows deleted."""
+        if (before is None) == (weeks is None):
+            raise ValueError("pass exactly one of before= or weeks=")
+        if before is not None:
+            condition, params = "submitted_at < ?", [before]
+        else:
+            if not weeks:
+                return 0
+            condition, params = f"event_week IN ({', '.join('?' for _ in weeks)})", list(weeks)
+
+        with self._event_board.lock:
+            with self.conn:
+                bounds = self._batch_bounds("event_rankings", "id", condition, params, batch_size)
+                if bounds is None:
+                    return 0
+                scoped = f"id BETWEEN ? AND ? AND {condition}"
+                users = self.conn.execute(
+                    f"SELECT DISTINCT guild_id, user_id FROM event_rankings WHERE {scoped} AND guild_id IS NOT NULL",
+                    (*bounds, *params),
+                ).fetchall()
+                cursor = self.conn.execute(f"DELETE FROM event_rankings WHERE {scoped}", (*bounds, *params))
+                changes = self._reaggregate_event_leaderboard_users(
+                    [(row["guild_id"], row["user_id"]) for row in users]
+                )
+            self._apply_event_leaderboard_changes(changes)
+        return cursor.rowcount
+
+    def rollup_interactions_batch(self, before: str, batch_size: int = 500) -> int:
+        """Fold up to ``batch_size`` interactions older than ``before`` into interaction_daily."""
         with self.conn:
+            bounds = self._batch_bounds("interactions", "interaction_id", "timestamp < ?", [before], batch_size)
+            if bounds is None:
+                return 0
+            params = (*bounds, before)
+            self.conn.execute(
+                """
+                INSERT INTO interaction_daily (day, user_id, interaction_type, interactions, cookies_earned)
+                SELECT substr(timestamp, 1, 10), COALESCE(user_id, ''), COALESCE(interaction_type, ''),
+                       COUNT(*), COALESCE(SUM(cookies_earned), 0)
+                  FROM interactions
+                 WHERE interaction_id BETWEEN ? AND ? AND timestamp < ?
+                 GROUP BY 1, 2, 3
+                ON CONFLICT(day, user_id, interaction_type) DO UPDATE SET
+                    interactions = interactions + excluded.interactions,
+                    cookies_earned = cookies_earned + excluded.cookies_earned
+                """,
+                params,
+            )
             cursor = self.conn.execute(
+                "DELETE FROM interactions WHERE interaction_id BETWEEN ? AND ? AND timestamp < ?", params
+            )
+        return cursor.rowcount
+
+    def rollup_event_submissions_batch(self, before: str, batch_size: int = 500) -> int:
+        """Fold up to ``batch_size`` submissions older than ``before`` into event_submission_daily."""
+        with self.conn:
+            bounds = self._batch_bounds("event_submissions", "id", "submitted_at < ?", [before], batch_size)
+            if bounds is None:
+                return 0
+            params = (*bounds, before)
+            self.conn.execute(
                 """
-                DELETE FROM event_rankings
-                WHERE submitted_at < ?
+                INSERT INTO event_submission_daily (day, guild_id, status, submissions)
+                SELECT substr(submitted_at, 1, 10), COALESCE(guild_id, ''), status, COUNT(*)
+                  FROM event_submissions
+                 WHERE id BETWEEN ? AND ? AND submitted_at < ?
+                 GROUP BY 1, 2, 3
+                ON CONFLICT(day, guild_id, status) DO UPDATE SET
+                    submissions = submissions + excluded.submissions
                 """,
-                (cutoff.isoformat(),),
+                params,
+            )
+            cursor = self.conn.execute(
+                "DELETE FROM event_submissions WHERE id BETWEEN ? AND ? AND submitted_at < ?", params
             )
         return cursor.rowcount
+
+    def _batch_bounds(
+        self, table: str, key: str, condition: str, params: List[Any], batch_size: int
+    ) -> Optional[Tuple[int, int]]:
+        """Rowid range covering the first ``batch_size`` rows matching ``condition``."""
+        row = self.conn.execute(
+            f"""
+            SELECT MIN({key}), MAX({key}) FROM (
+                SELECT {key} FROM {table} WHERE {condition} ORDER BY {key} LIMIT ?
+            )
+            """,
+            (*params, max(1, int(batch_size))),
+        ).fetchone()
+        return None if row[0] is None else (row[0], row[1])
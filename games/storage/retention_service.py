@@ -0,0 +1,190 @@
+"""
+Scheduled, lock-friendly data retention for the game database.
+
+Key features:
+ - Old event weeks (and optionally rankings past an age) are deleted in
+   rowid-bounded batches, each its own short transaction
+ - Raw ``interactions`` and ``event_submissions`` rows past retention are
+   rolled up into ``interaction_daily`` / ``event_submission_daily`` and deleted
+   in the same batch transaction
+ - Batches go through :class:`AsyncGameStorage`'s writer thread, and the
+   service sleeps between them so queued cookie and ranking writes run in between
+ - Every job reports rows, batches, duration and rows per second
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Union
+
+from discord_bot.games.storage.async_game_storage import AsyncGameStorage
+from discord_bot.games.storage.game_storage_engine import GameStorageEngine
+
+logger = logging.getLogger("hippo_bot.retention")
+
+
+@dataclass
+class RetentionReport:
+    """Outcome of one retention job."""
+
+    job: str
+    rows: int
+    batches: int
+    duration_s: float
+    rows_per_second: float
+    error: Optional[str] = None
+
+
+class RetentionService:
+    """
+    Periodically trim the game database without holding the write lock for long.
+
+    Parameters:
+        storage: the engine (or its async facade) to trim.
+        ranking_weeks_to_keep: newest event weeks kept in ``event_rankings``.
+        ranking_max_age_days: also delete rankings older than this; None disables it.
+        interactions_days: raw interactions kept before rolling up into daily rows.
+        submissions_days: raw submission logs kept before rolling up into daily rows.
+        batch_size: rows per transaction.
+        pause_ms: sleep between batches, letting other writes take the lock.
+        interval_hours: time between scheduled runs started by :meth:`start`.
+    """
+
+    def __init__(
+        self,
+        storage: Union[GameStorageEngine, AsyncGameStorage],
+        *,
+        ranking_weeks_to_keep: int = 4,
+        ranking_max_age_days: Optional[int] = None,
+        interactions_days: int = 30,
+        submissions_days: int = 30,
+        batch_size: int = 500,
+        pause_ms: int = 50,
+        interval_hours: float = 24.0,
+    ) -> None:
+        self.db = AsyncGameStorage.for_engine(storage)
+        self.ranking_weeks_to_keep = max(1, int(ranking_weeks_to_keep))
+        self.ranking_max_age_days = ranking_max_age_days
+        self.interactions_days = max(1, int(interactions_days))
+        self.submissions_days = max(1, int(submissions_days))
+        self.batch_size = max(1, int(batch_size))
+        self.pause = max(0, int(pause_ms)) / 1000.0
+        self.interval = max(60.0, float(interval_hours) * 3600)
+        self._run_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.history: Deque[RetentionReport] = deque(maxlen=50)
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        """Start the periodic retention loop on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._loop())
+            logger.info("Retention jobs scheduled every %.1fh", self.interval / 3600)
+
+    async def stop(self) -> None:
+        """Cancel the loop; a batch already on the writer thread still commits."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("Scheduled retention run failed")
+
+    # ------------------------------------------------------------------
+    # Jobs
+    # ------------------------------------------------------------------
+    async def run_once(self) -> List[RetentionReport]:
+        """Run every retention job once, in order."""
+        async with self._run_lock:
+            now = datetime.utcnow()
+            reports = []
+
+            weeks = await self.db.stale_event_weeks(self.ranking_weeks_to_keep)
+            reports.append(
+                await self._run_job(
+                    "event_rankings_weeks",
+                    lambda: self.db.delete_event_rankings_batch(weeks=weeks, batch_size=self.batch_size),
+                )
+            )
+            if self.ranking_max_age_days is not None:
+                ranking_cutoff = (now - timedelta(days=self.ranking_max_age_days)).isoformat()
+                reports.append(
+                    await self._run_job(
+                        "event_rankings_age",
+                        lambda: self.db.delete_event_rankings_batch(before=ranking_cutoff, batch_size=self.batch_size),
+                    )
+                )
+
+            interactions_cutoff = (now - timedelta(days=self.interactions_days)).isoformat()
+            reports.append(
+                await self._run_job(
+                    "interactions_rollup",
+                    lambda: self.db.rollup_interactions_batch(interactions_cutoff, self.batch_size),
+                )
+            )
+            submissions_cutoff = (now - timedelta(days=self.submissions_days)).isoformat()
+            reports.append(
+                await self._run_job(
+                    "event_submissions_rollup",
+                    lambda: self.db.rollup_event_submissions_batch(submissions_cutoff, self.batch_size),
+                )
+            )
+            return reports
+
+    async def _run_job(self, job: str, batch: Callable[[], Awaitable[int]]) -> RetentionReport:
+        started = time.monotonic()
+        rows = batches = 0
+        error = None
+        try:
+            while True:
+                removed = await batch()
+                if not removed:
+                    break
+                rows += removed
+                batches += 1
+                await asyncio.sleep(self.pause)
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+            logger.exception("Retention job %s failed after %d rows", job, rows)
+        duration = time.monotonic() - started
+        report = RetentionReport(
+            job=job,
+            rows=rows,
+            batches=batches,
+            duration_s=duration,
+            rows_per_second=rows / duration if duration > 0 else 0.0,
+            error=error,
+        )
+        self.history.append(report)
+        if rows:
+            logger.info(
+                "Retention %s: %d rows in %d batches, %.2fs (%.0f rows/s)",
+                job,
+                rows,
+                batches,
+                duration,
+                report.rows_per_second,
+            )
+        return report
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the most recent report for each job."""
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "last": {report.job: asdict(report) for report in self.history},
+        }
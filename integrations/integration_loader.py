@@ -23,10 +23,18 @@ from discord_bot.core.engines.screenshot_processor import ScreenshotProcessor
 from discord_bot.core.engines.personality_engine import PersonalityEngine
 from discord_bot.core.engines.processing_engine import ProcessingEngine
 from discord_bot.core.engines.role_manager import RoleManager
+from discord_bot.core.engines.http_client import HttpClientService
+from discord_bot.core.storage.backup_service import BackupService
+from discord_bot.core.storage.storage_engine import StorageEngine
+from discord_bot.core.engines.ocr_executor import OcrExecutor
+from discord_bot.core.engines.provider_executor import ProviderExecutor
+from discord_bot.core.engines.screenshot_cache import ScreenshotCache
+from discord_bot.core.engines.screenshot_intake import ScreenshotIntake
+from discord_bot.core.engines.translation_cache import TranslationCache
 from discord_bot.core.engines.translation_orchestrator import TranslationOrchestratorEngine
 from discord_bot.core.engines.translation_ui_engine import TranslationUIEngine
 from discord_bot.core.event_bus import EventBus
-from discord_bot.core.event_topics import ENGINE_ERROR
+from discord_bot.core.event_topics import ENGINE_ERROR, SHUTDOWN_INITIATED
 from discord_bot.language_context import AmbiguityResolver, LanguageAliasHelper, load_language_map
 from discord_bot.language_context.context_engine import ContextEngine
 from discord_bot.language_context.context.policies import PolicyRepository
@@ -82,6 +90,7 @@ class HippoBot(commands.Bot):
         self.alert_recipient_ids: Set[int] = set(alert_recipient_ids or ())
         self._synced = False
         self._post_setup_hooks: list[Callable[[], Awaitable[None]]] = []
+        self._shutdown_hooks: list[Callable[[], Awaitable[None]]] = []
         self.last_command_sync: Optional[datetime] = None
         self._mismatch_alerts: Set[Tuple[str, Optional[int]]] = set()
 
@@ -537,6 +546,18 @@ class HippoBot(commands.Bot):
             except Exception:
                 logger.exception("Post-setup hook failed")
 
+    def add_shutdown_hook(self, hook: Callable[[], Awaitable[None]]) -> None:
+        self._shutdown_hooks.append(hook)
+
+    async def close(self) -> None:
+        hooks, self._shutdown_hooks = self._shutdown_hooks, []
+        for hook in hooks:
+            try:
+                await hook()
+            except Exception:
+                logger.exception("Shutdown hook failed")
+        await super().close()
+
 
 class IntegrationLoader:
     """
@@ -590,6 +611,8 @@ class IntegrationLoader:
 
         # Game system engines
         from discord_bot.games.storage.game_storage_engine import GameStorageEngine
+        from discord_bot.games.storage.async_game_storage import AsyncGameStorage
+        from discord_bot.games.storage.retention_service import RetentionService
         from discord_bot.core.engines.relationship_manager import RelationshipManager
         from discord_bot.core.engines.cookie_manager import CookieManager
         from discord_bot.games.pokemon_game import PokemonGame
@@ -597,6 +620,7 @@ class IntegrationLoader:
         from discord_bot.games.pokemon_data_manager import PokemonDataManager
 
         self.game_storage = GameStorageEngine(db_path="data/game_data.db")
+        self.game_storage_async = AsyncGameStorage.for_engine(self.game_storage)
         self.relationship_manager = RelationshipManager(storage=self.game_storage)
         self.cookie_manager = CookieManager(
             storage=self.game_storage,
@@ -623,10 +647,50 @@ class IntegrationLoader:
         self.event_reminder_engine.kvk_tracker = self.kvk_tracker
 
         # Ranking system engines
-        self.ranking_processor = ScreenshotProcessor()
-        self.ranking_storage = RankingStorageEngine(storage=self.game_storage)
+        # OCR runs in a bounded process pool so submissions never block the event loop
+        self.ocr_executor = OcrExecutor(
+            "ocr",
+            max_workers=int(os.getenv("OCR_POOL_WORKERS", "2")),
+            max_queue=int(os.getenv("OCR_POOL_QUEUE", "8")),
+        )
+        # Byte-identical resubmitted screenshots skip OCR
+        self.screenshot_cache = ScreenshotCache(
+            max_scopes=int(os.getenv("SCREENSHOT_CACHE_SCOPES", "128")),
+            per_scope=int(os.getenv("SCREENSHOT_CACHE_PER_SCOPE", "256")),
+        )
+        self.ranking_processor = ScreenshotProcessor(
+            ocr_executor=self.ocr_executor,
+            ocr_timeout=float(os.getenv("OCR_TIMEOUT_SECONDS", "30")),
+            screenshot_cache=self.screenshot_cache,
+        )
+        self.ranking_storage = RankingStorageEngine(
+            storage=self.game_storage,
+            screenshot_cache=self.screenshot_cache,
+        )
         logger.debug("Ranking system engines initialized")
 
+        # Async log/error store with write-behind batching
+        self.storage_engine = StorageEngine(db_path=os.getenv("STORAGE_DB_PATH", "data/database.db"))
+        self.storage_engine.attach_event_bus(self.event_bus)
+
+        # Online, page-stepped SQLite backups (RankingStorageEngine shares the game database)
+        self.backup_service = BackupService(
+            backup_dir=os.getenv("DB_BACKUP_DIR", "data/backups"),
+            interval_hours=float(os.getenv("DB_BACKUP_INTERVAL_HOURS", "6")),
+            keep=int(os.getenv("DB_BACKUP_KEEP", "7")),
+        )
+        self.backup_service.add_engine("game_data", self.game_storage)
+        self.backup_service.add_engine("storage", self.storage_engine)
+
+        # Batched retention + daily rollups for rankings, interactions and submission logs
+        self.retention_service = RetentionService(
+            self.game_storage_async,
+            ranking_weeks_to_keep=int(os.getenv("RANKING_WEEKS_TO_KEEP", "4")),
+            interactions_days=int(os.getenv("INTERACTIONS_RETENTION_DAYS", "30")),
+            submissions_days=int(os.getenv("SUBMISSIONS_RETENTION_DAYS", "30")),
+            interval_hours=float(os.getenv("RETENTION_INTERVAL_HOURS", "24")),
+        )
+
         self.ambiguity_resolver = (
             AmbiguityResolver(
                 role_manager=self.role_manager,
@@ -659,11 +723,33 @@ class IntegrationLoader:
         self.translation_ui = TranslationUIEngine(event_bus=self.event_bus)
         self.admin_ui = AdminUIEngine(event_bus=self.event_bus)
 
+        # Shared pooled HTTP client for adapters, cogs and scrapers (closed on shutdown)
+        self.http_client = HttpClientService(
+            limit=int(os.getenv("HTTP_POOL_LIMIT", "100")),
+            limit_per_host=int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "10")),
+        )
+        # Ranking screenshots are streamed through the shared client under a byte cap
+        self.screenshot_intake = ScreenshotIntake(
+            http_client=self.http_client,
+            max_bytes=int(os.getenv("SCREENSHOT_MAX_BYTES", str(10 * 1024 * 1024))),
+        )
+
+        # Dedicated bounded pools for blocking provider SDKs (kept off the default executor)
+        self.provider_executors: Dict[str, ProviderExecutor] = {
+            name: ProviderExecutor(
+                name,
+                max_workers=int(os.getenv("PROVIDER_POOL_WORKERS", "4")),
+                max_queue=int(os.getenv("PROVIDER_POOL_QUEUE", "32")),
+            )
+            for name in ("deepl", "google")
+        }
+
         # Translators / orchestrator wiring
         self.deepl_adapter: Optional[DeepLAdapter] = None
         self.mymemory_adapter: Optional[MyMemoryAdapter] = None
         self.google_adapter = None  # GoogleTranslateAdapter (free tier fallback)
         self.openai_adapter: Optional[OpenAIAdapter] = None
+        self.translation_cache: Optional[TranslationCache] = None
         self.orchestrator: Optional[TranslationOrchestratorEngine] = None
 
     # ------------------------------------------------------------------
@@ -676,7 +762,12 @@ class IntegrationLoader:
         try:
             deepl_key = os.getenv("DEEPL_API_KEY")
             if deepl_key:
-                self.deepl_adapter = DeepLAdapter(api_key=deepl_key)
+                batch_window_ms = float(os.getenv("DEEPL_BATCH_WINDOW_MS", "15"))
+                self.deepl_adapter = DeepLAdapter(
+                    api_key=deepl_key,
+                    executor=self.provider_executors["deepl"],
+                    batch_window=batch_window_ms / 1000 if batch_window_ms > 0 else None,
+                )
                 logger.debug("DeepL adapter initialised")
             else:
                 logger.debug("DEEPL_API_KEY not set; DeepL adapter disabled")
@@ -688,7 +779,9 @@ class IntegrationLoader:
         try:
             mymemory_email = os.getenv("MYMEMORY_USER_EMAIL")
             mymemory_key = os.getenv("MYMEMORY_API_KEY")
-            self.mymemory_adapter = MyMemoryAdapter(user_email=mymemory_email, api_key=mymemory_key)
+            self.mymemory_adapter = MyMemoryAdapter(
+                user_email=mymemory_email, api_key=mymemory_key, http_client=self.http_client
+            )
             if mymemory_key:
                 logger.debug("MyMemory adapter initialised with API key")
             elif mymemory_email:
@@ -701,7 +794,7 @@ class IntegrationLoader:
 
         # Google Translate (free tier fallback for 100+ languages)
         try:
-            self.google_adapter = create_google_translate_adapter()
+            self.google_adapter = create_google_translate_adapter(executor=self.provider_executors["google"])
             logger.debug("Google Translate adapter initialised (100+ languages)")
         except Exception:
             self.google_adapter = None
@@ -730,16 +823,37 @@ class IntegrationLoader:
             except Exception:
                 logger.exception("Failed to attach OpenAI adapter to PersonalityEngine")
 
+        # Translation result cache (memory LRU + SQLite)
+        try:
+            cache_db = os.getenv("TRANSLATION_CACHE_DB", "data/translation_cache.db").strip()
+            self.translation_cache = TranslationCache(
+                max_entries=int(os.getenv("TRANSLATION_CACHE_SIZE", "2048")),
+                db_path=cache_db or None,
+            )
+            logger.debug("Translation cache initialised (db=%s)", cache_db or "<memory only>")
+        except Exception:
+            self.translation_cache = None
+            logger.exception("Failed to initialise TranslationCache; continuing without it")
+
         # Orchestrator
         try:
+            hedge = str(os.getenv("TRANSLATION_HEDGE", "0")).lower() in {"1", "true", "yes"}
+            hedge_delay_ms = os.getenv("TRANSLATION_HEDGE_DELAY_MS", "").strip()
             self.orchestrator = TranslationOrchestratorEngine(
                 deepl_adapter=self.deepl_adapter,
                 mymemory_adapter=self.mymemory_adapter,
                 google_adapter=self.google_adapter,
                 detection_service=self.detector,
                 nlp_processor=self.nlp_processor,
+                cache=self.translation_cache,
+                hedge=hedge,
+                hedge_delay=float(hedge_delay_ms) / 1000 if hedge_delay_ms else None,
+                adaptive_order=str(os.getenv("TRANSLATION_ADAPTIVE_ORDER", "0")).lower() in {"1", "true", "yes"},
+            )
+            logger.info(
+                "TranslationOrchestratorEngine created (DeepL ➜ MyMemory ➜ Google Translate%s)",
+                ", hedged" if hedge else "",
             )
-            logger.info("TranslationOrchestratorEngine created (DeepL ➜ MyMemory ➜ Google Translate)")
         except Exception:
             self.orchestrator = None
             logger.exception("Failed to create TranslationOrchestratorEngine")
@@ -834,9 +948,11 @@ class IntegrationLoader:
         self.registry.inject("policy_repository", self.policy_repository)
         self.registry.inject("session_memory", self.session_memory)
         self.registry.inject("context_memory", self.context_memory)
+        self.registry.inject("http_client", self.http_client)
         
         # Inject game system dependencies
         self.registry.inject("game_storage", self.game_storage)
+        self.registry.inject("game_storage_async", self.game_storage_async)
         self.registry.inject("relationship_manager", self.relationship_manager)
         self.registry.inject("cookie_manager", self.cookie_manager)
         self.registry.inject("pokemon_data_manager", self.pokemon_data_manager)
@@ -866,6 +982,14 @@ class IntegrationLoader:
 
         self.bot.add_post_setup_hook(resume_kvk_runs)
 
+        async def start_maintenance() -> None:
+            await self.storage_engine.initialize()
+            self.backup_service.start()
+            self.retention_service.start()
+
+        self.bot.add_post_setup_hook(start_maintenance)
+        self.bot.add_shutdown_hook(self._shutdown)
+
         if self._guardian_auto_disable:
             logger.warning("Guardian SAFE MODE auto-disable is ENABLED (GUARDIAN_SAFE_MODE=1)")
         else:
@@ -903,6 +1027,7 @@ class IntegrationLoader:
             "context_memory": self.context_memory,
             # Game system
             "game_storage": self.game_storage,
+            "game_storage_async": self.game_storage_async,
             "relationship_manager": self.relationship_manager,
             "cookie_manager": self.cookie_manager,
             "pokemon_data_manager": self.pokemon_data_manager,
@@ -911,9 +1036,20 @@ class IntegrationLoader:
             "event_reminder_engine": self.event_reminder_engine,
             "kvk_tracker": self.kvk_tracker,
             "ranking_processor": self.ranking_processor,
+            "ocr_executor": self.ocr_executor,
+            "screenshot_cache": self.screenshot_cache,
+            "screenshot_intake": self.screenshot_intake,
             "ranking_storage": self.ranking_storage,
+            "storage_engine": self.storage_engine,
+            "backup_service": self.backup_service,
+            "retention_service": self.retention_service,
         }
 
+        if self.translation_cache:
+            mapping["translation_cache"] = self.translation_cache
+        mapping["http_client"] = self.http_client
+        mapping["provider_executors"] = self.provider_executors
+
         orchestrator = getattr(self.processing_engine, "orchestrator", None) or self.orchestrator
         if orchestrator:
             mapping["translation_orchestrator"] = orchestrator
@@ -945,6 +1081,23 @@ class IntegrationLoader:
         summary = " | ".join(parts) if parts else "no registered engines"
         logger.info("📦 Engine registry snapshot (%s): %s", context, summary)
 
+    async def _shutdown(self) -> None:
+        """Announce shutdown on the event bus, then release loader-owned resources."""
+        try:
+            await self.event_bus.emit(SHUTDOWN_INITIATED, reason="bot.close")
+        except Exception:
+            logger.exception("event_bus.emit failed while announcing shutdown")
+
+        if self.translation_cache:
+            await self.translation_cache.close()
+        await self.http_client.close()
+        for executor in self.provider_executors.values():
+            executor.shutdown()
+        self.ocr_executor.shutdown()
+        await self.backup_service.stop()
+        await self.retention_service.stop()
+        await self.game_storage_async.close()
+
     async def _mount_cogs(self, owners: Iterable[int]) -> None:
         if not self.bot:
             return
@@ -969,6 +1122,7 @@ class IntegrationLoader:
                 self.bot,
                 processor=self.ranking_processor,
                 storage=self.ranking_storage,
+                intake=self.screenshot_intake,
             )
             
             # Mount game system cogs with dependency injection
@@ -976,7 +1130,8 @@ class IntegrationLoader:
                 bot=self.bot,
                 relationship_manager=self.relationship_manager,
                 cookie_manager=self.cookie_manager,
-                personality_engine=self.personality_engine
+                personality_engine=self.personality_engine,
+                http_client=self.http_client,
             )
             await self.bot.add_cog(easter_egg_cog, override=True)
             
@@ -64,6 +64,8 @@ class ContextEngine:
         self.policy_repo = policy_repository
         self.context_memory = context_memory
         self.session_memory = session_memory
+        # Number of times the injected detector was actually invoked (one per planned message).
+        self.detection_calls = 0
 
     @staticmethod
     def _preview(text: str, limit: int = 60) -> str:
@@ -251,7 +253,7 @@ class ContextEngine:
 
         processed_text = self._normalize_input_text(text, policy)
         tgt = self._resolve_target_code(guild_id, author_id, force_tgt, policy=policy)
-        src = await self._detect_source_code(processed_text)
+        src, src_conf = await self._detect_source(processed_text)
         
         # NEW: If target is "auto", it means no preference was found
         # Return a special context indicating user needs to specify target
@@ -299,6 +301,7 @@ class ContextEngine:
             author_id=author_id,
             text=text,
             src_lang=src,
+            src_confidence=src_conf,
             tgt_lang=tgt,
             metadata=metadata,
         )
@@ -333,7 +336,7 @@ class ContextEngine:
 
         processed_text = self._normalize_input_text(text, policy)
         tgt = self._resolve_target_code(guild_id, other_user_id, force_tgt, policy=policy)
-        src = await self._detect_source_code(processed_text)
+        src, src_conf = await self._detect_source(processed_text)
         if self._equivalent_lang(src, tgt):
             _logger.info(
                 "🧭 plan_for_pair skip: guild=%s author=%s other=%s src=%s tgt=%s len=%d preview=%r",
@@ -361,6 +364,7 @@ class ContextEngine:
             author_id=author_id,
             text=text,
             src_lang=src,
+            src_confidence=src_conf,
             tgt_lang=tgt,
             metadata=metadata,
         )
@@ -396,7 +400,7 @@ class ContextEngine:
         processed_text = self._normalize_input_text(text, policy)
         tgt = self._normalize_code(code)
         tgt = self._apply_policy_target(tgt, policy)
-        src = await self._detect_source_code(processed_text)
+        src, src_conf = await self._detect_source(processed_text)
         if self._equivalent_lang(src, tgt):
             _logger.info(
                 "🧭 plan_for_code skip: guild=%s user=%s src=%s tgt=%s len=%d preview=%r",
@@ -423,6 +427,7 @@ class ContextEngine:
             author_id=author_id,
             text=text,
             src_lang=src,
+            src_confidence=src_conf,
             tgt_lang=tgt,
             metadata=metadata,
         )
@@ -540,7 +545,16 @@ class ContextEngine:
             return default_resp
 
         try:
-            # Prefer job-based API if present
+            # Prefer the pre-planned entry point: it reuses the source detected while planning.
+            if hasattr(orchestrator, "translate_planned_job"):
+                maybe = orchestrator.translate_planned_job(job)
+                if asyncio.iscoroutine(maybe):
+                    raw = await asyncio.wait_for(maybe, timeout) if timeout else await maybe
+                else:
+                    raw = maybe
+                return self._normalize_orchestrator_result(raw, job)
+
+            # Job-based API
             if hasattr(orchestrator, "translate_job"):
                 maybe = orchestrator.translate_job(job)
                 if asyncio.iscoroutine(maybe):
@@ -623,19 +637,37 @@ class ContextEngine:
             )
             return {"job": None, "context": context, "response": empty}
 
+        resp = await self.run_planned_job(job, orchestrator, original_text=text, channel_id=channel_id, timeout=timeout)
+        return {"job": job, "context": context, "response": resp}
+
+    async def run_planned_job(
+        self,
+        job: TranslationJob,
+        orchestrator: Optional[Any],
+        *,
+        original_text: str,
+        channel_id: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> TranslationResponse:
+        """
+        Execute a job returned by one of the `plan_for_*` helpers and record the result.
+
+        Unlike `translate_for_author_via_orchestrator` this does not plan again, so the
+        source language detected while planning is the only detection for the message.
+        """
         resp = await self.execute_job_with_orchestrator(job, orchestrator, timeout=timeout)
         try:
             await self._record_translation_event(
-                guild_id=guild_id,
+                guild_id=job.guild_id,
                 channel_id=channel_id,
-                user_id=author_id,
+                user_id=job.author_id,
                 job=job,
                 response=resp,
-                original_text=text,
+                original_text=original_text,
             )
         except Exception:
             _logger.debug("record_translation_event failed", exc_info=True)
-        return {"job": job, "context": context, "response": resp}
+        return resp
 
     # -------------------------
     # Internal normalizers & helpers
@@ -795,24 +827,33 @@ class ContextEngine:
         return None
 
     async def _detect_source_code(self, text: str) -> str:
+        """Detect source language code for `text` (see `_detect_source`)."""
+        code, _ = await self._detect_source(text)
+        return code
+
+    async def _detect_source(self, text: str) -> Tuple[str, Optional[float]]:
         """
-        Detect source language code for `text`.
+        Detect source language code and confidence for `text`.
 
         Behavior:
           - If a detection_service is injected and exposes `detect_language`, prefer it.
             Supports both synchronous and asynchronous detector implementations.
             Accepts detectors that return either a string code or (code, confidence).
           - Falls back to fast Unicode-range heuristics (existing behavior).
-          - Returns base normalized code (two-letter/core) like 'en', 'ja', 'zh'.
+          - Returns base normalized code (two-letter/core) like 'en', 'ja', 'zh'
+            plus the detector's confidence in [0, 1]. The confidence is None when no
+            detector scored the text (heuristic fallback, empty text, or a detector
+            that returns a bare code), so it is never mistaken for a detector score.
         """
         t = (text or "").strip()
         if not t:
-            return "en"
+            return "en", None
 
         # Try injected detector first if present
         if self.detector and hasattr(self.detector, "detect_language"):
             try:
                 detect_fn = getattr(self.detector, "detect_language")
+                self.detection_calls += 1
                 # If it's a coroutine function, await directly
                 if asyncio.iscoroutinefunction(detect_fn):
                     res = await detect_fn(t)
@@ -822,30 +863,33 @@ class ContextEngine:
                     res = await loop.run_in_executor(None, detect_fn, t)
 
                 # Detector may return (lang, confidence) or lang string
+                conf: Optional[float] = None
                 if isinstance(res, tuple) and res:
                     lang = res[0]
+                    if len(res) > 1 and isinstance(res[1], (int, float)):
+                        conf = float(res[1])
                 elif isinstance(res, str):
                     lang = res
                 else:
                     lang = None
 
                 if isinstance(lang, str) and lang:
-                    return self._normalize_code(lang)
+                    return self._normalize_code(lang), conf
             except Exception as exc:
-                _logger.exception("detector failed in _detect_source_code")
-                self._log_error(exc, context="_detect_source_code")
+                _logger.exception("detector failed in _detect_source")
+                self._log_error(exc, context="_detect_source")
                 # fall through to heuristics if detector fails
 
-        # Fallback: existing unicode-range heuristics (kept as-is)
+        # Fallback: existing unicode-range heuristics (kept as-is); no detector score
         if any("\u3040" <= ch <= "\u30ff" for ch in t):
-            return "ja"
+            return "ja", None
         if any("\u4e00" <= ch <= "\u9fff" for ch in t):
-            return "zh"
+            return "zh", None
         if any("\u0400" <= ch <= "\u04FF" for ch in t):
-            return "ru"
+            return "ru", None
         if any("\u00C0" <= ch <= "\u024F" for ch in t):
-            return "es"
-        return "en"
+            return "es", None
+        return "en", None
 
     def _equivalent_lang(self, a: str, b: str) -> bool:
         """
@@ -40,7 +40,7 @@ class NLPProcessor:
         self._re_space_before_punct = re.compile(r"\s+([,.:;!?%])")
         self._re_multidots = re.compile(r"\.{3,}")
 
-    def preprocess(self, text: Optional[str]) -> str:
+    def preprocess(self, text: Optional[str], *, truncate: bool = True) -> str:
         """
         Prepare text before sending to translation providers.
 
@@ -51,6 +51,7 @@ class NLPProcessor:
           a zero-width space after '@'
         - Protects long sequences of backticks by converting them to a safe marker
         - Trims to max_input_chars, preferring to cut at a newline boundary when possible
+          (`truncate=False` keeps the full text for callers that chunk it themselves)
         """
         if not text:
             return ""
@@ -86,7 +87,7 @@ class NLPProcessor:
         t = self._re_backticks.sub("```", t)
 
         # Trim safely to max chars. Prefer to trim at last newline before limit so sentences/blocks are preserved.
-        if len(t) > self.max_input_chars:
+        if truncate and len(t) > self.max_input_chars:
             # try to cut at last double newline within limit for better chunking
             cut_point = t.rfind("\n\n", 0, self.max_input_chars)
             if cut_point == -1:
@@ -135,7 +136,9 @@ class NLPProcessor:
         Utility: split text into chunked segments not exceeding max_size.
         Returns a tuple of chunks. Default max_size uses self.max_input_chars.
 
-        Splitting tries to preserve paragraph boundaries.
+        Splitting prefers paragraph boundaries, then line breaks, then sentence ends,
+        then whitespace; only a single unbroken run longer than max_size is cut hard.
+        Chunks are stripped, non-empty, and appear in the original text in order.
         """
         if not text:
             return tuple()
@@ -148,16 +151,21 @@ class NLPProcessor:
         parts = []
         start = 0
         while start < len(t):
+            # skip whitespace left over from the previous boundary
+            while start < len(t) and t[start].isspace():
+                start += 1
+            if start >= len(t):
+                break
             end = min(start + max_size, len(t))
+            cut = end
             if end < len(t):
-                # attempt to cut at last paragraph/newline within the window
-                cut = t.rfind("\n\n", start, end)
-                if cut <= start:
-                    cut = t.rfind("\n", start, end)
-                if cut <= start:
-                    cut = end
-            else:
-                cut = end
-            parts.append(t[start:cut].rstrip())
+                for boundary, keep in (("\n\n", 0), ("\n", 0), (". ", 1), (" ", 0)):
+                    found = t.rfind(boundary, start, end)
+                    if found > start:
+                        cut = found + keep
+                        break
+            chunk = t[start:cut].strip()
+            if chunk:
+                parts.append(chunk)
             start = cut
-        return tuple(parts)
\ No newline at end of file
+        return tuple(parts)
@@ -18,6 +18,8 @@ class TranslationJob:
     Fields:
         text: original text from user
         src: detected or user-selected source language (None = auto)
+        src_confidence: detector confidence for `src` when it was detected while
+            planning (None = not detected); lets the orchestrator skip re-detection
         tgt: target language code
         guild_id: Discord guild/server ID (0 if DM)
         author_id: Discord user ID
@@ -29,6 +31,7 @@ class TranslationJob:
     text: str
     tgt_lang: str
     src_lang: Optional[str]
+    src_confidence: Optional[float]
     guild_id: int
     author_id: int
     metadata: Dict[str, Any]
@@ -43,6 +46,7 @@ class TranslationJob:
         tgt_lang: Optional[str] = None,
         src: Optional[str] = None,
         src_lang: Optional[str] = None,
+        src_confidence: Optional[float] = None,
         guild_id: int = 0,
         author_id: int = 0,
         metadata: Optional[Dict[str, Any]] = None,
@@ -54,6 +58,7 @@ class TranslationJob:
         object.__setattr__(self, "text", text)
         object.__setattr__(self, "tgt_lang", target or "en")
         object.__setattr__(self, "src_lang", source)
+        object.__setattr__(self, "src_confidence", src_confidence)
         object.__setattr__(self, "guild_id", guild_id)
         object.__setattr__(self, "author_id", author_id)
         object.__setattr__(self, "metadata", metadata.copy() if isinstance(metadata, dict) else {})
@@ -68,12 +73,13 @@ class TranslationJob:
     def src(self) -> Optional[str]:
         return self.src_lang
 
-    def with_src(self, new_src: str) -> "TranslationJob":
+    def with_src(self, new_src: str, confidence: Optional[float] = None) -> "TranslationJob":
         """Return a copy of this job with a new source language."""
         return TranslationJob(
             text=self.text,
             tgt_lang=self.tgt_lang,
             src_lang=new_src,
+            src_confidence=confidence,
             guild_id=self.guild_id,
             author_id=self.author_id,
             metadata=self.metadata,
@@ -87,6 +93,7 @@ class TranslationJob:
             text=self.text,
             tgt_lang=new_tgt,
             src_lang=self.src_lang,
+            src_confidence=self.src_confidence,
             guild_id=self.guild_id,
             author_id=self.author_id,
             metadata=self.metadata,
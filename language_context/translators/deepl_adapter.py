@@ -13,8 +13,11 @@
 # DESIGN NOTES:
 # - Avoids hard runtime dependency on the `deepl` package by allowing an injected client.
 # - Provides both sync and async entrypoints. If the injected client's translate method is synchronous,
-#   async calls are executed in a thread with `asyncio.to_thread`.
+#   async calls are executed on the injected `ProviderExecutor` (a bounded pool dedicated to
+#   blocking providers), or with `asyncio.to_thread` when none is injected.
 # - Minimal retry/backoff is implemented; this is tunable and replaceable by callers if needed.
+# - Optional micro-batching (`batch_window`): concurrent calls for the same (src, tgt) pair are
+#   collected for a few milliseconds and sent as one multi-text request (see `DeepLBatcher`).
 #
 # TODOs are included at the bottom describing future extensions (timeouts, circuit-breaker, telemetry).
 from __future__ import annotations
@@ -24,11 +27,17 @@ import inspect
 import logging
 import time
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from discord_bot.core.engines.provider_executor import ProviderExecutor
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["DeepLAdapter", "TranslationResult"]
+__all__ = ["DeepLAdapter", "DeepLBatcher", "TranslationResult"]
+
+# DeepL accepts at most 50 texts and 128 KiB of request body per call.
+DEEPL_MAX_BATCH_ITEMS = 50
+DEEPL_MAX_BATCH_BYTES = 120_000
 
 
 @dataclass(frozen=True)
@@ -48,6 +57,108 @@ class TranslationResult:
     elapsed_seconds: Optional[float] = None
 
 
+BatchKey = Tuple[Optional[str], Optional[str]]
+
+
+class _PendingBatch:
+    __slots__ = ("items", "size", "timer")
+
+    def __init__(self) -> None:
+        self.items: List[Tuple[str, "asyncio.Future[Any]"]] = []
+        self.size = 0
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class DeepLBatcher:
+    """
+    Micro-batching stage in front of a multi-text `send(texts, src, tgt)` call.
+
+    Calls for the same (src, tgt) pair are held for at most `window` seconds, or
+    until `max_items` texts / `max_bytes` UTF-8 bytes are queued, then sent as one
+    request; the response list is split back out to the waiting callers in order.
+    A failed request fails every caller in that batch. Callers cancelled before
+    the flush are dropped from the request.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[List[str], Optional[str], Optional[str]], Awaitable[Any]],
+        *,
+        window: float = 0.015,
+        max_items: int = DEEPL_MAX_BATCH_ITEMS,
+        max_bytes: int = DEEPL_MAX_BATCH_BYTES,
+    ) -> None:
+        self._send = send
+        self.window = max(0.0, float(window))
+        self.max_items = max(1, min(int(max_items), DEEPL_MAX_BATCH_ITEMS))
+        self.max_bytes = max(1, int(max_bytes))
+        self._pending: Dict[BatchKey, _PendingBatch] = {}
+        self._dispatching: set = set()
+        self._stats: Dict[str, int] = {"batches": 0, "items": 0, "largest_batch": 0, "size_flushes": 0, "timer_flushes": 0}
+
+    async def submit(self, text: str, src_lang: Optional[str], tgt_lang: Optional[str]) -> Any:
+        """Queue one text and wait for its share of the batched response."""
+        key: BatchKey = (src_lang, tgt_lang)
+        size = len(text.encode("utf-8"))
+        batch = self._pending.get(key)
+        if batch is not None and batch.size + size > self.max_bytes:
+            self._flush(key, batch, reason="size_flushes")
+            batch = None
+        if batch is None:
+            batch = _PendingBatch()
+            self._pending[key] = batch
+            batch.timer = asyncio.get_running_loop().call_later(self.window, self._flush, key, batch, "timer_flushes")
+
+        future: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+        batch.items.append((text, future))
+        batch.size += size
+        if len(batch.items) >= self.max_items or batch.size >= self.max_bytes:
+            self._flush(key, batch, reason="size_flushes")
+        return await future
+
+    def _flush(self, key: BatchKey, batch: _PendingBatch, reason: str) -> None:
+        if self._pending.get(key) is batch:
+            del self._pending[key]
+        if batch.timer is not None:
+            batch.timer.cancel()
+            batch.timer = None
+        live = [(text, fut) for text, fut in batch.items if not fut.done()]
+        batch.items = []
+        if not live:
+            return
+        self._stats[reason] += 1
+        task = asyncio.ensure_future(self._dispatch(key, live))
+        self._dispatching.add(task)
+        task.add_done_callback(self._dispatching.discard)
+
+    async def _dispatch(self, key: BatchKey, items: List[Tuple[str, "asyncio.Future[Any]"]]) -> None:
+        self._stats["batches"] += 1
+        self._stats["items"] += len(items)
+        self._stats["largest_batch"] = max(self._stats["largest_batch"], len(items))
+        try:
+            results = await self._send([text for text, _ in items], key[0], key[1])
+            if not isinstance(results, (list, tuple)):
+                results = [results]
+            if len(results) != len(items):
+                raise RuntimeError(f"DeepL returned {len(results)} results for {len(items)} texts")
+        except BaseException as exc:
+            for _, fut in items:
+                if not fut.done():
+                    fut.set_exception(exc)
+            if isinstance(exc, asyncio.CancelledError):
+                raise
+            return
+        for (_, fut), result in zip(items, results):
+            if not fut.done():
+                fut.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = dict(self._stats)
+        out["avg_batch_size"] = (out["items"] / out["batches"]) if out["batches"] else 0.0
+        out["pending"] = sum(len(batch.items) for batch in self._pending.values())
+        return out
+
+
 class DeepLAdapter:
     """
     Adapter for DeepL translation.
@@ -87,6 +198,10 @@ class DeepLAdapter:
         max_retries: int = 1,
         retry_backoff: float = 0.2,
         default_timeout: Optional[float] = None,
+        executor: Optional[ProviderExecutor] = None,
+        batch_window: Optional[float] = None,
+        max_batch_items: int = DEEPL_MAX_BATCH_ITEMS,
+        max_batch_bytes: int = DEEPL_MAX_BATCH_BYTES,
     ) -> None:
         """
         Parameters:
@@ -95,12 +210,21 @@ class DeepLAdapter:
         - max_retries: number of total attempts (1 = no retry)
         - retry_backoff: base backoff seconds between retries (simple linear backoff)
         - default_timeout: optional timeout for a single translation call in seconds (adapter-level)
+        - executor: optional dedicated pool for the blocking SDK call (defaults to asyncio.to_thread)
+        - batch_window: seconds to hold calls for micro-batching (None/0 sends each text on its own)
+        - max_batch_items / max_batch_bytes: flush a batch early once either limit is reached
         """
         self._translator = translator
         self._api_key = api_key
         self.max_retries = max(1, int(max_retries))
         self.retry_backoff = float(retry_backoff)
         self.default_timeout = None if default_timeout is None else float(default_timeout)
+        self.executor = executor
+        self.batcher: Optional[DeepLBatcher] = None
+        if batch_window:
+            self.batcher = DeepLBatcher(
+                self._request, window=batch_window, max_items=max_batch_items, max_bytes=max_batch_bytes
+            )
 
         if self._translator is None:
             if not api_key:
@@ -127,11 +251,16 @@ class DeepLAdapter:
 
     def translate(self, text: str, src: Optional[str], tgt: str) -> Optional[TranslationResult]:
         """
-        Synchronous translation entrypoint.
+        Synchronous translation entrypoint for code running outside an event loop.
 
-        Returns TranslationResult on success or None on failure.
+        Returns TranslationResult on success or None on failure. Inside a running
+        loop this would block it, so it raises; await `translate_async` instead.
         """
-        return asyncio.get_event_loop().run_until_complete(self.translate_async(text, src, tgt))
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.translate_async(text, src, tgt))
+        raise RuntimeError("DeepLAdapter.translate() cannot be used inside a running event loop; use translate_async()")
 
     async def translate_async(self, text: str, src: Optional[str], tgt: str) -> Optional[TranslationResult]:
         """
@@ -154,18 +283,10 @@ class DeepLAdapter:
             attempt += 1
             start = time.perf_counter()
             try:
-                # If translator provides an async method, call it directly.
-                translate_callable = getattr(self._translator, "translate_text", None)
-                if translate_callable is None:
-                    raise AttributeError("Injected translator does not have 'translate_text' method.")
-
-                # Decide whether to run in thread or await directly based on callable inspect.
-                if inspect.iscoroutinefunction(translate_callable):
-                    # Async provider
-                    resp = await self._invoke_translate_async(translate_callable, text, src_lang, tgt_lang)
+                if self.batcher is not None:
+                    resp = await self.batcher.submit(text, src_lang, tgt_lang)
                 else:
-                    # Synchronous provider: run in thread to avoid blocking
-                    resp = await asyncio.to_thread(self._invoke_translate_sync, translate_callable, text, src_lang, tgt_lang)
+                    resp = await self._request(text, src_lang, tgt_lang)
 
                 elapsed = time.perf_counter() - start
                 if resp is None:
@@ -204,8 +325,27 @@ class DeepLAdapter:
             logger.info("DeepLAdapter: translation failed: %s", last_exc)
         return None
 
+    def batch_stats(self) -> Dict[str, Any]:
+        """Return micro-batching counters (empty when batching is disabled)."""
+        return self.batcher.stats() if self.batcher is not None else {}
+
     # ---- Internal helpers -----------------------------------------------------------
 
+    async def _request(self, text: Any, src_lang: Optional[str], tgt_lang: Optional[str]) -> Any:
+        """Send one provider call; `text` may be a single string or a list of strings."""
+        translate_callable = getattr(self._translator, "translate_text", None)
+        if translate_callable is None:
+            raise AttributeError("Injected translator does not have 'translate_text' method.")
+
+        # Decide whether to run in thread or await directly based on callable inspect.
+        if inspect.iscoroutinefunction(translate_callable):
+            # Async provider
+            return await self._invoke_translate_async(translate_callable, text, src_lang, tgt_lang)
+        # Synchronous provider: run in thread to avoid blocking
+        if self.executor is not None:
+            return await self.executor.run(self._invoke_translate_sync, translate_callable, text, src_lang, tgt_lang)
+        return await asyncio.to_thread(self._invoke_translate_sync, translate_callable, text, src_lang, tgt_lang)
+
     async def _invoke_translate_async(self, translate_callable: Callable[..., Any], text: str, src_lang: Optional[str], tgt_lang: Optional[str]) -> Any:
         """
         Call an async translate callable with best-effort parameter binding.
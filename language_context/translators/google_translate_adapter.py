@@ -7,7 +7,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Optional, List
+import threading
+from typing import Any, Dict, Optional, List, Tuple
+
+from discord_bot.core.engines.provider_executor import ProviderExecutor
 
 logger = logging.getLogger("hippo_bot.google_translate_adapter")
 
@@ -24,15 +27,52 @@ class GoogleTranslateAdapter:
     Adapter for Google Translate (free tier via deep-translator library).
     This is the third-tier fallback for languages not supported by DeepL or MyMemory.
     Supports 100+ languages.
+
+    deep-translator is blocking, so calls run on a dedicated bounded
+    `ProviderExecutor` instead of the loop's default executor. `GoogleTranslator`
+    instances mutate their request params on every call, so they are cached per
+    (src, tgt) pair *per worker thread* and reused across translations.
     """
 
-    def __init__(self):
-        self.translator = None  # Created per-translation with specific source/target
+    def __init__(self, executor: Optional[ProviderExecutor] = None):
         self._supported_langs: Optional[List[str]] = None
+        self._owns_executor = executor is None
+        self.executor = executor or ProviderExecutor("google", max_workers=4, max_queue=32)
+        self._local = threading.local()
         
         if not TRANSLATOR_AVAILABLE:
             logger.error("GoogleTranslateAdapter initialized but deep-translator not available")
 
+    @staticmethod
+    def _normalize_pair(src: Optional[str], tgt: str) -> Tuple[str, str]:
+        src_normalized = (src or "auto").lower().strip() or "auto"
+        tgt_normalized = tgt.lower().strip()
+        if tgt_normalized == "zh":
+            tgt_normalized = "zh-cn"
+        return src_normalized, tgt_normalized
+
+    def _translator_for(self, src: str, tgt: str) -> Any:
+        """Return this thread's cached GoogleTranslator for (src, tgt); runs on a worker thread."""
+        cache: Optional[Dict[Tuple[str, str], Any]] = getattr(self._local, "translators", None)
+        if cache is None:
+            cache = self._local.translators = {}
+        translator = cache.get((src, tgt))
+        if translator is None:
+            # deep-translator uses auto-detect when src='auto'
+            translator = GoogleTranslator(source=src, target=tgt)
+            cache[(src, tgt)] = translator
+        return translator
+
+    def _translate_blocking(self, text: str, src: str, tgt: str) -> Optional[str]:
+        return self._translator_for(src, tgt).translate(text)
+
+    def executor_stats(self) -> Dict[str, Any]:
+        return self.executor.stats()
+
+    def close(self) -> None:
+        if self._owns_executor:
+            self.executor.shutdown()
+
     def supported_languages(self) -> List[str]:
         """
         Return list of supported language codes.
@@ -77,29 +117,8 @@ class GoogleTranslateAdapter:
             return None
 
         try:
-            # Normalize language codes
-            src_normalized = src.lower().strip()
-            tgt_normalized = tgt.lower().strip()
-
-            # Handle special cases
-            if tgt_normalized in ['zh', 'zh-cn']:
-                tgt_normalized = 'zh-cn'
-            elif tgt_normalized == 'zh-tw':
-                tgt_normalized = 'zh-tw'
-
-            # Create translator instance for this translation
-            # deep-translator uses auto-detect when src='auto'
-            translator = GoogleTranslator(
-                source='auto' if src_normalized == 'auto' else src_normalized,
-                target=tgt_normalized
-            )
-
-            # Run translation in executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            translated = await loop.run_in_executor(
-                None,
-                lambda: translator.translate(text)
-            )
+            src_normalized, tgt_normalized = self._normalize_pair(src, tgt)
+            translated = await self.executor.run(self._translate_blocking, text, src_normalized, tgt_normalized)
 
             if translated:
                 translated = translated.strip()
@@ -122,21 +141,30 @@ class GoogleTranslateAdapter:
 
     def translate(self, text: str, src: str, tgt: str) -> Optional[str]:
         """
-        Synchronous translation method (for compatibility).
-        Note: This will block the event loop - prefer translate_async.
+        Synchronous translation method (for scripts and non-async callers).
+
+        Blocks the calling thread. Inside a running event loop use
+        `translate_async` instead; calls made from the loop thread are logged.
         """
         if not TRANSLATOR_AVAILABLE:
             return None
 
         try:
-            translator = GoogleTranslator(source=src, target=tgt)
-            return translator.translate(text)
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            logger.warning("GoogleTranslateAdapter.translate() called on the event loop; use translate_async()")
+
+        try:
+            src_normalized, tgt_normalized = self._normalize_pair(src, tgt)
+            return self._translate_blocking(text, src_normalized, tgt_normalized)
         except Exception as exc:
             logger.warning("Google Translate sync failed: %s", exc)
             return None
 
 
-def create_google_translate_adapter() -> Optional[GoogleTranslateAdapter]:
+def create_google_translate_adapter(executor: Optional[ProviderExecutor] = None) -> Optional[GoogleTranslateAdapter]:
     """
     Factory function to create Google Translate adapter.
     Returns None if deep-translator library is not available.
@@ -146,7 +174,7 @@ def create_google_translate_adapter() -> Optional[GoogleTranslateAdapter]:
         return None
     
     try:
-        adapter = GoogleTranslateAdapter()
+        adapter = GoogleTranslateAdapter(executor=executor)
         logger.info("Google Translate adapter initialized (100+ languages)")
         return adapter
     except Exception as exc:
@@ -91,6 +91,7 @@ class MyMemoryAdapter:
     - initial_backoff_s: initial backoff base in seconds (exponential backoff applied)
     - per_sec_limit: approximate allowed requests per second (simple slot-based throttle)
     - session: optional aiohttp.ClientSession injected by caller (preferred for reuse)
+    - http_client: optional shared HttpClientService; its pooled session is used when no session is injected
 
     Usage:
         adapter = MyMemoryAdapter(user_email="bot@example.com")
@@ -112,6 +113,7 @@ class MyMemoryAdapter:
         initial_backoff_s: float = 0.5,
         per_sec_limit: float = 4.0,
         session: Optional[aiohttp.ClientSession] = None,
+        http_client: Optional[Any] = None,
     ) -> None:
         self.user_email = user_email
         self.api_key = api_key
@@ -120,6 +122,7 @@ class MyMemoryAdapter:
         self.initial_backoff_s = max(0.05, float(initial_backoff_s))
         self.per_sec_limit = max(0.5, float(per_sec_limit))
         self._session = session
+        self._http = http_client
         self._err = get_error_engine()
 
         # token slot: next allowed timestamp for a single token
@@ -217,6 +220,8 @@ class MyMemoryAdapter:
         last_error: Optional[str] = None
         owns_session = False
         session = self._session
+        if session is None and self._http is not None:
+            session = self._http.session()
 
         if session is None:
             session = aiohttp.ClientSession()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Ranking screenshot OCR benchmark.
+
+Compares the previous pipeline (full-resolution image, default Tesseract
+settings, OCR run twice: once by validate_screenshot and again by
+process_screenshot, four separate regex scans) with the current one
+(crop/grayscale/downscale/binarize, tuned psm + whitelist, one OCR pass, one
+parse over precompiled patterns) and reports milliseconds per image for each stage.
+
+The corpus is either a directory of real screenshots or, by default, synthetic
+phone-sized ranking panels generated in memory. "handoff" is pytesseract
+writing the image to a temporary file for the tesseract binary, once per OCR
+call. Without the binary the OCR stage itself is not timed.
+
+Usage:
+    python scripts/benchmark_screenshot_ocr.py [--corpus DIR] [--images 12] [--repeat 3]
+"""
+
+import argparse
+import io
+import random
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from PIL import Image, ImageDraw, ImageFont
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from discord_bot.core.engines.screenshot_processor import (
+    OCR_CONFIG,
+    OCR_MAX_WIDTH,
+    parse_ranking_fields,
+    preprocess_for_ocr,
+)
+
+import pytesseract
+from pytesseract.pytesseract import save as tesseract_handoff
+
+try:
+    pytesseract.get_tesseract_version()
+    HAS_TESSERACT = True
+except Exception:
+    HAS_TESSERACT = False
+
+
+def legacy_parse(text):
+    """The previous extractors: a separate method and an uncompiled pattern per field."""
+    rank = None
+    for pattern in (r"#(\d+)", r"rank[:\s]+(\d+)", r"overall[:\s]+(\d+)"):
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            rank = int(match.group(1))
+            break
+    score = None
+    for pattern in (r"points?[:\s]+([\d,]+)", r"score[:\s]+([\d,]+)", r"(\d{1,3}(?:,\d{3})+)"):
+        values = [int(m.replace(",", "")) for m in re.findall(pattern, text, re.IGNORECASE) if m.replace(",", "")]
+        values = [v for v in values if v > 1000]
+        if values:
+            score = max(values)
+            break
+    name = None
+    for pattern in (r"#\d+\s+\[([A-Z]{3})\]\s+(\w+)", r"#\d+\s+\(([A-Z]{3})\)\s+(\w+)", r"#\d+\s+([A-Z]{3})\s+(\w+)"):
+        match = re.search(pattern, text)
+        if match:
+            name = match.group(match.lastindex)
+            break
+    tag = None
+    for pattern in (r"\[([A-Z]{3})\]", r"\(([A-Z]{3})\)", r"#\d+\s+([A-Z]{3})\s"):
+        match = re.search(pattern, text)
+        if match:
+            tag = match.group(1)
+            break
+    return rank, score, name, tag
+
+
+def synthetic_corpus(count, seed=7):
+    """Phone-sized (1170x2532) dark ranking panels with light text, as PNG bytes plus their text."""
+    rng = random.Random(seed)
+    try:
+        font = ImageFont.load_default(size=44)
+    except TypeError:  # Pillow < 10.1
+        font = ImageFont.load_default()
+    corpus = []
+    for i in range(count):
+        stage = rng.choice(["Prep Stage", "War Stage"])
+        lines = [stage, "1   2   3   4   5", "Ranking"]
+        for row in range(12):
+            tag = rng.choice(["TAO", "ABC", "XYZ", "HHP"])
+            lines.append(f"#{rng.randint(1, 99999)} [{tag}] Player{row}   {rng.randint(1_000_000, 99_999_999):,}")
+        lines.append(f"Points: {rng.randint(1_000_000, 99_999_999):,}")
+        image = Image.new("RGB", (1170, 2532), (22, 26, 44))
+        draw = ImageDraw.Draw(image)
+        for n, line in enumerate(lines):
+            draw.text((60, 260 + n * 120), line, fill=(235, 230, 210), font=font)
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG" if i % 2 else "JPEG", quality=90)
+        corpus.append((buffer.getvalue(), "\n".join(lines)))
+    return corpus
+
+
+def load_corpus(directory):
+    files = sorted(p for p in Path(directory).iterdir() if p.suffix.lower() in {".png", ".jpg", ".jpeg", ".webp"})
+    return [(p.read_bytes(), None) for p in files]
+
+
+def timed(fn, repeat):
+    samples = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), result
+
+
+def before_image(data):
+    image = Image.open(io.BytesIO(data))
+    image.load()
+    return image
+
+
+def after_image(data):
+    image = Image.open(io.BytesIO(data))
+    image.draft("L", (OCR_MAX_WIDTH, image.height * OCR_MAX_WIDTH // image.width))
+    return preprocess_for_ocr(image)
+
+
+def handoff(image, calls):
+    for _ in range(calls):
+        with tesseract_handoff(image):
+            pass
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", help="directory of screenshots (default: synthetic corpus)")
+    parser.add_argument("--images", type=int, default=12, help="synthetic corpus size")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per image; the median is reported")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus else synthetic_corpus(args.images)
+    stages = ("decode", "handoff", "ocr", "parse")
+    totals = {f"{stage}_{when}": 0.0 for stage in stages for when in ("before", "after")}
+    for data, reference_text in corpus:
+        ms, image = timed(lambda: before_image(data), args.repeat)
+        totals["decode_before"] += ms
+        ms, processed = timed(lambda: after_image(data), args.repeat)
+        totals["decode_after"] += ms
+        ms, _ = timed(lambda: handoff(image, 2), args.repeat)
+        totals["handoff_before"] += ms
+        ms, _ = timed(lambda: handoff(processed, 1), args.repeat)
+        totals["handoff_after"] += ms
+
+        text_before = text_after = reference_text or ""
+        if HAS_TESSERACT:
+            # Before: validate_screenshot and process_screenshot each ran OCR.
+            ms, text_before = timed(lambda: [pytesseract.image_to_string(image) for _ in range(2)][-1], 1)
+            totals["ocr_before"] += ms
+            ms, text_after = timed(lambda: pytesseract.image_to_string(processed, config=OCR_CONFIG), 1)
+            totals["ocr_after"] += ms
+
+        ms, _ = timed(lambda: [legacy_parse(text_before) for _ in range(100)], args.repeat)
+        totals["parse_before"] += ms / 100
+        ms, _ = timed(lambda: [parse_ranking_fields(text_after) for _ in range(100)], args.repeat)
+        totals["parse_after"] += ms / 100
+
+    count = len(corpus)
+    per_image = {key: value / count for key, value in totals.items()}
+    before = sum(per_image[f"{stage}_before"] for stage in stages)
+    after = sum(per_image[f"{stage}_after"] for stage in stages)
+    print(f"images={count} corpus={'synthetic' if not args.corpus else args.corpus} tesseract={HAS_TESSERACT}")
+    print(f"  {'stage':<12}{'before ms/img':>15}{'after ms/img':>15}")
+    for stage in stages:
+        print(f"  {stage:<12}{per_image[stage + '_before']:>15.3f}{per_image[stage + '_after']:>15.3f}")
+    print(f"  {'total':<12}{before:>15.3f}{after:>15.3f}  ({before / after:.1f}x)")
+    if not HAS_TESSERACT:
+        print("  (tesseract not installed: OCR stage not measured)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
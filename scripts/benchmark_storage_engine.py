@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+StorageEngine throughput benchmark.
+
+Compares the pooled StorageEngine (one writer + read-only reader pool) with the
+previous connect-per-query pattern on a mixed workload of concurrent inserts and
+reads against a temporary database.
+
+Usage:
+    python scripts/benchmark_storage_engine.py [--ops 2000] [--concurrency 16] [--read-ratio 0.8]
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import aiosqlite
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from discord_bot.core.storage.storage_engine import StorageEngine
+
+SCHEMA = "CREATE TABLE IF NOT EXISTS logs (id INTEGER PRIMARY KEY AUTOINCREMENT, context TEXT, message TEXT);"
+INSERT = "INSERT INTO logs (context, message) VALUES (?, ?)"
+SELECT = "SELECT COUNT(*) FROM logs WHERE context = ?"
+
+
+class ConnectPerQuery:
+    """The pre-pool access pattern: a fresh connection and PRAGMA per call, serialised by one lock."""
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        self._lock = asyncio.Lock()
+
+    async def execute(self, query, params):
+        async with self._lock:
+            async with aiosqlite.connect(self.db_path) as db:
+                await db.execute("PRAGMA foreign_keys=ON;")
+                await db.execute(query, params)
+                await db.commit()
+
+    async def fetch(self, query, params):
+        async with self._lock:
+            async with aiosqlite.connect(self.db_path) as db:
+                cursor = await db.execute(query, params)
+                rows = await cursor.fetchall()
+                await cursor.close()
+                return rows
+
+
+async def _workload(store, ops: int, concurrency: int, read_ratio: float) -> float:
+    rng = random.Random(42)
+    plan = [rng.random() < read_ratio for _ in range(ops)]
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(i: int, is_read: bool) -> None:
+        async with sem:
+            ctx = f"ctx{i % 8}"
+            if is_read:
+                await store.fetch(SELECT, (ctx,))
+            else:
+                await store.execute(INSERT, (ctx, f"message {i}"))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i, is_read) for i, is_read in enumerate(plan)))
+    return time.perf_counter() - start
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ops", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--read-ratio", type=float, default=0.8)
+    parser.add_argument("--readers", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        schema = tmp_path / "schema.sql"
+        schema.write_text(SCHEMA, encoding="utf-8")
+
+        legacy_db = tmp_path / "legacy.db"
+        async with aiosqlite.connect(legacy_db) as db:
+            await db.execute("PRAGMA journal_mode=WAL;")
+            await db.execute(SCHEMA)
+            await db.commit()
+        legacy = await _workload(ConnectPerQuery(legacy_db), args.ops, args.concurrency, args.read_ratio)
+
+        pooled_store = StorageEngine(
+            db_path=str(tmp_path / "pooled.db"),
+            json_backup=str(tmp_path / "backup.json"),
+            schema_file=str(schema),
+            readers=args.readers,
+        )
+        await pooled_store.initialize()
+        pooled = await _workload(pooled_store, args.ops, args.concurrency, args.read_ratio)
+        stats = pooled_store.pool_stats()
+        await pooled_store.close()
+
+    print(f"ops={args.ops} concurrency={args.concurrency} read_ratio={args.read_ratio:.2f}")
+    print(f"  connect-per-query: {legacy:7.3f}s  {args.ops / legacy:8.0f} ops/s")
+    print(f"  pooled           : {pooled:7.3f}s  {args.ops / pooled:8.0f} ops/s  ({legacy / pooled:.1f}x)")
+    print(f"  pool: {stats}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
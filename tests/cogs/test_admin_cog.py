@@ -128,3 +128,102 @@ async def test_keyword_remove_requires_existing_mapping():
 
     assert "alert" not in engine.get_sos_mapping(1)
     assert interaction.response.messages[0][0].startswith("Removed keyword")
+
+
+@pytest.mark.asyncio
+async def test_provider_health_reports_circuit_state():
+    from discord_bot.core.engines.provider_health import ProviderHealth
+    from discord_bot.core.engines.translation_orchestrator import TranslationOrchestratorEngine
+
+    health = ProviderHealth(failure_threshold=1)
+    health.record_failure("mymemory", "en", "fr")
+    health.record_success("google", "en", "fr", 0.25)
+    bot = FakeBot(FakeInputEngine())
+    bot.translation_orchestrator = TranslationOrchestratorEngine(
+        mymemory_adapter=object(), google_adapter=object(), health=health
+    )
+    cog = AdminCog(bot, ui_engine=None)
+    interaction = DummyInteraction(
+        guild=DummyGuild(1, owner_id=99),
+        user=DummyUser(42, DummyPermissions(manage_guild=True)),
+    )
+
+    await AdminCog.provider_health.callback(cog, interaction)
+
+    content, ephemeral = interaction.response.messages[0]
+    assert ephemeral
+    assert "**mymemory** open" in content
+    assert "**google** closed | latency 250ms" in content
+    assert "HTTP pool" not in content and "OCR workers" not in content
+
+
+def _stats_interaction():
+    return DummyInteraction(
+        guild=DummyGuild(1, owner_id=99),
+        user=DummyUser(42, DummyPermissions(manage_guild=True)),
+    )
+
+
+@pytest.mark.asyncio
+async def test_runtime_stats_reports_shared_pools():
+    from types import SimpleNamespace
+
+    from discord_bot.core.engines.http_client import HttpClientService
+    from discord_bot.core.engines.provider_executor import ProviderExecutor
+
+    deepl = SimpleNamespace(
+        batch_stats=lambda: {"batches": 2, "items": 7, "avg_batch_size": 3.5, "largest_batch": 5}
+    )
+    bot = FakeBot(FakeInputEngine())
+    bot.http_client = HttpClientService()
+    bot.provider_executors = {"deepl": ProviderExecutor("deepl", max_workers=2)}
+    bot.translation_orchestrator = SimpleNamespace(deepl=deepl)
+    cog = AdminCog(bot, ui_engine=None)
+    interaction = _stats_interaction()
+
+    await AdminCog.runtime_stats.callback(cog, interaction)
+    bot.provider_executors["deepl"].shutdown()
+
+    content, ephemeral = interaction.response.messages[0]
+    assert ephemeral
+    assert "HTTP pool: 0 requests" in content
+    assert "deepl workers: 0/2 busy" in content
+    assert "DeepL batching: 2 requests for 7 texts" in content
+    assert "OCR" not in content and "Screenshot" not in content
+
+
+@pytest.mark.asyncio
+async def test_ranking_stats_reports_ocr_and_screenshot_pipeline():
+    from discord_bot.core.engines.ocr_executor import OcrExecutor
+    from discord_bot.core.engines.screenshot_cache import ScreenshotCache
+    from discord_bot.core.engines.screenshot_intake import ScreenshotIntake
+
+    bot = FakeBot(FakeInputEngine())
+    bot.ocr_executor = OcrExecutor(max_workers=1)
+    bot.screenshot_cache = ScreenshotCache()
+    bot.screenshot_intake = ScreenshotIntake()
+    cog = AdminCog(bot, ui_engine=None)
+    interaction = _stats_interaction()
+
+    await AdminCog.ranking_stats.callback(cog, interaction)
+    bot.ocr_executor.shutdown()
+
+    content, ephemeral = interaction.response.messages[0]
+    assert ephemeral
+    assert "OCR workers: 0/1 busy" in content
+    assert "Screenshot cache: 0 exact hits" in content
+    assert "Screenshot intake: 0 accepted" in content
+    assert "HTTP pool" not in content
+
+
+@pytest.mark.asyncio
+async def test_stats_commands_report_missing_pipelines():
+    bot = FakeBot(FakeInputEngine())
+    cog = AdminCog(bot, ui_engine=None)
+
+    runtime, ranking = _stats_interaction(), _stats_interaction()
+    await AdminCog.runtime_stats.callback(cog, runtime)
+    await AdminCog.ranking_stats.callback(cog, ranking)
+
+    assert runtime.response.messages == [("No shared runtime pools are running.", True)]
+    assert ranking.response.messages == [("The ranking screenshot pipeline is not running.", True)]
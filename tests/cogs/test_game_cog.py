@@ -0,0 +1,83 @@
+import asyncio
+import sqlite3
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from cogs.game_cog import GameCog
+from discord_bot.core.engines.cookie_manager import CookieManager
+from discord_bot.core.engines.relationship_manager import RelationshipManager
+from discord_bot.games.pokemon_game import PokemonGame
+from discord_bot.games.storage.game_storage_engine import GameStorageEngine
+
+
+def make_interaction(channel_id: int, user_id: int):
+    response = AsyncMock()
+    response.send_message = AsyncMock()
+    response.is_done = lambda: False
+    return SimpleNamespace(
+        guild=SimpleNamespace(id=999),
+        channel=SimpleNamespace(id=channel_id),
+        user=SimpleNamespace(id=user_id, name="Tester", display_name="Tester"),
+        response=response,
+        followup=AsyncMock(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_catch_keeps_the_loop_free_while_the_writer_is_busy(monkeypatch, tmp_path):
+    monkeypatch.setenv("ALLOWED_CHANNELS", "555")
+    db_path = tmp_path / "game.db"
+    storage = GameStorageEngine(db_path=str(db_path))
+    storage.add_cookies("100", 10)
+    storage.unlock_game("100")
+    relationships = RelationshipManager(storage)
+    cookies = CookieManager(storage, relationships)
+    personality = SimpleNamespace(
+        get_mood=lambda: "neutral",
+        get_pokemon_catch_success=lambda user, pokemon: "caught",
+        get_pokemon_catch_fail=lambda user, pokemon: "missed",
+    )
+    cog = GameCog(
+        SimpleNamespace(),
+        PokemonGame(storage, cookies, relationships),
+        None,
+        storage,
+        cookies,
+        relationships,
+        personality,
+    )
+
+    # Another connection (a retention batch, say) holds the write lock for a while.
+    blocker = sqlite3.connect(db_path, isolation_level=None)
+    blocker.execute("BEGIN IMMEDIATE")
+
+    ticks = 0
+
+    async def heartbeat():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    async def release_writer():
+        await asyncio.sleep(0.3)
+        blocker.execute("COMMIT")
+
+    interaction = make_interaction(555, 100)
+    beat = asyncio.create_task(heartbeat())
+    release = asyncio.create_task(release_writer())
+    try:
+        await asyncio.wait_for(GameCog.catch.callback(cog, interaction), timeout=3)
+    finally:
+        beat.cancel()
+        await release
+        blocker.close()
+
+    # The stamina spend waited on the writer thread; the loop kept ticking and released the lock.
+    assert ticks >= 15
+    sent = interaction.response.send_message.await_args
+    assert sent is not None and "Failed to spend cookies" not in str(sent)
+    assert storage.get_user_data("100")["total_interactions"] == 1
+    await cog.db.close()
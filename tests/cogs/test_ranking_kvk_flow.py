@@ -1,3 +1,4 @@
+import io
 from datetime import datetime, timezone
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
@@ -6,9 +7,22 @@ import pytest
 
 from cogs import ranking_cog
 from cogs.ranking_cog import RankingCog
-from discord_bot.core.engines.screenshot_processor import RankingData, StageType, RankingCategory
+from discord_bot.core.engines.screenshot_processor import (
+    RankingCategory,
+    RankingData,
+    ScreenshotAnalysis,
+    StageType,
+)
 from discord_bot.games.storage.game_storage_engine import GameStorageEngine
 
+Image = pytest.importorskip("PIL.Image")
+
+
+def _png_bytes(width=585, height=1266) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), (22, 26, 44)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
 
 class FakeProcessor:
     def __init__(self, ranking: RankingData):
@@ -20,6 +34,11 @@ class FakeProcessor:
     async def process_screenshot(self, image_data: bytes, user_id: str, username: str, guild_id: str | None = None):
         return self._ranking
 
+    async def analyze_screenshot(
+        self, image_data: bytes, user_id: str, username: str, guild_id: str | None = None, *, cache_scope=None
+    ):
+        return ScreenshotAnalysis(True, "", "", self._ranking)
+
 
 class FakeAttachment:
     def __init__(self, url="https://cdn.example.com/screen.png"):
@@ -28,7 +47,7 @@ class FakeAttachment:
         self.url = url
 
     async def read(self):
-        return b"fake-image-bytes"
+        return _png_bytes()
 
 
 class FakeKvkRun:
@@ -0,0 +1,91 @@
+import gzip
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from discord_bot.core.storage.backup_service import BackupService
+
+
+def _make_db(path: Path, rows: int) -> None:
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL;")
+    conn.execute("CREATE TABLE t (payload TEXT)")
+    conn.executemany("INSERT INTO t VALUES (?)", [("x" * 500,) for _ in range(rows)])
+    conn.commit()
+    conn.close()
+
+
+def _restore(snapshot: Path, target: Path) -> int:
+    target.write_bytes(gzip.decompress(snapshot.read_bytes()))
+    with sqlite3.connect(target) as conn:
+        return conn.execute("SELECT COUNT(*) FROM t").fetchone()[0]
+
+
+@pytest.mark.asyncio
+async def test_stepped_backup_is_compressed_and_rotated(tmp_path: Path):
+    _make_db(tmp_path / "game.db", 2000)
+    service = BackupService(tmp_path / "backups", keep=2, pages_per_step=50, step_sleep_ms=0)
+    assert service.add_database("game", tmp_path / "game.db")
+
+    results = [await service.backup("game") for _ in range(3)]
+
+    assert all(result.ok for result in results)
+    last = results[-1]
+    assert last.steps == -(-last.pages // 50) and last.pages_per_step == 50
+    assert last.compressed_bytes < last.size_bytes
+    assert sorted(p.name for p in (tmp_path / "backups").iterdir()) == sorted(r.path.name for r in results[1:])
+    assert _restore(last.path, tmp_path / "restored.db") == 2000
+    assert service.stats()["last"]["game"]["steps"] == last.steps
+
+
+@pytest.mark.asyncio
+async def test_restarting_backup_falls_back_to_single_pass(tmp_path: Path):
+    _make_db(tmp_path / "busy.db", 400)
+    service = BackupService(tmp_path / "backups", pages_per_step=5, step_sleep_ms=20, max_restarts=1)
+    service.add_database("busy", tmp_path / "busy.db")
+
+    done = threading.Event()
+
+    def writer():
+        conn = sqlite3.connect(tmp_path / "busy.db")
+        while not done.is_set():
+            conn.execute("INSERT INTO t VALUES ('w')")
+            conn.commit()
+            time.sleep(0.005)
+        conn.close()
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        result = await service.backup("busy")
+    finally:
+        done.set()
+        thread.join()
+
+    assert result.ok and result.single_pass and result.restarts == 2
+    assert _restore(result.path, tmp_path / "restored.db") >= 400
+
+
+def test_engines_sharing_a_file_are_registered_once(tmp_path: Path):
+    from discord_bot.core.engines.ranking_storage_engine import RankingStorageEngine
+    from discord_bot.games.storage.game_storage_engine import GameStorageEngine
+
+    game = GameStorageEngine(db_path=str(tmp_path / "game.db"))
+    service = BackupService(tmp_path / "backups")
+
+    assert service.add_engine("game_data", game)
+    assert not service.add_engine("event_rankings", RankingStorageEngine(storage=game))
+    assert not service.add_engine("memory", GameStorageEngine(db_path=":memory:"))
+    assert service.databases == {"game_data": (tmp_path / "game.db").resolve()}
+
+
+def test_storage_engine_database_is_registered(tmp_path: Path):
+    from discord_bot.core.storage.storage_engine import StorageEngine
+
+    service = BackupService(tmp_path / "backups")
+
+    assert service.add_engine("storage", StorageEngine(db_path=str(tmp_path / "database.db")))
+    assert service.databases == {"storage": (tmp_path / "database.db").resolve()}
@@ -0,0 +1,52 @@
+import json
+from pathlib import Path
+
+from discord_bot.core.storage.fallback_journal import FallbackJournal
+
+
+def test_reads_seek_across_rotated_segments(tmp_path: Path):
+    journal = FallbackJournal(tmp_path / "logs.jsonl", segment_bytes=200)
+    for i in range(50):
+        assert journal.append({"table": "logs", "i": i}) == i
+
+    assert journal.stats()["segments"] > 1
+    assert [record["i"] for record in journal.tail(5)] == list(range(45, 50))
+    assert [seq for seq, _ in journal.read(10, 7)] == list(range(10, 17))
+    assert journal.read(48, 10)[-1] == (49, {"table": "logs", "i": 49})
+
+
+def test_reopen_repairs_torn_write_and_keeps_generation(tmp_path: Path):
+    path = tmp_path / "logs.jsonl"
+    journal = FallbackJournal(path)
+    for i in range(3):
+        journal.append({"i": i})
+    with path.open("ab") as fh:
+        fh.write(b'{"i": 3')  # crashed mid-append
+
+    reopened = FallbackJournal(path)
+    assert reopened.count() == 3
+    assert reopened.generation == journal.generation
+    assert reopened.append({"i": 4}) == 3
+    assert reopened.tail(2) == [{"i": 2}, {"i": 4}]
+
+
+def test_pre_journal_backup_file_is_indexed_once(tmp_path: Path):
+    path = tmp_path / "error_logs.jsonl"
+    path.write_text("".join(json.dumps({"i": i}) + "\n" for i in range(10)), encoding="utf-8")
+
+    journal = FallbackJournal(path)
+    assert journal.count() == 10
+    assert (tmp_path / "error_logs.jsonl.idx").stat().st_size == 80
+    assert FallbackJournal.discover(tmp_path) == [path]
+
+
+def test_retire_only_drops_a_fully_replayed_generation(tmp_path: Path):
+    journal = FallbackJournal(tmp_path / "logs.jsonl", segment_bytes=100)
+    for i in range(10):
+        journal.append({"i": i})
+    generation = journal.generation
+
+    assert journal.retire(9) is False
+    assert journal.retire(10) is True
+    assert journal.count() == 0 and journal.generation != generation
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["logs.journal.json"]
@@ -0,0 +1,82 @@
+import pytest
+from aiohttp import web
+
+from discord_bot.core.engines.http_client import HttpClientService
+from discord_bot.core.engines.top_heroes_scraper import TopHeroesEventScraper
+from discord_bot.language_context.translators.mymemory_adapter import MyMemoryAdapter
+
+
+@pytest.fixture
+async def server():
+    async def translate(request):
+        return web.json_response(
+            {"responseData": {"translatedText": f"<{request.query['q']}>"}, "responseStatus": 200}
+        )
+
+    app = web.Application()
+    app.router.add_get("/get", translate)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}/get"
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_shared_session_reuses_keepalive_connections(server):
+    client = HttpClientService(limit_per_host=2)
+    session = client.session()
+    assert client.session() is session
+
+    for _ in range(5):
+        async with client.session().get(server, params={"q": "hi"}) as resp:
+            assert resp.status == 200
+            await resp.read()
+
+    stats = client.stats()
+    assert stats["requests"] == 5
+    assert stats["connections_created"] == 1
+    assert stats["connections_reused"] == 4
+    assert stats["idle_connections"] == 1
+    assert stats["limit_per_host"] == 2
+
+    await client.close()
+    assert client.closed and session.closed
+    assert client.stats()["open"] is False
+
+
+@pytest.mark.asyncio
+async def test_session_is_recreated_after_close():
+    client = HttpClientService()
+    first = client.session()
+    await client.close()
+    second = client.session()
+    assert second is not first and not second.closed
+    assert client.stats()["sessions_created"] == 2
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_mymemory_adapter_uses_shared_client(server, monkeypatch):
+    client = HttpClientService()
+    adapter = MyMemoryAdapter(http_client=client, per_sec_limit=100)
+    monkeypatch.setattr(MyMemoryAdapter, "BASE_URL", server)
+
+    first = await adapter.translate_async("hello", "en", "fr")
+    second = await adapter.translate_async("bye", "en", "fr")
+
+    assert (first, second) == ("<hello>", "<bye>")
+    assert not client.closed  # the adapter must not close the shared session
+    assert client.stats()["connections_created"] == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_scraper_without_shared_client_uses_its_own_session(server):
+    scraper = TopHeroesEventScraper()
+    async with scraper._http_session() as session:
+        async with session.get(server, params={"q": "hi"}) as resp:
+            assert resp.status == 200
+    assert session.closed
@@ -0,0 +1,113 @@
+"""
+Tests for the InputEngine standard translation path (plan once, translate once).
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from discord_bot.core.engines.cache_manager import CacheManager
+from discord_bot.core.engines.input_engine import InputEngine
+from discord_bot.core.engines.processing_engine import ProcessingEngine
+from discord_bot.core.engines.translation_orchestrator import TranslationOrchestratorEngine
+from discord_bot.language_context.context_engine import ContextEngine
+from discord_bot.language_context.translation_job import TranslationJob
+
+
+class CountingDetector:
+    def __init__(self, lang: str = "es", confidence: float = 0.93):
+        self.lang = lang
+        self.confidence = confidence
+        self.calls = 0
+
+    async def detect_language(self, text: str):
+        self.calls += 1
+        return self.lang, self.confidence
+
+
+class RecordingAdapter:
+    def __init__(self, output: str):
+        self.output = output
+        self.calls = []
+
+    async def translate_async(self, text, src, tgt):
+        self.calls.append((text, src, tgt))
+        return self.output
+
+
+def _message(content: str, *, guild_id: int = 1, author_id: int = 42):
+    return SimpleNamespace(
+        id=1000,
+        content=content,
+        guild=SimpleNamespace(id=guild_id),
+        author=SimpleNamespace(id=author_id, bot=False),
+        channel=SimpleNamespace(id=55),
+        reference=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_standard_message_runs_detector_once():
+    detector = CountingDetector()
+    adapter = RecordingAdapter("hello friend")
+    cache = CacheManager()
+    cache.set_user_lang(1, 42, "en")
+
+    context = ContextEngine(role_manager=None, cache_manager=cache, detection_service=detector)
+    orchestrator = TranslationOrchestratorEngine(deepl_adapter=adapter, detection_service=detector)
+    processing = ProcessingEngine(orchestrator=orchestrator)
+    output = MagicMock()
+    output.send_dm = AsyncMock()
+
+    engine = InputEngine(
+        MagicMock(),
+        context_engine=context,
+        processing_engine=processing,
+        output_engine=output,
+        cache_manager=cache,
+        role_manager=None,
+    )
+
+    await engine._handle_standard(_message("hola amigo"))
+
+    output.send_dm.assert_awaited_once()
+    assert output.send_dm.await_args.args[1] == "hello friend"
+    assert detector.calls == 1
+    assert context.detection_calls == 1
+    assert orchestrator.detection_stats() == {"detections": 0, "reused": 1}
+    assert adapter.calls == [("hola amigo", "es", "en")]
+
+
+@pytest.mark.asyncio
+async def test_translate_planned_job_carries_confidence_and_skips_detection():
+    detector = CountingDetector(lang="fr")
+    orchestrator = TranslationOrchestratorEngine(
+        deepl_adapter=RecordingAdapter("hi"), detection_service=detector
+    )
+    job = TranslationJob(text="salut", src_lang="de", src_confidence=0.8, tgt_lang="en", guild_id=1, author_id=2)
+
+    result = await orchestrator.translate_planned_job(job)
+
+    assert result["text"] == "hi"
+    assert result["src"] == "de"
+    assert result["confidence"] == pytest.approx(0.8)
+    assert result["meta"]["detection_reused"] is True
+    assert detector.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_translate_planned_job_detects_when_source_missing():
+    detector = CountingDetector(lang="fr")
+    orchestrator = TranslationOrchestratorEngine(
+        deepl_adapter=RecordingAdapter("hi"), detection_service=detector
+    )
+    job = TranslationJob(text="salut", tgt_lang="en")
+
+    result = await orchestrator.translate_planned_job(job)
+
+    assert result["src"] == "fr"
+    assert detector.calls == 1
+    assert orchestrator.detection_stats() == {"detections": 1, "reused": 0}
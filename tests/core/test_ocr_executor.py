@@ -0,0 +1,73 @@
+import asyncio
+import time
+
+import pytest
+
+from discord_bot.core.engines.ocr_executor import OcrExecutor
+from discord_bot.core.engines.provider_executor import ExecutorSaturatedError
+from discord_bot.core.engines.screenshot_processor import ScreenshotProcessor, StageType
+
+FAKE_TEXT = "Prep Stage Rank #42 [TAO] Mars Points: 28,200,103"
+
+
+def fake_ocr(image_data: bytes, timeout: float = 0):
+    """Stand-in for tesseract: CPU-bound for a while, then returns ranking text."""
+    deadline = time.monotonic() + 0.4
+    while time.monotonic() < deadline:
+        pass
+    return 1170, 2532, FAKE_TEXT
+
+
+@pytest.mark.asyncio
+async def test_event_loop_keeps_ticking_while_screenshots_are_processed():
+    executor = OcrExecutor(max_workers=2, max_queue=4)
+    processor = ScreenshotProcessor(ocr_executor=executor)
+    processor.available = True
+    processor.ocr_function = fake_ocr
+
+    ticks = []
+
+    async def heartbeat():
+        while True:
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    beat = asyncio.create_task(heartbeat())
+    try:
+        rankings = await asyncio.gather(
+            *(processor.process_screenshot(b"png", str(i), f"user{i}") for i in range(4))
+        )
+    finally:
+        beat.cancel()
+        executor.shutdown()
+
+    assert [r.rank for r in rankings] == [42] * 4
+    assert rankings[0].stage_type is StageType.PREP
+    assert rankings[0].score == 28200103
+    # Four 0.4s OCR jobs ran, yet the loop never went more than a fraction of that without a tick.
+    gaps = [b - a for a, b in zip(ticks, ticks[1:])]
+    assert len(ticks) > 40
+    assert max(gaps) < 0.2
+    stats = executor.stats()
+    assert (stats["completed"], stats["queued"], stats["running"]) == (4, 0, 0)
+    assert stats["p95_latency_ms"] >= 400
+
+
+@pytest.mark.asyncio
+async def test_full_queue_is_rejected_and_timeouts_are_counted():
+    executor = OcrExecutor(max_workers=1, max_queue=1)
+    try:
+        running = [asyncio.create_task(executor.run(time.sleep, 0.5)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        assert executor.stats()["queued"] == 1
+
+        with pytest.raises(ExecutorSaturatedError):
+            await executor.run(time.sleep, 0)
+        assert executor.stats()["rejected"] == 1
+        await asyncio.gather(*running)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await executor.run(time.sleep, 1, timeout=0.05)
+        assert executor.stats()["timeouts"] == 1
+    finally:
+        executor.shutdown()
@@ -0,0 +1,22 @@
+"""
+Tests for OutputEngine message delivery.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from discord_bot.core.engines.output_engine import DISCORD_MESSAGE_LIMIT, OutputEngine
+
+
+@pytest.mark.asyncio
+async def test_output_engine_splits_long_dms():
+    user = Mock()
+    user.send = AsyncMock()
+    text = "\n\n".join(["x" * 900] * 5)
+
+    await OutputEngine().send_dm(user, text)
+
+    sent = [call.args[0] for call in user.send.call_args_list]
+    assert len(sent) == 3
+    assert all(len(part) <= DISCORD_MESSAGE_LIMIT for part in sent)
+    assert "".join(sent).count("x") == 4500
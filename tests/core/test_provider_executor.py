@@ -0,0 +1,93 @@
+import asyncio
+import threading
+
+import pytest
+
+from discord_bot.core.engines.provider_executor import ExecutorSaturatedError, ProviderExecutor
+from discord_bot.language_context.translators import google_translate_adapter as gta
+
+
+@pytest.mark.asyncio
+async def test_executor_bounds_workers_and_reports_queue_depth():
+    executor = ProviderExecutor("test", max_workers=2, max_queue=4)
+    gate = threading.Event()
+
+    tasks = [asyncio.create_task(executor.run(gate.wait, 5)) for _ in range(5)]
+    await asyncio.sleep(0.05)
+    stats = executor.stats()
+    assert stats["running"] == 2
+    assert stats["queued"] == 3
+    assert stats["peak_queue"] >= 3
+
+    gate.set()
+    assert all(await asyncio.gather(*tasks))
+    stats = executor.stats()
+    assert (stats["running"], stats["queued"], stats["completed"]) == (0, 0, 5)
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_executor_rejects_when_saturated():
+    executor = ProviderExecutor("test", max_workers=1, max_queue=1)
+    gate = threading.Event()
+    running = [asyncio.create_task(executor.run(gate.wait, 5)) for _ in range(2)]
+    await asyncio.sleep(0.02)
+
+    with pytest.raises(ExecutorSaturatedError):
+        await executor.run(lambda: None)
+    assert executor.stats()["rejected"] == 1
+
+    gate.set()
+    await asyncio.gather(*running)
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_queued_call_releases_its_slot():
+    executor = ProviderExecutor("test", max_workers=1, max_queue=1)
+    gate = threading.Event()
+    ran = []
+    blocker = asyncio.create_task(executor.run(gate.wait, 5))
+    queued = asyncio.create_task(executor.run(ran.append, "queued"))
+    await asyncio.sleep(0.02)
+
+    queued.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+    assert executor.stats()["queued"] == 0
+
+    gate.set()
+    await blocker
+    await asyncio.sleep(0.02)
+    assert ran == []
+    executor.shutdown()
+
+
+class FakeGoogleTranslator:
+    created = []
+
+    def __init__(self, source, target):
+        self.source = source
+        self.target = target
+        FakeGoogleTranslator.created.append((source, target, threading.get_ident()))
+
+    def translate(self, text):
+        return f"{text}->{self.target}"
+
+
+@pytest.mark.asyncio
+async def test_google_adapter_reuses_translator_per_pair_on_dedicated_pool(monkeypatch):
+    FakeGoogleTranslator.created = []
+    monkeypatch.setattr(gta, "GoogleTranslator", FakeGoogleTranslator)
+    monkeypatch.setattr(gta, "TRANSLATOR_AVAILABLE", True)
+    executor = ProviderExecutor("google", max_workers=1)
+    adapter = gta.GoogleTranslateAdapter(executor=executor)
+
+    results = [await adapter.translate_async(f"hi {i}", "en", "zh") for i in range(3)]
+    await adapter.translate_async("hi", "en", "fr")
+
+    assert results[0] == "hi 0->zh-cn"
+    assert [(src, tgt) for src, tgt, _ in FakeGoogleTranslator.created] == [("en", "zh-cn"), ("en", "fr")]
+    assert FakeGoogleTranslator.created[0][2] != threading.get_ident()
+    assert executor.stats()["completed"] == 4
+    executor.shutdown()
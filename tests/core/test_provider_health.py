@@ -0,0 +1,128 @@
+import pytest
+
+from discord_bot.core.engines.provider_health import CircuitBreaker, ProviderHealth
+from discord_bot.core.engines.translation_orchestrator import TranslationOrchestratorEngine
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class DetectorStub:
+    async def detect_language(self, text: str):
+        return "en", 0.9
+
+
+class FlakyAdapter:
+    def __init__(self, output=None, error=None):
+        self.output = output
+        self.error = error
+        self.calls = 0
+
+    async def translate_async(self, text, src, tgt):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return self.output
+
+
+def test_breaker_opens_after_consecutive_failures_and_half_opens_after_cooldown():
+    clock = FakeClock()
+    breaker = CircuitBreaker("mymemory", failure_threshold=3, cooldown=30, clock=clock)
+
+    for _ in range(3):
+        assert breaker.acquire()
+        breaker.record_failure()
+
+    assert breaker.state == "open"
+    assert not breaker.acquire()
+    assert breaker.snapshot()["rejected"] == 1
+
+    clock.now = 31
+    assert breaker.acquire()  # the single half-open probe
+    assert breaker.state == "half_open"
+    assert not breaker.acquire()
+
+    breaker.record_success(0.2)
+    assert breaker.state == "closed"
+    assert breaker.acquire()
+
+
+def test_failed_probe_reopens_circuit():
+    clock = FakeClock()
+    breaker = CircuitBreaker("google", failure_threshold=1, cooldown=10, clock=clock)
+    breaker.record_failure()
+    clock.now = 11
+    assert breaker.acquire()
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    assert breaker.trips == 2
+    assert breaker.snapshot()["retry_in"] == pytest.approx(10)
+
+
+def test_breaker_opens_on_error_rate_with_enough_samples():
+    breaker = CircuitBreaker("deepl", failure_threshold=100, error_rate_threshold=0.4, min_samples=6, alpha=0.5)
+    for _ in range(4):
+        breaker.record_success(0.1)
+        breaker.record_failure()
+    assert breaker.state == "open"
+
+
+def test_adaptive_order_waits_for_measurements_then_prefers_cheaper_tier():
+    health = ProviderHealth()
+    tiers = [("deepl", "a"), ("mymemory", "b")]
+    health.record_success("deepl", "en", "fr", 2.0)
+    assert health.order(tiers, "en", "fr") == tiers
+
+    health.record_success("mymemory", "en", "fr", 0.3)
+    assert health.order(tiers, "en", "fr") == [("mymemory", "b"), ("deepl", "a")]
+    # Other pairs keep the configured order.
+    assert health.order(tiers, "en", "de") == tiers
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_skips_open_circuit():
+    mymemory = FlakyAdapter(error=RuntimeError("429"))
+    google = FlakyAdapter(output="bonjour")
+    orchestrator = TranslationOrchestratorEngine(
+        mymemory_adapter=mymemory,
+        google_adapter=google,
+        detection_service=DetectorStub(),
+        health=ProviderHealth(failure_threshold=2, cooldown=60),
+    )
+
+    for i in range(4):
+        result = await orchestrator.translate_text_for_user(text=f"hi {i}", guild_id=1, user_id=2, tgt_lang="fr")
+        assert result == ("bonjour", "en", "google")
+
+    assert mymemory.calls == 2
+    health = orchestrator.provider_health()
+    assert health["mymemory"]["state"] == "open"
+    assert health["google"]["state"] == "closed"
+    assert health["google"]["latency_ewma"] is not None
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_adaptive_order_uses_pair_latency():
+    deepl = FlakyAdapter(output="lent")
+    mymemory = FlakyAdapter(output="rapide")
+    health = ProviderHealth()
+    health.record_success("deepl", "en", "fr", 3.0)
+    health.record_success("mymemory", "en", "fr", 0.1)
+    orchestrator = TranslationOrchestratorEngine(
+        deepl_adapter=deepl,
+        mymemory_adapter=mymemory,
+        detection_service=DetectorStub(),
+        health=health,
+        adaptive_order=True,
+    )
+
+    result = await orchestrator.translate_text_for_user(text="hi", guild_id=1, user_id=2, tgt_lang="fr")
+
+    assert result == ("rapide", "en", "mymemory")
+    assert deepl.calls == 0
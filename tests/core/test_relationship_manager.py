@@ -176,5 +176,44 @@ class TestRelationshipManager:
         assert "Best Friends" in tier
 
 
+    def test_interactions_are_staged_until_flush(self, relationship_manager, storage):
+        """Repeated interactions stay in the cache and flush as one transaction."""
+        user_id = "test_user_batched"
+        relationship_manager.record_interaction(user_id, 'translation')  # first sighting creates the row
+
+        statements = []
+        storage.conn.set_trace_callback(statements.append)
+        for _ in range(5):
+            relationship_manager.record_interaction(user_id, 'game_action')
+            relationship_manager.get_luck_modifier(user_id)
+            relationship_manager.get_cookie_drop_bonus(user_id)
+        assert not [sql for sql in statements if sql.lstrip().upper().startswith(("BEGIN", "UPDATE", "INSERT"))]
+
+        # Readers going through the engine already see the staged values.
+        assert storage.get_user_data(user_id)['total_interactions'] == 6
+
+        assert storage.flush_user_state() == 1
+        storage.conn.set_trace_callback(None)
+        assert sum(sql.lstrip().upper().startswith("BEGIN") for sql in statements) == 1
+
+        row = storage.conn.execute(
+            "SELECT total_interactions FROM users WHERE user_id = ?", (user_id,)
+        ).fetchone()
+        logged = storage.conn.execute(
+            "SELECT COUNT(*) FROM interactions WHERE user_id = ?", (user_id,)
+        ).fetchone()[0]
+        assert row['total_interactions'] == 6
+        assert logged == 6
+        assert storage.user_state_stats()['dirty'] == 0
+
+    def test_direct_writes_flush_staged_state_first(self, relationship_manager, storage):
+        """A direct update_relationship must not be overwritten by a later flush."""
+        user_id = "test_user_direct"
+        relationship_manager.record_interaction(user_id, 'translation')
+        storage.update_relationship(user_id, 12)
+        storage.flush_user_state()
+        assert storage.get_user_data(user_id)['relationship_index'] == 12
+        assert storage.get_user_data(user_id)['total_interactions'] == 1
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,93 @@
+import io
+from datetime import datetime
+
+import pytest
+
+from discord_bot.core.engines.ranking_storage_engine import RankingStorageEngine
+from discord_bot.core.engines.screenshot_cache import ScreenshotCache
+from discord_bot.core.engines.screenshot_processor import (
+    RankingCategory,
+    RankingData,
+    ScreenshotProcessor,
+    StageType,
+)
+from discord_bot.games.storage.game_storage_engine import GameStorageEngine
+from discord_bot.tests.stubs.sqlite import assert_no_select
+
+Image = pytest.importorskip("PIL.Image")
+ImageDraw = pytest.importorskip("PIL.ImageDraw")
+
+RANKING_TEXT = "Prep Stage\n#10435 [TAO] Mars\nPoints: 28,200,103\n"
+
+
+class CountingExecutor:
+    def __init__(self):
+        self.calls = 0
+
+    async def run(self, fn, *args, timeout=None):
+        self.calls += 1
+        return fn(*args)
+
+
+def fake_read(image_data, timeout=0):
+    return 1170, 2532, RANKING_TEXT
+
+
+def screenshot(label="#10435 [TAO] Mars", fmt="PNG", scale=1.0):
+    image = Image.new("RGB", (585, 1266), (22, 26, 44))
+    draw = ImageDraw.Draw(image)
+    for row in range(10):
+        draw.rectangle((30, 120 + row * 100, 555, 190 + row * 100), fill=(60 + row * 15, 70, 90))
+    draw.text((60, 140), label, fill=(240, 240, 220))
+    if scale != 1.0:
+        image = image.resize((int(image.width * scale), int(image.height * scale)))
+    buffer = io.BytesIO()
+    image.save(buffer, format=fmt, quality=75)
+    return buffer.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_only_byte_identical_uploads_skip_ocr():
+    executor = CountingExecutor()
+    cache = ScreenshotCache()
+    processor = ScreenshotProcessor(ocr_executor=executor, screenshot_cache=cache)
+    processor.available = True
+    processor.ocr_function = fake_read
+    scope = ScreenshotCache.scope("g1", (7, "prep", 1))
+    upload = screenshot()
+
+    first = await processor.analyze_screenshot(upload, "u1", "one", "g1", cache_scope=scope)
+    again = await processor.analyze_screenshot(upload, "u2", "two", "g1", cache_scope=scope)
+    assert executor.calls == 1
+    assert (first.cache_hit, again.cache_hit) == (None, "exact")
+    assert again.ranking.user_id == "u2"
+
+    # A re-encoded copy or a corrected score looks nearly the same but is read again.
+    await processor.analyze_screenshot(screenshot(fmt="JPEG", scale=0.8), "u1", "one", "g1", cache_scope=scope)
+    corrected = screenshot(label="#10435 [TAO] Mars  31,044,870")
+    await processor.analyze_screenshot(corrected, "u1", "one", "g1", cache_scope=scope)
+    # Other slots never share results, even for the same bytes.
+    await processor.analyze_screenshot(upload, "u1", "one", "g1", cache_scope=ScreenshotCache.scope("g1", (7, "prep", 2)))
+    assert executor.calls == 4
+    stats = cache.stats()
+    assert (stats["exact_hits"], stats["misses"]) == (1, 4)
+
+
+def test_duplicate_check_answers_resubmission_from_cache():
+    storage = GameStorageEngine(db_path=":memory:")
+    cache = ScreenshotCache()
+    rankings = RankingStorageEngine(storage=storage, screenshot_cache=cache)
+    ranking = RankingData(
+        user_id="u1", username="one", guild_tag="TAO", event_week="KVK-07", stage_type=StageType.PREP,
+        day_number=2, category=RankingCategory.RESEARCH, rank=40, score=5000, player_name="Mars",
+        submitted_at=datetime.utcnow(), guild_id="g1", kvk_run_id=7,
+    )
+    args = ("u1", "g1", "KVK-07", StageType.PREP, 2)
+
+    assert rankings.check_duplicate_submission(*args, kvk_run_id=7) is None
+    ranking_id = rankings.save_ranking(ranking)
+    assert rankings.update_ranking(ranking_id, 35, 6000)
+
+    existing = assert_no_select(storage.conn, lambda: rankings.check_duplicate_submission(*args, kvk_run_id=7))
+    assert (existing["id"], existing["rank"], existing["score"]) == (ranking_id, 35, 6000)
+    assert rankings.check_duplicate_submission("u2", "g1", "KVK-07", StageType.PREP, 2, kvk_run_id=7) is None
@@ -0,0 +1,117 @@
+import io
+
+import pytest
+
+from discord_bot.core.engines.screenshot_intake import ScreenshotIntake, ScreenshotRejected
+
+Image = pytest.importorskip("PIL.Image")
+
+MB = 1024 * 1024
+
+
+def png(width=1170, height=2532, noise=False):
+    image = Image.effect_noise((width, height), 90) if noise else Image.new("L", (width, height), 30)
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", compress_level=0)
+    return buffer.getvalue()
+
+
+class FakeResponse:
+    def __init__(self, body, chunk_size_seen, content_length=None):
+        self.body = body
+        self.headers = {"Content-Length": str(content_length)} if content_length is not None else {}
+        self.served = 0
+        self.content = self
+        self._seen = chunk_size_seen
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    async def iter_chunked(self, size):
+        self._seen.append(size)
+        for offset in range(0, len(self.body), size):
+            self.served += min(size, len(self.body) - offset)
+            yield self.body[offset:offset + size]
+
+
+class FakeHttpClient:
+    def __init__(self, body, content_length=None):
+        self.body = body
+        self.content_length = content_length
+        self.chunk_sizes = []
+        self.response = None
+
+    def session(self):
+        return self
+
+    def get(self, url):
+        self.response = FakeResponse(self.body, self.chunk_sizes, self.content_length)
+        return self.response
+
+
+class FakeAttachment:
+    url = "https://cdn.example.com/screen.png"
+
+    def __init__(self, content_type="image/png", size=1024):
+        self.content_type = content_type
+        self.size = size
+
+    async def read(self):
+        raise AssertionError("attachment.read() buffers the whole upload")
+
+
+@pytest.mark.asyncio
+async def test_valid_screenshot_is_streamed_and_header_checked():
+    body = png()
+    client = FakeHttpClient(body)
+    intake = ScreenshotIntake(client)
+
+    upload = await intake.read(FakeAttachment(size=len(body)))
+
+    assert (upload.format, upload.width, upload.height) == ("PNG", 1170, 2532)
+    assert upload.data == body
+    assert client.chunk_sizes == [intake.chunk_size]
+    stats = intake.stats()
+    assert (stats["accepted"], stats["rejected"], stats["peak_bytes"]) == (1, 0, len(body))
+
+
+@pytest.mark.asyncio
+async def test_bad_uploads_are_rejected_before_the_download_finishes():
+    intake = ScreenshotIntake(FakeHttpClient(b""), max_bytes=4 * MB)
+
+    # Metadata alone: nothing is requested.
+    for attachment in (FakeAttachment(content_type="application/pdf"), FakeAttachment(size=5 * MB)):
+        with pytest.raises(ScreenshotRejected):
+            await intake.read(attachment)
+    assert intake.http_client.response is None
+
+    # Not an image: the first chunk is enough.
+    intake.http_client = FakeHttpClient(b"%PDF-1.7" + bytes(2 * MB))
+    with pytest.raises(ScreenshotRejected) as excinfo:
+        await intake.read(FakeAttachment(size=2 * MB))
+    assert excinfo.value.reason == "format"
+    assert intake.http_client.response.served == intake.chunk_size
+
+    # Oversized dimensions: stops once the header is parsed, before any pixels decode.
+    intake.http_client = FakeHttpClient(png(5000, 300, noise=True))
+    with pytest.raises(ScreenshotRejected) as excinfo:
+        await intake.read(FakeAttachment(size=len(intake.http_client.body)))
+    assert excinfo.value.reason == "dimensions"
+    assert intake.http_client.response.served == intake.chunk_size
+
+    # Metadata under-reports the size: the buffer is still capped.
+    intake.http_client = FakeHttpClient(png(3000, 3000, noise=True))
+    with pytest.raises(ScreenshotRejected) as excinfo:
+        await intake.read(FakeAttachment(size=1024))
+    assert excinfo.value.reason == "size"
+
+    stats = intake.stats()
+    assert stats["accepted"] == 0
+    assert stats["rejections"] == {"content_type": 1, "size": 2, "format": 1, "dimensions": 1}
+    assert stats["peak_bytes"] <= 4 * MB
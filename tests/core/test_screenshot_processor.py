@@ -0,0 +1,82 @@
+import pytest
+
+from discord_bot.core.engines.screenshot_processor import (
+    OCR_MAX_WIDTH,
+    ScreenshotProcessor,
+    StageType,
+    parse_ranking_fields,
+    preprocess_for_ocr,
+)
+
+RANKING_TEXT = "Prep Stage\n1 2 3 4 5\n#10435 [TAO] Mars\nPoints: 28,200,103\n"
+
+
+class CountingExecutor:
+    """Runs OCR jobs inline and counts them."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def run(self, fn, *args, timeout=None):
+        self.calls += 1
+        return fn(*args)
+
+
+def fake_read(image_data, timeout=0):
+    return 1170, 2532, RANKING_TEXT
+
+
+def test_fused_parser_reads_every_field():
+    fields = parse_ranking_fields("War Stage #42 (ABC) Luna Score: 9,000 87,653,088 points: 1,500")
+    assert fields == (42, 1500, "Luna", "ABC")
+
+    fields = parse_ranking_fields(RANKING_TEXT)
+    assert fields == (10435, 28200103, "Mars", "TAO")
+
+    # Overlapping fields: the name "87" also starts the comma-grouped score.
+    assert parse_ranking_fields("#5 [QQQ] 87,653,088").score == 87653088
+
+
+@pytest.mark.asyncio
+async def test_analyze_runs_ocr_once_for_validation_and_extraction():
+    executor = CountingExecutor()
+    processor = ScreenshotProcessor(ocr_executor=executor)
+    processor.available = True
+    processor.ocr_function = fake_read
+
+    analysis = await processor.analyze_screenshot(b"png", "1", "user", "99")
+
+    assert executor.calls == 1
+    assert analysis.is_valid and analysis.error == ""
+    ranking = analysis.ranking
+    assert (ranking.rank, ranking.score, ranking.guild_tag, ranking.player_name) == (10435, 28200103, "TAO", "Mars")
+    assert ranking.stage_type is StageType.PREP
+    assert ranking.day_number == 1
+
+
+@pytest.mark.asyncio
+async def test_analyze_rejects_bad_dimensions_without_parsing():
+    processor = ScreenshotProcessor(ocr_executor=CountingExecutor())
+    processor.available = True
+    processor.ocr_function = lambda image_data, timeout=0: (80, 80, "")
+
+    analysis = await processor.analyze_screenshot(b"png", "1", "user")
+    assert not analysis.is_valid
+    assert analysis.error.startswith("Image too small")
+    assert analysis.ranking is None
+
+
+def test_preprocess_downscales_grayscales_and_binarizes_light_on_dark():
+    Image = pytest.importorskip("PIL.Image")
+    ImageDraw = pytest.importorskip("PIL.ImageDraw")
+    image = Image.new("RGB", (2000, 3000), (20, 24, 40))
+    ImageDraw.Draw(image).rectangle((200, 1400, 1800, 1500), fill=(250, 250, 250))
+
+    processed = preprocess_for_ocr(image)
+
+    assert processed.mode == "1"
+    assert processed.width == OCR_MAX_WIDTH
+    histogram = processed.histogram()
+    assert histogram[0] + histogram[255] == processed.width * processed.height
+    # The dark panel became the white background; the light bar became dark "text".
+    assert histogram[255] > histogram[0] > 0
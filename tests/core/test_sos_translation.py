@@ -27,6 +27,9 @@ def mock_processing_engine():
     processing = Mock()
     orchestrator = Mock()
     orchestrator.translate_text_for_user = AsyncMock(return_value=("Translated text", "en", "deepl"))
+    orchestrator.translate_to_many = AsyncMock(
+        side_effect=lambda text, targets, **kwargs: {t: ("Translated text", "deepl") for t in targets}
+    )
     processing.orchestrator = orchestrator
     return processing
 
@@ -170,19 +173,19 @@ async def test_send_sos_dms_translates_to_target_language(input_engine, mock_rol
     
     # Setup orchestrator to return translated text
     orchestrator = input_engine.processing.orchestrator
-    orchestrator.translate_text_for_user = AsyncMock(
-        return_value=("¡Emergencia!", "en", "deepl")
+    orchestrator.translate_to_many = AsyncMock(
+        return_value={"es": ("¡Emergencia!", "deepl")}
     )
     
     # Send SOS DMs
     await input_engine._send_sos_dms(guild, "Emergency!", sender)
     
     # Verify translation was requested
-    orchestrator.translate_text_for_user.assert_called_once_with(
-        text="Emergency!",
+    orchestrator.translate_to_many.assert_called_once_with(
+        "Emergency!",
+        ["es"],
         guild_id=guild.id,
-        user_id=member.id,
-        tgt_lang="es"
+        user_id=sender.id,
     )
     
     # Verify DM was sent
@@ -216,15 +219,13 @@ async def test_send_sos_dms_skips_english_speakers(input_engine, mock_role_manag
     
     # Setup orchestrator
     orchestrator = input_engine.processing.orchestrator
-    orchestrator.translate_text_for_user = AsyncMock(
-        return_value=("Emergency!", "en", "deepl")
-    )
+    orchestrator.translate_to_many = AsyncMock(return_value={})
     
     # Send SOS DMs
     await input_engine._send_sos_dms(guild, "Emergency!", sender)
     
     # Verify translation was NOT requested (English to English)
-    orchestrator.translate_text_for_user.assert_not_called()
+    orchestrator.translate_to_many.assert_not_called()
     
     # Verify DM was sent with original message
     assert member.send.call_count == 1
@@ -317,7 +318,7 @@ async def test_send_sos_dms_uses_fallback_on_translation_failure(input_engine, m
     
     # Setup orchestrator to fail translation
     orchestrator = input_engine.processing.orchestrator
-    orchestrator.translate_text_for_user = AsyncMock(return_value=(None, "en", None))
+    orchestrator.translate_to_many = AsyncMock(return_value={"es": (None, None)})
     
     # Send SOS DMs
     await input_engine._send_sos_dms(guild, "Emergency!", sender)
@@ -326,3 +327,44 @@ async def test_send_sos_dms_uses_fallback_on_translation_failure(input_engine, m
     assert member.send.call_count == 1
     dm_content = member.send.call_args[0][0]
     assert "Emergency!" in dm_content
+
+
+@pytest.mark.asyncio
+async def test_send_sos_dms_translates_once_per_language(input_engine, mock_role_manager):
+    """Test that recipients sharing a language share one translation."""
+    guild = Mock(spec=discord.Guild)
+    guild.id = 123456789
+    guild.name = "Test Guild"
+
+    sender = Mock(spec=discord.User)
+    sender.id = 1
+    sender.mention = "@sender"
+
+    languages = {}
+    members = [sender]
+    for idx in range(2, 32):
+        member = Mock(spec=discord.Member)
+        member.id = idx
+        member.bot = False
+        member.name = f"User{idx}"
+        member.send = AsyncMock()
+        members.append(member)
+        languages[idx] = ["es", "fr", "EN"][idx % 3]
+    guild.members = members
+
+    mock_role_manager.get_user_languages = AsyncMock(
+        side_effect=lambda user_id, guild_id: [languages[user_id]]
+    )
+    orchestrator = input_engine.processing.orchestrator
+    orchestrator.translate_to_many = AsyncMock(
+        return_value={"es": ("¡Emergencia!", "deepl"), "fr": ("Urgence !", "deepl")}
+    )
+
+    await input_engine._send_sos_dms(guild, "Emergency!", sender)
+
+    orchestrator.translate_to_many.assert_awaited_once()
+    assert orchestrator.translate_to_many.call_args.args[1] == ["es", "fr"]
+    orchestrator.translate_text_for_user.assert_not_called()
+    for member in members[1:]:
+        expected = {"es": "¡Emergencia!", "fr": "Urgence !", "EN": "Emergency!"}[languages[member.id]]
+        assert expected in member.send.call_args[0][0]
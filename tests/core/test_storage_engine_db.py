@@ -1,3 +1,4 @@
+import asyncio
 import sys
 from pathlib import Path
 
@@ -39,6 +40,7 @@ async def test_execute_and_fetch_roundtrip(tmp_path: Path):
     }
 
     await storage.insert_log_entry(entry)
+    await storage.flush()
 
     rows = await storage.fetch(
         "SELECT timestamp, severity, context, message FROM logs WHERE context = ?",
@@ -77,3 +79,260 @@ async def test_execute_handles_query_failure_and_returns_false(monkeypatch, tmp_
 
     result = await storage.execute("INSERT INTO logs VALUES (1)", commit=True)
     assert result is False
+
+
+def _log_schema(tmp_path: Path) -> Path:
+    schema = tmp_path / "schema.sql"
+    schema.write_text(
+        "CREATE TABLE IF NOT EXISTS logs (id INTEGER PRIMARY KEY AUTOINCREMENT, message TEXT);",
+        encoding="utf-8",
+    )
+    return schema
+
+
+@pytest.mark.asyncio
+async def test_connections_are_reused_across_queries(monkeypatch, tmp_path: Path):
+    import aiosqlite
+
+    opened = []
+    real_connect = aiosqlite.connect
+
+    def counting_connect(*args, **kwargs):
+        opened.append(args[0])
+        return real_connect(*args, **kwargs)
+
+    monkeypatch.setattr("discord_bot.core.storage.storage_engine.aiosqlite.connect", counting_connect)
+
+    storage = StorageEngine(db_path=tmp_path / "pool.db", schema_file=str(_log_schema(tmp_path)), readers=2)
+    await storage.initialize()
+    for i in range(20):
+        assert await storage.execute("INSERT INTO logs (message) VALUES (?)", (f"m{i}",))
+        assert await storage.fetch("SELECT COUNT(*) FROM logs") == [(i + 1,)]
+
+    assert len(opened) == 3  # one writer + two readers, opened once
+    stats = storage.pool_stats()
+    assert stats["writes"] == 20 and stats["reads"] == 20
+    assert stats["readers_idle"] == 2
+    await storage.close()
+    assert storage.pool_stats()["writer_open"] is False
+
+
+@pytest.mark.asyncio
+async def test_readers_run_while_writer_holds_a_transaction(tmp_path: Path):
+    storage = StorageEngine(db_path=tmp_path / "wal.db", schema_file=str(_log_schema(tmp_path)), readers=2)
+    await storage.initialize()
+    await storage.execute("INSERT INTO logs (message) VALUES ('committed')")
+
+    # Leave an uncommitted write open on the writer; WAL readers still see the last commit.
+    await storage.execute("INSERT INTO logs (message) VALUES ('pending')", commit=False)
+    rows = await asyncio.wait_for(
+        asyncio.gather(*(storage.fetch("SELECT message FROM logs") for _ in range(4))), timeout=2
+    )
+    assert all(r == [("committed",)] for r in rows)
+
+    await storage.execute("SELECT 1")  # commits the pending insert
+    assert await storage.fetch("SELECT COUNT(*) FROM logs") == [(2,)]
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_readers_reject_writes_and_ping_reports_pool_health(tmp_path: Path):
+    storage = StorageEngine(
+        db_path=tmp_path / "ro.db", json_backup=str(tmp_path / "backup.json"), schema_file=str(_log_schema(tmp_path))
+    )
+    await storage.initialize()
+
+    assert await storage.ping() is True
+    # A write routed through fetch lands on a read-only reader and falls back instead of mutating.
+    await storage.fetch("INSERT INTO logs (message) VALUES ('sneaky')")
+    assert await storage.fetch("SELECT COUNT(*) FROM logs") == [(0,)]
+
+    await storage.close()
+    assert await storage.ping() is True  # pool reopens lazily
+    await storage.close()
+
+
+def _error_schema(tmp_path: Path) -> Path:
+    schema = tmp_path / "schema.sql"
+    schema.write_text(
+        """
+        CREATE TABLE IF NOT EXISTS error_logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            error_type TEXT, message TEXT, traceback TEXT, timestamp TEXT, context TEXT
+        );
+        CREATE TABLE IF NOT EXISTS logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp TEXT, severity TEXT, context TEXT, message TEXT
+        );
+        """,
+        encoding="utf-8",
+    )
+    return schema
+
+
+@pytest.mark.asyncio
+async def test_log_inserts_are_group_committed(tmp_path: Path):
+    storage = StorageEngine(
+        db_path=tmp_path / "batch.db",
+        schema_file=str(_error_schema(tmp_path)),
+        flush_interval_ms=10_000,
+        flush_batch_size=50,
+    )
+    await storage.initialize()
+
+    for i in range(120):
+        await storage.insert_error_log({"type": "ValueError", "message": f"e{i}"})
+    await storage.insert_log_entry({"message": "tail"})
+    await asyncio.sleep(0.05)  # size trigger wakes the flusher without waiting for the interval
+
+    assert await storage.fetch("SELECT COUNT(*) FROM error_logs") == [(120,)]
+    await storage.flush()
+    assert await storage.fetch("SELECT COUNT(*) FROM logs") == [(1,)]
+    stats = storage.queue_stats()
+    assert stats["queued"] == 121 and stats["flushed"] == 121 and stats["pending"] == 0
+    assert stats["batches"] < 121
+    await storage.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_queue_drops_oldest_and_flushes_on_shutdown_event(tmp_path: Path):
+    from discord_bot.core.event_bus import EventBus
+    from discord_bot.core.event_topics import SHUTDOWN_INITIATED
+
+    storage = StorageEngine(
+        db_path=tmp_path / "drop.db",
+        schema_file=str(_error_schema(tmp_path)),
+        flush_interval_ms=60_000,
+        flush_batch_size=1_000,
+        max_pending=5,
+    )
+    await storage.initialize()
+    bus = EventBus()
+    storage.attach_event_bus(bus)
+
+    for i in range(8):
+        await storage.insert_log_entry({"message": f"m{i}"})
+    assert storage.queue_stats()["dropped"] == 3
+
+    await bus.emit(SHUTDOWN_INITIATED, reason="test")
+    assert storage.queue_stats()["flushed"] == 5
+
+    rows = await storage.fetch("SELECT message FROM logs ORDER BY id")
+    assert [r[0] for r in rows] == ["m3", "m4", "m5", "m6", "m7"]
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_rejected_row_is_journaled_without_its_table_or_the_others(tmp_path: Path):
+    schema = tmp_path / "schema.sql"
+    schema.write_text(
+        """
+        CREATE TABLE IF NOT EXISTS error_logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            error_type TEXT, message TEXT, traceback TEXT, timestamp TEXT, context TEXT
+        );
+        CREATE TABLE IF NOT EXISTS logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp TEXT, severity TEXT, context TEXT, message TEXT CHECK (message <> 'poison')
+        );
+        """,
+        encoding="utf-8",
+    )
+    storage = StorageEngine(
+        db_path=tmp_path / "isolate.db",
+        json_backup=str(tmp_path / "journal"),
+        schema_file=str(schema),
+        flush_interval_ms=60_000,
+    )
+    await storage.initialize()
+
+    await storage.insert_error_log({"type": "ValueError", "message": "healthy"})
+    for message in ("m0", "poison", "m1"):
+        await storage.insert_log_entry({"message": message})
+    assert await storage.flush() == 3
+
+    assert await storage.fetch("SELECT message FROM error_logs") == [("healthy",)]
+    assert await storage.fetch("SELECT message FROM logs ORDER BY id") == [("m0",), ("m1",)]
+    journaled = await storage._json_fallback_fetch("SELECT message FROM logs")
+    assert [row["message"] for row in journaled] == ["poison"]
+    assert await storage._json_fallback_fetch("SELECT message FROM error_logs") == []
+    assert storage.queue_stats()["fallback"] == 1
+    assert storage._pool_stats["reopens"] == 0
+    await storage.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_journal_replay_is_batched_and_resumable(tmp_path: Path):
+    storage = StorageEngine(
+        db_path=tmp_path / "replay.db",
+        schema_file=str(_error_schema(tmp_path)),
+        journal_segment_bytes=256,
+        replay_batch_size=7,
+    )
+    await storage.initialize()
+    for i in range(30):
+        await storage._json_backup_write("logs", {"message": f"m{i}"})
+    fallback = await storage._json_fallback_fetch("SELECT message FROM logs ORDER BY id")
+    assert [row["message"] for row in fallback][-2:] == ["m28", "m29"]
+
+    def interrupt(stream, done, total):
+        if done == 14:
+            raise RuntimeError("stop")
+
+    await storage.replay_journal(progress=interrupt)
+    assert await storage.fetch("SELECT COUNT(*) FROM logs") == [(14,)]
+
+    seen = []
+    replayed = await storage.replay_journal(progress=lambda stream, done, total: seen.append((done, total)))
+    assert replayed == {"logs.jsonl": 16}
+    assert seen == [(21, 30), (28, 30), (30, 30)]
+    rows = await storage.fetch("SELECT message FROM logs ORDER BY id")
+    assert [r[0] for r in rows] == [f"m{i}" for i in range(30)]
+    assert storage.journal_stats()["retired"] == 1
+    assert await storage.replay_journal() == {"logs.jsonl": 0}
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_recovery_replays_the_journal(tmp_path: Path):
+    schema = _error_schema(tmp_path)
+    storage = StorageEngine(db_path=tmp_path / "recover.db", schema_file=str(schema))
+    await storage.initialize()
+    await storage._json_backup_write("error_logs", {"type": "ValueError", "message": "during outage"})
+
+    await storage._recover_database()
+    rows = await storage.fetch("SELECT error_type, message FROM error_logs")
+    assert rows == [("ValueError", "during outage")]
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_recovery_waits_for_checked_out_readers(tmp_path: Path):
+    schema = _error_schema(tmp_path)
+    storage = StorageEngine(db_path=tmp_path / "recover.db", schema_file=str(schema), readers=1)
+    await storage.initialize()
+    assert await storage.execute("INSERT INTO error_logs (error_type) VALUES ('before')")
+
+    order = []
+    release = asyncio.Event()
+
+    async def slow_read():
+        async with storage._reader() as db:
+            await release.wait()
+            cursor = await db.execute("SELECT COUNT(*) FROM error_logs")
+            order.append(("read", (await cursor.fetchone())[0]))
+
+    reader = asyncio.create_task(slow_read())
+    await asyncio.sleep(0.05)
+    recovery = asyncio.create_task(storage._recover_database())
+    await asyncio.sleep(0.05)
+    assert not recovery.done() and storage._lock.locked()
+
+    late = asyncio.create_task(storage.fetch("SELECT COUNT(*) FROM error_logs"))
+    release.set()
+    await asyncio.gather(reader, recovery)
+    # The checked-out reader finished on the old file; the late fetch saw the fresh one.
+    assert order == [("read", 1)]
+    assert await late == [(0,)]
+    assert storage.pool_stats()["reopens"] == 1
+    await storage.close()
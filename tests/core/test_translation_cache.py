@@ -0,0 +1,140 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from discord_bot.core.engines.translation_cache import TranslationCache
+from discord_bot.core.engines.translation_orchestrator import TranslationOrchestratorEngine
+
+
+class DetectorStub:
+    async def detect_language(self, text: str):
+        return "en", 0.9
+
+
+class CountingAdapter:
+    def __init__(self, output):
+        self.output = output
+        self.calls = 0
+
+    async def translate_async(self, text, src, tgt):
+        self.calls += 1
+        return self.output
+
+
+@pytest.mark.asyncio
+async def test_memory_lru_evicts_oldest_and_counts():
+    cache = TranslationCache(max_entries=2)
+    await cache.set("a", "en", "fr", "p", "A", "deepl")
+    await cache.set("b", "en", "fr", "p", "B", "deepl")
+    assert await cache.get("a", "en", "fr", "p") == ("A", "deepl")  # refresh "a"
+    await cache.set("c", "en", "fr", "p", "C", "deepl")
+
+    assert await cache.get("b", "en", "fr", "p") is None
+    assert await cache.get("a", "en", "fr", "p") == ("A", "deepl")
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 2 and stats["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_key_normalizes_whitespace_and_respects_policy():
+    cache = TranslationCache()
+    await cache.set("  on   my way ", "EN", "FR", "deepl>google", "en route", "deepl")
+    assert await cache.get("on my way", "en", "fr", "deepl>google") == ("en route", "deepl")
+    assert await cache.get("on my way", "en", "fr", "google") is None
+
+
+@pytest.mark.asyncio
+async def test_key_keeps_line_breaks():
+    cache = TranslationCache()
+    await cache.set("rally at\t 9\n\n  bring   shields", "en", "fr", "p", "rassemblement", "deepl")
+    assert await cache.get("rally at 9\r\n\r\nbring shields", "en", "fr", "p") == ("rassemblement", "deepl")
+    assert await cache.get("rally at 9 bring shields", "en", "fr", "p") is None
+    assert await cache.get("rally at 9\nbring shields", "en", "fr", "p") is None
+
+
+@pytest.mark.asyncio
+async def test_memory_ttl_expires_entries(monkeypatch):
+    cache = TranslationCache(ttl=10)
+    await cache.set("gg", "en", "de", "p", "gg", "deepl")
+    real_time = time.time
+    monkeypatch.setattr(time, "time", lambda: real_time() + 60)
+    assert await cache.get("gg", "en", "de", "p") is None
+    assert cache.stats()["expirations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_persistent_layer_survives_restart(tmp_path: Path):
+    db_path = str(tmp_path / "cache.db")
+    first = TranslationCache(db_path=db_path)
+    await first.set("hello", "en", "es", "p", "hola", "mymemory")
+    await first.close()
+
+    second = TranslationCache(db_path=db_path)
+    assert await second.get("hello", "en", "es", "p") == ("hola", "mymemory")
+    assert second.stats()["hits_persistent"] == 1
+    # Promoted into memory on the first hit.
+    assert await second.get("hello", "en", "es", "p") == ("hola", "mymemory")
+    assert second.stats()["hits_memory"] == 1
+    await second.close()
+
+
+@pytest.mark.asyncio
+async def test_persistent_hits_touch_last_access_once_per_interval(tmp_path: Path):
+    db_path = str(tmp_path / "cache.db")
+    first = TranslationCache(db_path=db_path)
+    await first.set("hello", "en", "es", "p", "hola", "mymemory")
+    await first.close()
+
+    second = TranslationCache(db_path=db_path, touch_interval=3600)
+    db = await second._connection()
+    updates = []
+    await db.set_trace_callback(lambda sql: updates.append(sql) if sql.startswith("UPDATE") else None)
+    for _ in range(3):
+        second._l1.clear()  # force the lookup down to SQLite
+        assert await second.get("hello", "en", "es", "p") == ("hola", "mymemory")
+    assert updates == []
+
+    await db.execute("UPDATE translation_cache SET last_access = last_access - 7200")
+    second._l1.clear()
+    assert await second.get("hello", "en", "es", "p") == ("hola", "mymemory")
+    assert len(updates) == 2  # the backdating above, then one touch
+    await second.close()
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_serves_repeats_from_cache():
+    deepl = CountingAdapter("salut")
+    orchestrator = TranslationOrchestratorEngine(
+        deepl_adapter=deepl,
+        detection_service=DetectorStub(),
+        cache=TranslationCache(),
+    )
+
+    for _ in range(3):
+        result, src, provider = await orchestrator.translate_text_for_user(
+            text="hi", guild_id=1, user_id=2, tgt_lang="fr"
+        )
+        assert (result, src, provider) == ("salut", "en", "deepl")
+
+    assert deepl.calls == 1
+    assert orchestrator.cache_stats()["hit_ratio"] == pytest.approx(2 / 3)
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_does_not_cache_failures():
+    deepl = CountingAdapter(None)
+    orchestrator = TranslationOrchestratorEngine(
+        deepl_adapter=deepl,
+        detection_service=DetectorStub(),
+        cache=TranslationCache(),
+    )
+
+    for _ in range(2):
+        result, _, provider = await orchestrator.translate_text_for_user(
+            text="hi", guild_id=1, user_id=2, tgt_lang="fr"
+        )
+        assert result is None and provider is None
+
+    assert deepl.calls == 2
@@ -1,3 +1,4 @@
+import asyncio
 import sys
 from pathlib import Path
 
@@ -98,3 +99,368 @@ async def test_translate_job_invokes_text_pipeline():
     job = TranslationJob(text="hi", src="en", tgt="en", guild_id=1, author_id=1)
     translated = await orchestrator.translate_job(job)
     assert translated == "ciao"
+
+
+class SlowAdapter:
+    def __init__(self, output="bonjour", delay=0.05, error=None):
+        self.output = output
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    async def translate_async(self, text, src, tgt):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.output
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_requests_share_one_upstream_call():
+    adapter = SlowAdapter()
+    orchestrator = TranslationOrchestratorEngine(deepl_adapter=adapter, detection_service=DetectorStub())
+
+    results = await asyncio.gather(*[
+        orchestrator.translate_text_for_user(text="hello", guild_id=1, user_id=i, tgt_lang="fr")
+        for i in range(10)
+    ])
+
+    assert adapter.calls == 1
+    assert all(result == ("bonjour", "es", "deepl") for result in results)
+    stats = orchestrator.singleflight_stats()
+    assert stats == {"leaders": 1, "coalesced": 9, "inflight": 0}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_call():
+    adapter = SlowAdapter()
+    orchestrator = TranslationOrchestratorEngine(deepl_adapter=adapter, detection_service=DetectorStub())
+
+    first = asyncio.create_task(
+        orchestrator.translate_text_for_user(text="hello", guild_id=1, user_id=1, tgt_lang="fr")
+    )
+    second = asyncio.create_task(
+        orchestrator.translate_text_for_user(text="hello", guild_id=1, user_id=2, tgt_lang="fr")
+    )
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    assert await second == ("bonjour", "es", "deepl")
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert adapter.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_last_cancelled_caller_cancels_upstream_and_releases_key():
+    adapter = SlowAdapter(delay=10)
+    orchestrator = TranslationOrchestratorEngine(deepl_adapter=adapter, detection_service=DetectorStub())
+
+    task = asyncio.create_task(
+        orchestrator.translate_text_for_user(text="hello", guild_id=1, user_id=1, tgt_lang="fr")
+    )
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert orchestrator.singleflight_stats()["inflight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_upstream_errors_reach_every_waiter_and_are_not_shared_later():
+    orchestrator = TranslationOrchestratorEngine(detection_service=DetectorStub())
+    calls = 0
+
+    async def failing_tiers(text, src, tgt):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("provider exploded")
+
+    orchestrator._run_tiers = failing_tiers
+    results = await asyncio.gather(
+        *[orchestrator.translate_text_for_user(text="hi", guild_id=1, user_id=i, tgt_lang="fr") for i in range(3)],
+        return_exceptions=True,
+    )
+    assert calls == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    with pytest.raises(RuntimeError):
+        await orchestrator.translate_text_for_user(text="hi", guild_id=1, user_id=9, tgt_lang="fr")
+    assert calls == 2
+
+
+class CancellableAdapter(SlowAdapter):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cancelled = False
+
+    async def translate_async(self, text, src, tgt):
+        try:
+            return await super().translate_async(text, src, tgt)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+@pytest.mark.asyncio
+async def test_hedged_mode_races_backup_tier_and_cancels_loser():
+    deepl = CancellableAdapter(output="lent", delay=5)
+    mymemory = CancellableAdapter(output="rapide", delay=0.01)
+    orchestrator = TranslationOrchestratorEngine(
+        deepl_adapter=deepl,
+        mymemory_adapter=mymemory,
+        detection_service=DetectorStub(),
+        hedge=True,
+        hedge_delay=0.02,
+    )
+
+    result = await asyncio.wait_for(
+        orchestrator.translate_text_for_user(text="hello", guild_id=1, user_id=2, tgt_lang="fr"), timeout=1
+    )
+    await asyncio.sleep(0)
+
+    assert result == ("rapide", "es", "mymemory")
+    assert deepl.calls == 1 and deepl.cancelled
+    assert orchestrator.hedge_stats() == {"hedged": 1, "hedge_wins": 1}
+
+
+@pytest.mark.asyncio
+async def test_hedged_mode_does_not_start_backup_when_primary_is_fast():
+    deepl = SlowAdapter(output="vite", delay=0.001)
+    mymemory = SlowAdapter(output="unused")
+    orchestrator = TranslationOrchestratorEngine(
+        deepl_adapter=deepl,
+        mymemory_adapter=mymemory,
+        detection_service=DetectorStub(),
+        hedge=True,
+        hedge_delay=0.5,
+    )
+
+    result = await orchestrator.translate_text_for_user(text="hello", guild_id=1, user_id=2, tgt_lang="fr")
+
+    assert result == ("vite", "es", "deepl")
+    assert mymemory.calls == 0
+    assert orchestrator.hedge_stats() == {"hedged": 0, "hedge_wins": 0}
+
+
+@pytest.mark.asyncio
+async def test_hedged_mode_moves_on_immediately_when_primary_fails():
+    deepl = SlowAdapter(output=None, delay=0.001)
+    mymemory = SlowAdapter(output="secours", delay=0.001)
+    orchestrator = TranslationOrchestratorEngine(
+        deepl_adapter=deepl,
+        mymemory_adapter=mymemory,
+        detection_service=DetectorStub(),
+        hedge=True,
+        hedge_delay=10,
+    )
+
+    result = await asyncio.wait_for(
+        orchestrator.translate_text_for_user(text="hello", guild_id=1, user_id=2, tgt_lang="fr"), timeout=1
+    )
+
+    assert result == ("secours", "es", "mymemory")
+    assert orchestrator.hedge_stats()["hedged"] == 0
+
+
+@pytest.mark.asyncio
+async def test_hedge_timer_is_not_restarted_when_an_earlier_tier_fails():
+    started = {}
+
+    class StampedAdapter(SlowAdapter):
+        def __init__(self, name, **kwargs):
+            super().__init__(**kwargs)
+            self.name = name
+
+        async def translate_async(self, text, src, tgt):
+            started[self.name] = asyncio.get_running_loop().time()
+            return await super().translate_async(text, src, tgt)
+
+    orchestrator = TranslationOrchestratorEngine(
+        deepl_adapter=StampedAdapter("deepl", output=None, delay=0.3),
+        mymemory_adapter=StampedAdapter("mymemory", output="lent", delay=5),
+        google_adapter=StampedAdapter("google", output="vite", delay=0.001),
+        detection_service=DetectorStub(),
+        hedge=True,
+        hedge_delay=0.2,
+    )
+
+    result = await asyncio.wait_for(
+        orchestrator.translate_text_for_user(text="hello", guild_id=1, user_id=2, tgt_lang="fr"), timeout=2
+    )
+
+    assert result == ("vite", "es", "google")
+    # DeepL failing at 0.3s must not push Google past MyMemory's own 0.2s hedge delay.
+    assert started["google"] - started["mymemory"] == pytest.approx(0.2, abs=0.05)
+
+
+def test_hedge_delay_defaults_to_observed_p90():
+    orchestrator = TranslationOrchestratorEngine(hedge=True)
+    assert orchestrator.latency_p90("deepl") is None
+    for ms in range(1, 21):
+        orchestrator._record_latency("deepl", ms / 100)
+    assert orchestrator._hedge_delay_for("deepl") == pytest.approx(0.19)
+    assert orchestrator._hedge_delay_for("mymemory") == 1.0
+
+
+class CountingDetector:
+    def __init__(self):
+        self.calls = 0
+
+    async def detect_language(self, text: str):
+        self.calls += 1
+        return "en", 0.9
+
+
+@pytest.mark.asyncio
+async def test_translate_to_many_detects_once_and_dedupes_targets():
+    detector = CountingDetector()
+    adapter = AdapterStub(output="translated", languages=["es", "fr"])
+    orchestrator = TranslationOrchestratorEngine(deepl_adapter=adapter, detection_service=detector)
+
+    result = await orchestrator.translate_to_many("Help!", ["es", "FR", "es", "en", " fr "])
+
+    assert result == {"es": ("translated", "deepl"), "fr": ("translated", "deepl"), "en": ("Help!", None)}
+    assert detector.calls == 1
+    assert sorted(tgt for _, _, tgt in adapter.calls) == ["es", "fr"]
+
+
+@pytest.mark.asyncio
+async def test_translate_to_many_bounds_concurrency():
+    active = 0
+    peak = 0
+
+    class TrackingAdapter:
+        async def translate_async(self, text, src, tgt):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return f"{text}-{tgt}"
+
+    orchestrator = TranslationOrchestratorEngine(deepl_adapter=TrackingAdapter(), detection_service=DetectorStub())
+
+    targets = ["de", "fr", "it", "ja", "ko", "pt", "ru", "zh"]
+    result = await orchestrator.translate_to_many("hi", targets, max_concurrency=3)
+
+    assert peak == 3
+    assert result["ja"] == ("hi-ja", "deepl")
+    assert len(result) == len(targets)
+
+
+@pytest.mark.asyncio
+async def test_long_text_is_chunked_translated_concurrently_and_reassembled():
+    from discord_bot.core.engines.translation_cache import TranslationCache
+    from discord_bot.language_context.detectors.nlp_model import NLPProcessor
+
+    active = 0
+    peak = 0
+    seen = []
+
+    class UpperAdapter:
+        async def translate_async(self, text, src, tgt):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            seen.append(text)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return text.upper()
+
+    paragraphs = [f"paragraph {i} " + "word " * 40 for i in range(6)]
+    text = "\n\n".join(p.strip() for p in paragraphs)
+    cache = TranslationCache()
+    orchestrator = TranslationOrchestratorEngine(
+        deepl_adapter=UpperAdapter(),
+        detection_service=DetectorStub(),
+        nlp_processor=NLPProcessor(max_input_chars=300),
+        cache=cache,
+        chunk_size=500,
+        max_chunk_concurrency=3,
+    )
+
+    result, src, provider = await orchestrator.translate_text_for_user(
+        text=text, guild_id=1, user_id=2, tgt_lang="fr"
+    )
+
+    assert result == text.upper()  # nothing truncated, paragraph breaks preserved
+    assert provider == "deepl"
+    assert len(seen) == 3 and all(len(chunk) <= 500 for chunk in seen)
+    assert peak == 3
+
+    # Each chunk is cached on its own, so a repeat makes no provider calls.
+    await orchestrator.translate_text_for_user(text=text, guild_id=1, user_id=2, tgt_lang="fr")
+    assert len(seen) == 3
+
+
+@pytest.mark.asyncio
+async def test_chunked_translation_fails_when_any_chunk_fails():
+    from discord_bot.language_context.detectors.nlp_model import NLPProcessor
+
+    class PickyAdapter:
+        async def translate_async(self, text, src, tgt):
+            return None if "bad" in text else text
+
+    text = "good " * 30 + "\n\n" + "bad " * 30
+    orchestrator = TranslationOrchestratorEngine(
+        deepl_adapter=PickyAdapter(),
+        detection_service=DetectorStub(),
+        nlp_processor=NLPProcessor(),
+        chunk_size=160,
+    )
+
+    result, _, provider = await orchestrator.translate_text_for_user(text=text, guild_id=1, user_id=2, tgt_lang="fr")
+    assert (result, provider) == (None, None)
+
+
+class _RaisingSplitter:
+    def preprocess(self, text, truncate=True):
+        return text
+
+    def split_into_chunks(self, text, max_size):
+        raise RuntimeError("splitter broke")
+
+
+class _RewritingSplitter(_RaisingSplitter):
+    def split_into_chunks(self, text, max_size):
+        return [text[i:i + max_size].upper() for i in range(0, len(text), max_size)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("splitter", [_RaisingSplitter(), _RewritingSplitter()], ids=["raises", "rewrites"])
+async def test_failed_split_falls_back_to_size_limited_chunks(splitter):
+    seen = []
+
+    class EchoAdapter:
+        async def translate_async(self, text, src, tgt):
+            seen.append(text)
+            return text
+
+    text = "word " * 100 + "x" * 250
+    orchestrator = TranslationOrchestratorEngine(
+        deepl_adapter=EchoAdapter(),
+        detection_service=DetectorStub(),
+        nlp_processor=splitter,
+        chunk_size=120,
+    )
+
+    result, _, provider = await orchestrator.translate_text_for_user(text=text, guild_id=1, user_id=2, tgt_lang="fr")
+
+    assert (result, provider) == (text, "deepl")
+    assert len(seen) > 1 and all(len(chunk) <= 120 for chunk in seen)
+    assert "x" * 120 in seen  # a run with no space is cut on the hard limit
+
+
+def test_split_into_chunks_prefers_boundaries_and_never_splits_words():
+    from discord_bot.language_context.detectors.nlp_model import NLPProcessor
+
+    nlp = NLPProcessor()
+    text = "First sentence here. Second sentence follows.\n\nNew paragraph with several words"
+    chunks = nlp.split_into_chunks(text, max_size=25)
+
+    assert all(len(c) <= 25 for c in chunks)
+    assert " ".join(chunks).split() == text.split()
+    assert chunks[0] == "First sentence here."
@@ -0,0 +1,187 @@
+import asyncio
+import inspect
+import threading
+import time
+
+import pytest
+
+from discord_bot.games.storage.async_game_storage import AsyncGameStorage, READ_METHODS, WRITE_METHODS
+from discord_bot.games.storage.game_storage_engine import GameStorageEngine
+
+
+def test_every_public_method_has_an_awaitable():
+    public = {
+        name
+        for name, member in inspect.getmembers(GameStorageEngine, inspect.isfunction)
+        if not name.startswith("_")
+    }
+    assert public <= READ_METHODS | WRITE_METHODS
+    assert not READ_METHODS & WRITE_METHODS
+
+
+@pytest.mark.asyncio
+async def test_roundtrip_on_file_database(tmp_path):
+    engine = GameStorageEngine(db_path=str(tmp_path / "game.db"))
+    storage = AsyncGameStorage(engine, readers=2)
+
+    await storage.add_user("42")
+    assert await storage.add_cookies("42", 7) == (7, 7)
+    assert await storage.spend_cookies("42", 3) is True
+    assert await storage.get_user_cookies("42") == (7, 4)
+    assert (await storage.get_cookie_leaderboard(limit=5))[0]["user_id"] == "42"
+
+    stats = storage.stats()
+    assert stats["writes"] == 3 and stats["reads"] == 2
+    await storage.close()
+    # The engine's own connection is untouched and sees the facade's writes.
+    assert engine.get_user_cookies("42") == (7, 4)
+
+
+@pytest.mark.asyncio
+async def test_memory_database_shares_the_engine_connection():
+    engine = GameStorageEngine(db_path=":memory:")
+    storage = AsyncGameStorage.for_engine(engine)
+    assert AsyncGameStorage.for_engine(engine) is storage
+
+    await storage.add_cookies("1", 5)
+    assert engine.get_user_cookies("1") == (5, 5)
+    assert await storage.is_game_unlocked("1") is False
+    assert storage.stats()["reads_on_writer"] == 1
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_writes_are_serialized_on_one_thread(tmp_path):
+    engine = GameStorageEngine(db_path=str(tmp_path / "game.db"))
+    storage = AsyncGameStorage(engine)
+
+    await asyncio.gather(*(storage.add_cookies("7", 1) for _ in range(50)))
+    assert await storage.get_user_cookies("7") == (50, 50)
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_loop_stays_responsive_during_slow_query(monkeypatch, tmp_path):
+    engine = GameStorageEngine(db_path=str(tmp_path / "game.db"))
+    storage = AsyncGameStorage(engine)
+    original = GameStorageEngine.get_cookie_leaderboard
+    reader_threads = []
+
+    def slow_leaderboard(self, limit=10):
+        reader_threads.append(threading.current_thread().name)
+        time.sleep(0.3)
+        return original(self, limit)
+
+    monkeypatch.setattr(GameStorageEngine, "get_cookie_leaderboard", slow_leaderboard)
+
+    ticks = 0
+
+    async def heartbeat():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    beat = asyncio.create_task(heartbeat())
+    try:
+        await storage.get_cookie_leaderboard()
+    finally:
+        beat.cancel()
+
+    assert ticks >= 10
+    assert reader_threads[0].startswith("game-db-reader")
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_staged_user_state(tmp_path):
+    db_path = str(tmp_path / "game.db")
+    engine = GameStorageEngine(db_path=db_path)
+    storage = AsyncGameStorage(engine, flush_interval_ms=60_000)
+
+    await storage.stage_interaction("9", "mention")
+    await storage.stage_user_state("9", relationship_index=70)
+    assert (await storage.user_state_stats())["dirty"] == 1
+    await storage.close()
+
+    fresh = GameStorageEngine(db_path=db_path)
+    assert fresh.get_user_data("9")["relationship_index"] == 70
+    assert fresh.get_user_data("9")["total_interactions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_periodic_flush_writes_dirty_rows(tmp_path):
+    engine = GameStorageEngine(db_path=str(tmp_path / "game.db"))
+    storage = AsyncGameStorage(engine, flush_interval_ms=20)
+
+    await storage.stage_user_state("5", daily_streak=3)
+    query = "SELECT daily_streak FROM users WHERE user_id = '5'"
+    for _ in range(100):
+        if engine.conn.execute(query).fetchone()["daily_streak"] == 3:
+            break
+        await asyncio.sleep(0.01)
+
+    assert engine.conn.execute(query).fetchone()["daily_streak"] == 3
+    await storage.close()
+
+
+def test_concurrent_flushes_commit_in_snapshot_order(tmp_path):
+    import copy
+    import sqlite3
+
+    db_path = tmp_path / "game.db"
+    engine = GameStorageEngine(db_path=str(db_path))
+    # A second view on its own connection, as AsyncGameStorage builds per thread.
+    other = copy.copy(engine)
+    other.conn = sqlite3.connect(db_path, timeout=5, check_same_thread=False)
+    other.conn.row_factory = sqlite3.Row
+
+    in_update = threading.Event()
+    release = threading.Event()
+
+    def hold_first_update(sql):
+        if sql.startswith("UPDATE users") and not in_update.is_set():
+            in_update.set()
+            release.wait(2)
+
+    engine.stage_user_state("3", relationship_index=10)
+    engine.conn.set_trace_callback(hold_first_update)
+    first = threading.Thread(target=engine.flush_user_state)
+    first.start()
+    assert in_update.wait(2)
+
+    engine.stage_user_state("3", relationship_index=20)
+    second = threading.Thread(target=other.flush_user_state)
+    second.start()
+    time.sleep(0.1)
+    release.set()
+    first.join(2)
+    second.join(2)
+
+    row = engine.conn.execute("SELECT relationship_index FROM users WHERE user_id = '3'").fetchone()
+    assert row["relationship_index"] == 20  # the older snapshot never lands last
+    other.conn.close()
+
+
+@pytest.mark.asyncio
+async def test_size_triggered_flush_runs_on_the_writer_thread(monkeypatch, tmp_path):
+    engine = GameStorageEngine(db_path=str(tmp_path / "game.db"), user_flush_batch=2)
+    storage = AsyncGameStorage.for_engine(engine, flush_interval_ms=60_000)
+    original = GameStorageEngine.flush_user_state
+    flush_threads = []
+
+    def tracked_flush(self):
+        flush_threads.append(threading.current_thread().name)
+        return original(self)
+
+    monkeypatch.setattr(GameStorageEngine, "flush_user_state", tracked_flush)
+
+    # A manager still holding the sync engine stages from the event loop thread.
+    engine.stage_user_state("1", daily_streak=1)
+    engine.stage_user_state("2", daily_streak=2)
+    await storage.get_user_cookies("1")  # queued behind the flush on the writer thread
+    await asyncio.get_running_loop().run_in_executor(storage._writer_pool, lambda: None)
+
+    assert flush_threads and all(name.startswith("game-db-writer") for name in flush_threads)
+    assert (await storage.user_state_stats())["dirty"] == 0
+    await storage.close()
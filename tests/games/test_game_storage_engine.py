@@ -2,6 +2,7 @@ import os
 import sqlite3
 import pytest
 from discord_bot.games.storage.game_storage_engine import GameStorageEngine
+from discord_bot.tests.stubs.sqlite import assert_no_select, assert_replay_matches_recompute
 
 @pytest.fixture
 def storage_engine():
@@ -55,4 +56,283 @@ def test_get_user_cookies(storage_engine):
 
     # Test for non-existent user
     cookies = storage_engine.get_user_cookies("nonexistent")
-    assert cookies == (0, 0)
\ No newline at end of file
+    assert cookies == (0, 0)
+
+def _hammer(db_path, worker, iterations):
+    from concurrent.futures import ThreadPoolExecutor
+
+    # One engine (and connection) per thread so SQLite sees genuinely concurrent writers.
+    engines = [GameStorageEngine(db_path=db_path) for _ in range(8)]
+    with ThreadPoolExecutor(max_workers=len(engines)) as pool:
+        results = list(pool.map(lambda engine: [worker(engine) for _ in range(iterations)], engines))
+    for engine in engines:
+        engine.conn.close()
+    return [value for batch in results for value in batch]
+
+
+def test_concurrent_awards_lose_no_updates(tmp_path):
+    db_path = str(tmp_path / "stress.db")
+    _hammer(db_path, lambda engine: engine.add_cookies("hot", 1), iterations=50)
+
+    engine = GameStorageEngine(db_path=db_path)
+    assert engine.get_user_cookies("hot") == (400, 400)
+
+
+def test_concurrent_spends_never_overdraw(tmp_path):
+    db_path = str(tmp_path / "stress.db")
+    GameStorageEngine(db_path=db_path).add_cookies("wallet", 100)
+
+    outcomes = _hammer(db_path, lambda engine: engine.spend_cookies("wallet", 3), iterations=10)
+
+    engine = GameStorageEngine(db_path=db_path)
+    assert outcomes.count(True) == 33
+    assert engine.get_user_cookies("wallet") == (100, 1)
+
+
+def test_try_spend_cookies_returns_new_balance(storage_engine):
+    storage_engine.add_cookies("u", 5)
+    assert storage_engine.try_spend_cookies("u", 2) == 3
+    assert storage_engine.try_spend_cookies("u", 4) is None
+    assert storage_engine.try_spend_cookies("missing", 1) is None
+    assert storage_engine.get_user_cookies("u") == (5, 3)
+
+
+def test_add_cookies_bulk_creates_and_increments(storage_engine):
+    storage_engine.add_cookies("a", 2)
+    totals = storage_engine.add_cookies_bulk({"a": 3, "b": 4})
+    assert totals == {"a": (5, 5), "b": (4, 4)}
+    assert storage_engine.get_user_data("b")["last_interaction"] is not None
+
+
+def test_admin_allowance_is_consumed_atomically(storage_engine):
+    assert storage_engine.consume_admin_gift_allowance("admin", 6, daily_limit=10) is True
+    assert storage_engine.consume_admin_gift_allowance("admin", 6, daily_limit=10) is False
+    assert storage_engine.get_admin_gift_remaining("admin", 10) == 4
+
+    with storage_engine.conn:
+        storage_engine.conn.execute("UPDATE admin_cookie_allowances SET last_date = '2000-01-01'")
+    assert storage_engine.consume_admin_gift_allowance("admin", 10, daily_limit=10) is True
+    assert storage_engine.get_admin_gift_remaining("admin", 10) == 0
+
+
+def test_old_sqlite_is_rejected_at_init(monkeypatch):
+    monkeypatch.setattr(sqlite3, "sqlite_version_info", (3, 34, 1))
+    with pytest.raises(RuntimeError, match="3.35"):
+        GameStorageEngine(db_path=":memory:")
+
+
+def test_migrations_run_once_per_database(tmp_path):
+    from discord_bot.games.storage.game_storage_engine import SCHEMA_VERSION
+
+    db_path = str(tmp_path / "migrate.db")
+    first = GameStorageEngine(db_path=db_path)
+    assert len(first._migrations()) == SCHEMA_VERSION
+    assert first.schema_version() == SCHEMA_VERSION
+
+    statements = []
+    second = GameStorageEngine.__new__(GameStorageEngine)
+    second.conn = sqlite3.connect(db_path)
+    second.conn.row_factory = sqlite3.Row
+    second.conn.set_trace_callback(statements.append)
+    assert second.migrate() == SCHEMA_VERSION
+    assert not [sql for sql in statements if "CREATE" in sql.upper() or "ALTER" in sql.upper()]
+
+
+def test_unversioned_database_is_adopted(tmp_path):
+    db_path = str(tmp_path / "legacy.db")
+    legacy = sqlite3.connect(db_path)
+    legacy.execute("CREATE TABLE users (user_id TEXT PRIMARY KEY, total_cookies INTEGER DEFAULT 0, "
+                   "cookies_left INTEGER DEFAULT 0, relationship_index INTEGER DEFAULT 0, "
+                   "last_interaction TEXT, daily_streak INTEGER DEFAULT 0, game_unlocked INTEGER DEFAULT 0, "
+                   "total_interactions INTEGER DEFAULT 0, last_daily_check TEXT, "
+                   "aggravation_level INTEGER DEFAULT 0, mute_until TEXT)")
+    legacy.execute("INSERT INTO users (user_id, total_cookies, cookies_left) VALUES ('old', 9, 4)")
+    legacy.commit()
+    legacy.close()
+
+    engine = GameStorageEngine(db_path=db_path)
+    assert engine.get_user_cookies("old") == (9, 4)
+    columns = {row["name"] for row in engine.conn.execute("PRAGMA table_info(users)")}
+    assert "relationship_anchor_at" in columns
+
+
+def test_hot_queries_use_indexes(storage_engine):
+    from datetime import datetime
+    from discord_bot.core.engines.screenshot_processor import RankingCategory, RankingData, StageType
+
+    engine = storage_engine
+    engine.add_cookies("u1", 5)
+    ranking = RankingData(
+        user_id="u1", username="u1", guild_tag="TAG", event_week="2025-01",
+        stage_type=StageType.PREP, day_number=1, category=RankingCategory.CONSTRUCTION,
+        rank=3, score=100, player_name="p", submitted_at=datetime.utcnow(), guild_id="g",
+    )
+    engine.save_event_ranking(ranking)
+
+    statements = []
+    engine.conn.set_trace_callback(statements.append)
+    engine.get_cookie_leaderboard(limit=10)
+    engine.get_user_pokemon("u1")
+    engine.get_pokemon_count_by_species("u1", "pikachu")
+    engine.get_event_submission_stats(guild_id="g")
+    engine.get_event_submission_stats()
+    engine.get_user_event_rankings("u1")
+    engine.get_event_ranking_history("u1", guild_id="g")
+    engine.get_event_reminders(guild_id=1)
+    engine.conn.set_trace_callback(None)
+
+    selects = [sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]
+    assert len(selects) == 8
+    for sql in selects:
+        plan = [row[3] for row in engine.conn.execute("EXPLAIN QUERY PLAN " + sql)]
+        full_scans = [step for step in plan if step.startswith("SCAN") and "INDEX" not in step]
+        assert not full_scans, (sql, plan)
+
+    leaderboard_plan = [row[3] for row in engine.conn.execute(
+        "EXPLAIN QUERY PLAN " + selects[0])]
+    assert not [step for step in leaderboard_plan if "TEMP B-TREE" in step], leaderboard_plan
+
+
+def _recomputed_leaderboard(engine, limit):
+    rows = engine.conn.execute(
+        "SELECT user_id, total_cookies, cookies_left FROM users "
+        "WHERE total_cookies > 0 ORDER BY total_cookies DESC, user_id ASC LIMIT ?",
+        (limit,),
+    ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def test_cookie_leaderboard_matches_full_recompute():
+    import random
+
+    engine = GameStorageEngine(db_path=":memory:", leaderboard_capacity=5)
+    users = [f"user{i:02d}" for i in range(20)]
+    setup = random.Random(1234)
+    for user_id in users[:8]:
+        engine.add_cookies(user_id, setup.randint(1, 5))
+    engine.get_cookie_leaderboard(limit=5)  # seed
+
+    def mutate(rng):
+        user_id = rng.choice(users)
+        op = rng.random()
+        if op < 0.5:
+            engine.add_cookies(user_id, rng.randint(1, 6))
+        elif op < 0.75:
+            engine.spend_cookies(user_id, rng.randint(1, 4))
+        elif op < 0.85:
+            engine.add_gift_cookies(user_id, rng.randint(1, 3))
+        elif op < 0.9:
+            engine.add_cookies_bulk({rng.choice(users): 2, rng.choice(users): 1})
+        elif op < 0.93:
+            engine.update_cookies(user_id, total_cookies=rng.randint(0, 10))
+        else:
+            engine.update_cookies(user_id, cookies_left=rng.randint(0, 10))
+
+    assert_replay_matches_recompute(
+        1234, 400,
+        mutate=mutate,
+        pick=lambda rng: rng.randint(1, 5),
+        read=lambda limit: engine.get_cookie_leaderboard(limit=limit),
+        recompute=lambda limit: _recomputed_leaderboard(engine, limit),
+    )
+
+
+def test_cookie_leaderboard_reads_do_not_query(storage_engine):
+    storage_engine.add_cookies("a", 3)
+    storage_engine.add_cookies("b", 7)
+    storage_engine.get_cookie_leaderboard(limit=10)
+
+    def award_spend_read():
+        storage_engine.add_cookies("c", 5)
+        storage_engine.spend_cookies("b", 2)
+        return storage_engine.get_cookie_leaderboard(limit=10)
+
+    board = assert_no_select(storage_engine.conn, award_spend_read)
+    assert [row["user_id"] for row in board] == ["b", "c", "a"]
+    assert board[0]["cookies_left"] == 5
+
+
+def _recomputed_event_leaderboard(engine, guild_id, event_week, stage, day, tag, limit):
+    query = """
+        SELECT user_id, MIN(rank) AS best_rank, MAX(score) AS highest_score,
+               MAX(submitted_at) AS last_submission
+          FROM event_rankings WHERE guild_id = ?
+    """
+    params = [guild_id]
+    for column, value in (("event_week", event_week), ("stage_type", stage), ("day_number", day), ("guild_tag", tag)):
+        if value:
+            query += f" AND {column} = ?"
+            params.append(value)
+    query += " GROUP BY user_id ORDER BY best_rank ASC, highest_score DESC, user_id ASC LIMIT ?"
+    return [tuple(row) for row in engine.conn.execute(query, (*params, limit))]
+
+
+def test_event_leaderboard_matches_full_recompute():
+    from datetime import datetime, timedelta
+    from discord_bot.core.engines.screenshot_processor import RankingCategory, RankingData, StageType
+
+    engine = GameStorageEngine(db_path=":memory:", event_leaderboard_depth=4)
+    users = [f"user{i:02d}" for i in range(12)]
+    weeks = ["2025-01", "2025-02"]
+    stages = [StageType.PREP, StageType.WAR]
+    saved = {}
+    clock = [datetime(2025, 1, 1)]
+
+    def mutate(rng):
+        clock[0] += timedelta(minutes=1)
+        user_id, week, stage = rng.choice(users), rng.choice(weeks), rng.choice(stages)
+        day = rng.randint(1, 3) if stage is StageType.PREP else None
+        key = (user_id, week, stage, day)
+        if key in saved and rng.random() < 0.6:
+            engine.update_event_ranking(saved[key], rng.randint(1, 50), rng.randint(0, 1000))
+        elif key not in saved:
+            saved[key] = engine.save_event_ranking(RankingData(
+                user_id=user_id, username=user_id, guild_tag=rng.choice(["AAA", "BBB"]),
+                event_week=week, stage_type=stage, day_number=day,
+                category=RankingCategory.UNKNOWN, rank=rng.randint(1, 50),
+                score=rng.randint(0, 1000), player_name=user_id, submitted_at=clock[0], guild_id="g",
+            ))
+
+    def pick(rng):
+        return (rng.choice(weeks + [None]), rng.choice(stages + [None]), rng.choice([None, 1, 2]),
+                rng.choice(["AAA", None]), rng.randint(1, 6))
+
+    def read(args):
+        week, stage, day, tag, limit = args
+        board = engine.get_guild_event_leaderboard(
+            "g", event_week=week, stage_type=stage, day_number=day, guild_tag=tag, limit=limit,
+        )
+        return [(r["user_id"], r["best_rank"], r["highest_score"], r["last_submission"]) for r in board]
+
+    def recompute(args):
+        week, stage, day, tag, limit = args
+        return _recomputed_event_leaderboard(engine, "g", week, stage.value if stage else None, day, tag, limit)
+
+    assert_replay_matches_recompute(99, 300, mutate=mutate, pick=pick, read=read, recompute=recompute)
+
+    engine.prune_event_weeks(weeks_to_keep=1)
+    board = engine.get_guild_event_leaderboard("g", limit=3)
+    assert [r["user_id"] for r in board] == [
+        row[0] for row in _recomputed_event_leaderboard(engine, "g", None, None, None, None, 3)]
+
+
+def test_event_leaderboard_reads_do_not_query(storage_engine):
+    from datetime import datetime
+    from discord_bot.core.engines.screenshot_processor import RankingCategory, RankingData, StageType
+
+    def ranking(user_id, rank):
+        return RankingData(
+            user_id=user_id, username=user_id, guild_tag="TAG", event_week="2025-01",
+            stage_type=StageType.WAR, day_number=None, category=RankingCategory.UNKNOWN,
+            rank=rank, score=10, player_name=user_id, submitted_at=datetime.utcnow(), guild_id="g",
+        )
+
+    storage_engine.save_event_ranking(ranking("a", 5))
+    storage_engine.get_guild_event_leaderboard("g", event_week="2025-01")
+
+    def save_and_read():
+        storage_engine.save_event_ranking(ranking("b", 2))
+        return storage_engine.get_guild_event_leaderboard("g", event_week="2025-01")
+
+    board = assert_no_select(storage_engine.conn, save_and_read, table="event_leaderboard")
+    assert [row["user_id"] for row in board] == ["b", "a"]
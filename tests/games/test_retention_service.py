@@ -0,0 +1,99 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from discord_bot.core.engines.screenshot_processor import RankingCategory, RankingData, StageType
+from discord_bot.games.storage.async_game_storage import AsyncGameStorage
+from discord_bot.games.storage.game_storage_engine import GameStorageEngine
+from discord_bot.games.storage.retention_service import RetentionService
+
+
+def _ranking(user_id, week, rank, score):
+    return RankingData(
+        user_id=user_id, username=user_id, guild_tag="TAG", event_week=week,
+        stage_type=StageType.WAR, day_number=None, category=RankingCategory.UNKNOWN,
+        rank=rank, score=score, player_name=user_id, submitted_at=datetime.utcnow(), guild_id="g",
+    )
+
+
+def _recomputed(engine):
+    rows = engine.conn.execute(
+        """
+        SELECT user_id, MIN(rank), MAX(score) FROM event_rankings WHERE guild_id = 'g'
+         GROUP BY user_id ORDER BY MIN(rank), MAX(score) DESC, user_id
+        """
+    )
+    return [tuple(row) for row in rows]
+
+
+@pytest.mark.asyncio
+async def test_old_rows_are_rolled_up_in_batches(tmp_path):
+    engine = GameStorageEngine(db_path=str(tmp_path / "game.db"))
+    old = (datetime.utcnow() - timedelta(days=40)).replace(hour=12)
+    recent = datetime.utcnow().isoformat()
+    interactions = [("a", "mention", (old + timedelta(minutes=i)).isoformat(), 2) for i in range(7)]
+    interactions += [("b", "mention", old.isoformat(), 1), ("a", "mention", recent, 5)]
+    engine.conn.executemany(
+        "INSERT INTO interactions (user_id, interaction_type, timestamp, cookies_earned) VALUES (?, ?, ?, ?)",
+        interactions,
+    )
+    engine.conn.executemany(
+        "INSERT INTO event_submissions (user_id, guild_id, submitted_at, status) VALUES (?, ?, ?, ?)",
+        [("a", "g", old.isoformat(), "success")] * 4 + [("a", None, old.isoformat(), "failed"), ("a", "g", recent, "success")],
+    )
+    engine.conn.commit()
+
+    service = RetentionService(engine, batch_size=3, pause_ms=0)
+    reports = {report.job: report for report in await service.run_once()}
+
+    assert reports["interactions_rollup"].rows == 8 and reports["interactions_rollup"].batches == 3
+    assert reports["event_submissions_rollup"].rows == 5
+    assert reports["interactions_rollup"].rows_per_second > 0
+    day = old.date().isoformat()
+    daily = engine.conn.execute("SELECT user_id, interactions, cookies_earned FROM interaction_daily WHERE day = ? ORDER BY user_id", (day,))
+    assert [tuple(row) for row in daily] == [("a", 7, 14), ("b", 1, 1)]
+    assert engine.conn.execute("SELECT COUNT(*) FROM interactions").fetchone()[0] == 1
+    submissions = engine.conn.execute("SELECT guild_id, status, submissions FROM event_submission_daily ORDER BY guild_id")
+    assert [tuple(row) for row in submissions] == [("", "failed", 1), ("g", "success", 4)]
+    assert engine.conn.execute("SELECT COUNT(*) FROM event_submissions").fetchone()[0] == 1
+    await service.db.close()
+
+
+@pytest.mark.asyncio
+async def test_week_pruning_keeps_leaderboards_consistent(tmp_path):
+    engine = GameStorageEngine(db_path=str(tmp_path / "game.db"))
+    for week in range(1, 6):
+        for user in range(6):
+            engine.save_event_ranking(_ranking(f"u{user}", f"2025-0{week}", rank=(user * week) % 7 + 1, score=user * 10 + week))
+    engine.get_guild_event_leaderboard("g", limit=10)  # populate the in-memory mirror
+
+    service = RetentionService(engine, ranking_weeks_to_keep=2, batch_size=4, pause_ms=0)
+    report = (await service.run_once())[0]
+
+    assert report.job == "event_rankings_weeks" and report.rows == 18 and report.batches == 5
+    assert {row[0] for row in engine.conn.execute("SELECT DISTINCT event_week FROM event_rankings")} == {"2025-04", "2025-05"}
+    board = engine.get_guild_event_leaderboard("g", limit=10)
+    assert [(r["user_id"], r["best_rank"], r["highest_score"]) for r in board] == _recomputed(engine)
+    assert engine.get_guild_event_leaderboard("g", event_week="2025-01") == []
+    await service.db.close()
+
+
+@pytest.mark.asyncio
+async def test_other_writes_run_between_batches(tmp_path):
+    engine = GameStorageEngine(db_path=str(tmp_path / "game.db"))
+    engine.conn.executemany(
+        "INSERT INTO interactions (user_id, interaction_type, timestamp, cookies_earned) VALUES ('a', 'm', ?, 1)",
+        [("2000-01-01T00:00:00",)] * 50,
+    )
+    engine.conn.commit()
+    db = AsyncGameStorage.for_engine(engine)
+    service = RetentionService(db, batch_size=5, pause_ms=10)
+
+    retention = asyncio.create_task(service.run_once())
+    await asyncio.sleep(0.02)
+    assert await db.add_cookies("w", 3) == (3, 3)
+    assert not retention.done()
+    reports = await retention
+    assert reports[-2].rows == 50
+    await db.close()
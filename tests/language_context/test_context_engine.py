@@ -220,6 +220,7 @@ async def test_detect_source_uses_injected_detector_tuple_response():
 
     detected = await engine._detect_source_code("Guten Tag")
     assert detected == "de"
+    assert await engine._detect_source("Guten Tag") == ("de", 0.87)
 
 
 @pytest.mark.asyncio
@@ -227,6 +228,8 @@ async def test_detect_source_heuristics_for_unicode_ranges():
     engine = ContextEngine(role_manager=None, cache_manager=None)
     detected = await engine._detect_source_code("これはテストです")
     assert detected == "ja"
+    # Heuristic guesses carry no confidence, so they are not mistaken for detector scores.
+    assert await engine._detect_source("これはテストです") == ("ja", None)
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,88 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from discord_bot.language_context.translators.deepl_adapter import DeepLAdapter
+
+
+class BatchingTranslator:
+    """Fake deepl.Translator: accepts a string or a list and records every request."""
+
+    def __init__(self, fail=False):
+        self.requests = []
+        self.fail = fail
+
+    def translate_text(self, text, *, source_lang=None, target_lang=None):
+        self.requests.append((text, source_lang, target_lang))
+        if self.fail:
+            raise RuntimeError("quota exceeded")
+        if isinstance(text, list):
+            return [SimpleNamespace(text=f"{t}@{target_lang}") for t in text]
+        return SimpleNamespace(text=f"{text}@{target_lang}")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_for_same_pair_share_one_request():
+    translator = BatchingTranslator()
+    adapter = DeepLAdapter(translator=translator, batch_window=0.02)
+
+    results = await asyncio.gather(*[adapter.translate_async(f"msg {i}", "en", "de") for i in range(5)])
+
+    assert [r.translated_text for r in results] == [f"msg {i}@DE" for i in range(5)]
+    assert len(translator.requests) == 1
+    assert translator.requests[0][0] == [f"msg {i}" for i in range(5)]
+    assert adapter.batch_stats()["batches"] == 1
+
+
+@pytest.mark.asyncio
+async def test_batches_are_split_by_pair_and_item_limit():
+    translator = BatchingTranslator()
+    adapter = DeepLAdapter(translator=translator, batch_window=0.02, max_batch_items=2)
+
+    await asyncio.gather(
+        adapter.translate_async("a", "en", "de"),
+        adapter.translate_async("b", "en", "de"),
+        adapter.translate_async("c", "en", "de"),
+        adapter.translate_async("d", "en", "fr"),
+    )
+
+    sent = sorted((tuple(texts), tgt) for texts, _, tgt in translator.requests)
+    assert sent == [(("a", "b"), "DE"), (("c",), "DE"), (("d",), "FR")]
+    assert adapter.batch_stats()["size_flushes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_byte_budget_flushes_before_overflowing():
+    translator = BatchingTranslator()
+    adapter = DeepLAdapter(translator=translator, batch_window=0.02, max_batch_bytes=10)
+
+    await asyncio.gather(adapter.translate_async("123456", "en", "de"), adapter.translate_async("abcdef", "en", "de"))
+
+    assert [texts for texts, _, _ in translator.requests] == [["123456"], ["abcdef"]]
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_reaches_every_caller_and_cancelled_callers_are_dropped():
+    translator = BatchingTranslator(fail=True)
+    adapter = DeepLAdapter(translator=translator, batch_window=0.02)
+
+    cancelled = asyncio.create_task(adapter.translate_async("gone", "en", "de"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    results = await asyncio.gather(adapter.translate_async("x", "en", "de"), adapter.translate_async("y", "en", "de"))
+
+    assert results == [None, None]
+    assert translator.requests[0][0] == ["x", "y"]
+
+
+@pytest.mark.asyncio
+async def test_batching_disabled_by_default():
+    translator = BatchingTranslator()
+    adapter = DeepLAdapter(translator=translator)
+
+    result = await adapter.translate_async("hello", "en", "de")
+
+    assert result.translated_text == "hello@DE"
+    assert translator.requests == [("hello", "EN", "DE")]
+    assert adapter.batch_stats() == {}
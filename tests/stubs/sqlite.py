@@ -0,0 +1,44 @@
+import random
+from typing import Any, Callable, Optional
+
+
+def assert_no_select(conn, fn: Callable[[], Any], *, table: Optional[str] = None) -> Any:
+    """
+    Run ``fn`` with ``conn`` traced and fail if it read from the database.
+
+    Without ``table`` any SELECT fails; with it, any statement naming ``FROM <table>``.
+    Returns ``fn()``'s result.
+    """
+    statements = []
+    conn.set_trace_callback(statements.append)
+    try:
+        result = fn()
+    finally:
+        conn.set_trace_callback(None)
+    if table is None:
+        offending = [sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]
+    else:
+        offending = [sql for sql in statements if f"FROM {table}" in sql]
+    assert not offending, offending
+    return result
+
+
+def assert_replay_matches_recompute(
+    seed: int,
+    steps: int,
+    *,
+    mutate: Callable[[random.Random], None],
+    pick: Callable[[random.Random], Any],
+    read: Callable[[Any], Any],
+    recompute: Callable[[Any], Any],
+) -> None:
+    """
+    Apply ``steps`` seeded random mutations; after each, an incrementally
+    maintained ``read(args)`` must equal the full ``recompute(args)`` for
+    randomly picked ``args``.
+    """
+    rng = random.Random(seed)
+    for step in range(steps):
+        mutate(rng)
+        args = pick(rng)
+        assert read(args) == recompute(args), (step, args)